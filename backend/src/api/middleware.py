@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from backend.src.config.db_config import get_db_settings
+from backend.src.database.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Queries"
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class QueryStatsMiddleware:
+    """
+    Count the SQL statements each HTTP request runs and report them as
+    `X-DB-Queries: <n>` and `Server-Timing: db;dur=<ms>;desc="<n> queries"`.
+
+    Logs a warning when one statement shape runs more than n_plus_one_threshold
+    times in a request (default: DB_N_PLUS_ONE_THRESHOLD).
+
+    Plain ASGI rather than BaseHTTPMiddleware so the stats live in the request's
+    own context, which sync routes on the threadpool and async routes both share.
+    """
+
+    def __init__(self, app, n_plus_one_threshold: Optional[int] = None):
+        self.app = app
+        self.threshold = (
+            n_plus_one_threshold if n_plus_one_threshold is not None else get_db_settings().n_plus_one_threshold
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message):
+                # The unit of work has committed by the time the response starts
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()))
+                    headers.append((
+                        SERVER_TIMING_HEADER.lower().encode(),
+                        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"'.encode(),
+                    ))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+        for shape, n in stats.repeated(self.threshold):
+            logger.warning(
+                "Possible N+1: statement ran %d times in %s %s: %s",
+                n, scope.get("method"), scope.get("path"), shape,
+            )
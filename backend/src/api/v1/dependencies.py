@@ -0,0 +1,26 @@
+import anyio
+from starlette.concurrency import run_in_threadpool
+
+from backend.src.database.db_setup import end_request_sessions, request_sessions
+
+
+async def unit_of_work():
+    """
+    One database session per request: every service call made while handling the
+    request shares it, and it commits once after the route returns (rolls back if
+    the route raises, HTTPException included). FastAPI runs the code after the
+    yield before it sends the response (since 0.106; the version is pinned in
+    requirements.txt), so a client never sees a response for uncommitted writes.
+
+    Async so the scope is opened in the request's own context; sync routes run in
+    a copy of that context on the threadpool and so see the same sessions. The
+    blocking commit / rollback runs on the threadpool too, not on the event loop.
+    """
+    with request_sessions() as sessions:
+        try:
+            yield
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(end_request_sessions, sessions, commit=False)
+            raise
+        await run_in_threadpool(end_request_sessions, sessions, commit=True)
@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from backend.src.api.v1.dependencies import unit_of_work
 from backend.src.api.v1.routes.task_route import router as task_router
 from backend.src.api.v1.routes.user_route import router as user_router
 from backend.src.api.v1.routes.report_route import router as report_router
@@ -6,7 +7,8 @@ from backend.src.api.v1.routes.report_route import router as report_router
 
 
 
-router = APIRouter(prefix="/kira/app/api/v1")
+# Every v1 request runs in one unit of work (a single session / connection checkout)
+router = APIRouter(prefix="/kira/app/api/v1", dependencies=[Depends(unit_of_work)])
 
 router.include_router(task_router)
 router.include_router(user_router)
@@ -3,55 +3,239 @@ API routes for project report generation and export.
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
-from io import BytesIO
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple
 
 import backend.src.handlers.report_handler as report_handler
+from backend.src.enums.report import ExportFormat, ReportFormat, ReportJobStatus
+from backend.src.schemas.report import ReportJobCreate, ReportJobRead
 
 router = APIRouter(prefix="/report", tags=["report"])
 
 
-@router.get("/project/{project_id}/pdf", name="export_pdf_report")
-def export_pdf_report(project_id: int):
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, so W/ prefixes added by proxies still match)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _file_chunks(file: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    try:
+        while chunk := file.read(chunk_size):
+            yield chunk
+    finally:
+        file.close()
+
+
+def _report_file_response(
+    path, report_format: ReportFormat, filename_stem: str, etag: str, if_none_match: Optional[str]
+) -> Response:
     """
-    Export a project schedule report as PDF.
-    Shows projected, in-progress, completed, and under review tasks.
+    The rendered report as an attachment, or 304 Not Modified when the client already has this version.
+    The file is opened here, so a newer render pruning it from the cache no longer affects this
+    response; raises FileNotFoundError if it was pruned already.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    file = open(path, "rb")
+    headers["Content-Length"] = str(os.fstat(file.fileno()).st_size)
+    headers["Content-Disposition"] = f'attachment; filename="{filename_stem}.{report_format.extension}"'
+    return StreamingResponse(_file_chunks(file), media_type=report_format.media_type, headers=headers)
+
+
+def _serve_report(
+    report_format: ReportFormat,
+    if_none_match: Optional[str],
+    label: str,
+    filename_stem: str,
+    version_and_etag: Callable[[], Tuple[str, str]],
+    export: Callable[[str], Path],
+    missing_status: int = 404,
+):
+    """
+    Conditional report download: look up the data version first, answer 304 if the
+    client has it, otherwise render (or reuse the cached file) and send it.
+    ValueErrors map to 404 when something was not found, else to missing_status.
     """
     try:
-        pdf_buffer = report_handler.generate_pdf_report(project_id)
-        
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=project_{project_id}_schedule_report.pdf"
-            }
-        )
+        version, etag = version_and_etag()
+        # Only render (or open the cached file) when the client doesn't already have this version
+        path = None if _etag_matches(if_none_match, etag) else export(version)
+        try:
+            return _report_file_response(path, report_format, filename_stem, etag, if_none_match)
+        except FileNotFoundError:
+            # A newer version's render pruned the file after export returned it: render this version again
+            return _report_file_response(export(version), report_format, filename_stem, etag, if_none_match)
     except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+        status_code = 404 if "not found" in str(e).lower() else missing_status
+        raise HTTPException(status_code=status_code, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating PDF report: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating {label} report: {str(e)}")
+
+
+def _export_report(project_id: int, report_format: ReportFormat, if_none_match: Optional[str], label: str):
+    def version_and_etag():
+        version = report_handler.get_report_version(project_id)
+        return version, report_handler.report_etag(project_id, report_format, version)
+
+    return _serve_report(
+        report_format, if_none_match, label, f"project_{project_id}_schedule_report",
+        version_and_etag, lambda version: report_handler.export_report(project_id, report_format, version),
+    )
+
+
+def _export_portfolio(
+    report_format: ReportFormat,
+    if_none_match: Optional[str],
+    label: str,
+    project_ids: Optional[List[int]],
+    manager_id: Optional[int],
+    department_id: Optional[int],
+):
+    resolved: List[int] = []
+
+    def version_and_etag():
+        resolved.extend(report_handler.resolve_portfolio(project_ids, manager_id, department_id))
+        version = report_handler.get_portfolio_version(resolved)
+        return version, report_handler.portfolio_etag(report_format, version)
+
+    return _serve_report(
+        report_format, if_none_match, label, "portfolio_schedule_report",
+        version_and_etag, lambda version: report_handler.export_portfolio(resolved, report_format, version),
+        missing_status=400,
+    )
+
+
+@router.get("/project/{project_id}/pdf", name="export_pdf_report")
+def export_pdf_report(project_id: int, if_none_match: Optional[str] = Header(None)):
+    """
+    Export a project schedule report as PDF.
+    Shows projected, in-progress, completed, and under review tasks.
+    Sends an ETag; If-None-Match with the current one gets 304 without touching the tasks.
+    """
+    return _export_report(project_id, ReportFormat.PDF, if_none_match, "PDF")
 
 
 @router.get("/project/{project_id}/excel", name="export_excel_report")
-def export_excel_report(project_id: int):
+def export_excel_report(project_id: int, if_none_match: Optional[str] = Header(None)):
     """
     Export a project schedule report as Excel.
     Shows projected, in-progress, completed, and under review tasks.
+    Sends an ETag; If-None-Match with the current one gets 304 without touching the tasks.
     """
+    return _export_report(project_id, ReportFormat.EXCEL, if_none_match, "Excel")
+
+
+def _export_tasks(project_id: int, export_format: ExportFormat, changed_since: Optional[datetime]):
     try:
-        excel_buffer = report_handler.generate_excel_report(project_id)
-        
-        return StreamingResponse(
-            excel_buffer,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename=project_{project_id}_schedule_report.xlsx"
-            }
-        )
+        watermark, chunks = report_handler.export_tasks(project_id, export_format, changed_since)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    filename = f"project_{project_id}_tasks.{export_format.extension}"
+    return StreamingResponse(
+        chunks,
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Export-Watermark": watermark.isoformat(),
+        },
+    )
+
+
+@router.get("/project/{project_id}/csv", name="export_csv_tasks")
+def export_csv_tasks(project_id: int, changed_since: Optional[datetime] = None):
+    """
+    Stream the project's task rows (with assignees) as CSV, for analytics pipelines.
+    Pass changed_since (e.g. the X-Export-Watermark of the previous export) to get only
+    the tasks changed since then; deactivated ones, and ones attached under another
+    task, are included with active = False.
+    """
+    return _export_tasks(project_id, ExportFormat.CSV, changed_since)
+
+
+@router.get("/project/{project_id}/parquet", name="export_parquet_tasks")
+def export_parquet_tasks(project_id: int, changed_since: Optional[datetime] = None):
+    """The CSV export's rows as a Parquet file (typed columns; assignees as a list)."""
+    return _export_tasks(project_id, ExportFormat.PARQUET, changed_since)
+
+
+@router.get("/project/{project_id}/arrow", name="export_arrow_tasks")
+def export_arrow_tasks(project_id: int, changed_since: Optional[datetime] = None):
+    """The CSV export's rows as an Arrow IPC stream, one record batch per chunk of tasks."""
+    return _export_tasks(project_id, ExportFormat.ARROW, changed_since)
+
+
+@router.get("/portfolio/pdf", name="export_portfolio_pdf_report")
+def export_portfolio_pdf_report(
+    project_ids: Optional[List[int]] = Query(None),
+    manager_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Export one PDF covering several projects, one section (with a bookmark) per project.
+    Select the projects with repeated project_ids, or a manager_id or department_id.
+    """
+    return _export_portfolio(ReportFormat.PDF, if_none_match, "PDF", project_ids, manager_id, department_id)
+
+
+@router.get("/portfolio/excel", name="export_portfolio_excel_report")
+def export_portfolio_excel_report(
+    project_ids: Optional[List[int]] = Query(None),
+    manager_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Export one workbook covering several projects: a portfolio overview sheet, then one sheet per project.
+    Select the projects with repeated project_ids, or a manager_id or department_id.
+    """
+    return _export_portfolio(ReportFormat.EXCEL, if_none_match, "Excel", project_ids, manager_id, department_id)
+
+
+@router.post("/jobs", response_model=ReportJobRead, status_code=202, name="create_report_job")
+def create_report_job(payload: ReportJobCreate):
+    """
+    Queue a project report render in the background.
+    Poll GET /report/jobs/{job_id} until status is done, then download it.
+    """
+    try:
+        return report_handler.create_report_job(payload.project_id, payload.format)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJobRead, name="get_report_job")
+def get_report_job(job_id: str):
+    try:
+        return report_handler.get_report_job(job_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating Excel report: {str(e)}")
 
+
+@router.get("/jobs/{job_id}/download", name="download_report_job")
+def download_report_job(job_id: str, if_none_match: Optional[str] = Header(None)):
+    """
+    Download a finished report job; 409 while it is still pending or if it failed,
+    410 once the project has changed and its newer report replaced the file.
+    """
+    try:
+        job = report_handler.get_report_job(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if job.status != ReportJobStatus.DONE:
+        raise HTTPException(status_code=409, detail=f"Report job {job_id} is {job.status.value}")
+    etag = report_handler.report_etag(job.project_id, job.format, job.data_version)
+    try:
+        return _report_file_response(
+            job.path, job.format, f"project_{job.project_id}_schedule_report", etag, if_none_match
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=410, detail=f"Report job {job_id} is outdated: the project has changed")
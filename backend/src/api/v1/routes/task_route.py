@@ -1,10 +1,10 @@
 from __future__ import annotations
 from typing import List, Optional, Dict
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 import json
 
-from backend.src.schemas.task import TaskCreate, TaskUpdate, TaskRead, TaskWithSubTasks, SubtaskIds
+from backend.src.schemas.task import TaskCreate, TaskUpdate, TaskRead, TaskWithSubTasks, TaskTree, SubtaskIds
 from backend.src.schemas.task_assignment import UnassignUsersPayload, AssignUsersPayload
 from backend.src.schemas.user import UserRead
 from backend.src.schemas.comment import CommentCreate, CommentRead, CommentUpdate, CommentDelete
@@ -14,9 +14,23 @@ import backend.src.handlers.comment_handler as comment_handler
 import backend.src.handlers.project_handler as project_handler
 import backend.src.handlers.department_handler as department_handler
 import backend.src.services.user as user_service
+from backend.src.services.task_paging import MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/task", tags=["task"])
 
+# The hot read endpoints (get_task, list_tasks, list_tasks_by_user) are async and read
+# through AsyncSessionLocal, so they don't hold an AnyIO worker thread per request.
+
+# Listing endpoints page with ?limit=&after=<cursor>; the cursor for the next page
+# (if any) is returned in this header so the response body stays a plain list.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _set_next_cursor(response: Response, tasks: list, sort_by: str, limit: Optional[int]) -> None:
+    cursor = task_handler.next_page_cursor(tasks, sort_by, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
 
 # ---------- Task CRUD Handlers ----------
 
@@ -35,23 +49,35 @@ def create_task(payload: TaskCreate):
 
 
 @router.get("/", response_model=List[TaskWithSubTasks], name="list_tasks")
-def list_tasks(
+async def list_tasks(
+    response: Response,
     sort_by: str = Query("priority_desc"),
-    filters: Optional[str] = Query(None, description="JSON string with filter criteria")
+    filters: Optional[str] = Query(None, description="JSON filter expression (see /task/parents)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
 ):
-    """Return all top-level tasks with optional filtering and sorting."""
+    """Return all top-level tasks with optional filtering, sorting and cursor pagination."""
     try:
         filter_dict = json.loads(filters) if filters else None
-        return task_handler.list_tasks(sort_by=sort_by, filter_by=filter_dict)
+        tasks = await task_handler.list_tasks_async(sort_by=sort_by, filter_by=filter_dict, limit=limit, after=after)
+        _set_next_cursor(response, tasks, sort_by, limit)
+        return tasks
     except (ValueError, json.JSONDecodeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid filter parameters: {str(e)}")
 
 
 @router.get("/project/{project_id}", response_model=List[TaskWithSubTasks], name="list_tasks_by_project")
-def list_tasks_by_project(project_id: int):
+def list_tasks_by_project(
+    project_id: int,
+    response: Response,
+    sort_by: str = Query("priority_desc"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+):
     """Get all parent-level tasks for a specific project with their subtasks."""
     try: 
-        parent_tasks = task_handler.list_tasks_by_project(project_id)
+        parent_tasks = task_handler.list_tasks_by_project(project_id, sort_by=sort_by, limit=limit, after=after)
+        _set_next_cursor(response, parent_tasks, sort_by, limit)
         return parent_tasks
     
     except ValueError as e:
@@ -59,12 +85,22 @@ def list_tasks_by_project(project_id: int):
 
 
 @router.get("/user/{user_id}", response_model=List[TaskWithSubTasks], name="list_tasks_by_user")
-def list_tasks_by_user(user_id: int):
+async def list_tasks_by_user(
+    user_id: int,
+    response: Response,
+    sort_by: str = Query("priority_desc"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+):
     """Get all tasks assigned to a specific user."""
     try:
-        return assignment_handler.list_user_tasks(user_id)
+        tasks = await assignment_handler.list_user_tasks_async(user_id, sort_by=sort_by, limit=limit, after=after)
+        _set_next_cursor(response, tasks, sort_by, limit)
+        return tasks
     except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/project-user/{project_id}/{user_id}", response_model=List[TaskWithSubTasks], name="list_project_tasks_by_user")
@@ -110,25 +146,29 @@ def list_tasks_by_director(director_id: int):
 
 @router.get("/parents", response_model=List[TaskRead], name="list_parent_tasks")
 def list_parent_tasks(
+    response: Response,
     # checking for "?sort_by=...&filters=..." in the URL
     sort_by: str = Query("priority_desc", description="Sort criteria"),
-    filters: str = Query(None, description="JSON string with filter criteria. Date ranges (deadline_range, start_date_range) can be combined. Other filters (priority_range, status) must be used separately.")
+    filters: str = Query(None, description="JSON filter expression, e.g. {\"status\": [\"To-do\"], \"or\": [{\"tag\": \"urgent\"}, {\"priority_range\": [8, 10]}]}. Keys are ANDed; \"and\"/\"or\" nest."),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
 ):
-    """Return all parent-level tasks without their subtasks."""
-    """Return all top-level tasks with optional filtering and sorting. Date ranges can be combined; other filters are mutually exclusive."""
+    """Return all parent-level tasks without their subtasks, with optional filtering, sorting and cursor pagination."""
     
     try:
         filter_dict = json.loads(filters) if filters else None
-        return task_handler.list_parent_tasks(sort_by=sort_by, filter_by=filter_dict)
+        tasks = task_handler.list_parent_tasks(sort_by=sort_by, filter_by=filter_dict, limit=limit, after=after)
+        _set_next_cursor(response, tasks, sort_by, limit)
+        return tasks
     except (ValueError, json.JSONDecodeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid filter parameters: {str(e)}")
 
 
 @router.get("/{task_id}", response_model=TaskWithSubTasks, name="get_task")
-def get_task(task_id: int):
+async def get_task(task_id: int):
     """Get a task by id; return it with its subtasks."""
     try:
-        task = task_handler.get_task(task_id)
+        task = await task_handler.get_task_async(task_id)
     except ValueError:
         raise HTTPException(404, "Task not found")
     return task
@@ -179,6 +219,18 @@ def list_subtasks(task_id: int):
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/{task_id}/tree", response_model=TaskTree, name="get_task_tree")
+def get_task_tree(
+    task_id: int,
+    max_depth: Optional[int] = Query(None, ge=0, description="Levels of subtasks to include below the task; omit for the whole tree"),
+):
+    """Return a task with its entire subtree nested, loaded in a single query."""
+    try:
+        return task_handler.get_task_tree(task_id, max_depth)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.post("/{parent_id}/subtasks", response_model=TaskWithSubTasks, name="attach_subtasks")
 def attach_subtasks(parent_id: int, payload: SubtaskIds):
     """
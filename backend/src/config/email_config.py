@@ -5,6 +5,8 @@ import os
 from pydantic_settings import BaseSettings
 from typing import Optional
 
+from backend.src.enums.email import EmailTransport
+
 
 class EmailSettings(BaseSettings):
     """Email configuration settings"""
@@ -26,6 +28,19 @@ class EmailSettings(BaseSettings):
     use_ssl: bool = False
     timeout: int = 60
 
+    # How batches (the outbox dispatcher) are sent: "smtplib" opens one blocking
+    # connection per batch; "aiosmtplib" keeps a pool of authenticated connections
+    # open and sends over up to smtp_pool_size of them at once
+    email_transport: EmailTransport = EmailTransport.SMTPLIB
+    smtp_pool_size: int = 4
+    # A pooled connection is closed and replaced after this many messages...
+    smtp_max_messages_per_connection: int = 100
+    # ...or when it has been idle this many seconds
+    smtp_idle_timeout: float = 30
+
+    # Directory for compiled email template bytecode, shared by worker processes (unset: compile in memory)
+    email_template_cache_dir: Optional[str] = None
+
     # Test/Dev convenience: force notification recipient for local runs
     # Set via env TEST_RECIPIENT_EMAIL / TEST_RECIPIENT_NAME
     test_recipient_email: Optional[str] = None
@@ -38,4 +53,35 @@ class EmailSettings(BaseSettings):
 
 def get_email_settings() -> EmailSettings:
     """Create a fresh EmailSettings instance (reads current env)."""
-    return EmailSettings()
\ No newline at end of file
+    return EmailSettings()
+
+class OutboxSettings(BaseSettings):
+    """Email outbox dispatcher settings; EMAIL_OUTBOX_-prefixed env vars (e.g. EMAIL_OUTBOX_BATCH_SIZE=100)"""
+
+    # Run the background dispatcher with the API (off: rows wait until dispatch_once is called)
+    autostart: bool = True
+
+    # Seconds between polls while the outbox is empty
+    poll_interval: float = 2.0
+
+    # Messages sent per SMTP connection
+    batch_size: int = 50
+
+    # A claimed row is retried by any dispatcher if not settled within this many seconds
+    lease_seconds: int = 300
+
+    # Retry backoff: base * 2^(attempts - 1) seconds, capped; failed for good after max_attempts
+    backoff_base_seconds: float = 30
+    backoff_max_seconds: float = 3600
+    max_attempts: int = 6
+
+    class Config:
+        env_prefix = "EMAIL_OUTBOX_"
+        env_file = ".env"
+        case_sensitive = False
+        extra = "ignore"
+
+
+def get_outbox_settings() -> OutboxSettings:
+    """Create a fresh OutboxSettings instance (reads current env)."""
+    return OutboxSettings()
@@ -0,0 +1,38 @@
+"""
+Notification coalescing, digest and background worker settings
+"""
+from typing import List
+from pydantic_settings import BaseSettings
+
+
+class NotificationSettings(BaseSettings):
+    """Notification settings; NOTIFICATION_-prefixed env vars (e.g. NOTIFICATION_COALESCE_WINDOW_SECONDS=120)"""
+
+    # Hold activity notifications this many seconds and send each recipient one email
+    # for everything that happened in the window (0: send every notification at once)
+    coalesce_window_seconds: float = 0
+
+    # Recipients who get one daily digest instead, as a JSON list: '["a@example.com"]'
+    digest_recipients: List[str] = []
+
+    # UTC hour at which daily digests are sent
+    digest_hour_utc: int = 8
+
+    # Threads that run background notification work, and how many jobs may wait for
+    # them; with the queue full the submitting request runs the job itself
+    workers: int = 4
+    queue_size: int = 256
+
+    # On shutdown, seconds to wait for queued notification work before dropping it
+    drain_timeout_seconds: float = 10
+
+    class Config:
+        env_prefix = "NOTIFICATION_"
+        env_file = ".env"
+        case_sensitive = False
+        extra = "ignore"
+
+
+def get_notification_settings() -> NotificationSettings:
+    """Create a fresh NotificationSettings instance (reads current env)."""
+    return NotificationSettings()
@@ -0,0 +1,34 @@
+"""
+Report job settings (render worker pool and on-disk result cache)
+"""
+import tempfile
+from pathlib import Path
+from pydantic_settings import BaseSettings
+
+
+class ReportSettings(BaseSettings):
+    """Report job settings; REPORT_-prefixed env vars (e.g. REPORT_WORKERS=4)"""
+
+    # Worker processes that render PDF / Excel jobs
+    workers: int = 2
+
+    # Finished artifacts, one file per project / format / data version
+    cache_dir: Path = Path(tempfile.gettempdir()) / "kira-report-cache"
+
+    # Portfolio reports kept per format (newest first); a project keeps only its latest version
+    portfolio_cache_files: int = 50
+
+    # Incremental export watermarks are set back this far, so a task change flushed before an
+    # export started but committed after it is exported next time; keep it above the longest write transaction
+    export_watermark_lag_seconds: float = 60
+
+    class Config:
+        env_prefix = "REPORT_"
+        env_file = ".env"
+        case_sensitive = False
+        extra = "ignore"
+
+
+def get_report_settings() -> ReportSettings:
+    """Create a fresh ReportSettings instance (reads current env)."""
+    return ReportSettings()
@@ -1,18 +1,226 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-import os
+from typing import Iterator, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
+
+from backend.src.config.db_config import DatabaseSettings, get_db_settings
 
 #/.../backend/src/database
 SRC_DIR = Path(__file__).resolve().parent
-DB_PATH = SRC_DIR / "kira.db" 
-ECHO = os.getenv("DB_ECHO", "0") == "1"
+DB_PATH = SRC_DIR / "kira.db"
+DEFAULT_DATABASE_URL = f"sqlite:///{DB_PATH}"
+
+TUNED_PROFILE = "tuned"
+BASELINE_PROFILE = "baseline"
+
+# asyncio DBAPI used for each backend by the async engine
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "psycopg"}
+
+
+def apply_sqlite_pragmas(engine: Engine, settings: DatabaseSettings) -> None:
+    """Run the tuned-profile PRAGMAs on every new DBAPI connection of engine."""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cur = dbapi_connection.cursor()
+        cur.execute(f"PRAGMA journal_mode={settings.journal_mode}")
+        cur.execute(f"PRAGMA synchronous={settings.synchronous}")
+        cur.execute(f"PRAGMA mmap_size={int(settings.mmap_size)}")
+        cur.execute(f"PRAGMA cache_size={int(settings.cache_size)}")
+        cur.execute(f"PRAGMA busy_timeout={int(settings.busy_timeout)}")
+        cur.execute(f"PRAGMA foreign_keys={'ON' if settings.foreign_keys else 'OFF'}")
+        cur.close()
+
+
+def to_async_url(url: str) -> str:
+    """Same database as url, through the backend's asyncio driver (sqlite -> sqlite+aiosqlite)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or parsed.get_driver_name() in (driver, "asyncpg"):
+        return url
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def _engine_kwargs(url: str, settings: DatabaseSettings) -> dict:
+    """create_engine/create_async_engine keyword arguments shared by the sync and async engines."""
+    if make_url(url).get_backend_name() != "sqlite":
+        return dict(
+            echo=settings.echo,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_pre_ping=True,
+        )
+
+    if settings.profile not in (TUNED_PROFILE, BASELINE_PROFILE):
+        raise ValueError(f"Unknown DB profile '{settings.profile}'")
+
+    if settings.profile == BASELINE_PROFILE:
+        return dict(echo=settings.echo, connect_args={"check_same_thread": False})
+
+    return dict(
+        echo=settings.echo,
+        # sqlite3's own lock timeout (seconds) also covers the connect-time PRAGMAs
+        connect_args={"check_same_thread": False, "timeout": settings.busy_timeout / 1000},
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+    )
+
+
+def _is_tuned_sqlite(url: str, settings: DatabaseSettings) -> bool:
+    return make_url(url).get_backend_name() == "sqlite" and settings.profile == TUNED_PROFILE
+
+
+def make_engine(url: Optional[str] = None, settings: Optional[DatabaseSettings] = None) -> Engine:
+    """
+    Build the engine for url (default: DATABASE_URL, else the bundled SQLite file).
+    SQLite gets the configured profile; other backends (e.g. PostgreSQL) get a sized, pre-pinged pool.
+    """
+    settings = settings or get_db_settings()
+    url = url or settings.database_url or DEFAULT_DATABASE_URL
+
+    kwargs = _engine_kwargs(url, settings)
+    if not _is_tuned_sqlite(url, settings):
+        return create_engine(url, **kwargs)
+
+    # pysqlite defaults file databases to an unsized pool; use a sized QueuePool instead
+    engine = create_engine(url, poolclass=QueuePool, **kwargs)
+    apply_sqlite_pragmas(engine, settings)
+    return engine
+
+
+def make_async_engine(url: Optional[str] = None, settings: Optional[DatabaseSettings] = None) -> AsyncEngine:
+    """
+    Async counterpart of make_engine for the async routes: same database, profile and pool
+    settings, reached through the backend's asyncio driver (aiosqlite / psycopg).
+    """
+    settings = settings or get_db_settings()
+    url = url or settings.database_url or DEFAULT_DATABASE_URL
+
+    engine = create_async_engine(to_async_url(url), **_engine_kwargs(url, settings))
+    if _is_tuned_sqlite(url, settings):
+        # Pool events fire on the sync facade; the aiosqlite adapter runs the PRAGMAs
+        apply_sqlite_pragmas(engine.sync_engine, settings)
+    return engine
 
-engine = create_engine(
-    f"sqlite:///{DB_PATH}",
-    echo=ECHO,
-    connect_args={"check_same_thread": False},  
-)
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+# Sessions of the current request, one per sessionmaker (set by request_scope); None outside a request
+_request_sessions: ContextVar[Optional[dict]] = ContextVar("request_sessions", default=None)
+
+
+class RequestScopedSessionmaker:
+    """
+    sessionmaker facade used by the service layer.
+
+    Outside request_scope() it behaves exactly like the wrapped sessionmaker. Inside it,
+    `with SessionLocal()` and `with SessionLocal.begin()` hand out the request's session
+    (one connection checkout and one identity map per request). begin() blocks run as a
+    SAVEPOINT, so a block that raises still only undoes its own writes; the request
+    commits once when the scope ends.
+    """
+
+    def __init__(self, factory: sessionmaker):
+        self.factory = factory
+
+    def __call__(self):
+        session = self._request_session()
+        return self.factory() if session is None else _borrowed(session)
+
+    def begin(self):
+        session = self._request_session()
+        return self.factory.begin() if session is None else _borrowed(session, savepoint=True)
+
+    def __getattr__(self, name):
+        # configure(), kw, class_ ... of the wrapped sessionmaker
+        return getattr(self.factory, name)
+
+    def _request_session(self) -> Optional[Session]:
+        sessions = _request_sessions.get()
+        if sessions is None:
+            return None
+        if self.factory not in sessions:
+            sessions[self.factory] = self.factory()
+        return sessions[self.factory]
+
+
+@contextmanager
+def _borrowed(session: Session, *, savepoint: bool = False) -> Iterator[Session]:
+    """The request's session for one service call; closing it is left to request_scope."""
+    if not savepoint:
+        yield session
+        return
+    _begin_outer_transaction(session)
+    with session.begin_nested():
+        yield session
+
+
+def _begin_outer_transaction(session: Session) -> None:
+    """
+    pysqlite only emits BEGIN before DML, so a SAVEPOINT issued first would open the
+    transaction itself and its RELEASE would commit; start the request's transaction explicitly.
+    """
+    connection = session.connection()
+    if connection.dialect.name != "sqlite":
+        return
+    dbapi_connection = connection.connection.driver_connection
+    if not dbapi_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN")
+
+
+@contextmanager
+def request_sessions() -> Iterator[dict]:
+    """
+    Make RequestScopedSessionmaker hand out shared sessions for the duration of the
+    block; yields the dict they are kept in, for end_request_sessions().
+    """
+    sessions: dict = {}
+    token = _request_sessions.set(sessions)
+    try:
+        yield sessions
+    finally:
+        _request_sessions.reset(token)
+
+
+def end_request_sessions(sessions: dict, *, commit: bool) -> None:
+    """Commit (or roll back) every session a request opened, then close them all."""
+    try:
+        for session in sessions.values():
+            if commit:
+                session.commit()
+            else:
+                session.rollback()
+    finally:
+        for session in sessions.values():
+            session.close()
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """
+    Unit of work: every RequestScopedSessionmaker used inside shares one session per
+    sessionmaker, committed on success and rolled back if the block raises.
+    """
+    with request_sessions() as sessions:
+        try:
+            yield
+        except BaseException:
+            end_request_sessions(sessions, commit=False)
+            raise
+        end_request_sessions(sessions, commit=True)
+
+
+engine = make_engine()
+async_engine = make_async_engine()
+
+SessionLocal = RequestScopedSessionmaker(
+    sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
@@ -8,6 +8,9 @@ from backend.src.database.models.comment import Comment
 from backend.src.database.models.department import Department
 from backend.src.database.models.task_assignment import TaskAssignment
 from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task_closure import TaskClosure
+from backend.src.database.models.email_outbox import EmailOutbox
+from backend.src.database.models.notification_buffer import NotificationBuffer
 
 # Create tables
 Base.metadata.create_all(engine)
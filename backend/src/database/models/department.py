@@ -7,7 +7,13 @@ class Department(Base):
 
     department_id = Column(Integer, primary_key=True, autoincrement=True)
     department_name = Column(String, nullable=False, index=True)
-    manager_id = Column(Integer, ForeignKey("user.user_id", ondelete="SET NULL"), nullable=False)
+    # department <-> user reference each other; use_alter lets backends with ALTER (PostgreSQL)
+    # add this constraint after both tables exist and drop it first on teardown
+    manager_id = Column(
+        Integer,
+        ForeignKey("user.user_id", ondelete="SET NULL", use_alter=True, name="fk_department_manager_id_user"),
+        nullable=False,
+    )
     teams = relationship("Team", back_populates="department")
     users = relationship("User", back_populates="department", foreign_keys="User.department_id")
     manager = relationship("User", back_populates="managed_departments", foreign_keys=[manager_id])
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+from backend.src.database.db_setup import Base
+from backend.src.database.models.task import utcnow
+from backend.src.enums.email import EmailType, OutboxStatus
+
+class EmailOutbox(Base):
+    """
+    One rendered email waiting to be sent (or sent / given up on). Rows are written
+    in the same transaction as the change they report and sent later by
+    services/email_dispatcher; times are naive UTC.
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    email_type = Column(String(32), nullable=False, default=EmailType.GENERAL_NOTIFICATION.value)
+    subject = Column(String(200), nullable=False)
+    to_addrs = Column(JSON, nullable=False)
+    cc_addrs = Column(JSON, nullable=True)
+    text_body = Column(Text, nullable=True)
+    html_body = Column(Text, nullable=True)
+
+    status = Column(String(16), nullable=False, default=OutboxStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    # When the row is next due; while a dispatcher holds it, the end of its lease
+    next_attempt_at = Column(DateTime, nullable=False, default=utcnow)
+    last_error = Column(Text, nullable=True)
+    message_id = Column(String(256), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # The dispatcher's claim: due pending rows, oldest first
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, Index, UniqueConstraint
+from backend.src.database.db_setup import Base
+from backend.src.database.models.task import utcnow
+
+class NotificationBuffer(Base):
+    """
+    Activity notifications held for one recipient about one task until due_at, with
+    the field changes merged across events. services/notification_buffer turns the due
+    rows of a recipient into one email; times are naive UTC.
+    """
+    __tablename__ = "notification_buffer"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    recipient = Column(String(256), nullable=False)
+    task_id = Column(Integer, nullable=False)
+    task_title = Column(String(200), nullable=False, default="")
+    # [{"type": NotificationType value, "actor": who triggered it}], oldest first
+    events = Column(JSON, nullable=False, default=list)
+    # Net task changes over the buffered events: field -> value before the first / after the last
+    updated_fields = Column(JSON, nullable=False, default=list)
+    old_values = Column(JSON, nullable=False, default=dict)
+    new_values = Column(JSON, nullable=False, default=dict)
+    digest = Column(Boolean, nullable=False, default=False)
+    due_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("recipient", "task_id", name="uq_notification_buffer_recipient_task"),
+        Index("ix_notification_buffer_due_at", "due_at"),
+    )
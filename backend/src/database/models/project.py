@@ -1,6 +1,17 @@
+import time
+import uuid
+from itertools import chain
+from typing import Iterable
+
 from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, UniqueConstraint, PrimaryKeyConstraint
+from sqlalchemy import event, inspect, or_, select, update
 from backend.src.database.db_setup import Base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
+
+
+def new_report_version() -> str:
+    # Clock first (fixed-width hex nanoseconds), then random bits: a later version sorts after an earlier one
+    return f"{time.time_ns():016x}{uuid.uuid4().hex[:16]}"
 
 
 class Project(Base):
@@ -10,6 +21,9 @@ class Project(Base):
     project_name = Column(String, nullable=False)
     project_manager = (Column(Integer, ForeignKey("user.user_id"), nullable=True))
     active = Column(Boolean, nullable=False, default=True)
+    # Replaced whenever anything a project report shows changes (see _refresh_report_versions);
+    # a time-ordered random token rather than a counter so it never repeats after the database is rebuilt
+    report_version = Column(String(32), nullable=True, default=new_report_version)
 
     tasks = relationship(
         "Task", back_populates="project", cascade="all, delete-orphan"
@@ -26,4 +40,103 @@ class ProjectAssignment(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint("project_id", "user_id", name="pk_project_user"),
-    )
\ No newline at end of file
+    )
+
+
+def touch_project_reports(
+    connection,
+    project_ids: Iterable[int] = (),
+    task_ids: Iterable[int] = (),
+    user_ids: Iterable[int] = (),
+) -> None:
+    """
+    Give a new report_version to the given projects, the projects of the given tasks,
+    and the projects with tasks assigned to the given users (one UPDATE). The given
+    tasks and the users' tasks also get a new updated_at, since their assignee lists
+    or their place in the task hierarchy changed (one more UPDATE).
+    """
+    from backend.src.database.models.task import Task, utcnow
+    from backend.src.database.models.task_assignment import TaskAssignment
+
+    project_ids, task_ids, user_ids = set(project_ids) - {None}, set(task_ids) - {None}, set(user_ids) - {None}
+    project = Project.__table__
+    conditions = []
+    if project_ids:
+        conditions.append(project.c.project_id.in_(project_ids))
+    if task_ids:
+        conditions.append(project.c.project_id.in_(select(Task.project_id).where(Task.id.in_(task_ids))))
+    if user_ids:
+        conditions.append(project.c.project_id.in_(
+            select(Task.project_id)
+            .join(TaskAssignment, TaskAssignment.task_id == Task.id)
+            .where(TaskAssignment.user_id.in_(user_ids))
+        ))
+    if conditions:
+        connection.execute(update(project).where(or_(*conditions)).values(report_version=new_report_version()))
+
+    task = Task.__table__
+    task_conditions = []
+    if task_ids:
+        task_conditions.append(task.c.id.in_(task_ids))
+    if user_ids:
+        task_conditions.append(task.c.id.in_(
+            select(TaskAssignment.task_id).where(TaskAssignment.user_id.in_(user_ids))
+        ))
+    if task_conditions:
+        connection.execute(update(task).where(or_(*task_conditions)).values(updated_at=utcnow()))
+
+
+# session.info key: tasks of the users being deleted, noted before the flush removes their assignments
+_DELETED_ASSIGNEE_TASKS = "report_deleted_assignee_tasks"
+
+
+@event.listens_for(Session, "before_flush")
+def _note_deleted_assignees(session, flush_context, instances):
+    """Note the tasks assigned to users about to be deleted, while their task_assignment rows still exist."""
+    from backend.src.database.models.task_assignment import TaskAssignment
+    from backend.src.database.models.user import User
+
+    user_ids = {obj.user_id for obj in session.deleted if isinstance(obj, User)}
+    if not user_ids:
+        session.info.pop(_DELETED_ASSIGNEE_TASKS, None)
+        return
+    with session.no_autoflush:
+        session.info[_DELETED_ASSIGNEE_TASKS] = set(session.execute(
+            select(TaskAssignment.task_id).where(TaskAssignment.user_id.in_(user_ids))
+        ).scalars())
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_report_versions(session, flush_context):
+    """
+    Touch the projects whose report content (project row, tasks, assignees, assignee
+    names, which tasks are top-level) was flushed. A deleted user counts for every
+    task they were assigned to (see _note_deleted_assignees).
+    """
+    from backend.src.database.models.parent_assignment import ParentAssignment
+    from backend.src.database.models.task import Task
+    from backend.src.database.models.task_assignment import TaskAssignment
+    from backend.src.database.models.user import User
+
+    project_ids, task_ids, user_ids = set(), set(session.info.pop(_DELETED_ASSIGNEE_TASKS, ())), set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Task):
+            if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+                continue
+            history = inspect(obj).attrs.project_id.history
+            project_ids.update(chain(history.added, history.unchanged, history.deleted))
+        elif isinstance(obj, TaskAssignment):
+            task_ids.add(obj.task_id)
+        elif isinstance(obj, ParentAssignment) and obj not in session.dirty:
+            # Linking / unlinking a subtask changes which tasks are top-level in both tasks' projects
+            task_ids.update((obj.parent_id, obj.subtask_id))
+        elif isinstance(obj, User) and obj in session.dirty:
+            state = inspect(obj).attrs
+            if state.name.history.has_changes() or state.email.history.has_changes():
+                user_ids.add(obj.user_id)
+        elif isinstance(obj, Project) and obj in session.dirty:
+            if session.is_modified(obj, include_collections=False):
+                project_ids.add(obj.project_id)
+
+    if project_ids or task_ids or user_ids:
+        touch_project_reports(session.connection(), project_ids, task_ids, user_ids)
@@ -1,5 +1,7 @@
+from datetime import datetime, timezone
+
 from sqlalchemy import (
-    Column, Integer, String, Date, ForeignKey, CheckConstraint, Index, Boolean, text
+    Column, Integer, String, Date, DateTime, ForeignKey, CheckConstraint, Index, Boolean, text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.associationproxy import association_proxy
@@ -9,6 +11,12 @@ from backend.src.database.models.parent_assignment import ParentAssignment
 from backend.src.enums.task_status import TaskStatus
 from backend.src.database.models.comment import Comment
 
+
+def utcnow() -> datetime:
+    """Naive UTC timestamp, as stored in updated_at."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Task(Base):
     
     __tablename__ = "task"  
@@ -27,6 +35,8 @@ class Task(Base):
 
     project_id  = Column(Integer, ForeignKey("project.project_id", ondelete="SET NULL"), nullable=True)
     active      = Column(Boolean, nullable=False, default=True)
+    # Last change to anything the task's export row shows, assignees included (UTC)
+    updated_at  = Column(DateTime, nullable=True, default=utcnow, onupdate=utcnow)
 
     # --- Association-object relationships ---
     # One parent -> many link rows (each link points to a subtask)
@@ -63,4 +73,16 @@ class Task(Base):
     __table_args__ = (
         CheckConstraint("priority >= 1 AND priority <= 10", name="ck_priority_range"),
         Index("ix_task_project_active_deadline", "project_id", "active", "deadline"),
+        # Incremental exports: a project's tasks changed since a timestamp
+        Index("ix_task_project_updated_at", "project_id", "updated_at"),
+        # One index per TaskSort (see services/task_paging.SORT_KEYS) so listings read rows
+        # in sort order instead of sorting them. NULLs-last keys are indexed as
+        # (col IS NULL, col); the trailing id tie-breaker is the implicit rowid.
+        Index("ix_task_sort_priority_desc", active, priority.desc(), deadline.is_(None), deadline),
+        Index("ix_task_sort_priority_asc", active, priority, deadline.is_(None), deadline),
+        Index("ix_task_sort_start_date_asc", active, start_date.is_(None), start_date, priority.desc()),
+        Index("ix_task_sort_start_date_desc", active, start_date.is_(None), start_date.desc(), priority.desc()),
+        Index("ix_task_sort_deadline_asc", active, deadline.is_(None), deadline, priority.desc()),
+        Index("ix_task_sort_deadline_desc", active, deadline.is_(None), deadline.desc(), priority.desc()),
+        Index("ix_task_sort_status", active, status.desc(), priority.desc()),
     )
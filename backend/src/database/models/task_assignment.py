@@ -14,4 +14,6 @@ class TaskAssignment(Base):
     __table_args__ = (
         PrimaryKeyConstraint("task_id", "user_id", name="pk_task_assignment"),
         Index("ix_task_assignment_task_user", "task_id", "user_id"),
+        # user -> tasks lookups (a user's tasks, team members' tasks)
+        Index("ix_task_assignment_user_task", "user_id", "task_id"),
     )
\ No newline at end of file
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, ForeignKey, CheckConstraint, Index
+from backend.src.database.db_setup import Base
+
+class TaskClosure(Base):
+    __tablename__ = "task_closure"
+
+    # One row per (ancestor, descendant) pair in the task/subtask hierarchy.
+    # depth = number of parent_assignment hops between the two (1 = direct parent).
+    ancestor_id   = Column(Integer, ForeignKey("task.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("task.id", ondelete="CASCADE"), primary_key=True)
+    depth         = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("depth >= 1", name="ck_task_closure_depth"),
+        # PK (ancestor_id, descendant_id) serves "all descendants of X";
+        # this one serves "all ancestors of X" and the cycle check.
+        Index("ix_task_closure_descendant_ancestor", "descendant_id", "ancestor_id", "depth"),
+    )
+
+    # NOTE: maintained by services/task.py alongside parent_assignment;
+    # use init_scripts/rebuild_task_closure.py to backfill existing databases
@@ -1,7 +1,18 @@
 from sqlalchemy import Column, Integer, String, UniqueConstraint, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from backend.src.database.db_setup import Base
 
+# team_number is DDTTSS: department, team, subteam
+DEPARTMENT_PREFIX_LEN = 2
+TEAM_PREFIX_LEN = 4
+
+
+def _prefix_default(length: int):
+    """Column default for Core inserts that only supply team_number."""
+    def default(context):
+        return context.get_current_parameters()["team_number"][:length]
+    return default
+
 
 class Team(Base):
     __tablename__ = "team"
@@ -12,6 +23,11 @@ class Team(Base):
     department_id = Column(Integer, ForeignKey("department.department_id", ondelete="CASCADE"), nullable=False)
     team_number = Column(String, nullable=False)
 
+    # Stored prefixes of team_number so department / team hierarchy lookups are
+    # index equality scans instead of LIKE over every row. Kept in sync below.
+    department_prefix = Column(String(DEPARTMENT_PREFIX_LEN), default=_prefix_default(DEPARTMENT_PREFIX_LEN), index=True)
+    team_prefix = Column(String(TEAM_PREFIX_LEN), default=_prefix_default(TEAM_PREFIX_LEN), index=True)
+
     department = relationship("Department", back_populates="teams")
 
     team_members = relationship(
@@ -19,3 +35,9 @@ class Team(Base):
     )
 
     manager = relationship("User", back_populates="managed_teams", foreign_keys=[manager_id])
+
+    @validates("team_number")
+    def _sync_prefixes(self, key, team_number):
+        self.department_prefix = team_number[:DEPARTMENT_PREFIX_LEN]
+        self.team_prefix = team_number[:TEAM_PREFIX_LEN]
+        return team_number
@@ -0,0 +1,90 @@
+"""
+Per-request SQL statement counting.
+
+SQLAlchemy cursor events on every Engine record each statement into the QueryStats
+of the current context (opened with track_queries(); the API middleware opens one
+per request). Statements are grouped by shape, i.e. the SQL with its bound values
+left out, so the same query issued in a loop (N+1) shows up as one shape with a
+high count.
+"""
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+# IN (?, ?, ?) / IN (%(p_1)s, %(p_2)s) -> IN (?) so expanding IN lists of any length share a shape
+_PARAM_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|%s|:\w+)\s*,)+\s*(?:\?|%\(\w+\)s|%s|:\w+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalized SQL used to group repeats of the same query."""
+    return _PARAM_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    """Statements executed (and time spent in the database) within one track_queries() block."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Shapes executed more than threshold times, most frequent first."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_start")
+    if starts:
+        stats.total_seconds += time.perf_counter() - starts.pop()
+    stats.count += 1
+    stats.shapes[statement_shape(statement)] += 1
+
+
+def install_query_hooks() -> None:
+    """Listen on every Engine (sync and the sync side of async engines); safe to call repeatedly."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements run inside the block, e.g. to assert a query budget:
+
+        with track_queries() as stats:
+            task_service.list_tasks()
+        assert stats.count <= 2
+    """
+    install_query_hooks()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
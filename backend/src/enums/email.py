@@ -9,3 +9,14 @@ class EmailType(str, Enum):
     UPCOMING_DEADLINE = "upcoming_deadline"
     OVERDUE_DEADLINE = "overdue_deadline"
     GENERAL_NOTIFICATION = "general_notification"
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class EmailTransport(str, Enum):
+    SMTPLIB = "smtplib"
+    AIOSMTPLIB = "aiosmtplib"
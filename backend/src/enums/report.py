@@ -0,0 +1,42 @@
+from enum import Enum
+
+
+class ReportFormat(str, Enum):
+    PDF = "pdf"
+    EXCEL = "excel"
+
+    @property
+    def extension(self) -> str:
+        return {ReportFormat.PDF: "pdf", ReportFormat.EXCEL: "xlsx"}[self]
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ReportFormat.PDF: "application/pdf",
+            ReportFormat.EXCEL: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        }[self]
+
+
+class ReportJobStatus(str, Enum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ExportFormat(str, Enum):
+    """Raw schedule data exports (one row per task), as opposed to rendered reports."""
+    CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+    @property
+    def extension(self) -> str:
+        return {ExportFormat.CSV: "csv", ExportFormat.PARQUET: "parquet", ExportFormat.ARROW: "arrows"}[self]
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.CSV: "text/csv; charset=utf-8",
+            ExportFormat.PARQUET: "application/vnd.apache.parquet",
+            ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+        }[self]
@@ -5,5 +5,13 @@ class TaskFilter(str, Enum):
     STATUS = "status"
     DEADLINE_RANGE = "deadline_range"
     START_DATE_RANGE = "start_date_range"
+    TAG = "tag"
+    PROJECT = "project_id"
+    ASSIGNEE = "assignee_id"
 
-ALLOWED_FILTERS = {f.value for f in TaskFilter}
\ No newline at end of file
+class FilterCombinator(str, Enum):
+    AND = "and"
+    OR = "or"
+
+ALLOWED_FILTERS = {f.value for f in TaskFilter}
+ALLOWED_COMBINATORS = {c.value for c in FilterCombinator}
@@ -1,8 +1,8 @@
-import threading
 from backend.src.services import task as task_service
 from backend.src.services import user as user_service
 from backend.src.services import comment as comment_service
 from backend.src.services import task_assignment as assignment_service
+from backend.src.services import notification_dispatch
 from backend.src.services.notification import get_notification_service
 from backend.src.enums.notification import NotificationType
 
@@ -19,12 +19,9 @@ def add_comment(task_id: int, user_id: int, comment_text: str, recipient_emails:
 
     comment = comment_service.add_comment(task_id, user_id, comment_text)
 
-    recipients: set[str] = set()
-    if recipient_emails:
-        for email in recipient_emails:
-            recipient_user = user_service.get_user(email)
-            if recipient_user and getattr(recipient_user, "email", None):
-                recipients.add(recipient_user.email)
+    recipients: set[str] = {
+        u.email for u in user_service.get_users_by_identifiers(recipient_emails or []).values() if u.email
+    }
 
     assignees = assignment_service.list_assignees(task_id)
     for u in assignees or []:
@@ -35,17 +32,14 @@ def add_comment(task_id: int, user_id: int, comment_text: str, recipient_emails:
     commenter_email = getattr(user, "email", None) or "system@kira.local"
     commenter_name = getattr(user, "name", None) or commenter_email
 
-    threading.Thread(
-        target=comment_service._send_notify,
-        kwargs={
-            "task_id": task_id,
-            "task_title": task_title,
-            "commenter_email": commenter_email,
-            "commenter_name": commenter_name,
-            "recipients": sorted(recipients) if recipients else None,
-        },
-        daemon=True,
-    ).start()
+    notification_dispatch.submit(
+        comment_service._send_notify,
+        task_id=task_id,
+        task_title=task_title,
+        commenter_email=commenter_email,
+        commenter_name=commenter_name,
+        recipients=sorted(recipients) if recipients else None,
+    )
 
     return comment
 
@@ -102,9 +96,7 @@ def notify_comment_mentions(task_id: int, user_id: int, recipient_emails: list[s
         raise ValueError(f"User {user_id} not found")
 
     valid_recipients: set[str] = {
-        u.email
-        for u in (user_service.get_user(email) for email in (recipient_emails or []))
-        if u and getattr(u, "email", None)
+        u.email for u in user_service.get_users_by_identifiers(recipient_emails or []).values() if u.email
     }
 
     if not valid_recipients:
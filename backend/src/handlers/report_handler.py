@@ -3,11 +3,21 @@ Report handler for project schedule reports.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
+import shutil
+import tempfile
 from io import BytesIO
-from typing import Dict, List
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
+from backend.src.config.report_config import get_report_settings
+from backend.src.database.models.task import Task, utcnow
+from backend.src.enums.report import ExportFormat, ReportFormat
 from backend.src.services import report as report_service
+from backend.src.services import report_export as report_export_service
+from backend.src.services import report_jobs as report_jobs_service
 from backend.src.services import project as project_service
 from backend.src.services import task as task_service
 from backend.src.services import task_assignment as task_assignment_service
@@ -15,29 +25,41 @@ from backend.src.services import task_assignment as task_assignment_service
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Excel exports stay in memory up to this size, then spill to a temp file on disk
+EXCEL_SPOOL_MAX_BYTES = 8 * 1024 * 1024
 
-def generate_pdf_report(project_id: int) -> BytesIO:
+# Upper bound on projects in one portfolio report
+PORTFOLIO_MAX_PROJECTS = 100
+
+# Parquet exports are built in memory up to this size, then spill to a temp file on disk
+PARQUET_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _load_report_data(project_id: int) -> Tuple[Dict[str, Any], Iterator[Any], Dict[int, List[str]]]:
     """
-    Generate a PDF report for a project.
-    Returns BytesIO buffer with PDF content.
+    Project row, its active top-level tasks and each task's assignee names (name, else email).
+    The tasks are plain rows of REPORT_TASK_COLUMNS, read in batches as they are iterated
+    (iterate them once), so a large project is never loaded as Task objects.
     """
     project = project_service.get_project_by_id(project_id)
     if not project:
         raise ValueError(f"Project {project_id} not found")
-    tasks = task_service.list_tasks_by_project(project_id, active_only=True)
-    task_assignees: Dict[int, List[str]] = {}
-    for task in tasks:
-        assignees = task_assignment_service.list_assignees(task.id)
-        assignee_names = []
-        for assignee in assignees:
-            name = assignee.name if assignee.name else assignee.email
-            assignee_names.append(name)
-        task_assignees[task.id] = assignee_names
+    task_assignees = task_assignment_service.assignee_names_by_task(project_id, active_only=True)
+    tasks = task_service.iter_task_rows_by_project(project_id, report_service.REPORT_TASK_COLUMNS, active_only=True)
+    return project, tasks, task_assignees
+
+
+def generate_pdf_report(project_id: int) -> BytesIO:
+    """
+    Generate a PDF report for a project.
+    Returns BytesIO buffer with PDF content.
+    """
+    project, tasks, task_assignees = _load_report_data(project_id)
     
     logger.info(f"Generating PDF report for project {project_id}")
     
     try:
-        pdf_buffer = report_service.generate_pdf_report(project, tasks, task_assignees)
+        pdf_buffer = report_service.generate_pdf_report(project, list(tasks), task_assignees)
         logger.info(f"Successfully generated PDF report for project {project_id}")
         return pdf_buffer
     except Exception as e:
@@ -45,31 +67,212 @@ def generate_pdf_report(project_id: int) -> BytesIO:
         raise
 
 
-def generate_excel_report(project_id: int) -> BytesIO:
+def generate_excel_report(project_id: int) -> BinaryIO:
     """
     Generate an Excel report for a project.
-    Returns BytesIO buffer with Excel content.
+    Returns a SpooledTemporaryFile with the Excel content, rewound to the start;
+    the caller closes it.
     """
-    project = project_service.get_project_by_id(project_id)
-    if not project:
-        raise ValueError(f"Project {project_id} not found")
-    tasks = task_service.list_tasks_by_project(project_id, active_only=True)
-    task_assignees: Dict[int, List[str]] = {}
-    for task in tasks:
-        assignees = task_assignment_service.list_assignees(task.id)
-        assignee_names = []
-        for assignee in assignees:
-            name = assignee.name if assignee.name else assignee.email
-            assignee_names.append(name)
-        task_assignees[task.id] = assignee_names
+    project, tasks, task_assignees = _load_report_data(project_id)
     
     logger.info(f"Generating Excel report for project {project_id}")
     
     try:
-        excel_buffer = report_service.generate_excel_report(project, tasks, task_assignees)
+        spool = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_BYTES)
+        try:
+            excel_buffer = report_service.generate_excel_report(project, tasks, task_assignees, out=spool)
+        except Exception:
+            spool.close()
+            raise
         logger.info(f"Successfully generated Excel report for project {project_id}")
         return excel_buffer
     except Exception as e:
         logger.error(f"Error generating Excel report for project {project_id}: {str(e)}")
         raise
 
+
+def get_report_version(project_id: int) -> str:
+    """The project's report data version: changes whenever anything its reports show changes."""
+    version = project_service.get_report_version(project_id)
+    if version is None:
+        raise ValueError(f"Project {project_id} not found")
+    return version
+
+
+def report_etag(project_id: int, report_format: ReportFormat, version: str) -> str:
+    return f'"{project_id}-{report_format.value}-{version}"'
+
+
+def export_report(project_id: int, report_format: ReportFormat, version: str) -> Path:
+    """
+    Path of the rendered report for this data version, from the report cache when it
+    was rendered before; otherwise rendered now and stored there.
+    Read `version` before calling: the file is then never older than its version.
+    """
+    path = report_jobs_service.cache_path(project_id, report_format, version)
+    if path.exists():
+        logger.info(f"Serving cached {report_format.value} report for project {project_id} ({version})")
+        return path
+
+    render = generate_pdf_report if report_format == ReportFormat.PDF else generate_excel_report
+    buffer = render(project_id)
+    try:
+        return report_jobs_service.write_cache_file(path, lambda out: shutil.copyfileobj(buffer, out))
+    finally:
+        buffer.close()
+
+
+def resolve_portfolio(
+    project_ids: Optional[List[int]] = None,
+    manager_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+) -> List[int]:
+    """
+    Project ids of a portfolio, given exactly one of: explicit project ids,
+    a manager (projects they manage) or a department (projects its managers manage).
+    """
+    selectors = [bool(project_ids), manager_id is not None, department_id is not None]
+    if sum(selectors) != 1:
+        raise ValueError("Give exactly one of project_ids, manager_id or department_id")
+    if project_ids:
+        ids = sorted(set(project_ids))
+    else:
+        if manager_id is not None:
+            projects = project_service.get_projects_by_manager(manager_id)
+            owner = f"manager {manager_id}"
+        else:
+            projects = project_service.get_projects_by_department(department_id)
+            owner = f"department {department_id}"
+        if not projects:
+            raise ValueError(f"Projects for {owner} not found")
+        ids = sorted(project["project_id"] for project in projects)
+    if len(ids) > PORTFOLIO_MAX_PROJECTS:
+        raise ValueError(f"A portfolio report covers at most {PORTFOLIO_MAX_PROJECTS} projects, got {len(ids)}")
+    return ids
+
+
+def get_portfolio_version(project_ids: List[int]) -> str:
+    """Combined report version of the projects: changes when any of their reports would."""
+    versions = project_service.get_report_versions(project_ids)
+    for project_id in project_ids:
+        if project_id not in versions:
+            raise ValueError(f"Project {project_id} not found")
+    key = ",".join(f"{project_id}:{versions[project_id]}" for project_id in sorted(project_ids))
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def portfolio_etag(report_format: ReportFormat, version: str) -> str:
+    return f'"portfolio-{report_format.value}-{version}"'
+
+
+def _load_portfolio_data(
+    project_ids: List[int],
+) -> Tuple[List[Dict[str, Any]], Dict[int, List[Task]], Dict[int, List[str]]]:
+    """Projects, their active top-level tasks grouped by project, and assignee names: three queries in all."""
+    projects = project_service.get_projects_by_ids(project_ids)
+    tasks_by_project: Dict[int, List[Task]] = {project["project_id"]: [] for project in projects}
+    for task in task_service.list_tasks_by_projects(project_ids, active_only=True):
+        tasks_by_project[task.project_id].append(task)
+    names = task_assignment_service.assignee_names_by_task_in_projects(project_ids, active_only=True)
+    task_assignees = {task.id: names.get(task.id, []) for tasks in tasks_by_project.values() for task in tasks}
+    return projects, tasks_by_project, task_assignees
+
+
+def export_portfolio(project_ids: List[int], report_format: ReportFormat, version: str) -> Path:
+    """
+    Path of the rendered portfolio report for this combined version, from the report
+    cache when possible. PDF sections are rendered per project in the worker pool and
+    merged; Excel gets an overview sheet plus one sheet per project.
+    """
+    path = report_jobs_service.portfolio_cache_path(report_format, version)
+    if path.exists():
+        logger.info(f"Serving cached {report_format.value} portfolio report for projects {project_ids}")
+        return path
+
+    logger.info(f"Generating {report_format.value} portfolio report for projects {project_ids}")
+    projects, tasks_by_project, task_assignees = _load_portfolio_data(project_ids)
+    if report_format == ReportFormat.PDF:
+        sections = []
+        for project in projects:
+            tasks = [report_service.ReportTask.from_task(task) for task in tasks_by_project[project["project_id"]]]
+            sections.append((project, tasks, {task.id: task_assignees[task.id] for task in tasks}))
+        pdfs = report_jobs_service.render_pdf_sections(sections)
+        write = lambda out: report_service.merge_pdf_reports(
+            zip((project["project_name"] for project in projects), pdfs), out=out
+        )
+    else:
+        write = lambda out: report_service.generate_portfolio_excel_report(
+            projects, tasks_by_project, task_assignees, out=out
+        )
+    return report_jobs_service.write_cache_file(path, write)
+
+
+def export_tasks(
+    project_id: int,
+    export_format: ExportFormat,
+    changed_since: Optional[datetime] = None,
+) -> Tuple[datetime, Iterator[bytes]]:
+    """
+    Raw task + assignee rows of a project as CSV, Parquet or Arrow IPC chunks.
+    With changed_since, only the tasks updated since then (soft-deleted ones included).
+    Also returns the watermark to pass as changed_since next time: taken before the
+    first row is read and set back by REPORT_EXPORT_WATERMARK_LAG_SECONDS. updated_at is
+    stamped when a change is flushed, but the writer commits later, so a change flushed
+    before the export and committed after it is exported next time rather than missed.
+    Successive incremental exports therefore overlap; apply their rows by task_id.
+    The project is checked up front; the rows are read as the chunks are consumed.
+    """
+    if not project_service.get_project_by_id(project_id):
+        raise ValueError(f"Project {project_id} not found")
+    if changed_since is not None and changed_since.tzinfo is not None:
+        changed_since = changed_since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    watermark = utcnow() - timedelta(seconds=get_report_settings().export_watermark_lag_seconds)
+    batches = report_export_service.iter_task_batches(project_id, changed_since=changed_since)
+    logger.info(
+        f"Exporting {export_format.value} task data for project {project_id}"
+        + (f" changed since {changed_since.isoformat()}" if changed_since else "")
+    )
+    if export_format == ExportFormat.CSV:
+        chunks = report_export_service.csv_chunks(batches)
+    elif export_format == ExportFormat.ARROW:
+        chunks = report_export_service.arrow_ipc_chunks(batches)
+    else:
+        chunks = _parquet_chunks(batches)
+    return watermark.replace(tzinfo=timezone.utc), chunks
+
+
+def _parquet_chunks(batches, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    # Parquet writes its footer last, so the file is built (spooled) before it is sent
+    spool = tempfile.SpooledTemporaryFile(max_size=PARQUET_SPOOL_MAX_BYTES)
+    try:
+        report_export_service.write_parquet(batches, spool)
+        while chunk := spool.read(chunk_size):
+            yield chunk
+    finally:
+        spool.close()
+
+
+def create_report_job(project_id: int, report_format: ReportFormat) -> report_jobs_service.ReportJob:
+    """
+    Queue a background render of a project report.
+    Returns the job; it is already done when this data version was rendered before.
+    """
+    def load():
+        project, tasks, task_assignees = _load_report_data(project_id)
+        return project, [report_service.ReportTask(*row) for row in tasks], task_assignees
+
+    version = get_report_version(project_id)
+    job = report_jobs_service.submit_job(project_id, report_format, version, load)
+    logger.info(
+        f"Report job {job.job_id} ({report_format.value}) for project {project_id}: "
+        f"{'cached' if job.cached else 'queued'}"
+    )
+    return job
+
+
+def get_report_job(job_id: str) -> report_jobs_service.ReportJob:
+    job = report_jobs_service.get_job(job_id)
+    if job is None:
+        raise ValueError(f"Report job {job_id} not found")
+    return job
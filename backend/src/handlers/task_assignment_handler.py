@@ -11,6 +11,7 @@ from backend.src.services import department as department_service
 from backend.src.services.notification import get_notification_service
 from backend.src.schemas.user import UserRead
 from backend.src.enums.notification import NotificationType
+from backend.src.enums.task_sort import ALLOWED_SORTS
 
 
 logger = logging.getLogger(__name__)
@@ -27,9 +28,9 @@ def assign_users(
     if not ids:
         return 0
 
-    for id in ids:
-        if user_service.get_user(id) is None:
-            raise ValueError("User not found")
+    users = user_service.get_users_by_ids(ids)
+    if len(users) != len(ids):
+        raise ValueError("User not found")
     
     if task_service.get_task_with_subtasks(task_id) is None:
         raise ValueError("Task not found")
@@ -51,11 +52,7 @@ def assign_users(
     after_ids: Set[int] = {u.user_id for u in after_assignees}
     newly_assigned_ids = sorted(after_ids - before_ids)
 
-    recipient_emails: List[str] = []
-    for uid in newly_assigned_ids:
-        u = user_service.get_user(uid)
-        if u and getattr(u, "email", None):
-            recipient_emails.append(u.email)
+    recipient_emails = _emails_of(newly_assigned_ids, users)
 
     task_obj = task_service.get_task_with_subtasks(task_id)
     task_title = getattr(task_obj, "title", "") if task_obj else ""
@@ -92,9 +89,9 @@ def unassign_users(
     if not ids:
         return 0
     
-    for id in ids:
-        if user_service.get_user(id) is None:
-            raise ValueError("User not found")
+    users = user_service.get_users_by_ids(ids)
+    if len(users) != len(ids):
+        raise ValueError("User not found")
     
     if task_service.get_task_with_subtasks(task_id) is None:
         raise ValueError("Task not found")
@@ -115,11 +112,7 @@ def unassign_users(
     if not removed_ids:
         removed_ids = ids
 
-    recipient_emails: List[str] = []
-    for uid in removed_ids:
-        u = user_service.get_user(uid)
-        if u and getattr(u, "email", None):
-            recipient_emails.append(u.email)
+    recipient_emails = _emails_of(removed_ids, users)
 
     task_obj = task_service.get_task_with_subtasks(task_id)
     task_title = getattr(task_obj, "title", "") if task_obj else ""
@@ -147,6 +140,17 @@ def unassign_users(
     return deleted
 
 
+def _emails_of(user_ids: List[int], known: dict) -> List[str]:
+    """Emails of user_ids (in order), fetching any not already in `known` in one query."""
+    missing = [uid for uid in user_ids if uid not in known]
+    users = {**known, **user_service.get_users_by_ids(missing)} if missing else known
+    return [
+        users[uid].email
+        for uid in user_ids
+        if uid in users and getattr(users[uid], "email", None)
+    ]
+
+
 def list_assignees(task_id: int) -> list[UserRead]:
     if task_service.get_task_with_subtasks(task_id) is None:
         raise ValueError("Task not found")
@@ -161,11 +165,36 @@ def clear_task_assignees(task_id: int) -> int:
     return assignment_service.clear_task_assignees(task_id)
 
 
-def list_user_tasks(user_id: int) -> list[int]:
+def list_user_tasks(
+    user_id: int,
+    *,
+    sort_by: str = "priority_desc",
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> list[int]:
     if user_service.get_user(user_id) is None:
         raise ValueError("User not found")
 
-    return assignment_service.list_tasks_for_user(user_id)
+    if sort_by not in ALLOWED_SORTS:
+        raise ValueError(f"Invalid sort_by value '{sort_by}'")
+
+    return assignment_service.list_tasks_for_user(user_id, sort_by=sort_by, limit=limit, after=after)
+
+
+async def list_user_tasks_async(
+    user_id: int,
+    *,
+    sort_by: str = "priority_desc",
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> list[int]:
+    if await user_service.get_user_async(user_id) is None:
+        raise ValueError("User not found")
+
+    if sort_by not in ALLOWED_SORTS:
+        raise ValueError(f"Invalid sort_by value '{sort_by}'")
+
+    return await assignment_service.list_tasks_for_user_async(user_id, sort_by=sort_by, limit=limit, after=after)
 
 
 def list_tasks_by_manager(manager_id: int) -> dict:
@@ -181,27 +210,11 @@ def list_tasks_by_manager(manager_id: int) -> dict:
     if not teams:
         return {}
 
-    all_tasks = {}
-
-    for team in teams:
-        all_tasks[f"{team['team_number']}-{team['team_name']}"] = []
-        team_members = team_service.get_users_in_team(team["team_id"])
-        for member in team_members:
-            user_tasks = assignment_service.list_tasks_for_user(member["user_id"])
-            for task in user_tasks:
-                if task not in all_tasks[f"{team['team_number']}-{team['team_name']}"]:
-                    all_tasks[f"{team['team_number']}-{team['team_name']}"].append(task)
-        subteams = team_service.get_subteam_by_team_number(team["team_number"])
-        for subteam in subteams:
-            subteam_members = team_service.get_users_in_team(subteam["team_id"])
-            all_tasks[f"{subteam['team_number']}-{subteam['team_name']}"] = []
-            for member in subteam_members:
-                user_tasks = assignment_service.list_tasks_for_user(member["user_id"])
-                for task in user_tasks:
-                    if task not in all_tasks[f"{subteam['team_number']}-{subteam['team_name']}"]:
-                        all_tasks[f"{subteam['team_number']}-{subteam['team_name']}"].append(task)
-
-    return all_tasks
+    # The manager's teams and every team under them, in one query
+    candidates = team_service.get_teams_by_prefixes(t["team_number"][:4] for t in teams)
+    return _tasks_by_team(
+        teams, candidates, lambda team: f"{team['team_number']}-{team['team_name']}"
+    )
 
 
 def list_tasks_by_director(director_id: int) -> dict:
@@ -221,23 +234,25 @@ def list_tasks_by_director(director_id: int) -> dict:
     if not teams:
         return {}
 
-    all_tasks = {}
+    # Subteams share their parent's department prefix, so they are already in `teams`
+    return _tasks_by_team(
+        teams, teams,
+        lambda team: f"{team['team_number']}-{team['team_name']}-{department['department_name']}",
+    )
+
+
+def _tasks_by_team(teams: list[dict], candidates: list[dict], key) -> dict:
+    """
+    {key(team): tasks} for each of `teams` followed by its subteams (teams in `candidates`
+    sharing its 4-digit prefix), in that order. Tasks for all of them come from one query.
+    """
+    ordered: dict[int, dict] = {}
     for team in teams:
-        all_tasks[f"{team['team_number']}-{team['team_name']}-{department['department_name']}"] = []
-        team_members = team_service.get_users_in_team(team["team_id"])
-        for member in team_members:
-            user_tasks = assignment_service.list_tasks_for_user(member["user_id"])
-            for task in user_tasks:
-                if task not in all_tasks[f"{team['team_number']}-{team['team_name']}-{department['department_name']}"]:
-                    all_tasks[f"{team['team_number']}-{team['team_name']}-{department['department_name']}"].append(task)
-        subteams = team_service.get_subteam_by_team_number(team["team_number"])
-        for subteam in subteams:
-            all_tasks[f"{subteam['team_number']}-{subteam['team_name']}-{department['department_name']}"] = []
-            subteam_members = team_service.get_users_in_team(subteam["team_id"])
-            for member in subteam_members:
-                user_tasks = assignment_service.list_tasks_for_user(member["user_id"])
-                for task in user_tasks:
-                    if task not in all_tasks[f"{subteam['team_number']}-{subteam['team_name']}-{department['department_name']}"]:
-                        all_tasks[f"{subteam['team_number']}-{subteam['team_name']}-{department['department_name']}"].append(task)
-
-    return all_tasks
\ No newline at end of file
+        ordered.setdefault(team["team_id"], team)
+        prefix = team["team_number"][:4]
+        for sub in candidates:
+            if sub["team_number"][:4] == prefix and sub["team_number"] != team["team_number"]:
+                ordered.setdefault(sub["team_id"], sub)
+
+    tasks = assignment_service.list_tasks_for_teams(ordered.keys())
+    return {key(team): tasks.get(team_id, []) for team_id, team in ordered.items()}
@@ -8,6 +8,7 @@ from datetime import datetime
 from datetime import date, datetime, timedelta
 from typing import Dict, Any
 from backend.src.services import task as task_service
+from backend.src.services import task_paging
 from backend.src.services import user as user_service
 from backend.src.services import project as project_service
 from backend.src.services.notification import get_notification_service
@@ -23,31 +24,13 @@ from backend.src.database.models.task import Task
 
 from backend.src.enums.email import EmailType
 from backend.src.schemas.email import EmailMessage, EmailRecipient
+from backend.src.schemas.task import TaskTree
 from fastapi import HTTPException
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# ---- Helpers ----------------------------------------------------------------
-
-
-def _normalize_filter_dates(filter_dict: Optional[dict]) -> Optional[dict]:
-    """Convert date strings in filters into datetime.date objects."""
-
-    parsed = {}
-    for key, value in filter_dict.items():
-        if key in {"deadline_range", "start_date_range"}:
-            start, end = value
-            parsed[key] = [
-                datetime.strptime(start, "%Y-%m-%d").date(),
-                datetime.strptime(end, "%Y-%m-%d").date(),
-            ]
-        else:
-            parsed[key] = value
-    return parsed
-
-
 # -------- Task Handlers -------------------------------------------------------
 
 
@@ -373,7 +356,12 @@ def update_task(
     return updated
 
 def get_task(task_id: int):
-    task = task_service.get_task_with_subtasks(task_id)
+    return _visible_task(task_service.get_task_with_subtasks(task_id))
+
+async def get_task_async(task_id: int):
+    return _visible_task(await task_service.get_task_with_subtasks_async(task_id))
+
+def _visible_task(task):
     if not task:
         raise ValueError("Task not found.")
 
@@ -397,27 +385,12 @@ def list_tasks(*,
     active_only: bool = True, 
     project_id: Optional[int] = None,
     sort_by: Optional[str] = "priority_desc",
-    filter_by: Optional[dict] = None
+    filter_by: Optional[dict] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
 ):
     
-    if filter_by: 
-        invalid = [f for f in filter_by if f not in ALLOWED_FILTERS]
-        if invalid:
-            raise ValueError(f"Invalid filter keys: {invalid}")
-        
-        date_filters = set(filter_by) & {"deadline_range", "start_date_range"}
-        non_date_filters = set(filter_by) & {"priority_range", "status"}
-
-        if len(non_date_filters) > 1:
-            raise ValueError(f"Only one non-date filter allowed: {list(non_date_filters)}")
-        if date_filters and non_date_filters:
-            raise ValueError(
-                f"Date filters cannot be combined with other filter types. "
-                f"Date filters: {list(date_filters)}, other: {list(non_date_filters)}"
-            )
-
-    filter_by = _normalize_filter_dates(filter_by) if filter_by else None
-
+    # Filter expressions (any AND/OR combination) are validated by task_query.compile_filter
     if sort_by not in ALLOWED_SORTS:
         raise ValueError(f"Invalid sort_by value '{sort_by}'")
 
@@ -425,35 +398,42 @@ def list_tasks(*,
         active_only=active_only,
         project_id=project_id,
         sort_by=sort_by,
-        filter_by=filter_by
+        filter_by=filter_by,
+        limit=limit,
+        after=after,
     )
     return tasks
 
-def list_parent_tasks(*, 
-    active_only: bool = True, 
+async def list_tasks_async(*,
+    active_only: bool = True,
     project_id: Optional[int] = None,
     sort_by: Optional[str] = "priority_desc",
-    filter_by: Optional[dict] = None
+    filter_by: Optional[dict] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
 ):
+    if sort_by not in ALLOWED_SORTS:
+        raise ValueError(f"Invalid sort_by value '{sort_by}'")
 
-    if filter_by: 
-        invalid = [f for f in filter_by if f not in ALLOWED_FILTERS]
-        if invalid:
-            raise ValueError(f"Invalid filter keys: {invalid}")
-        
-        date_filters = set(filter_by) & {"deadline_range", "start_date_range"}
-        non_date_filters = set(filter_by) & {"priority_range", "status"}
-
-        if len(non_date_filters) > 1:
-            raise ValueError(f"Only one non-date filter allowed: {list(non_date_filters)}")
-        if date_filters and non_date_filters:
-            raise ValueError(
-                f"Date filters cannot be combined with other filter types. "
-                f"Date filters: {list(date_filters)}, other: {list(non_date_filters)}"
-            )
+    return await task_service.list_tasks_async(
+        active_only=active_only,
+        project_id=project_id,
+        sort_by=sort_by,
+        filter_by=filter_by,
+        limit=limit,
+        after=after,
+    )
 
-    filter_by = _normalize_filter_dates(filter_by) if filter_by else None
+def list_parent_tasks(*, 
+    active_only: bool = True, 
+    project_id: Optional[int] = None,
+    sort_by: Optional[str] = "priority_desc",
+    filter_by: Optional[dict] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+):
 
+    # Filter expressions (any AND/OR combination) are validated by task_query.compile_filter
     if sort_by not in ALLOWED_SORTS:
         raise ValueError(f"Invalid sort_by value '{sort_by}'")
 
@@ -461,10 +441,18 @@ def list_parent_tasks(*,
         active_only=active_only,
         project_id=project_id,
         sort_by=sort_by,
-        filter_by=filter_by
+        filter_by=filter_by,
+        limit=limit,
+        after=after,
     )
     return tasks
 
+def next_page_cursor(tasks: list, sort_by: str, limit: Optional[int]) -> Optional[str]:
+    """Cursor for the page after `tasks`, or None when this was the last page."""
+    if limit is None or len(tasks) < limit:
+        return None
+    return task_paging.encode_cursor(tasks[-1], sort_by)
+
 def delete_task(task_id: int):
     task = task_service.get_task_with_subtasks(task_id)
     if not task:
@@ -500,6 +488,18 @@ def attach_subtasks(parent_id: int, subtask_ids: Iterable[int]) -> Task:
     return task_service.attach_subtasks(parent_id, ids)
 
 
+def get_task_tree(task_id: int, max_depth: Optional[int] = None) -> TaskTree:
+    """The task and its subtree as nested TaskWithSubTasks (TaskTree) nodes."""
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("max_depth must be a non-negative integer")
+
+    tree = task_service.get_task_tree(task_id, max_depth=max_depth)
+    if not tree or not tree["active"]:
+        raise ValueError("Task not found")
+
+    return TaskTree.model_validate(tree)
+
+
 def detach_subtask(parent_id: int, subtask_id: int) -> Task:
 
     parent = task_service.get_task_with_subtasks(parent_id)
@@ -515,12 +515,23 @@ def detach_subtask(parent_id: int, subtask_id: int) -> Task:
 # -------- Task x Project Handlers -------------------------------------------------------
 
 
-def list_tasks_by_project(project_id: int):
+def list_tasks_by_project(
+    project_id: int,
+    *,
+    sort_by: str = "priority_desc",
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+):
     project = project_service.get_project_by_id(project_id)
     if not project:
         raise ValueError(f"Project {project_id} not found")
 
-    return task_service.list_tasks_by_project(project_id, active_only=True)
+    if sort_by not in ALLOWED_SORTS:
+        raise ValueError(f"Invalid sort_by value '{sort_by}'")
+
+    return task_service.list_tasks_by_project(
+        project_id, active_only=True, sort_by=sort_by, limit=limit, after=after
+    )
 
 def list_project_tasks_by_user(project_id: int, user_id: int):
     project = project_service.get_project_by_id(project_id)
@@ -0,0 +1,79 @@
+"""
+Add the project.report_version column (report fingerprint used for export caching / ETags).
+This script will:
+1. Add project.report_version if the database predates it
+2. Give every project a first version
+
+Safe to re-run.
+
+Usage:
+    python -m backend.src.init_scripts.add_report_version
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import inspect, select, text, update
+
+# Importing db_setup_tables registers every model and creates missing tables
+from backend.src.database.db_setup_tables import engine
+from backend.src.database.models.project import Project, new_report_version
+
+
+def add_report_version_column(bind) -> bool:
+    """ALTER TABLE project ADD COLUMN report_version if it is missing; returns whether it was added."""
+    existing = {c["name"] for c in inspect(bind).get_columns(Project.__tablename__)}
+    if "report_version" in existing:
+        return False
+    column = Project.__table__.c.report_version
+    with bind.begin() as conn:
+        conn.execute(text(
+            f"ALTER TABLE {Project.__tablename__} ADD COLUMN report_version {column.type.compile(bind.dialect)}"
+        ))
+    return True
+
+
+def backfill_report_versions(bind) -> int:
+    """Give each project without a report_version its own; returns how many were set."""
+    with bind.begin() as conn:
+        project_ids = conn.execute(
+            select(Project.project_id).where(Project.report_version.is_(None))
+        ).scalars().all()
+        for project_id in project_ids:
+            conn.execute(
+                update(Project.__table__)
+                .where(Project.__table__.c.project_id == project_id)
+                .values(report_version=new_report_version())
+            )
+    return len(project_ids)
+
+
+def add_report_version():
+    """Add (if missing) and fill in project.report_version."""
+    print("=" * 60)
+    print("KIRA Project Report Version")
+    print("=" * 60)
+
+    try:
+        print("\n📋 Step 1: Ensuring report_version column exists...")
+        added = add_report_version_column(engine)
+        print("✅ Added: report_version" if added else "✅ Column already present!")
+
+        print("\n🔁 Step 2: Setting first versions...")
+        rows = backfill_report_versions(engine)
+        print(f"✅ Updated {rows} projects!")
+
+        print("\n🎉 Report versions ready!")
+
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    add_report_version()
@@ -0,0 +1,82 @@
+"""
+Add the task.updated_at column used by incremental (changed-since) exports.
+This script will:
+1. Add task.updated_at if the database predates it
+2. Stamp every task that has none with the current time
+3. Create its index
+
+Safe to re-run.
+
+Usage:
+    python -m backend.src.init_scripts.add_task_updated_at
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import inspect, text, update
+from sqlalchemy.schema import CreateIndex
+
+# Importing db_setup_tables registers every model and creates missing tables
+from backend.src.database.db_setup_tables import engine
+from backend.src.database.models.task import Task, utcnow
+
+UPDATED_AT_INDEX = "ix_task_project_updated_at"
+
+
+def add_updated_at_column(bind) -> bool:
+    """ALTER TABLE task ADD COLUMN updated_at if it is missing; returns whether it was added."""
+    existing = {c["name"] for c in inspect(bind).get_columns(Task.__tablename__)}
+    if "updated_at" in existing:
+        return False
+    column = Task.__table__.c.updated_at
+    with bind.begin() as conn:
+        conn.execute(text(
+            f"ALTER TABLE {Task.__tablename__} ADD COLUMN updated_at {column.type.compile(bind.dialect)}"
+        ))
+    return True
+
+
+def backfill_updated_at(bind) -> int:
+    """Stamp tasks without updated_at with the current time; returns how many."""
+    table = Task.__table__
+    with bind.begin() as conn:
+        result = conn.execute(update(table).where(table.c.updated_at.is_(None)).values(updated_at=utcnow()))
+    return result.rowcount
+
+
+def add_task_updated_at():
+    """Add (if missing), backfill and index task.updated_at."""
+    print("=" * 60)
+    print("KIRA Task updated_at")
+    print("=" * 60)
+
+    try:
+        print("\n📋 Step 1: Ensuring updated_at column exists...")
+        added = add_updated_at_column(engine)
+        print("✅ Added: updated_at" if added else "✅ Column already present!")
+
+        print("\n🔁 Step 2: Stamping existing tasks...")
+        rows = backfill_updated_at(engine)
+        print(f"✅ Updated {rows} tasks!")
+
+        print("\n📇 Step 3: Creating index...")
+        index = next(ix for ix in Task.__table__.indexes if ix.name == UPDATED_AT_INDEX)
+        with engine.begin() as conn:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+        print(f"✅ {index.name}")
+
+        print("\n🎉 Task updated_at ready!")
+
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    add_task_updated_at()
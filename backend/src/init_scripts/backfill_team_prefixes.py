@@ -0,0 +1,78 @@
+"""
+Add and backfill the team hierarchy prefix columns.
+This script will:
+1. Add team.department_prefix / team.team_prefix if the database predates them
+2. Fill them in from team_number for every existing team
+3. Create their indexes
+
+Safe to re-run.
+
+Usage:
+    python -m backend.src.init_scripts.backfill_team_prefixes
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+# Importing db_setup_tables registers every model and creates missing tables
+from backend.src.database.db_setup_tables import engine
+from backend.src.database.models.team import Team
+from backend.src.services import team as team_service
+
+PREFIX_COLUMNS = ("department_prefix", "team_prefix")
+
+
+def add_missing_prefix_columns(bind) -> list[str]:
+    """ALTER TABLE team ADD COLUMN for each prefix column it lacks; returns the names added."""
+    existing = {c["name"] for c in inspect(bind).get_columns(Team.__tablename__)}
+    added = []
+    with bind.begin() as conn:
+        for name in PREFIX_COLUMNS:
+            if name in existing:
+                continue
+            column = Team.__table__.c[name]
+            conn.execute(text(
+                f"ALTER TABLE {Team.__tablename__} ADD COLUMN {name} {column.type.compile(bind.dialect)}"
+            ))
+            added.append(name)
+    return added
+
+
+def backfill_team_prefixes():
+    """Add (if missing), backfill and index the team prefix columns."""
+    print("=" * 60)
+    print("KIRA Team Prefix Backfill")
+    print("=" * 60)
+
+    try:
+        print("\n📋 Step 1: Ensuring prefix columns exist...")
+        added = add_missing_prefix_columns(engine)
+        print(f"✅ Added: {', '.join(added)}" if added else "✅ Columns already present!")
+
+        print("\n🔁 Step 2: Backfilling from team_number...")
+        rows = team_service.backfill_team_prefixes()
+        print(f"✅ Updated {rows} teams!")
+
+        print("\n📇 Step 3: Creating indexes...")
+        with engine.begin() as conn:
+            for index in sorted(Team.__table__.indexes, key=lambda ix: ix.name):
+                conn.execute(CreateIndex(index, if_not_exists=True))
+                print(f"✅ {index.name}")
+
+        print("\n🎉 Team prefixes ready!")
+
+    except Exception as e:
+        print(f"\n❌ Error during backfill: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    backfill_team_prefixes()
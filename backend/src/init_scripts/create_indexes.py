@@ -0,0 +1,47 @@
+"""
+Create any indexes declared on the models that an existing database is missing.
+create_all only builds indexes together with new tables, so databases created
+before an index was added (e.g. the per-sort task indexes) need this once.
+
+Usage:
+    python -m backend.src.init_scripts.create_indexes
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy.schema import CreateIndex
+
+# Importing db_setup_tables registers every model and creates missing tables
+from backend.src.database.db_setup_tables import engine, Base
+
+def create_indexes():
+    """Create every declared index that does not exist yet; existing ones are left alone."""
+    print("=" * 60)
+    print("KIRA Index Migration")
+    print("=" * 60)
+
+    try:
+        # IF NOT EXISTS rather than reflection: SQLite does not reflect expression indexes
+        count = 0
+        with engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in sorted(table.indexes, key=lambda ix: ix.name):
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+                    print(f"✅ {table.name}.{index.name}")
+                    count += 1
+
+        print(f"\n🎉 {count} indexes in place!")
+
+    except Exception as e:
+        print(f"\n❌ Error creating indexes: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    create_indexes()
@@ -15,6 +15,8 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from sqlalchemy import text
+
 from backend.src.database.db_setup_tables import engine, Base
 from backend.src.init_scripts.seed_data import seed_database
 
@@ -27,7 +29,15 @@ def init_database():
     try:
         # Step 0: Drop all tables (for clean reset)
         print("\n🗑️  Step 0: Dropping all existing tables...")
-        Base.metadata.drop_all(engine)
+        sqlite = engine.dialect.name == "sqlite"
+        with engine.connect() as conn:
+            # SQLite enforces foreign keys and department <-> user reference each other, so drop with them off
+            if sqlite:
+                conn.execute(text("PRAGMA foreign_keys=OFF"))
+            Base.metadata.drop_all(bind=conn)
+            if sqlite:
+                conn.execute(text("PRAGMA foreign_keys=ON"))
+            conn.commit()
         print("✅ All tables dropped successfully!")
         
         # Step 1: Create tables
@@ -0,0 +1,44 @@
+"""
+Rebuild the task hierarchy index.
+This script will:
+1. Create the task_closure table if the database predates it
+2. Repopulate it from the existing parent_assignment rows
+
+Usage:
+    python -m backend.src.init_scripts.rebuild_task_closure
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Importing db_setup_tables registers every model and creates missing tables (incl. task_closure)
+from backend.src.database.db_setup_tables import engine, Base
+from backend.src.services import task as task_service
+
+def rebuild_task_closure():
+    """Create (if missing) and repopulate the task_closure table."""
+    print("=" * 60)
+    print("KIRA Task Hierarchy Index Rebuild")
+    print("=" * 60)
+
+    try:
+        print("\n📋 Step 1: Ensuring task_closure table exists...")
+        Base.metadata.create_all(engine)
+        print("✅ task_closure table ready!")
+
+        print("\n🔁 Step 2: Rebuilding from parent_assignment...")
+        rows = task_service.rebuild_task_closure()
+        print(f"✅ Wrote {rows} closure rows!")
+
+    except Exception as e:
+        print(f"\n❌ Error during rebuild: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    rebuild_task_closure()
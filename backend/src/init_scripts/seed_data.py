@@ -18,6 +18,7 @@ from backend.src.database.models.parent_assignment import ParentAssignment
 from backend.src.database.models.department import Department
 from backend.src.database.models.team import Team
 from backend.src.database.models.team_assignment import TeamAssignment
+from backend.src.services import task as task_service
 from backend.src.enums.user_role import UserRole
 from backend.src.enums.task_status import TaskStatus
 from passlib.context import CryptContext
@@ -635,6 +636,10 @@ def seed_database():
         
         # Commit all changes
         session.commit()
+
+        # parent_assignment rows above bypass the task service, so backfill the hierarchy index
+        rows = task_service.rebuild_task_closure()
+        print(f"Rebuilt task hierarchy index ({rows} rows)")
         print("✅ Database seed completed successfully!")
         
     except Exception as e:
@@ -1,16 +1,24 @@
+from dataclasses import asdict
 from fastapi import FastAPI
 
 from backend.src.database.db_setup import Base, engine
 from backend.src.database.models.task import Task  
 from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task_closure import TaskClosure
 from backend.src.database.models.team import Team
 from backend.src.database.models.team_assignment import TeamAssignment
 from backend.src.database.models.user import User
 from backend.src.database.models.department import Department
 from backend.src.database.models.project import Project, ProjectAssignment  
 from backend.src.database.models.comment import Comment
+from backend.src.database.models.email_outbox import EmailOutbox
+from backend.src.database.models.notification_buffer import NotificationBuffer
 from backend.src.api.v1.router import router as v1_router
 from fastapi.middleware.cors import CORSMiddleware
+from backend.src.api.middleware import QueryStatsMiddleware, QUERY_COUNT_HEADER, SERVER_TIMING_HEADER
+from backend.src.services import report_jobs
+from backend.src.services import email_dispatcher
+from backend.src.services import notification_dispatch
 
 Base.metadata.create_all(bind=engine)
 
@@ -22,14 +30,32 @@ app.add_middleware(
     allow_origins=["*"],  # in dev, allow all origins
     allow_credentials=True,
     allow_methods=["*"],
+    # task listing pagination cursor; per-request DB query stats
+    expose_headers=["X-Next-Cursor", QUERY_COUNT_HEADER, SERVER_TIMING_HEADER],
 )
+# Per-request SQL statement count / DB time headers and N+1 warnings
+app.add_middleware(QueryStatsMiddleware)
 
 app.include_router(v1_router)
 
+# Stop the report render worker pool with the app
+app.add_event_handler("shutdown", report_jobs.shutdown)
+
+# Send queued notification emails in the background while the app runs
+app.add_event_handler("startup", email_dispatcher.start)
+# Let queued comment notifications finish (up to NOTIFICATION_DRAIN_TIMEOUT_SECONDS) first
+app.add_event_handler("shutdown", notification_dispatch.shutdown)
+app.add_event_handler("shutdown", email_dispatcher.stop)
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
+@app.get("/health/notifications")
+def notification_health():
+    """Background notification pool counters (queue depth, in flight, dropped, ...)."""
+    return asdict(notification_dispatch.stats())
+
 @app.options("/{full_path:path}")
 async def options_handler(full_path: str):
     """Handle preflight OPTIONS requests"""
@@ -0,0 +1,25 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Optional
+
+from backend.src.enums.report import ReportFormat, ReportJobStatus
+
+
+class ReportJobCreate(BaseModel):
+    project_id: int
+    format: ReportFormat
+
+
+class ReportJobRead(BaseModel):
+    job_id: str
+    project_id: int
+    format: ReportFormat
+    status: ReportJobStatus
+    data_version: str
+    cached: bool = False  # served from a previously rendered file
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
@@ -33,6 +33,21 @@ class TaskWithSubTasks(TaskRead):
         serialization_alias="subTasks", 
     )
 
+class TaskTree(TaskWithSubTasks):
+    """
+    TaskWithSubTasks nested all the way down: the same fields and subTasks key, but
+    each subtask carries its own subTasks instead of stopping at one level.
+    """
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    subTasks: List[TaskTree] = Field(
+        default_factory=list,
+        validation_alias="subtasks",
+        serialization_alias="subTasks",
+    )
+
+TaskTree.model_rebuild()
+
 class SubtaskIds(BaseModel):
     subtask_ids: List[int] = []  # allow empty list -> idempotent no-op
 
@@ -2,13 +2,15 @@ import logging
 import smtplib
 from backend.src.database.db_setup import SessionLocal
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import uuid
 from ..config.email_config import get_email_settings
 from ..schemas.email import EmailMessage, EmailRecipient, EmailResponse, EmailType
+from ..enums.email import EmailTransport
 from ..templates.email_templates import EmailTemplates
+from . import email_outbox
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +30,7 @@ class EmailService:
     def __init__(self):
         self.settings = get_email_settings()
         self.templates = EmailTemplates()
+        self._pool_transport = None
     
     def send_email(self, email_message: EmailMessage) -> EmailResponse:
         try:
@@ -70,6 +73,82 @@ class EmailService:
                 recipients_count=0
             )
     
+    def queue_email(self, email_message: EmailMessage) -> EmailResponse:
+        """
+        Render the message and put it in the email outbox; the dispatcher sends it.
+        Inside an API request the row is written in the request's transaction, so it is
+        only sent if the change it reports is committed. No SMTP traffic here.
+        """
+        text_content, html_content = self._prepare_content(email_message)
+        outbox_id = email_outbox.enqueue(
+            subject=email_message.content.subject,
+            to_addrs=[r.email for r in email_message.recipients],
+            cc_addrs=[r.email for r in email_message.cc] if email_message.cc else None,
+            text_body=text_content,
+            html_body=html_content,
+            email_type=email_message.email_type,
+        )
+        logger.info(f"Email queued: outbox_id={outbox_id}, subject=\"{email_message.content.subject}\"")
+        return EmailResponse(
+            success=True,
+            message="Email queued",
+            recipients_count=len(email_message.recipients),
+            email_id=str(outbox_id),
+        )
+
+    def send_batch(
+        self, messages: List[Tuple[MIMEMultipart, List[str]]]
+    ) -> List[Union[str, Exception]]:
+        """
+        Send (message, envelope recipients) pairs over one SMTP connection: one connect,
+        STARTTLS and login for the whole batch. Returns, per message in order, its
+        Message-ID or the exception that failed it. A refused message does not stop the
+        batch; once the connection is lost the remaining messages get that error.
+        Connect / login errors are raised.
+        With EMAIL_TRANSPORT=aiosmtplib the batch goes through the kept-alive connection
+        pool instead (services/smtp_pool), where connect / login errors are per message.
+        """
+        if self.settings.email_transport == EmailTransport.AIOSMTPLIB:
+            return self._pooled_transport().send_batch(messages)
+
+        smtp = self._connect()
+        try:
+            smtp.login(self.settings.fastmail_username, self.settings.fastmail_password)
+            results: List[Union[str, Exception]] = []
+            for msg, recipient_emails in messages:
+                try:
+                    smtp.send_message(msg, from_addr=self.settings.fastmail_from_email, to_addrs=recipient_emails)
+                    results.append(msg['Message-ID'])
+                except smtplib.SMTPServerDisconnected as e:
+                    results.extend([e] * (len(messages) - len(results)))
+                    break
+                except smtplib.SMTPException as e:
+                    # refused recipients / data: this message only
+                    results.append(e)
+                except OSError as e:
+                    results.extend([e] * (len(messages) - len(results)))
+                    break
+            return results
+        finally:
+            try:
+                smtp.quit()
+            except OSError:
+                pass
+
+    def _pooled_transport(self):
+        if self._pool_transport is None:
+            # aiosmtplib is only loaded when the pooled transport is selected
+            from .smtp_pool import AsyncSMTPTransport
+
+            self._pool_transport = AsyncSMTPTransport(self.settings)
+        return self._pool_transport
+
+    def close(self) -> None:
+        """Close the pooled SMTP connections, if any were opened."""
+        transport, self._pool_transport = self._pool_transport, None
+        if transport is not None:
+            transport.close()
+
     def _prepare_message(self, email_message: EmailMessage) -> MIMEMultipart:
         msg = MIMEMultipart('mixed')
         
@@ -99,8 +178,6 @@ class EmailService:
         content = email_message.content
 
         if content.template_name and content.template_data:
-            templates = self.templates.get_template_by_type(content.template_name)
-
             template_data = {
                 **content.template_data,
                 'app_name': self.settings.app_name,
@@ -108,10 +185,7 @@ class EmailService:
                 'update_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
 
-            text_content = self.templates.render_template(templates.get('text', ''), template_data)
-            html_content = self.templates.render_template(templates.get('html', ''), template_data)
-
-            return text_content, html_content
+            return self.templates.render_by_type(content.template_name, template_data)
 
         return content.text_body, content.html_body
     
@@ -120,21 +194,7 @@ class EmailService:
         if cc:
             recipient_emails += [r.email for r in cc]
 
-        if self.settings.use_ssl:
-            smtp = smtplib.SMTP_SSL(
-                host=self.settings.fastmail_smtp_host,
-                port=self.settings.fastmail_smtp_port,
-                timeout=self.settings.timeout
-            )
-        else:
-            smtp = smtplib.SMTP(
-                host=self.settings.fastmail_smtp_host,
-                port=self.settings.fastmail_smtp_port,
-                timeout=self.settings.timeout
-            )
-
-            if self.settings.use_tls:
-                smtp.starttls()
+        smtp = self._connect()
         
         try:
             # uncomment this section (lines 130-140) for actual email sending
@@ -156,6 +216,24 @@ class EmailService:
             
         finally:
             smtp.quit()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP connection (SSL, or plain with STARTTLS when use_tls)."""
+        if self.settings.use_ssl:
+            return smtplib.SMTP_SSL(
+                host=self.settings.fastmail_smtp_host,
+                port=self.settings.fastmail_smtp_port,
+                timeout=self.settings.timeout
+            )
+
+        smtp = smtplib.SMTP(
+            host=self.settings.fastmail_smtp_host,
+            port=self.settings.fastmail_smtp_port,
+            timeout=self.settings.timeout
+        )
+        if self.settings.use_tls:
+            smtp.starttls()
+        return smtp
     
     def _validate_settings(self) -> bool:
         required_settings = [
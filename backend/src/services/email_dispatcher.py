@@ -0,0 +1,141 @@
+"""
+Background sender for the email outbox.
+
+dispatch_once() leases a batch of due outbox rows and sends them over one SMTP
+connection (EmailService.send_batch), then records per row whether it was sent or
+when to retry. The API runs it in a loop on a daemon thread (start / stop with the
+app) that drains full batches back to back and otherwise polls every
+EMAIL_OUTBOX_POLL_INTERVAL seconds; each pass first queues the buffered
+notifications that are due (NotificationService.flush_buffered). Set
+EMAIL_OUTBOX_AUTOSTART=false to send from elsewhere (a cron job calling
+dispatch_once, tests).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from email.mime.multipart import MIMEMultipart
+
+from backend.src.config.email_config import OutboxSettings, get_outbox_settings
+from backend.src.database.models.email_outbox import EmailOutbox
+from backend.src.schemas.email import EmailContent, EmailMessage, EmailRecipient
+from backend.src.services import email_outbox
+from backend.src.services.email import EmailService, get_email_service
+from backend.src.services.notification import get_notification_service
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@dataclass
+class DispatchResult:
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_stop = threading.Event()
+
+
+def _build_message(service: EmailService, row: EmailOutbox) -> Tuple[MIMEMultipart, List[str]]:
+    """The MIME message for an outbox row and its envelope recipients (to + cc)."""
+    email_message = EmailMessage(
+        recipients=[EmailRecipient(email=e) for e in row.to_addrs],
+        cc=[EmailRecipient(email=e) for e in row.cc_addrs] if row.cc_addrs else None,
+        content=EmailContent(subject=row.subject, text_body=row.text_body, html_body=row.html_body),
+        email_type=row.email_type,
+    )
+    msg = service._prepare_message(email_message)
+    # Stable across retries, so a message re-sent after a lost acknowledgement can be deduplicated
+    domain = (service.settings.fastmail_from_email or "kira.local").split("@")[-1]
+    msg["Message-ID"] = f"<kira-outbox-{row.id}@{domain}>"
+    return msg, list(row.to_addrs) + list(row.cc_addrs or [])
+
+
+def dispatch_once(settings: Optional[OutboxSettings] = None) -> DispatchResult:
+    """Send one batch of due outbox rows over a single SMTP connection."""
+    settings = settings or get_outbox_settings()
+    service = get_email_service()
+    if not service._validate_settings():
+        logger.warning("Email settings are not properly configured; outbox not dispatched")
+        return DispatchResult()
+
+    rows = email_outbox.claim_batch(settings.batch_size, settings=settings)
+    result = DispatchResult(claimed=len(rows))
+    if not rows:
+        return result
+
+    batch, to_send = [], []
+    for row in rows:
+        try:
+            batch.append(_build_message(service, row))
+            to_send.append(row)
+        except Exception as e:
+            email_outbox.mark_failed([row], f"Invalid message: {e}", settings=settings)
+            result.failed += 1
+
+    try:
+        outcomes = service.send_batch(batch) if batch else []
+    except Exception as e:
+        # Connect / STARTTLS / login failed: nothing in the batch went out
+        logger.error(f"Outbox batch of {len(to_send)} failed: {e}")
+        email_outbox.mark_failed(to_send, f"{type(e).__name__}: {e}", settings=settings)
+        result.failed += len(to_send)
+        return result
+
+    sent = {row.id: outcome for row, outcome in zip(to_send, outcomes) if not isinstance(outcome, Exception)}
+    email_outbox.mark_sent(sent)
+    for row, outcome in zip(to_send, outcomes):
+        if isinstance(outcome, Exception):
+            email_outbox.mark_failed([row], f"{type(outcome).__name__}: {outcome}", settings=settings)
+    result.sent = len(sent)
+    result.failed += len(to_send) - len(sent)
+    logger.info(f"Outbox batch: {result.sent} sent, {result.failed} failed")
+    return result
+
+
+def _run(settings: OutboxSettings) -> None:
+    while not _stop.is_set():
+        try:
+            # Coalesced / digest notifications whose window has closed join the outbox first
+            get_notification_service().flush_buffered()
+        except Exception as e:
+            logger.error(f"Notification buffer flush error: {e}")
+        try:
+            result = dispatch_once(settings)
+        except Exception as e:  # keep the loop alive through database hiccups
+            logger.error(f"Outbox dispatch error: {e}")
+            result = DispatchResult()
+        if result.claimed < settings.batch_size:
+            _stop.wait(settings.poll_interval)
+
+
+def start() -> bool:
+    """Start the dispatcher thread (unless EMAIL_OUTBOX_AUTOSTART is off); True if it runs."""
+    global _thread
+    settings = get_outbox_settings()
+    if not settings.autostart:
+        return False
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return True
+        _stop.clear()
+        _thread = threading.Thread(target=_run, args=(settings,), name="email-outbox-dispatcher", daemon=True)
+        _thread.start()
+    return True
+
+
+def stop(timeout: Optional[float] = 10) -> None:
+    """Stop the dispatcher thread after its current batch and close pooled SMTP connections."""
+    global _thread
+    with _lock:
+        thread, _thread = _thread, None
+        _stop.set()
+    if thread is not None:
+        thread.join(timeout)
+    get_email_service().close()
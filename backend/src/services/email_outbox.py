@@ -0,0 +1,127 @@
+"""
+Email outbox: durable queue of rendered emails.
+
+enqueue() writes through the service SessionLocal, so inside an API request the row
+commits (or rolls back) together with the change it reports. Dispatchers take due
+rows with claim_batch(), which leases them (pushes next_attempt_at past the lease and
+counts the attempt) in one UPDATE, so several API processes can dispatch from the
+same table without sending a row twice; a row whose dispatcher died is due again
+once its lease ends. mark_sent / mark_failed settle the claimed rows.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, func, select, update
+
+from backend.src.config.email_config import OutboxSettings, get_outbox_settings
+from backend.src.database.db_setup import SessionLocal
+from backend.src.database.models.email_outbox import EmailOutbox
+from backend.src.database.models.task import utcnow
+from backend.src.enums.email import EmailType, OutboxStatus
+
+
+def enqueue(
+    *,
+    subject: str,
+    to_addrs: List[str],
+    cc_addrs: Optional[List[str]] = None,
+    text_body: Optional[str] = None,
+    html_body: Optional[str] = None,
+    email_type: EmailType = EmailType.GENERAL_NOTIFICATION,
+) -> int:
+    """Queue one rendered email; returns its outbox id."""
+    if not to_addrs:
+        raise ValueError("At least one recipient is required")
+    with SessionLocal.begin() as session:
+        row = EmailOutbox(
+            email_type=EmailType(email_type).value,
+            subject=subject,
+            to_addrs=list(to_addrs),
+            cc_addrs=list(cc_addrs) if cc_addrs else None,
+            text_body=text_body,
+            html_body=html_body,
+        )
+        session.add(row)
+        session.flush()
+        return row.id
+
+
+def _due(now: datetime):
+    return and_(EmailOutbox.status == OutboxStatus.PENDING.value, EmailOutbox.next_attempt_at <= now)
+
+
+def claim_batch(limit: int, *, settings: Optional[OutboxSettings] = None, now: Optional[datetime] = None) -> List[EmailOutbox]:
+    """
+    Lease up to `limit` due rows (oldest first) to the caller and return them, detached.
+    Their attempts already include this one.
+    """
+    settings = settings or get_outbox_settings()
+    now = now or utcnow()
+    due_ids = select(EmailOutbox.id).where(_due(now)).order_by(EmailOutbox.id).limit(limit)
+    with SessionLocal.begin() as session:
+        claimed = session.scalars(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(due_ids.scalar_subquery()), _due(now))
+            .values(
+                next_attempt_at=now + timedelta(seconds=settings.lease_seconds),
+                attempts=EmailOutbox.attempts + 1,
+            )
+            .returning(EmailOutbox)
+            .execution_options(synchronize_session=False)
+        ).all()
+        session.expunge_all()
+    return sorted(claimed, key=lambda row: row.id)
+
+
+def mark_sent(message_ids: Dict[int, str], *, now: Optional[datetime] = None) -> None:
+    """Settle claimed rows as sent: {outbox id: Message-ID}."""
+    if not message_ids:
+        return
+    now = now or utcnow()
+    with SessionLocal.begin() as session:
+        for outbox_id, message_id in message_ids.items():
+            session.execute(
+                update(EmailOutbox).where(EmailOutbox.id == outbox_id).values(
+                    status=OutboxStatus.SENT.value, sent_at=now, message_id=message_id, last_error=None,
+                )
+            )
+
+
+def backoff_seconds(attempts: int, settings: OutboxSettings) -> float:
+    """Delay before the next attempt after `attempts` failed ones."""
+    return min(settings.backoff_base_seconds * 2 ** max(attempts - 1, 0), settings.backoff_max_seconds)
+
+
+def mark_failed(
+    rows: Iterable[EmailOutbox],
+    error: str,
+    *,
+    settings: Optional[OutboxSettings] = None,
+    now: Optional[datetime] = None,
+) -> None:
+    """
+    Settle claimed rows after a failed attempt: due again after the backoff, or
+    failed for good once they have used max_attempts.
+    """
+    settings = settings or get_outbox_settings()
+    now = now or utcnow()
+    with SessionLocal.begin() as session:
+        for row in rows:
+            if row.attempts >= settings.max_attempts:
+                values = {"status": OutboxStatus.FAILED.value}
+            else:
+                values = {"next_attempt_at": now + timedelta(seconds=backoff_seconds(row.attempts, settings))}
+            session.execute(
+                update(EmailOutbox).where(EmailOutbox.id == row.id).values(last_error=error[:1000], **values)
+            )
+
+
+def status_counts() -> Dict[str, int]:
+    """Rows per outbox status."""
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)
+        ).all()
+    return {status.value: 0 for status in OutboxStatus} | {status: count for status, count in rows}
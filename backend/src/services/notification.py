@@ -2,7 +2,9 @@ import logging
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
-from backend.src.database.db_setup import SessionLocal
+from backend.src.config.notification_config import NotificationSettings, get_notification_settings
+from backend.src.database.db_setup import SessionLocal, request_scope
+from . import notification_buffer
 from .email import get_email_service
 from ..schemas.email import EmailResponse, EmailMessage, EmailRecipient, EmailType
 from ..enums.notification import NotificationType
@@ -20,6 +22,10 @@ if not logger.handlers: # pragma: no cover
     logger.propagate = False
 
 
+def _fmt_val(v: Any) -> str:
+    return "Yes" if isinstance(v, bool) and v else ("No" if isinstance(v, bool) else str(v))
+
+
 class NotificationService:
     
     def __init__(self):
@@ -70,6 +76,28 @@ class NotificationService:
                     recipients_count=0,
                 )
 
+            buffered = self._buffer_activity(
+                recipients + cc,
+                type_of_alert=type_of_alert,
+                task_id=task_id,
+                task_title=task_title,
+                actor=comment_user or user_email,
+                updated_fields=updated_fields,
+                old_values=old_values,
+                new_values=new_values,
+            )
+            if buffered:
+                recipients = [e for e in recipients if e not in buffered]
+                cc = [e for e in cc if e not in buffered]
+                if not recipients:
+                    recipients, cc = cc, []
+                if not recipients:
+                    return EmailResponse(
+                        success=True,
+                        message="Notification buffered",
+                        recipients_count=len(buffered),
+                    )
+
             subject, text_body, html_body = self._build_activity_message(
                 type_of_alert=type_of_alert,
                 task_id=task_id,
@@ -102,7 +130,8 @@ class NotificationService:
                 },
             )
 
-            resp = self.email_service.send_email(email_message)
+            # Written to the email outbox (in the caller's transaction); the dispatcher sends it
+            resp = self.email_service.queue_email(email_message)
 
             if resp.success:
                 logger.info(
@@ -150,6 +179,125 @@ class NotificationService:
             if not updated_fields or len(updated_fields) == 0:
                 logger.warning("task_update without updated_fields; proceeding anyway")
 
+    def _buffer_activity(
+        self,
+        recipients: List[str],
+        *,
+        type_of_alert: str,
+        task_id: int,
+        task_title: str,
+        actor: Optional[str],
+        updated_fields: Optional[List[str]],
+        old_values: Optional[Dict[str, Any]],
+        new_values: Optional[Dict[str, Any]],
+        settings: Optional[NotificationSettings] = None,
+    ) -> List[str]:
+        """
+        Hold the event for the recipients who get coalesced emails (everyone when a
+        coalescing window is set, otherwise only digest recipients); returns them.
+        """
+        settings = settings or get_notification_settings()
+        if settings.coalesce_window_seconds > 0:
+            buffered = list(dict.fromkeys(recipients))
+        else:
+            digest = set(settings.digest_recipients)
+            buffered = [e for e in dict.fromkeys(recipients) if e in digest]
+        if buffered:
+            notification_buffer.add(
+                buffered,
+                task_id=task_id,
+                task_title=task_title,
+                type_of_alert=type_of_alert,
+                actor=actor,
+                updated_fields=updated_fields,
+                old_values=old_values,
+                new_values=new_values,
+                settings=settings,
+            )
+            logger.info(f"Activity '{type_of_alert}' on task {task_id} buffered for {len(buffered)} recipients")
+        return buffered
+
+    def flush_buffered(self, *, now: Optional[datetime] = None) -> int:
+        """
+        Queue one email per recipient whose buffered notifications are due; returns the
+        number of emails queued. The buffer rows are removed in the same transaction.
+        """
+        queued = 0
+        with request_scope():
+            for recipient, rows in notification_buffer.take_due(now=now).items():
+                message = self._build_buffered_message(rows)
+                if message is None:
+                    continue
+                subject, text_body, html_body = message
+                self.email_service.queue_email(EmailMessage(
+                    recipients=[EmailRecipient(email=recipient)],
+                    content={"subject": subject, "text_body": text_body, "html_body": html_body},
+                    email_type=EmailType.GENERAL_NOTIFICATION,
+                ))
+                queued += 1
+        if queued:
+            logger.info(f"Queued {queued} coalesced notification emails")
+        return queued
+
+    def _build_buffered_message(self, rows) -> Optional[Tuple[str, str, str]]:
+        """The (subject, text, html) for one recipient's due rows; None if nothing is left to report."""
+        # Updates whose changes all cancelled out leave nothing to say
+        rows = [
+            r for r in rows
+            if r.updated_fields or any(e["type"] != NotificationType.TASK_UPDATE.value for e in r.events)
+        ]
+        if not rows:
+            return None
+
+        types = list(dict.fromkeys(e["type"] for e in rows[0].events))
+        if len(rows) == 1 and not rows[0].digest and len(types) == 1:
+            # One task, one kind of activity: the same email an immediate notification would be
+            row = rows[0]
+            actors = list(dict.fromkeys(e["actor"] for e in row.events if e["actor"]))
+            return self._build_activity_message(
+                type_of_alert=types[0],
+                task_id=row.task_id,
+                task_title=row.task_title,
+                user_email=", ".join(actors),
+                comment_user=None,
+                updated_fields=row.updated_fields,
+                old_values=row.old_values,
+                new_values=row.new_values,
+            )
+
+        tasks = []
+        for row in rows:
+            verbs = [self._verb(t) for t in dict.fromkeys(e["type"] for e in row.events)]
+            tasks.append({
+                "task_id": row.task_id,
+                "task_title": row.task_title,
+                "activity": ", ".join(verbs).capitalize(),
+                "actors": list(dict.fromkeys(e["actor"] for e in row.events if e["actor"])) or ["—"],
+                "changes": [
+                    {"field": f, "before": _fmt_val(row.old_values.get(f, "—")), "after": _fmt_val(row.new_values.get(f, "—"))}
+                    for f in row.updated_fields
+                ],
+            })
+        digest = rows[0].digest
+        heading = "Daily digest" if digest else "Task activity"
+        subject = f"[{self.sender_display_name}] {heading} — {len(tasks)} task{'s' if len(tasks) != 1 else ''}"
+        settings = self.email_service.settings
+        text_body, html_body = self.email_service.templates.render_by_type("activity_digest", {
+            "app_name": settings.app_name,
+            "app_url": settings.app_url,
+            "heading": heading,
+            "digest": digest,
+            "tasks": tasks,
+        })
+        return subject, text_body, html_body
+
+    @staticmethod
+    def _verb(type_of_alert: str) -> str:
+        try:
+            return NotificationType(type_of_alert).verb()
+        except ValueError:
+            return type_of_alert
+
     def _resolve_recipients(
         self, *, task_id: int, to_recipients: Optional[List[str]], cc_recipients: Optional[List[str]]
     ) -> Tuple[List[str], List[str]]:
@@ -189,20 +337,17 @@ class NotificationService:
             verb = type_of_alert
         subject = f"[{self.sender_display_name}] {verb.title()} — {task_title} (#{task_id})"
 
-        def fmt_val(v: Any) -> str:
-            return "Yes" if isinstance(v, bool) and v else ("No" if isinstance(v, bool) else str(v))
-
         change_lines: List[str] = []
         for f in (updated_fields or []):
             before = old_values.get(f, "—")
             after = new_values.get(f, "—")
-            change_lines.append(f"<li><strong>{f}</strong>: {fmt_val(before)} → {fmt_val(after)}</li>")
+            change_lines.append(f"<li><strong>{f}</strong>: {_fmt_val(before)} → {_fmt_val(after)}</li>")
 
         change_text_lines: List[str] = []
         for f in (updated_fields or []):
             before = old_values.get(f, "—")
             after = new_values.get(f, "—")
-            change_text_lines.append(f"- {f}: {fmt_val(before)} -> {fmt_val(after)}")
+            change_text_lines.append(f"- {f}: {_fmt_val(before)} -> {_fmt_val(after)}")
 
         actor_html = f"<p><em>Triggered by:</em> {comment_user or user_email}</p>"
         actor_text = f"Triggered by: {comment_user or user_email}\n"
@@ -0,0 +1,161 @@
+"""
+Notification buffer: activity notifications held per (recipient, task) so that one
+email covers everything that happened in a window (or in a day, for digest
+recipients) instead of one email per event.
+
+add() writes through the service SessionLocal, so inside an API request the buffered
+event commits or rolls back with the change it reports. A recipient's events share
+one due time: the first event opens a window of coalesce_window_seconds (digest
+recipients: up to the next digest hour) and later events join it. take_due() removes
+the due rows in one DELETE ... RETURNING, so two dispatchers never both send them;
+run it in the same transaction as the emails it becomes.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+
+from backend.src.config.notification_config import NotificationSettings, get_notification_settings
+from backend.src.database.db_setup import SessionLocal
+from backend.src.database.models.notification_buffer import NotificationBuffer
+from backend.src.database.models.task import utcnow
+
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def merge_changes(
+    fields: List[str],
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    updated_fields: Iterable[str],
+    old_values: Dict[str, Any],
+    new_values: Dict[str, Any],
+) -> Tuple[List[str], Dict[str, Any], Dict[str, Any]]:
+    """
+    Fold one update into the buffered net change: a field keeps its value from before
+    the first update and takes the one after the latest. Fields that end where they
+    started are dropped.
+    """
+    fields, old, new = list(fields), dict(old), dict(new)
+    for field in updated_fields:
+        if field not in fields:
+            fields.append(field)
+            old[field] = _json_value(old_values.get(field))
+        new[field] = _json_value(new_values.get(field))
+    for field in [f for f in fields if str(old.get(f)) == str(new.get(f))]:
+        fields.remove(field)
+        old.pop(field, None)
+        new.pop(field, None)
+    return fields, old, new
+
+
+def next_digest_at(now: datetime, hour_utc: int) -> datetime:
+    """The first digest time (hour_utc:00, naive UTC) after now."""
+    due = datetime.combine(now.date(), time(hour_utc))
+    return due if due > now else due + timedelta(days=1)
+
+
+def add(
+    recipients: Iterable[str],
+    *,
+    task_id: int,
+    task_title: str,
+    type_of_alert: str,
+    actor: Optional[str],
+    updated_fields: Optional[List[str]] = None,
+    old_values: Optional[Dict[str, Any]] = None,
+    new_values: Optional[Dict[str, Any]] = None,
+    settings: Optional[NotificationSettings] = None,
+    now: Optional[datetime] = None,
+) -> None:
+    """Buffer one activity event for each recipient."""
+    settings = settings or get_notification_settings()
+    now = now or utcnow()
+    digest_recipients = set(settings.digest_recipients)
+    event = {"type": type_of_alert, "actor": actor}
+    for recipient in recipients:
+        for attempt in (1, 2):
+            try:
+                _add_one(
+                    recipient, task_id=task_id, task_title=task_title, event=event,
+                    updated_fields=updated_fields or [], old_values=old_values or {},
+                    new_values=new_values or {}, digest=recipient in digest_recipients,
+                    settings=settings, now=now,
+                )
+                break
+            except IntegrityError:
+                # A concurrent request opened the same (recipient, task) row first: merge into it
+                if attempt == 2:
+                    raise
+
+
+def _add_one(
+    recipient: str,
+    *,
+    task_id: int,
+    task_title: str,
+    event: Dict[str, Any],
+    updated_fields: List[str],
+    old_values: Dict[str, Any],
+    new_values: Dict[str, Any],
+    digest: bool,
+    settings: NotificationSettings,
+    now: datetime,
+) -> None:
+    with SessionLocal.begin() as session:
+        row = session.scalars(
+            select(NotificationBuffer).where(
+                NotificationBuffer.recipient == recipient, NotificationBuffer.task_id == task_id
+            )
+        ).first()
+        if row is None:
+            if digest:
+                due_at = next_digest_at(now, settings.digest_hour_utc)
+            else:
+                # Join the recipient's open window, if any
+                due_at = session.scalar(
+                    select(func.min(NotificationBuffer.due_at)).where(NotificationBuffer.recipient == recipient)
+                ) or now + timedelta(seconds=settings.coalesce_window_seconds)
+            row = NotificationBuffer(
+                recipient=recipient, task_id=task_id, events=[], updated_fields=[],
+                old_values={}, new_values={}, digest=digest, due_at=due_at,
+            )
+            session.add(row)
+        row.task_title = task_title
+        row.events = row.events + [event]
+        row.updated_fields, row.old_values, row.new_values = merge_changes(
+            row.updated_fields, row.old_values, row.new_values, updated_fields, old_values, new_values
+        )
+
+
+def take_due(*, now: Optional[datetime] = None) -> Dict[str, List[NotificationBuffer]]:
+    """Remove the due rows and return them, detached, per recipient in task id order."""
+    now = now or utcnow()
+    with SessionLocal.begin() as session:
+        rows = session.scalars(
+            delete(NotificationBuffer)
+            .where(NotificationBuffer.due_at <= now)
+            .returning(NotificationBuffer)
+            .execution_options(synchronize_session=False)
+        ).all()
+        for row in rows:
+            session.expunge(row)
+    groups: Dict[str, List[NotificationBuffer]] = {}
+    for row in sorted(rows, key=lambda r: (r.recipient, r.task_id)):
+        groups.setdefault(row.recipient, []).append(row)
+    return groups
+
+
+def pending_count() -> int:
+    """Buffered (recipient, task) rows not yet sent."""
+    with SessionLocal() as session:
+        return session.scalar(select(func.count()).select_from(NotificationBuffer))
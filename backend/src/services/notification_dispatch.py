@@ -0,0 +1,206 @@
+"""
+Bounded worker pool for notification side effects.
+
+Request handlers hand work that should not hold up the response (e.g. comment
+notifications) to submit(), which runs it on a shared pool of NOTIFICATION_WORKERS
+threads instead of starting a thread per call. At most NOTIFICATION_QUEUE_SIZE jobs
+wait for a worker; when the queue is full, or the pool has been shut down, the
+caller runs the job itself, so a flood of requests slows down instead of piling up
+threads or losing notifications.
+
+Jobs do not inherit the submitting request's context (its unit of work), not even
+when the caller runs them: each runs in its own transactions, as it did on its own
+thread. A failing job is logged and counted, never raised to the caller.
+
+shutdown() runs with the app: it stops taking jobs and waits up to
+NOTIFICATION_DRAIN_TIMEOUT_SECONDS for queued ones; jobs still queued after that
+are dropped (and counted).
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Set
+
+from backend.src.config.notification_config import get_notification_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DispatchStats:
+    workers: int
+    queue_size: int
+    # jobs waiting for a worker / running on one
+    queue_depth: int
+    in_flight: int
+    submitted: int
+    completed: int
+    failed: int
+    # jobs the caller ran itself because the queue was full or the pool shut down
+    ran_inline: int
+    # queued jobs abandoned when shutdown timed out
+    dropped: int
+
+
+class NotificationDispatcher:
+    """A ThreadPoolExecutor with a bounded queue, counters and a draining shutdown."""
+
+    def __init__(self, workers: int, queue_size: int):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative")
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify")
+        self._cond = threading.Condition()
+        self._pending: Set[Future] = set()
+        self._closed = False
+        self._saturated = False
+        self._queued = self._in_flight = 0
+        self._submitted = self._completed = self._failed = self._ran_inline = self._dropped = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> bool:
+        """
+        Run fn(*args, **kwargs) on a worker. Returns False if the queue was full or the
+        pool is shut down and the call ran in the caller's thread instead.
+        """
+        with self._cond:
+            self._submitted += 1
+            accept = not self._closed and self._queued + self._in_flight < self.workers + self.queue_size
+            if accept:
+                self._queued += 1
+                self._saturated = False
+            else:
+                self._ran_inline += 1
+                warn, self._saturated = not self._closed and not self._saturated, True
+        if not accept:
+            if warn:
+                logger.warning(
+                    "Notification queue full (%s workers, %s queued); running jobs in the caller",
+                    self.workers, self.queue_size,
+                )
+            self._call_detached(fn, args, kwargs)
+            return False
+
+        try:
+            future = self._executor.submit(self._run, fn, args, kwargs)
+        except RuntimeError:
+            # The executor was shut down between the check and the submit
+            with self._cond:
+                self._queued -= 1
+                self._ran_inline += 1
+            self._call_detached(fn, args, kwargs)
+            return False
+        with self._cond:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return True
+
+    def _forget(self, future: Future) -> None:
+        with self._cond:
+            self._pending.discard(future)
+
+    def _run(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        with self._cond:
+            self._queued -= 1
+            self._in_flight += 1
+        try:
+            self._call(fn, args, kwargs)
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def _call_detached(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        # An empty context, as on a worker thread: the job must not join the caller's unit of work
+        contextvars.Context().run(self._call, fn, args, kwargs)
+
+    def _call(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            logger.exception("Notification job %s failed", getattr(fn, "__qualname__", fn))
+            with self._cond:
+                self._failed += 1
+        else:
+            with self._cond:
+                self._completed += 1
+
+    def stats(self) -> DispatchStats:
+        with self._cond:
+            return DispatchStats(
+                workers=self.workers, queue_size=self.queue_size,
+                queue_depth=self._queued, in_flight=self._in_flight,
+                submitted=self._submitted, completed=self._completed, failed=self._failed,
+                ran_inline=self._ran_inline, dropped=self._dropped,
+            )
+
+    def shutdown(self, timeout: Optional[float] = None) -> int:
+        """
+        Stop taking jobs and wait up to `timeout` seconds (None: until done) for the
+        queued and running ones. Returns how many queued jobs were dropped.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._closed = True
+            while self._queued or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            dropped = sum(1 for future in list(self._pending) if future.cancel())
+            self._queued -= dropped
+            self._dropped += dropped
+            running = self._in_flight
+        if dropped or running:
+            logger.warning(
+                "Notification pool shut down after %ss: %s queued jobs dropped, %s still running",
+                timeout, dropped, running,
+            )
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return dropped
+
+
+_lock = threading.Lock()
+_dispatcher: Optional[NotificationDispatcher] = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """The process-wide pool, started on first use with the NOTIFICATION_ settings."""
+    global _dispatcher
+    with _lock:
+        if _dispatcher is None:
+            settings = get_notification_settings()
+            _dispatcher = NotificationDispatcher(settings.workers, settings.queue_size)
+        return _dispatcher
+
+
+def submit(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> bool:
+    """Run fn(*args, **kwargs) on the shared pool (see NotificationDispatcher.submit)."""
+    return get_notification_dispatcher().submit(fn, *args, **kwargs)
+
+
+def stats() -> DispatchStats:
+    """Counters of the shared pool."""
+    return get_notification_dispatcher().stats()
+
+
+def shutdown(timeout: Optional[float] = None) -> int:
+    """
+    Drain and stop the shared pool (timeout defaults to NOTIFICATION_DRAIN_TIMEOUT_SECONDS);
+    the next submit starts a new one.
+    """
+    global _dispatcher
+    with _lock:
+        dispatcher, _dispatcher = _dispatcher, None
+    if dispatcher is None:
+        return 0
+    if timeout is None:
+        timeout = get_notification_settings().drain_timeout_seconds
+    return dispatcher.shutdown(timeout)
@@ -1,6 +1,7 @@
-from typing import Dict
+from typing import Dict, Iterable, Optional
+from sqlalchemy import select, update
 from backend.src.database.db_setup import SessionLocal
-from backend.src.database.models.project import Project, ProjectAssignment
+from backend.src.database.models.project import Project, ProjectAssignment, new_report_version
 from backend.src.enums.user_role import UserRole
 from backend.src.database.models.user import User
 def create_project(project_name: str, user_id) -> Dict:
@@ -38,6 +39,65 @@ def get_project_by_id(project_id: int) -> Dict:
             "active": project.active
         }
 
+def get_report_version(project_id: int) -> Optional[str]:
+    """
+    Return the project's report_version (one indexed lookup), or None if the project doesn't exist.
+    Projects from before the column existed get their first version here.
+    """
+    return get_report_versions([project_id]).get(project_id)
+
+def get_report_versions(project_ids: Iterable[int]) -> Dict[int, str]:
+    """report_version of each existing project among project_ids, in one query."""
+    project_ids = set(project_ids)
+    if not project_ids:
+        return {}
+    with SessionLocal.begin() as session:
+        rows = session.execute(
+            select(Project.project_id, Project.report_version).where(Project.project_id.in_(project_ids))
+        ).all()
+        versions = {}
+        for project_id, version in rows:
+            if version is None:
+                version = new_report_version()
+                session.execute(
+                    update(Project).where(Project.project_id == project_id).values(report_version=version)
+                )
+            versions[project_id] = version
+        return versions
+
+def _project_dicts(projects) -> list[dict]:
+    return [
+        {
+            "project_id": proj.project_id,
+            "project_name": proj.project_name,
+            "project_manager": proj.project_manager,
+            "active": proj.active
+        }
+        for proj in projects
+    ]
+
+def get_projects_by_ids(project_ids: Iterable[int]) -> list[dict]:
+    """Return the existing projects among project_ids, ordered by project_id (one query)."""
+    project_ids = set(project_ids)
+    if not project_ids:
+        return []
+    with SessionLocal() as session:
+        projects = session.execute(
+            select(Project).where(Project.project_id.in_(project_ids)).order_by(Project.project_id)
+        ).scalars().all()
+        return _project_dicts(projects)
+
+def get_projects_by_department(department_id: int) -> list[dict]:
+    """Return the projects whose manager belongs to the department, ordered by project_id."""
+    with SessionLocal() as session:
+        projects = session.execute(
+            select(Project)
+            .join(User, User.user_id == Project.project_manager)
+            .where(User.department_id == department_id)
+            .order_by(Project.project_id)
+        ).scalars().all()
+        return _project_dicts(projects)
+
 def get_projects_by_manager(project_manager_id: int) -> list[dict]:
     """Return all projects managed by a given manager."""
     with SessionLocal() as session:
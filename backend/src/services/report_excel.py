@@ -0,0 +1,268 @@
+"""
+Excel rendering of project schedule and portfolio reports (openpyxl, write-only
+mode). Imported by services.report on first use.
+"""
+from __future__ import annotations
+
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
+
+from backend.src.database.models.task import Task
+from backend.src.enums.task_status import TaskStatus
+from backend.src.services.report import (
+    EXCEL_HEADERS, EXCEL_MAX_WIDTH, EXCEL_MIN_WIDTH, PORTFOLIO_HEADERS, PORTFOLIO_SHEET_TITLE,
+    _format_date, _get_assignees_string, _get_task_summary_data, _sheet_title,
+)
+
+# Styles are immutable and shared by every cell that uses them
+_THIN = Side(style='thin')
+_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+_HEADER_FILL = PatternFill(start_color="3949AB", end_color="3949AB", fill_type="solid")
+_STRIPE_FILL = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
+_HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+_BOLD = Font(bold=True)
+_TITLE_FONT = Font(bold=True, size=16)
+_SECTION_FONT = Font(bold=True, size=14)
+_STATUS_FONT = Font(bold=True, color="FFFFFF", size=13)
+_CENTER = Alignment(horizontal='center', vertical='center')
+_LEFT = Alignment(horizontal='left', vertical='center')
+_WRAP = Alignment(horizontal='left', vertical='top', wrap_text=True)
+
+
+def _excel_task_row(task: Task, task_assignees: Dict[int, List[str]]) -> list:
+    return [
+        task.id,
+        task.title or "N/A",
+        (task.description or "N/A")[:100],
+        task.priority,
+        _format_date(task.start_date),
+        _format_date(task.deadline),
+        _get_assignees_string(task, task_assignees),
+        task.tag or "N/A",
+    ]
+
+
+def _widen(widths: List[int], row: list) -> None:
+    """Grow each column's width to fit this row's values."""
+    for col, value in enumerate(row):
+        if value:
+            widths[col] = max(widths[col], len(str(value)))
+
+
+class _CellStyler:
+    """
+    Build styled write-only cells. Each font/fill/border/alignment combination is
+    registered with the workbook once; later cells copy its style ids instead of
+    re-hashing the style objects for every cell.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self._styles: Dict[tuple, tuple] = {}
+
+    def __call__(self, value, *, font=None, fill=None, border=None, alignment=None) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self.ws, value=value)
+        key = (id(font), id(fill), id(border), id(alignment))
+        cached = self._styles.get(key)
+        if cached is None:
+            for attr, style in (("font", font), ("fill", fill), ("border", border), ("alignment", alignment)):
+                if style is not None:
+                    setattr(cell, attr, style)
+            # keep the style objects alive so their ids stay unique
+            self._styles[key] = (StyleArray(cell._style), (font, fill, border, alignment))
+        else:
+            cell._style = StyleArray(cached[0])
+        return cell
+
+
+def generate_excel_report(
+    project: Dict[str, Any],
+    tasks: Iterable[Task],
+    task_assignees: Dict[int, List[str]],
+    out: Optional[BinaryIO] = None,
+) -> BinaryIO:
+    """
+    Generate an Excel report for a project showing task schedule.
+    All data is in a single sheet with tasks grouped by status.
+
+    The sheet is written with openpyxl's write-only mode: rows go straight to
+    `out` as they are produced, so memory does not grow with rows x columns.
+    Column widths are measured in the same pass that groups tasks by status.
+
+    Args:
+        project: Dictionary containing project information with at least 'project_name' key
+        tasks: Task objects to include in the report
+        task_assignees: Dictionary mapping task_id to list of assignee names
+        out: Binary file to write to (e.g. a SpooledTemporaryFile); a new BytesIO if omitted
+
+    Returns:
+        `out` (or the new BytesIO), rewound to the start.
+    """
+    if not project:
+        raise ValueError("Project data is required")
+
+    if not project.get('project_name'):
+        raise ValueError("Project name is required")
+
+    wb = Workbook(write_only=True)
+    _write_project_sheet(wb, "Project Schedule Report", project, tasks, task_assignees)
+
+    buffer = out if out is not None else BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def _write_project_sheet(
+    wb: Workbook,
+    sheet_title: str,
+    project: Dict[str, Any],
+    tasks: Iterable[Task],
+    task_assignees: Dict[int, List[str]],
+) -> None:
+    """Append one project's schedule sheet (summary, then tasks grouped by status) to a write-only workbook."""
+    status_groups = [
+        ("PROJECTED TASKS", TaskStatus.TO_DO.value, "4CAF50"),
+        ("IN-PROGRESS TASKS", TaskStatus.IN_PROGRESS.value, "FF9800"),
+        ("COMPLETED TASKS", TaskStatus.COMPLETED.value, "2196F3"),
+        ("UNDER REVIEW TASKS", TaskStatus.BLOCKED.value, "F44336"),
+    ]
+    by_status: Dict[str, List[Task]] = {status: [] for _, status, _ in status_groups}
+    total = 0
+
+    # One pass: group by status and measure the task columns (write-only sheets need widths up front)
+    widths = [0] * len(EXCEL_HEADERS)
+    for task in tasks:
+        total += 1
+        if task.status in by_status:
+            by_status[task.status].append(task)
+        _widen(widths, _excel_task_row(task, task_assignees))
+
+    summary_rows = [
+        ["Total Tasks", total],
+        ["Projected Tasks", len(by_status[TaskStatus.TO_DO.value])],
+        ["In-Progress Tasks", len(by_status[TaskStatus.IN_PROGRESS.value])],
+        ["Completed Tasks", len(by_status[TaskStatus.COMPLETED.value])],
+        ["Under Review Tasks", len(by_status[TaskStatus.BLOCKED.value])],
+    ]
+    for row in [["Project Schedule Report"], ["Project Name", project['project_name']], ["Summary"],
+                ["Metric", "Count"], EXCEL_HEADERS, *summary_rows, *([title] for title, _, _ in status_groups)]:
+        _widen(widths, row)
+
+    ws = wb.create_sheet(sheet_title)
+    _styled = _CellStyler(ws)
+    for col, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(col)].width = min(max(width + 2, EXCEL_MIN_WIDTH), EXCEL_MAX_WIDTH)
+
+    ws.append([_styled("Project Schedule Report", font=_TITLE_FONT, alignment=_CENTER)])
+    ws.merged_cells.add('A1:H1')
+    ws.append([_styled("Project Name", font=_BOLD), _styled(project['project_name'], font=_BOLD)])
+    ws.merged_cells.add('B2:H2')
+    ws.append([])
+    ws.append([_styled("Summary", font=_SECTION_FONT)])
+    ws.merged_cells.add('A4:H4')
+    ws.append([
+        _styled("Metric", font=_HEADER_FONT, fill=_HEADER_FILL, border=_BORDER),
+        _styled("Count", font=_HEADER_FONT, fill=_HEADER_FILL, border=_BORDER),
+    ])
+
+    for idx, row in enumerate(summary_rows, start=6):
+        fill = _STRIPE_FILL if idx % 2 == 0 else None
+        ws.append([_styled(value, border=_BORDER, fill=fill) for value in row])
+    ws.append([])
+
+    current_row = 12
+    for status_title, status, color_hex in status_groups:
+        task_list = by_status[status]
+        if not task_list:
+            continue
+
+        status_fill = PatternFill(start_color=color_hex, end_color=color_hex, fill_type="solid")
+        ws.append([_styled(status_title, font=_STATUS_FONT, fill=status_fill, alignment=_LEFT)])
+        ws.merged_cells.add(f'A{current_row}:H{current_row}')
+        ws.append([
+            _styled(header, font=_HEADER_FONT, fill=status_fill, border=_BORDER, alignment=_CENTER)
+            for header in EXCEL_HEADERS
+        ])
+        current_row += 2
+
+        for task in task_list:
+            fill = _STRIPE_FILL if current_row % 2 == 0 else None
+            ws.append([
+                _styled(value, border=_BORDER, alignment=_WRAP, fill=fill)
+                for value in _excel_task_row(task, task_assignees)
+            ])
+            current_row += 1
+
+        ws.append([])
+        current_row += 1
+
+
+
+def generate_portfolio_excel_report(
+    projects: List[Dict[str, Any]],
+    tasks_by_project: Dict[int, List[Task]],
+    task_assignees: Dict[int, List[str]],
+    out: Optional[BinaryIO] = None,
+) -> BinaryIO:
+    """
+    Generate one workbook for several projects: a portfolio overview sheet with each
+    project's task counts, then one schedule sheet per project (as in generate_excel_report).
+
+    Args:
+        projects: Project dictionaries (at least 'project_id' and 'project_name'), in sheet order
+        tasks_by_project: Dictionary mapping project_id to that project's tasks
+        task_assignees: Dictionary mapping task_id to list of assignee names
+        out: Binary file to write to; a new BytesIO if omitted
+
+    Returns:
+        `out` (or the new BytesIO), rewound to the start.
+    """
+    if not projects:
+        raise ValueError("At least one project is required")
+
+    overview = []
+    for project in projects:
+        summary = _get_task_summary_data(tasks_by_project.get(project["project_id"], []))
+        overview.append([
+            project["project_id"], project["project_name"], summary["total"], len(summary["projected"]),
+            len(summary["in_progress"]), len(summary["completed"]), len(summary["under_review"]),
+        ])
+
+    widths = [0] * len(PORTFOLIO_HEADERS)
+    for row in [PORTFOLIO_HEADERS, *overview]:
+        _widen(widths, row)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(PORTFOLIO_SHEET_TITLE)
+    _styled = _CellStyler(ws)
+    for col, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(col)].width = min(max(width + 2, EXCEL_MIN_WIDTH), EXCEL_MAX_WIDTH)
+    ws.append([_styled("Portfolio Schedule Report", font=_TITLE_FONT, alignment=_CENTER)])
+    ws.merged_cells.add('A1:G1')
+    ws.append([])
+    ws.append([
+        _styled(header, font=_HEADER_FONT, fill=_HEADER_FILL, border=_BORDER, alignment=_CENTER)
+        for header in PORTFOLIO_HEADERS
+    ])
+    for idx, row in enumerate(overview, start=4):
+        fill = _STRIPE_FILL if idx % 2 == 0 else None
+        ws.append([_styled(value, border=_BORDER, fill=fill) for value in row])
+
+    used = {PORTFOLIO_SHEET_TITLE.lower()}
+    for project in projects:
+        _write_project_sheet(
+            wb, _sheet_title(project, used), project,
+            tasks_by_project.get(project["project_id"], []), task_assignees,
+        )
+
+    buffer = out if out is not None else BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,182 @@
+"""
+Raw schedule data exports: the task + assignee rows behind the project reports,
+as CSV, Parquet or an Arrow IPC stream, for analytics jobs that do not want a
+rendered document.
+
+Rows are read in keyset batches (task id order, two queries per batch) and
+serialized batch by batch, so a large project is never held in memory at once.
+An incremental export (changed_since) returns the tasks whose updated_at is at
+or after the given time, with active = False for those that left the report so
+consumers see the removal: soft-deleted tasks and tasks attached under another
+task (linking and unlinking stamps both tasks' updated_at).
+"""
+from __future__ import annotations
+
+import csv
+import io
+from datetime import date, datetime
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import exists, select
+
+from backend.src.database.db_setup import SessionLocal
+from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task import Task
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.models.user import User
+
+EXPORT_COLUMNS = [
+    "task_id", "project_id", "title", "description", "status", "priority",
+    "start_date", "deadline", "tag", "active", "updated_at", "assignees",
+]
+
+# Tasks per batch: one Arrow record batch / Parquet row group / CSV chunk each
+EXPORT_BATCH_SIZE = 1000
+
+# Separator of the assignee names in the CSV assignees column
+CSV_ASSIGNEE_SEPARATOR = "; "
+
+
+def iter_task_batches(
+    project_id: int,
+    *,
+    changed_since: Optional[datetime] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    The project's top-level tasks as lists of EXPORT_COLUMNS dicts, in task id order.
+    Without changed_since: the active tasks, as in the reports. With it (naive UTC):
+    every task updated at or after that time, active or not; a task that has become
+    a subtask is included as removed (active False).
+    Each batch is read in its own short session, so a slow consumer holds no connection.
+    """
+    not_a_subtask = ~exists(
+        select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
+    )
+    stmt = (
+        select(
+            Task.id, Task.project_id, Task.title, Task.description, Task.status, Task.priority,
+            Task.start_date, Task.deadline, Task.tag, Task.active, Task.updated_at,
+            not_a_subtask.label("top_level"),
+        )
+        .where(Task.project_id == project_id)
+        .order_by(Task.id)
+        .limit(batch_size)
+    )
+    if changed_since is None:
+        stmt = stmt.where(Task.active.is_(True), not_a_subtask)
+    else:
+        stmt = stmt.where(Task.updated_at >= changed_since)
+
+    last_id = 0
+    while True:
+        with SessionLocal() as session:
+            rows = session.execute(stmt.where(Task.id > last_id)).all()
+            if not rows:
+                return
+            task_ids = [row.id for row in rows]
+            assignees: Dict[int, List[str]] = {}
+            for task_id, name, email in session.execute(
+                select(TaskAssignment.task_id, User.name, User.email)
+                .join(User, User.user_id == TaskAssignment.user_id)
+                .where(TaskAssignment.task_id.in_(task_ids))
+                .order_by(TaskAssignment.task_id, User.user_id)
+            ):
+                assignees.setdefault(task_id, []).append(name if name else email)
+
+        yield [
+            {
+                "task_id": row.id, "project_id": row.project_id, "title": row.title,
+                "description": row.description, "status": row.status, "priority": row.priority,
+                "start_date": row.start_date, "deadline": row.deadline, "tag": row.tag,
+                "active": bool(row.active and row.top_level), "updated_at": row.updated_at,
+                "assignees": assignees.get(row.id, []),
+            }
+            for row in rows
+        ]
+        if len(rows) < batch_size:
+            return
+        last_id = task_ids[-1]
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return CSV_ASSIGNEE_SEPARATOR.join(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def csv_chunks(batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """UTF-8 CSV: the header row, then one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for batch in batches:
+        for row in batch:
+            writer.writerow([_csv_value(row[column]) for column in EXPORT_COLUMNS])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def arrow_schema():
+    # pyarrow is imported on first use: only these exports need it
+    import pyarrow as pa
+
+    return pa.schema([
+        ("task_id", pa.int64()),
+        ("project_id", pa.int64()),
+        ("title", pa.string()),
+        ("description", pa.string()),
+        ("status", pa.string()),
+        ("priority", pa.int32()),
+        ("start_date", pa.date32()),
+        ("deadline", pa.date32()),
+        ("tag", pa.string()),
+        ("active", pa.bool_()),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+        ("assignees", pa.list_(pa.string())),
+    ])
+
+
+def _record_batches(batches: Iterable[List[Dict[str, Any]]], schema) -> Iterator[Any]:
+    import pyarrow as pa
+
+    for batch in batches:
+        yield pa.RecordBatch.from_pylist(batch, schema=schema)
+
+
+def arrow_ipc_chunks(batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """Arrow IPC stream: the schema, then one record batch per batch, then the end-of-stream marker."""
+    import pyarrow as pa
+
+    schema = arrow_schema()
+    sink = io.BytesIO()
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield drain()
+        for record_batch in _record_batches(batches, schema):
+            writer.write_batch(record_batch)
+            yield drain()
+    yield drain()
+
+
+def write_parquet(batches: Iterable[List[Dict[str, Any]]], out: BinaryIO) -> BinaryIO:
+    """Parquet file into `out`, one row group per batch; `out` is left rewound to the start."""
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema()
+    with pq.ParquetWriter(out, schema, compression="zstd") as writer:
+        for record_batch in _record_batches(batches, schema):
+            writer.write_batch(record_batch)
+    out.seek(0)
+    return out
@@ -0,0 +1,268 @@
+"""
+Background report jobs.
+
+Rendering (reportlab / openpyxl) runs in a process pool, so an API worker is not
+held for the seconds a large project takes. Finished files are cached on disk as
+<cache_dir>/project_<id>/<data_version>.<ext>, where the data version is the
+project's report_version: a job whose version has already been rendered
+completes straight from the cache without loading the project's tasks, and
+identical jobs submitted while a render is in flight share that render.
+
+The same pool renders the per-project sections of portfolio reports
+(render_pdf_sections), which are cached under <cache_dir>/portfolio/.
+
+Writing a file prunes the ones it supersedes: a project keeps only the latest
+rendered version of each format, and the portfolio directory keeps the newest
+REPORT_PORTFOLIO_CACHE_FILES per format.
+
+The job table lives in this process's memory. Jobs are visible to the API worker
+that created them and are forgotten on restart (cached files are not).
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from backend.src.config.report_config import get_report_settings
+from backend.src.enums.report import ReportFormat, ReportJobStatus
+from backend.src.services import report as report_service
+
+# Finished jobs are dropped from the table after this long (their files stay cached)
+JOB_TTL_SECONDS = 3600
+
+
+@dataclass
+class ReportJob:
+    job_id: str
+    project_id: int
+    format: ReportFormat
+    data_version: str
+    path: Path
+    status: ReportJobStatus = ReportJobStatus.PENDING
+    cached: bool = False
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+
+
+_lock = threading.RLock()
+_jobs: Dict[str, ReportJob] = {}
+_inflight: Dict[Path, Future] = {}
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def cache_path(project_id: int, report_format: ReportFormat, data_version: str) -> Path:
+    """Where the rendered file for this project / format / data version lives."""
+    cache_dir = Path(get_report_settings().cache_dir)
+    return cache_dir / f"project_{project_id}" / f"{data_version}.{report_format.extension}"
+
+
+def portfolio_cache_path(report_format: ReportFormat, data_version: str) -> Path:
+    """Where a rendered portfolio report for this combined data version lives."""
+    cache_dir = Path(get_report_settings().cache_dir)
+    return cache_dir / "portfolio" / f"{data_version}.{report_format.extension}"
+
+
+def write_cache_file(path: Path, write: Callable[[BinaryIO], Any]) -> Path:
+    """
+    Create `path` from what `write` writes into an open binary file. Goes through a
+    temp file so a crashed or concurrent render never leaves a partial file in the cache.
+    Then removes the cache files it supersedes (see prune_cache).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as out:
+            write(out)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    prune_cache(path)
+    return path
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def prune_cache(path: Path) -> List[Path]:
+    """
+    Delete the cache files of the same format next to `path` that it replaces: the
+    older versions of a project's report (report versions sort by age), or the
+    portfolio reports beyond the newest REPORT_PORTFOLIO_CACHE_FILES. A slow render
+    of an old version that finishes last leaves the newer file alone. Returns the
+    deleted paths.
+    """
+    path = Path(path)
+    siblings = [other for other in path.parent.glob(f"*{path.suffix}") if other != path]
+    if path.parent.name == "portfolio":
+        keep = max(get_report_settings().portfolio_cache_files - 1, 0)
+        siblings = sorted(siblings, key=_mtime, reverse=True)[keep:]
+    else:
+        siblings = [other for other in siblings if other.stem < path.stem]
+    for other in siblings:
+        # Readers that already opened an old file keep reading it
+        other.unlink(missing_ok=True)
+    return siblings
+
+
+def render_to_file(
+    report_format: ReportFormat,
+    project: Dict[str, Any],
+    tasks: List[report_service.ReportTask],
+    task_assignees: Dict[int, List[str]],
+    path: str,
+) -> str:
+    """Render a report into the cache file `path` (runs in a worker process)."""
+    if report_format == ReportFormat.PDF:
+        write = lambda out: out.write(report_service.generate_pdf_report(project, tasks, task_assignees).getvalue())
+    else:
+        write = lambda out: report_service.generate_excel_report(project, tasks, task_assignees, out=out)
+    write_cache_file(Path(path), write)
+    return path
+
+
+def render_pdf_section(
+    project: Dict[str, Any],
+    tasks: List[report_service.ReportTask],
+    task_assignees: Dict[int, List[str]],
+) -> bytes:
+    """One project's PDF report as bytes (runs in a worker process)."""
+    return report_service.generate_pdf_report(project, tasks, task_assignees).getvalue()
+
+
+def render_pdf_sections(
+    sections: List[Tuple[Dict[str, Any], List[report_service.ReportTask], Dict[int, List[str]]]],
+) -> List[bytes]:
+    """
+    Render one PDF per (project, tasks, task_assignees) section, in order, spread over
+    the worker pool. Rendered in this process for a single section or a single worker,
+    where the pool would only add pickling.
+    """
+    if len(sections) < 2 or get_report_settings().workers < 2:
+        return [render_pdf_section(*section) for section in sections]
+    with _lock:
+        executor = _get_executor()
+    return list(executor.map(render_pdf_section, *zip(*sections)))
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn: workers start clean instead of inheriting the API process's threads and DB connections
+        _executor = ProcessPoolExecutor(
+            max_workers=get_report_settings().workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown() -> None:
+    """Stop the worker pool (pending renders are cancelled); the next job starts a new one."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _prune(now: float) -> None:
+    expired = [
+        job_id for job_id, job in _jobs.items()
+        if job.finished_at is not None and now - job.finished_at.timestamp() > JOB_TTL_SECONDS
+    ]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+def _finish(job: ReportJob, future: Future) -> None:
+    with _lock:
+        job.finished_at = datetime.now(timezone.utc)
+        if future.cancelled():
+            job.status, job.error = ReportJobStatus.FAILED, "Report job was cancelled"
+        elif future.exception() is not None:
+            exc = future.exception()
+            job.status, job.error = ReportJobStatus.FAILED, str(exc) or type(exc).__name__
+        else:
+            job.status = ReportJobStatus.DONE
+
+
+def _forget_inflight(path: Path, future: Future) -> None:
+    with _lock:
+        if _inflight.get(path) is future:
+            del _inflight[path]
+
+
+def submit_job(
+    project_id: int,
+    report_format: ReportFormat,
+    data_version: str,
+    load: Callable[[], Tuple[Dict[str, Any], List[report_service.ReportTask], Dict[int, List[str]]]],
+) -> ReportJob:
+    """
+    Queue a render of this project's report at `data_version` and return its job.
+    Completes immediately when that version is already cached, and joins an identical
+    render that is still running instead of starting another; only otherwise is
+    `load()` called for the (project, tasks, task_assignees) to render.
+    """
+    path = cache_path(project_id, report_format, data_version)
+    job = ReportJob(uuid.uuid4().hex, project_id, report_format, data_version, path)
+
+    with _lock:
+        _prune(time.time())
+        _jobs[job.job_id] = job
+        if path.exists():
+            job.status, job.cached = ReportJobStatus.DONE, True
+            job.finished_at = datetime.now(timezone.utc)
+            return job
+        future = _inflight.get(path)
+
+    if future is None:
+        # Load outside the lock; a second identical submit may load too, but only one render starts
+        try:
+            project, tasks, task_assignees = load()
+        except Exception:
+            with _lock:
+                _jobs.pop(job.job_id, None)
+            raise
+        with _lock:
+            future = _inflight.get(path)
+            if future is None:
+                future = _get_executor().submit(
+                    render_to_file, report_format, project, tasks, task_assignees, str(path)
+                )
+                _inflight[path] = future
+                future.add_done_callback(lambda f: _forget_inflight(path, f))
+
+    future.add_done_callback(lambda f: _finish(job, f))
+    return job
+
+
+def get_job(job_id: str) -> Optional[ReportJob]:
+    with _lock:
+        return _jobs.get(job_id)
+
+
+def wait(job_id: str, timeout: Optional[float] = None) -> Optional[ReportJob]:
+    """Block until the job leaves PENDING (or timeout); for scripts and tests."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        job = get_job(job_id)
+        if job is None or job.status != ReportJobStatus.PENDING:
+            return job
+        if deadline is not None and time.monotonic() >= deadline:
+            return job
+        time.sleep(0.02)
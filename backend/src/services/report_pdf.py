@@ -0,0 +1,168 @@
+"""
+PDF rendering of project schedule reports (reportlab), and merging of rendered
+reports into one document (pypdf). Imported by services.report on first use.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from reportlab.lib.pagesizes import letter, A4
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+
+from pypdf import PdfWriter
+
+from backend.src.database.models.task import Task
+from backend.src.services.report import _format_date, _get_assignees_string, _get_task_summary_data
+
+
+def generate_pdf_report(
+    project: Dict[str, Any],
+    tasks: List[Task],
+    task_assignees: Dict[int, List[str]]
+) -> BytesIO:
+    """
+    Generate a PDF report for a project showing task schedule.
+    
+    Args:
+        project: Dictionary containing project information with at least 'project_name' key
+        tasks: List of Task objects to include in the report
+        task_assignees: Dictionary mapping task_id to list of assignee names
+    
+    Returns:
+        BytesIO buffer with PDF content.
+    """
+    if not project:
+        raise ValueError("Project data is required")
+    
+    if not project.get('project_name'):
+        raise ValueError("Project name is required")
+    
+    all_tasks = list(tasks)
+    
+    summary = _get_task_summary_data(all_tasks)
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    story = []
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        textColor=colors.HexColor('#1a237e'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#283593'),
+        spaceAfter=12,
+        spaceBefore=20
+    )
+    
+    story.append(Paragraph(f"Project Schedule Report: {project['project_name']}", title_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    summary_data = [
+        ["Metric", "Count"],
+        ["Total Tasks", str(summary["total"])],
+        ["Projected Tasks", str(len(summary["projected"]))],
+        ["In-Progress Tasks", str(len(summary["in_progress"]))],
+        ["Completed Tasks", str(len(summary["completed"]))],
+        ["Under Review Tasks", str(len(summary["under_review"]))],
+    ]
+    
+    summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
+    summary_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3949ab')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+    ]))
+    story.append(summary_table)
+    story.append(Spacer(1, 0.3*inch))
+    
+    status_groups = [
+        ("Projected Tasks", summary["projected"], colors.HexColor('#4caf50')),
+        ("In-Progress Tasks", summary["in_progress"], colors.HexColor('#ff9800')),
+        ("Completed Tasks", summary["completed"], colors.HexColor('#2196f3')),
+        ("Under Review Tasks", summary["under_review"], colors.HexColor('#f44336')),
+    ]
+    
+    for group_title, group_tasks, color in status_groups:
+        if not group_tasks:
+            continue
+            
+        story.append(Paragraph(group_title, heading_style))
+        
+        task_data = [["ID", "Title", "Priority", "Start Date", "Deadline", "Assignees"]]
+        
+        for task in group_tasks:
+            assignees = _get_assignees_string(task, task_assignees)
+            task_data.append([
+                str(task.id),
+                task.title[:40] + "..." if task.title and len(task.title) > 40 else (task.title or "N/A"),
+                str(task.priority),
+                _format_date(task.start_date),
+                _format_date(task.deadline),
+                assignees[:30] + "..." if len(assignees) > 30 else assignees,
+            ])
+        
+        task_table = Table(task_data, colWidths=[0.5*inch, 2.5*inch, 0.7*inch, 1*inch, 1*inch, 1.8*inch])
+        task_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), color),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        story.append(task_table)
+        story.append(Spacer(1, 0.2*inch))
+    
+    story.append(Spacer(1, 0.2*inch))
+    story.append(Paragraph(
+        f"Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        styles['Normal']
+    ))
+    
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
+
+
+def merge_pdf_reports(sections: Iterable[Tuple[str, bytes]], out: Optional[BinaryIO] = None) -> BinaryIO:
+    """
+    Concatenate rendered PDF reports into one document, with a bookmark per section.
+
+    Args:
+        sections: (bookmark title, PDF bytes) pairs in document order
+        out: Binary file to write to; a new BytesIO if omitted
+
+    Returns:
+        `out` (or the new BytesIO), rewound to the start.
+    """
+    writer = PdfWriter()
+    for title, pdf in sections:
+        writer.append(BytesIO(pdf), outline_item=title)
+    buffer = out if out is not None else BytesIO()
+    writer.write(buffer)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,175 @@
+"""
+Pooled async SMTP transport (aiosmtplib), selected with EMAIL_TRANSPORT=aiosmtplib.
+
+SMTPConnectionPool keeps up to smtp_pool_size connections open, each connected,
+STARTTLS'd and logged in once, and hands them to concurrent sends: a batch goes out
+over all of them at once, every connection sending its share back to back. A
+connection is replaced after smtp_max_messages_per_connection messages (servers cap
+messages per session) or smtp_idle_timeout idle seconds, and dropped on any
+connection error; a send that finds a kept-alive connection closed by the server is
+retried once on a fresh one.
+
+AsyncSMTPTransport runs a pool on its own event loop thread so the synchronous
+callers (EmailService.send_batch, called by the outbox dispatcher) keep their
+connections warm between batches.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from email.message import Message
+from typing import List, Optional, Sequence, Tuple, Union
+
+import aiosmtplib
+
+from backend.src.config.email_config import EmailSettings
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# The connection is unusable after these; anything else is a per-message refusal
+_CONNECTION_ERRORS = (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPTimeoutError, OSError)
+
+
+class _Connection:
+    __slots__ = ("client", "sent", "last_used")
+
+    def __init__(self, client: aiosmtplib.SMTP, now: float):
+        self.client = client
+        self.sent = 0
+        self.last_used = now
+
+
+class SMTPConnectionPool:
+    """A bounded pool of authenticated aiosmtplib connections; use from one event loop."""
+
+    def __init__(
+        self,
+        settings: EmailSettings,
+        *,
+        size: Optional[int] = None,
+        max_messages_per_connection: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+    ):
+        self.settings = settings
+        self.size = size or settings.smtp_pool_size
+        self.max_messages_per_connection = max_messages_per_connection or settings.smtp_max_messages_per_connection
+        self.idle_timeout = settings.smtp_idle_timeout if idle_timeout is None else idle_timeout
+        self._idle: List[_Connection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        # Connections opened over the pool's life (for tests and the benchmark)
+        self.opened = 0
+
+    async def _open(self) -> _Connection:
+        settings = self.settings
+        client = aiosmtplib.SMTP(
+            hostname=settings.fastmail_smtp_host,
+            port=settings.fastmail_smtp_port,
+            username=settings.fastmail_username or None,
+            password=settings.fastmail_password or None,
+            timeout=settings.timeout,
+            use_tls=settings.use_ssl,
+            start_tls=settings.use_tls and not settings.use_ssl,
+        )
+        try:
+            await client.connect()  # connect, STARTTLS and login
+        except BaseException:
+            client.close()
+            raise
+        self.opened += 1
+        return _Connection(client, asyncio.get_running_loop().time())
+
+    async def _close(self, conn: _Connection) -> None:
+        try:
+            await conn.client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            conn.client.close()
+
+    async def _acquire(self) -> Tuple[_Connection, bool]:
+        """A connection and whether it was reused from the pool."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        await self._slots.acquire()
+        try:
+            now = asyncio.get_running_loop().time()
+            while self._idle:
+                conn = self._idle.pop()  # most recently used first: the likeliest to be alive
+                if conn.client.is_connected and now - conn.last_used < self.idle_timeout:
+                    return conn, True
+                await self._close(conn)
+            return await self._open(), False
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _release(self, conn: _Connection, *, broken: bool) -> None:
+        try:
+            if broken:
+                conn.client.close()
+            elif conn.sent >= self.max_messages_per_connection or not conn.client.is_connected:
+                await self._close(conn)
+            else:
+                conn.last_used = asyncio.get_running_loop().time()
+                self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+    async def send(self, msg: Message, recipients: Sequence[str]) -> str:
+        """Send one message to the envelope recipients; returns its Message-ID."""
+        for attempt in (1, 2):
+            conn, reused = await self._acquire()
+            broken = False
+            try:
+                await conn.client.send_message(
+                    msg, sender=self.settings.fastmail_from_email, recipients=list(recipients)
+                )
+                conn.sent += 1
+                return msg["Message-ID"]
+            except aiosmtplib.SMTPServerDisconnected:
+                broken = True
+                # The server dropped a kept-alive connection while it sat in the pool
+                if reused and attempt == 1:
+                    logger.info("Pooled SMTP connection was closed by the server; retrying on a new one")
+                    continue
+                raise
+            except _CONNECTION_ERRORS:
+                broken = True
+                raise
+            finally:
+                await self._release(conn, broken=broken)
+
+    async def send_many(self, messages: Sequence[Tuple[Message, Sequence[str]]]) -> List[Union[str, Exception]]:
+        """Send (message, envelope recipients) pairs concurrently over the pool; per message, its Message-ID or the exception that failed it."""
+        return await asyncio.gather(
+            *(self.send(msg, recipients) for msg, recipients in messages), return_exceptions=True
+        )
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._close(conn)
+
+
+class AsyncSMTPTransport:
+    """Synchronous facade over an SMTPConnectionPool running on a private event loop thread."""
+
+    def __init__(self, settings: EmailSettings, **pool_options):
+        self.pool = SMTPConnectionPool(settings, **pool_options)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="smtp-pool", daemon=True)
+        self._thread.start()
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def send_batch(self, messages: Sequence[Tuple[Message, Sequence[str]]]) -> List[Union[str, Exception]]:
+        return self._run(self.pool.send_many(messages))
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._run(self.pool.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
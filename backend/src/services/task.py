@@ -5,18 +5,23 @@ from datetime import date, timedelta
 from enum import Enum
 from operator import and_
 from token import OP
-from typing import Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional, Sequence
 
-from sqlalchemy import select, exists
+from sqlalchemy import Integer, Row, cast, select, exists, delete, insert, literal, null, true, union_all
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
-from backend.src.database.db_setup import SessionLocal
+from backend.src.database.db_setup import SessionLocal, AsyncSessionLocal
+from backend.src.database.models.project import touch_project_reports
 from backend.src.database.models.task import Task
 from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task_closure import TaskClosure
 from backend.src.database.models.task_assignment import TaskAssignment
 from backend.src.enums.task_status import TaskStatus, ALLOWED_STATUSES
 from backend.src.enums.task_filter import TaskFilter, ALLOWED_FILTERS
 from backend.src.enums.task_sort import TaskSort, ALLOWED_SORTS
+from backend.src.services.task_paging import apply_sort, apply_page
+from backend.src.services.task_query import compile_filter, listing_statement
 
 
 
@@ -26,21 +31,75 @@ from backend.src.enums.task_sort import TaskSort, ALLOWED_SORTS
 def _assert_no_cycle(session, parent_id: int, child_id: int) -> None:
     """
     Prevent cycles: parent must not be a descendant of child.
-    Lightweight BFS over the association table.
-    """
-    to_visit = [child_id]
-    seen = set()
-    while to_visit:
-        cur = to_visit.pop()
-        if cur in seen:
-            continue  # pragma: no cover  (defensive; single-parent invariant prevents revisits)
-        seen.add(cur)
-        rows = session.execute(
-            select(ParentAssignment.subtask_id).where(ParentAssignment.parent_id == cur)
-        ).scalars().all()
-        if parent_id in rows:
-            raise ValueError("Cycle detected: the chosen parent is a descendant of the subtask.")
-        to_visit.extend(rows)
+    Single indexed lookup against the task_closure table.
+    """
+    _assert_no_cycles(session, parent_id=parent_id, child_ids=[child_id])
+
+
+def _assert_no_cycles(session, parent_id: int, child_ids: Iterable[int]) -> None:
+    """Cycle guard for attaching several children to one parent in a single query."""
+    ids = list(child_ids)
+    if not ids:
+        return
+    offending = session.execute(
+        select(TaskClosure.ancestor_id).where(
+            TaskClosure.descendant_id == parent_id,
+            TaskClosure.ancestor_id.in_(ids),
+        )
+    ).scalars().all()
+    if offending:
+        raise ValueError("Cycle detected: the chosen parent is a descendant of the subtask.")
+
+
+def _closure_link(session, parent_id: int, child_ids: Iterable[int]) -> None:
+    """
+    Add closure rows for newly linked children: every ancestor of the parent (and the
+    parent itself) becomes an ancestor of every node in each child's subtree.
+    """
+    ids = list(child_ids)
+    if not ids:
+        return
+
+    ancestors = union_all(
+        select(TaskClosure.ancestor_id.label("node_id"), TaskClosure.depth.label("depth"))
+        .where(TaskClosure.descendant_id == parent_id),
+        select(literal(parent_id).label("node_id"), literal(0).label("depth")),
+    ).subquery("anc")
+
+    subtree = union_all(
+        select(TaskClosure.descendant_id.label("node_id"), TaskClosure.depth.label("depth"))
+        .where(TaskClosure.ancestor_id.in_(ids)),
+        *[select(literal(cid).label("node_id"), literal(0).label("depth")) for cid in ids],
+    ).subquery("sub")
+
+    session.execute(
+        insert(TaskClosure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(
+                ancestors.c.node_id,
+                subtree.c.node_id,
+                ancestors.c.depth + subtree.c.depth + 1,
+            ).select_from(ancestors.join(subtree, true())),
+        )
+    )
+
+
+def _closure_unlink(session, child_id: int) -> None:
+    """
+    Remove closure rows connecting child's subtree to child's former ancestors.
+    Rows inside the subtree itself are kept.
+    """
+    subtree = union_all(
+        select(TaskClosure.descendant_id).where(TaskClosure.ancestor_id == child_id),
+        select(literal(child_id)),
+    )
+    ancestors = select(TaskClosure.ancestor_id).where(TaskClosure.descendant_id == child_id)
+    session.execute(
+        delete(TaskClosure).where(
+            TaskClosure.descendant_id.in_(subtree),
+            TaskClosure.ancestor_id.in_(ancestors),
+        )
+    )
 
 
 # ---- Task CRUD -------------------------------------------------------------------
@@ -182,20 +241,21 @@ def list_tasks(
     active_only: bool = True, 
     project_id: Optional[int] = None,
     sort_by: str = "priority_desc",
-    filter_by: Optional[dict] = None
+    filter_by: Optional[dict] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
 ) -> list[Task]:
     """
     Return all top-level tasks (tasks that are not referenced as a subtask),
     with their subtasks eagerly loaded.
     
-    Filter options:
+    Filter options (see task_query for the full grammar; keys are ANDed, "and"/"or" nest):
     - {"priority_range": [3, 7]} - Priority range (min, max)
-    - {"status": "IN_PROGRESS"} - Exact status 
+    - {"status": "In-progress"} - Status, or a list of statuses
     - {"deadline_range": [date(2024, 10, 1), date(2024, 10, 31)]} - Due date range
     - {"start_date_range": [date(2024, 10, 1), date(2024, 10, 31)]} - Start date range
-    
-    Note: Date ranges (deadline_range, start_date_range) can be combined together.
-    Other filters (priority_range, status) are mutually exclusive with all others.
+    - {"tag": ...}, {"project_id": ...}, {"assignee_id": ...} - Value or list of values
+    - {"or": [{"status": "Blocked"}, {"priority_range": [8, 10]}]} - Any of the expressions
     
     Sort options:
     - "priority_desc" (default): Priority high to low, then deadline closest to furthest
@@ -205,107 +265,114 @@ def list_tasks(
     - "deadline_asc": Deadline oldest to latest, then by priority high to low
     - "deadline_desc": Deadline latest to oldest, then by priority high to low
     - "status": By status, then by priority high to low
+
+    Pagination (keyset): pass limit to cap the page size and after=<cursor> to resume
+    after the last task of the previous page (see task_paging.encode_cursor).
     """
+    stmt, params = _list_tasks_statement(active_only, project_id, sort_by, filter_by, limit, after)
     with SessionLocal() as session:
+        return session.execute(stmt, params).scalars().all()
+
+async def list_tasks_async(
+    *,
+    active_only: bool = True,
+    project_id: Optional[int] = None,
+    sort_by: str = "priority_desc",
+    filter_by: Optional[dict] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> list[Task]:
+    """list_tasks on the async engine; same filters, sorts and pagination."""
+    stmt, params = _list_tasks_statement(active_only, project_id, sort_by, filter_by, limit, after)
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(stmt, params)).scalars().all()
+
+def _list_tasks_statement(active_only, project_id, sort_by, filter_by, limit, after):
+    """(statement, params) behind list_tasks / list_tasks_async."""
+    if project_id is not None:
+        scope = {"project_id": project_id}
+        filter_by = {"and": [filter_by, scope]} if filter_by else scope
+    shape, params = compile_filter(filter_by)
+
+    # The filtered, sorted statement is cached per filter shape; only the values change per call
+    stmt = listing_statement(shape, active_only=active_only, sort_by=sort_by, with_subtasks=True)
+    return apply_page(stmt, sort_by, limit=limit, after=after), params
+
+def list_tasks_by_project(
+    project_id: int,
+    *,
+    active_only: bool = True,
+    sort_by: str = "priority_desc",
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> list[Task]:
+    """
+    Only returns tasks that are not subtasks of other tasks (top-level hierarchy).
+    Supports the same sort options and keyset pagination as list_tasks.
+    """
+    with SessionLocal() as session:
+        # Only return parent tasks (not subtasks) for this project
         not_a_subtask = ~exists(
             select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
         )
         stmt = (
             select(Task)
             .where(not_a_subtask)
-            .where(Task.active.is_(active_only))
+            .where(Task.active == active_only)
+            .where(Task.project_id == project_id)
             .options(selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask))
         )
-            
-        # Apply filters if provided
-        if filter_by:
-
-            if "priority_range" in filter_by:
-                min_p, max_p = filter_by["priority_range"]
-                stmt = stmt.where(Task.priority >= min_p, Task.priority <= max_p)
-            
-            if "status" in filter_by:
-                stmt = stmt.where(Task.status == filter_by["status"])
-                
-            if "deadline_range" in filter_by:
-                start_date, end_date = filter_by["deadline_range"]
-                stmt = stmt.where(Task.deadline >= start_date, Task.deadline <= end_date)
-                
-            if "start_date_range" in filter_by:
-                start_date, end_date = filter_by["start_date_range"]
-                stmt = stmt.where(Task.start_date >= start_date, Task.start_date <= end_date)
+        stmt = apply_sort(stmt, sort_by)
+        stmt = apply_page(stmt, sort_by, limit=limit, after=after)
         
-        # Apply sorting after filtering
-        if sort_by == "priority_desc":
-            stmt = stmt.order_by(
-                Task.priority.desc(), 
-                Task.deadline.is_(None), 
-                Task.deadline.asc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "priority_asc":
-            stmt = stmt.order_by(
-                Task.priority.asc(), 
-                Task.deadline.is_(None), 
-                Task.deadline.asc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "start_date_asc":
-            stmt = stmt.order_by(
-                Task.start_date.is_(None), 
-                Task.start_date.asc(), 
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "start_date_desc":
-            stmt = stmt.order_by(
-                Task.start_date.desc(), 
-                Task.start_date.is_(None), 
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "deadline_asc":
-            stmt = stmt.order_by(
-                Task.deadline.is_(None), 
-                Task.deadline.asc(), 
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "deadline_desc":
-            stmt = stmt.order_by(
-                Task.deadline.desc(), 
-                Task.deadline.is_(None), 
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "status":
-            stmt = stmt.order_by(
-                Task.status.desc(), # reverse alphabetical order gives to-do first and blocked last
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        
-        return session.execute(stmt).scalars().all()
+        tasks = session.execute(stmt).scalars().all()
+        return tasks
 
-def list_tasks_by_project(project_id: int, *, active_only: bool = True) -> list[Task]:
+def iter_task_rows_by_project(
+    project_id: int,
+    columns: Sequence[Any],
+    *,
+    active_only: bool = True,
+    batch_size: int = 1000,
+) -> Iterator[Row]:
     """
-    Only returns tasks that are not subtasks of other tasks (top-level hierarchy).
+    The project's top-level tasks as plain rows of `columns` (Task attributes), highest
+    priority first as in list_tasks_by_project, fetched batch_size rows at a time as
+    they are iterated. No Task objects or subtask loads, so memory does not grow with
+    the size of the project.
     """
     with SessionLocal() as session:
-        # Only return parent tasks (not subtasks) for this project
         not_a_subtask = ~exists(
             select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
         )
         stmt = (
-            select(Task)
+            select(*columns)
             .where(not_a_subtask)
             .where(Task.active == active_only)
             .where(Task.project_id == project_id)
-            .options(selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask))
+            .execution_options(yield_per=batch_size)
         )
-        
-        tasks = session.execute(stmt).scalars().all()
-        return tasks
+        yield from session.execute(apply_sort(stmt, "priority_desc"))
+
+def list_tasks_by_projects(project_ids: Iterable[int], *, active_only: bool = True) -> list[Task]:
+    """
+    Top-level tasks (not subtasks) of several projects in one query, highest priority
+    first as in list_tasks_by_project; group them by task.project_id.
+    """
+    project_ids = set(project_ids)
+    if not project_ids:
+        return []
+    with SessionLocal() as session:
+        not_a_subtask = ~exists(
+            select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
+        )
+        stmt = (
+            select(Task)
+            .where(not_a_subtask)
+            .where(Task.active == active_only)
+            .where(Task.project_id.in_(project_ids))
+        )
+        return session.execute(apply_sort(stmt, "priority_desc")).scalars().all()
 
 def list_project_tasks_by_user(project_id: int, user_id: int) -> list[Task]:
     """
@@ -342,6 +409,17 @@ def delete_task(task_id: int) -> Task:
     with SessionLocal.begin() as session:
         task = session.get(Task, task_id)
 
+        # The bulk deletes below skip the flush hooks: touch the reports of every task
+        # whose place in the hierarchy changes (its parent and its direct subtasks) here
+        linked_ids = session.execute(
+            select(ParentAssignment.parent_id, ParentAssignment.subtask_id).where(
+                (ParentAssignment.parent_id == task_id) | (ParentAssignment.subtask_id == task_id)
+            )
+        ).all()
+        touch_project_reports(
+            session.connection(), task_ids={task_id, *(tid for link in linked_ids for tid in link)}
+        )
+
         # Remove links where this task is parent or subtask
         session.query(ParentAssignment).filter(
             ParentAssignment.parent_id == task_id
@@ -350,7 +428,15 @@ def delete_task(task_id: int) -> Task:
             ParentAssignment.subtask_id == task_id
         ).delete()
 
+        # Keep the hierarchy index in step: cut this task off from its ancestors,
+        # then from its own descendants (their subtrees stay intact)
+        _closure_unlink(session, task_id)
+        session.execute(delete(TaskClosure).where(TaskClosure.ancestor_id == task_id))
+
         task.active = False
+        # The bulk deletes bypass the identity map; drop the link collections
+        # (possibly loaded earlier in this request) so they aren't flushed or returned stale
+        session.expire(task, ["subtask_links", "parent_link"])
         session.add(task)
         session.flush()
         return task
@@ -362,26 +448,28 @@ def link_subtask(parent_id: int, subtask_id: int):
     with SessionLocal.begin() as session:
         _assert_no_cycle(session, parent_id=parent_id, child_id=subtask_id)
         session.add(ParentAssignment(parent_id=parent_id, subtask_id=subtask_id))
+        _closure_link(session, parent_id, [subtask_id])
 
 def list_parent_tasks(
     *, 
     active_only: bool = True, 
     project_id: Optional[int] = None,
     sort_by: str = "priority_desc",
-    filter_by: Optional[dict] = None
+    filter_by: Optional[dict] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
 ) -> list[Task]:
     """
     Return all top-level tasks (tasks that are not referenced as a subtask),
     with their subtasks eagerly loaded.
     
-    Filter options:
+    Filter options (see task_query for the full grammar; keys are ANDed, "and"/"or" nest):
     - {"priority_range": [3, 7]} - Priority range (min, max)
-    - {"status": "IN_PROGRESS"} - Exact status 
+    - {"status": "In-progress"} - Status, or a list of statuses
     - {"deadline_range": [date(2024, 10, 1), date(2024, 10, 31)]} - Due date range
     - {"start_date_range": [date(2024, 10, 1), date(2024, 10, 31)]} - Start date range
-    
-    Note: Date ranges (deadline_range, start_date_range) can be combined together.
-    Other filters (priority_range, status) are mutually exclusive with all others.
+    - {"tag": ...}, {"project_id": ...}, {"assignee_id": ...} - Value or list of values
+    - {"or": [{"status": "Blocked"}, {"priority_range": [8, 10]}]} - Any of the expressions
     
     Sort options:
     - "priority_desc" (default): Priority high to low, then deadline closest to furthest
@@ -391,88 +479,21 @@ def list_parent_tasks(
     - "deadline_asc": Deadline oldest to latest, then by priority high to low
     - "deadline_desc": Deadline latest to oldest, then by priority high to low
     - "status": By status, then by priority high to low
+
+    Pagination (keyset): pass limit to cap the page size and after=<cursor> to resume
+    after the last task of the previous page (see task_paging.encode_cursor).
     """
-    with SessionLocal() as session:
-        not_a_subtask = ~exists(
-            select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
-        )
-        stmt = (
-            select(Task)
-            .where(not_a_subtask)
-            .where(Task.active.is_(active_only))
-        )
-            
-        # Apply filters if provided
-        if filter_by:           
+    if project_id is not None:
+        scope = {"project_id": project_id}
+        filter_by = {"and": [filter_by, scope]} if filter_by else scope
+    shape, params = compile_filter(filter_by)
 
-            if "priority_range" in filter_by:
-                min_p, max_p = filter_by["priority_range"]
-                stmt = stmt.where(Task.priority >= min_p, Task.priority <= max_p)
-            
-            if "status" in filter_by:
-                stmt = stmt.where(Task.status == filter_by["status"])
-                
-            if "deadline_range" in filter_by:
-                start_date, end_date = filter_by["deadline_range"]
-                stmt = stmt.where(Task.deadline >= start_date, Task.deadline <= end_date)
-                
-            if "start_date_range" in filter_by:
-                start_date, end_date = filter_by["start_date_range"]
-                stmt = stmt.where(Task.start_date >= start_date, Task.start_date <= end_date)
-        
-        # Apply sorting after filtering
-        if sort_by == "priority_desc":
-            stmt = stmt.order_by(
-                Task.priority.desc(), 
-                Task.deadline.is_(None), 
-                Task.deadline.asc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "priority_asc":
-            stmt = stmt.order_by(
-                Task.priority.asc(), 
-                Task.deadline.is_(None), 
-                Task.deadline.asc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "start_date_asc":
-            stmt = stmt.order_by(
-                Task.start_date.is_(None), 
-                Task.start_date.asc(), 
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "start_date_desc":
-            stmt = stmt.order_by(
-                Task.start_date.desc(), 
-                Task.start_date.is_(None), 
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "deadline_asc":
-            stmt = stmt.order_by(
-                Task.deadline.is_(None), 
-                Task.deadline.asc(), 
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "deadline_desc":
-            stmt = stmt.order_by(
-                Task.deadline.desc(), 
-                Task.deadline.is_(None), 
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        elif sort_by == "status":
-            stmt = stmt.order_by(
-                Task.status.desc(), # reverse alphabetical order gives to-do first and blocked last
-                Task.priority.desc(), 
-                Task.id.asc()
-            )
-        else:
-            raise ValueError(f"Invalid sort_by parameter: {sort_by}")
+    with SessionLocal() as session:
+        # The filtered, sorted statement is cached per filter shape; only the values change per call
+        stmt = listing_statement(shape, active_only=active_only, sort_by=sort_by, with_subtasks=False)
+        stmt = apply_page(stmt, sort_by, limit=limit, after=after)
         
-        return session.execute(stmt).scalars().all()
+        return session.execute(stmt, params).scalars().all()
 
 def attach_subtasks(parent_id: int, subtask_ids: Iterable[int]) -> Task:
     """
@@ -493,6 +514,7 @@ def attach_subtasks(parent_id: int, subtask_ids: Iterable[int]) -> Task:
                 select(Task)
                 .where(Task.id == parent_id)
                 .options(selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask))
+                .execution_options(populate_existing=True)
             ).scalar_one()
 
         # Fetch subtask rows
@@ -510,15 +532,15 @@ def attach_subtasks(parent_id: int, subtask_ids: Iterable[int]) -> Task:
         if conflicts:
             raise ValueError(f"Task(s) already have a parent: {conflicts}")
 
-        # Cycle guard for each subtask
-        for st in sub_rows:
-            _assert_no_cycle(session, parent_id=parent_id, child_id=st.id)
+        # Cycle guard for all subtasks in one lookup
+        _assert_no_cycles(session, parent_id=parent_id, child_ids=[st.id for st in sub_rows])
 
         # Create links for those not already linked to this parent (idempotent)
         already = {lnk.subtask_id for lnk in existing_links if lnk.parent_id == parent_id}
         to_link = [sid for sid in ids if sid not in already]
         for sid in to_link:
             session.add(ParentAssignment(parent_id=parent_id, subtask_id=sid))
+        _closure_link(session, parent_id, to_link)
 
         session.flush()
 
@@ -527,6 +549,8 @@ def attach_subtasks(parent_id: int, subtask_ids: Iterable[int]) -> Task:
             select(Task)
             .where(Task.id == parent_id)
             .options(selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask))
+            # refresh collections the request's session may already hold from before the attach
+            .execution_options(populate_existing=True)
         ).scalar_one()
         return parent
 
@@ -547,6 +571,7 @@ def detach_subtask(parent_id: int, subtask_id: int) -> bool:
         ).scalar_one_or_none()
 
         session.delete(link)
+        _closure_unlink(session, subtask_id)
         return True
 
 def get_task_with_subtasks(task_id: int) -> Optional[Task]:
@@ -557,11 +582,129 @@ def get_task_with_subtasks(task_id: int) -> Optional[Task]:
     #     raise TypeError(f"task_id must be an integer, got {type(task_id).__name__}")
     
     with SessionLocal() as session:
-        stmt = (
-            select(Task)
+        return session.execute(_task_with_subtasks_statement(task_id)).scalar_one_or_none()
+
+async def get_task_with_subtasks_async(task_id: int) -> Optional[Task]:
+    """get_task_with_subtasks on the async engine."""
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(_task_with_subtasks_statement(task_id))).scalar_one_or_none()
+
+def _task_with_subtasks_statement(task_id: int):
+    return (
+        select(Task)
+        .where(Task.id == task_id)
+        .options(
+            selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask.and_(Task.active.is_(True)))
+        )
+        # within a request's session, reload rather than reuse collections loaded before a write
+        .execution_options(populate_existing=True)
+    )
+
+
+def get_task_tree(task_id: int, *, max_depth: Optional[int] = None) -> Optional[dict]:
+    """
+    Return task_id and its whole subtree (active subtasks only) as nested dicts,
+    fetched with a single WITH RECURSIVE query over parent_assignment.
+
+    Each node holds the task's columns plus a "subtasks" list (ordered by id): the
+    input of schemas.task.TaskTree, a TaskWithSubTasks nested to every level.
+    max_depth limits how many levels below the root are included (0 = root only).
+
+    Returns None if the task does not exist.
+    """
+    with SessionLocal() as session:
+        subtree = (
+            select(
+                Task.id.label("id"),
+                # typed, so PostgreSQL matches the anchor columns with the recursive member's
+                cast(null(), Integer).label("parent_id"),
+                literal(0, Integer).label("depth"),
+            )
             .where(Task.id == task_id)
-            .options(
-                selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask.and_(Task.active.is_(True)))
+            .cte("subtree", recursive=True)
+        )
+        step = (
+            select(
+                ParentAssignment.subtask_id,
+                ParentAssignment.parent_id,
+                subtree.c.depth + 1,
             )
+            .join(subtree, ParentAssignment.parent_id == subtree.c.id)
+            .join(Task, Task.id == ParentAssignment.subtask_id)
+            .where(Task.active.is_(True))
         )
-        return session.execute(stmt).scalar_one_or_none()
\ No newline at end of file
+        if max_depth is not None:
+            step = step.where(subtree.c.depth < max_depth)
+        subtree = subtree.union_all(step)
+
+        rows = session.execute(
+            select(Task, subtree.c.parent_id)
+            .join(subtree, Task.id == subtree.c.id)
+            .order_by(subtree.c.depth.asc(), Task.id.asc())
+        ).all()
+
+        if not rows:
+            return None
+
+        # Rows arrive parent-before-child (ordered by depth), so one pass assembles the tree
+        nodes: dict[int, dict] = {}
+        root = None
+        for task, parent_id in rows:
+            node = {col.name: getattr(task, col.name) for col in Task.__table__.columns}
+            node["subtasks"] = []
+            nodes[task.id] = node
+            if parent_id is None:
+                root = node
+            else:
+                nodes[parent_id]["subtasks"].append(node)
+        return root
+
+
+# ---- Hierarchy index -------------------------------------------------------------------
+
+def list_descendant_ids(task_id: int, *, max_depth: Optional[int] = None) -> list[int]:
+    """
+    Return ids of all tasks below task_id (any depth), nearest levels first.
+    Optionally limit to max_depth levels.
+    """
+    with SessionLocal() as session:
+        stmt = select(TaskClosure.descendant_id).where(TaskClosure.ancestor_id == task_id)
+        if max_depth is not None:
+            stmt = stmt.where(TaskClosure.depth <= max_depth)
+        stmt = stmt.order_by(TaskClosure.depth.asc(), TaskClosure.descendant_id.asc())
+        return list(session.execute(stmt).scalars().all())
+
+def rebuild_task_closure() -> int:
+    """
+    Rebuild the task_closure index from parent_assignment (e.g. for existing databases).
+    Expands one level per statement, so cost is O(max tree depth) queries.
+
+    Returns the number of closure rows written.
+    Raises ValueError if parent_assignment contains a cycle.
+    """
+    with SessionLocal.begin() as session:
+        session.execute(delete(TaskClosure))
+        total = session.execute(
+            insert(TaskClosure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(ParentAssignment.parent_id, ParentAssignment.subtask_id, literal(1)),
+            )
+        ).rowcount or 0
+
+        depth = 1
+        while True:
+            try:
+                added = session.execute(
+                    insert(TaskClosure).from_select(
+                        ["ancestor_id", "descendant_id", "depth"],
+                        select(TaskClosure.ancestor_id, ParentAssignment.subtask_id, TaskClosure.depth + 1)
+                        .join(ParentAssignment, ParentAssignment.parent_id == TaskClosure.descendant_id)
+                        .where(TaskClosure.depth == depth),
+                    )
+                ).rowcount or 0
+            except IntegrityError:
+                raise ValueError("Cycle detected in parent_assignment; cannot rebuild hierarchy index.")
+            if not added:
+                return total
+            total += added
+            depth += 1
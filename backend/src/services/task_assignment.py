@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Optional
 
 from sqlalchemy import and_, select, exists
 from sqlalchemy.orm import selectinload
 
-from backend.src.database.db_setup import SessionLocal
+from backend.src.database.db_setup import SessionLocal, AsyncSessionLocal
+from backend.src.database.models.project import touch_project_reports
 from backend.src.database.models.task import Task
 from backend.src.database.models.user import User
 from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.models.team_assignment import TeamAssignment
 from backend.src.database.models.parent_assignment import ParentAssignment
 from backend.src.schemas.user import UserRead
+from backend.src.services.task_paging import apply_sort, apply_page
 
 
 # -------------------------- Internal validators -------------------------------
@@ -96,6 +99,9 @@ def clear_task_assignees(task_id: int) -> int:
         deleted = session.query(TaskAssignment).filter(
             TaskAssignment.task_id == task_id
         ).delete(synchronize_session=False)
+        # Bulk delete skips the flush hook that keeps report versions current
+        if deleted:
+            touch_project_reports(session.connection(), task_ids=[task_id])
         return int(deleted)
 
 
@@ -112,27 +118,125 @@ def list_assignees(task_id: int) -> list[UserRead]:
         return [UserRead.model_validate(user) for user in users]
 
 
+def assignee_names_by_task(project_id: int, *, active_only: bool = True) -> dict[int, list[str]]:
+    """
+    Assignee display names (name, else email) of every task in the project that has
+    assignees, keyed by task id, in user id order. One query for the whole project.
+    """
+    return assignee_names_by_task_in_projects([project_id], active_only=active_only)
+
+
+def assignee_names_by_task_in_projects(
+    project_ids: Iterable[int], *, active_only: bool = True
+) -> dict[int, list[str]]:
+    """assignee_names_by_task for several projects at once (still one query)."""
+    project_ids = set(project_ids)
+    if not project_ids:
+        return {}
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(TaskAssignment.task_id, User.name, User.email)
+            .join(Task, Task.id == TaskAssignment.task_id)
+            .join(User, User.user_id == TaskAssignment.user_id)
+            .where(Task.project_id.in_(project_ids), Task.active == active_only)
+            .order_by(TaskAssignment.task_id, User.user_id)
+        ).all()
+    names: dict[int, list[str]] = {}
+    for task_id, name, email in rows:
+        names.setdefault(task_id, []).append(name if name else email)
+    return names
+
+
 def list_tasks_for_user(
     user_id: int,
     *,
     active_only: bool = True,
+    sort_by: str = "priority_desc",
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
 ) -> list[Task]:
     """
     Return top-level tasks assigned to a user with their corresponding subtasks.
+    Supports the same sort options and keyset pagination as task.list_tasks.
     """
+    stmt = _tasks_for_user_statement(user_id, active_only, sort_by, limit, after)
     with SessionLocal() as session:
-        # Only return parent tasks (not subtasks)
-        not_a_subtask = ~exists(
-            select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
-        )
-        stmt = (
-            select(Task)
-            .where(not_a_subtask)
-            .options(selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask))
-            .join(TaskAssignment, TaskAssignment.task_id == Task.id)
-            .filter(TaskAssignment.user_id == user_id)
-        )
-        if active_only:
-            stmt = stmt.where(Task.active.is_(True))
-
         return session.execute(stmt).scalars().all()
+
+
+def list_tasks_for_teams(
+    team_ids: Iterable[int],
+    *,
+    active_only: bool = True,
+    sort_by: str = "priority_desc",
+) -> dict[int, list[Task]]:
+    """
+    Top-level tasks assigned to the members of each team, with their subtasks, in one
+    statement (team_assignments -> task_assignment -> task) however many teams/members.
+    Per team, tasks follow member order (user_id), each member's in sort_by order; a task
+    assigned to several members of a team is listed once. Teams without tasks are omitted.
+    """
+    ids = sorted({int(tid) for tid in team_ids or []})
+    if not ids:
+        return {}
+
+    not_a_subtask = ~exists(
+        select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
+    )
+    stmt = (
+        select(TeamAssignment.team_id, Task)
+        .join(TaskAssignment, TaskAssignment.user_id == TeamAssignment.user_id)
+        .join(Task, Task.id == TaskAssignment.task_id)
+        .where(TeamAssignment.team_id.in_(ids), not_a_subtask)
+        .options(selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask))
+        .order_by(TeamAssignment.team_id, TeamAssignment.user_id)
+    )
+    if active_only:
+        # IS NOT false rather than = true (same for this NOT NULL column): without table stats
+        # SQLite would otherwise drive the join from the (active, ...) sort index and scan
+        # every active task per member instead of members -> ix_task_assignment_user_task -> task
+        stmt = stmt.where(Task.active.isnot(False))
+    stmt = apply_sort(stmt, sort_by)
+
+    with SessionLocal() as session:
+        rows = session.execute(stmt).all()
+
+    by_team: dict[int, list[Task]] = {}
+    seen: set[tuple[int, int]] = set()
+    for team_id, task in rows:
+        if (team_id, task.id) not in seen:
+            seen.add((team_id, task.id))
+            by_team.setdefault(team_id, []).append(task)
+    return by_team
+
+
+async def list_tasks_for_user_async(
+    user_id: int,
+    *,
+    active_only: bool = True,
+    sort_by: str = "priority_desc",
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> list[Task]:
+    """list_tasks_for_user on the async engine."""
+    stmt = _tasks_for_user_statement(user_id, active_only, sort_by, limit, after)
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(stmt)).scalars().all()
+
+
+def _tasks_for_user_statement(user_id, active_only, sort_by, limit, after):
+    # Only return parent tasks (not subtasks)
+    not_a_subtask = ~exists(
+        select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
+    )
+    stmt = (
+        select(Task)
+        .where(not_a_subtask)
+        .options(selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask))
+        .join(TaskAssignment, TaskAssignment.task_id == Task.id)
+        .filter(TaskAssignment.user_id == user_id)
+    )
+    if active_only:
+        stmt = stmt.where(Task.active.is_(True))
+    stmt = apply_sort(stmt, sort_by)
+    return apply_page(stmt, sort_by, limit=limit, after=after)
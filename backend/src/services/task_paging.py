@@ -0,0 +1,157 @@
+# backend/src/services/task_paging.py
+"""
+Sort keys and keyset (cursor) pagination shared by the task listing services.
+
+Every sort is a tuple of SortKey ending in Task.id, so orderings are total and
+a page can resume strictly after the last row seen instead of using OFFSET.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import and_, or_
+
+from backend.src.database.models.task import Task
+from backend.src.enums.task_sort import TaskSort
+
+
+@dataclass(frozen=True)
+class SortKey:
+    column: Any
+    descending: bool = False
+    nullable: bool = False  # nullable keys always sort their NULLs last
+
+
+SORT_KEYS: dict[str, tuple[SortKey, ...]] = {
+    TaskSort.PRIORITY_DESC.value: (
+        SortKey(Task.priority, descending=True),
+        SortKey(Task.deadline, nullable=True),
+        SortKey(Task.id),
+    ),
+    TaskSort.PRIORITY_ASC.value: (
+        SortKey(Task.priority),
+        SortKey(Task.deadline, nullable=True),
+        SortKey(Task.id),
+    ),
+    TaskSort.START_DATE_ASC.value: (
+        SortKey(Task.start_date, nullable=True),
+        SortKey(Task.priority, descending=True),
+        SortKey(Task.id),
+    ),
+    TaskSort.START_DATE_DESC.value: (
+        SortKey(Task.start_date, descending=True, nullable=True),
+        SortKey(Task.priority, descending=True),
+        SortKey(Task.id),
+    ),
+    TaskSort.DEADLINE_ASC.value: (
+        SortKey(Task.deadline, nullable=True),
+        SortKey(Task.priority, descending=True),
+        SortKey(Task.id),
+    ),
+    TaskSort.DEADLINE_DESC.value: (
+        SortKey(Task.deadline, descending=True, nullable=True),
+        SortKey(Task.priority, descending=True),
+        SortKey(Task.id),
+    ),
+    TaskSort.STATUS.value: (
+        SortKey(Task.status, descending=True),  # reverse alphabetical order gives to-do first and blocked last
+        SortKey(Task.priority, descending=True),
+        SortKey(Task.id),
+    ),
+}
+
+MAX_PAGE_SIZE = 500
+
+
+def apply_sort(stmt, sort_by: str):
+    """Append the ORDER BY for sort_by. Raises ValueError for unknown sorts."""
+    keys = SORT_KEYS.get(sort_by)
+    if keys is None:
+        raise ValueError(f"Invalid sort_by parameter: {sort_by}")
+
+    clauses = []
+    for key in keys:
+        if key.nullable:
+            clauses.append(key.column.is_(None))
+        clauses.append(key.column.desc() if key.descending else key.column.asc())
+    return stmt.order_by(*clauses)
+
+
+def apply_page(stmt, sort_by: str, *, limit: Optional[int] = None, after: Optional[str] = None):
+    """Restrict stmt to the rows after the `after` cursor, capped at `limit` rows."""
+    if after:
+        values = decode_cursor(after, sort_by)
+        stmt = stmt.where(_after_clause(SORT_KEYS[sort_by], values))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def encode_cursor(task: Task, sort_by: str) -> str:
+    """Opaque cursor pointing just past `task` in the sort_by ordering."""
+    values = []
+    for key in SORT_KEYS[sort_by]:
+        value = getattr(task, key.column.key)
+        values.append(value.isoformat() if isinstance(value, date) else value)
+    raw = json.dumps({"s": sort_by, "k": values}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str) -> list:
+    """Return the key values stored in cursor. Raises ValueError if it is malformed or for another sort."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        keys = SORT_KEYS[sort_by]
+        if payload["s"] != sort_by or not isinstance(payload["k"], list) or len(payload["k"]) != len(keys):
+            raise ValueError
+        return [_cursor_value(key, value) for key, value in zip(keys, payload["k"])]
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise ValueError("Invalid cursor")
+
+
+def _cursor_value(key: SortKey, value: Any) -> Any:
+    """Check a decoded key value against its column's type (dates arrive as ISO strings)."""
+    if value is None:
+        if key.nullable:
+            return None
+        raise ValueError
+    python_type = key.column.type.python_type
+    if python_type is date:
+        if isinstance(value, str):
+            return date.fromisoformat(value)
+        raise ValueError
+    if isinstance(value, python_type) and not isinstance(value, bool):
+        return value
+    raise ValueError
+
+
+def _after_clause(keys: tuple[SortKey, ...], values: list):
+    """
+    Row-value comparison "sort tuple > cursor tuple", expanded into
+    (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... so it works on every backend
+    and handles mixed directions and NULLs-last keys.
+    """
+    # Flatten each key into (equal, beyond) predicates; beyond=None means no row can sort past it
+    parts = []
+    for key, value in zip(keys, values):
+        col = key.column
+        if key.nullable:
+            if value is None:
+                parts.append((col.is_(None), None))
+                continue
+            parts.append((col.is_not(None), col.is_(None)))
+        beyond = col < value if key.descending else col > value
+        parts.append((col == value, beyond))
+
+    branches = []
+    for i, (_, beyond) in enumerate(parts):
+        if beyond is None:
+            continue
+        branches.append(and_(*[eq for eq, _ in parts[:i]], beyond))
+    return or_(*branches)
@@ -0,0 +1,158 @@
+# backend/src/services/task_query.py
+"""
+Composable filter expressions for the task listings.
+
+A filter is a JSON object. Predicate keys in the same object are ANDed, and
+"and"/"or" nest arbitrarily:
+
+    {"priority_range": [7, null], "status": ["To-do", "Blocked"]}
+    {"or": [{"assignee_id": 4}, {"and": [{"tag": "urgent"}, {"project_id": 2}]}]}
+
+Predicates:
+- "status", "tag", "project_id", "assignee_id": a value or a list of values (IN)
+- "priority_range": [min, max], inclusive; either bound may be null
+- "deadline_range", "start_date_range": ["YYYY-MM-DD", "YYYY-MM-DD"], inclusive; either bound may be null
+
+compile_filter() splits an expression into its *shape* (the predicate tree
+without values) and the values to bind. listing_statement() builds and caches
+one statement per shape, so repeated dashboard queries only bind new values.
+"""
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+from itertools import count
+from typing import Any, Optional
+
+from sqlalchemy import and_, or_, bindparam, select, exists
+from sqlalchemy.orm import selectinload
+
+from backend.src.database.models.task import Task
+from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.enums.task_filter import TaskFilter, ALLOWED_FILTERS, ALLOWED_COMBINATORS
+from backend.src.enums.task_status import ALLOWED_STATUSES
+from backend.src.services.task_paging import apply_sort
+
+STATEMENT_CACHE_SIZE = 256
+
+_IN_FILTERS = {
+    TaskFilter.STATUS.value: Task.status,
+    TaskFilter.TAG.value: Task.tag,
+    TaskFilter.PROJECT.value: Task.project_id,
+    TaskFilter.ASSIGNEE.value: TaskAssignment.user_id,
+}
+_RANGE_FILTERS = {
+    TaskFilter.PRIORITY_RANGE.value: Task.priority,
+    TaskFilter.DEADLINE_RANGE.value: Task.deadline,
+    TaskFilter.START_DATE_RANGE.value: Task.start_date,
+}
+
+
+def compile_filter(expr: Optional[dict]) -> tuple[Optional[tuple], dict[str, Any]]:
+    """
+    Validate expr and return (shape, params). shape is hashable and None when there is no filter.
+    Raises ValueError on unknown keys or malformed values.
+    """
+    if not expr:
+        return None, {}
+    params: dict[str, Any] = {}
+    return _parse(expr, params), params
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def listing_statement(shape: Optional[tuple], *, active_only: bool, sort_by: str, with_subtasks: bool):
+    """Filtered, sorted top-level task listing for a filter shape; bind values from compile_filter at execute time."""
+    not_a_subtask = ~exists(
+        select(ParentAssignment.subtask_id).where(ParentAssignment.subtask_id == Task.id)
+    )
+    stmt = (
+        select(Task)
+        .where(not_a_subtask)
+        .where(Task.active.is_(active_only))
+    )
+    if with_subtasks:
+        stmt = stmt.options(selectinload(Task.subtask_links).selectinload(ParentAssignment.subtask))
+    if shape is not None:
+        stmt = stmt.where(_build(shape, count()))
+    return apply_sort(stmt, sort_by)
+
+
+# -------- Parsing -------------------------------------------------------------
+
+
+def _parse(expr: Any, params: dict) -> tuple:
+    if not isinstance(expr, dict) or not expr:
+        raise ValueError("Each filter expression must be a non-empty object")
+
+    nodes = []
+    for key, value in expr.items():
+        if key in ALLOWED_COMBINATORS:
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"'{key}' expects a non-empty list of filter expressions")
+            nodes.append((key, tuple(_parse(child, params) for child in value)))
+        elif key in _IN_FILTERS:
+            values = value if isinstance(value, list) else [value]
+            if not values:
+                raise ValueError(f"'{key}' expects at least one value")
+            params[f"p{len(params)}"] = [_coerce(key, v) for v in values]
+            nodes.append((key, "in"))
+        elif key in _RANGE_FILTERS:
+            if not isinstance(value, list) or len(value) != 2 or value == [None, None]:
+                raise ValueError(f"'{key}' expects [min, max] with at least one bound")
+            bounds = []
+            for side, bound in zip(("lo", "hi"), value):
+                if bound is not None:
+                    params[f"p{len(params)}"] = _coerce(key, bound)
+                    bounds.append(side)
+            nodes.append((key, tuple(bounds)))
+        else:
+            invalid = sorted(k for k in expr if k not in ALLOWED_FILTERS and k not in ALLOWED_COMBINATORS)
+            raise ValueError(f"Invalid filter keys: {invalid}")
+
+    return nodes[0] if len(nodes) == 1 else ("and", tuple(nodes))
+
+
+def _coerce(key: str, value: Any) -> Any:
+    if key in (TaskFilter.DEADLINE_RANGE.value, TaskFilter.START_DATE_RANGE.value):
+        if isinstance(value, date):
+            return value
+        if isinstance(value, str):
+            return date.fromisoformat(value)
+    elif key == TaskFilter.STATUS.value:
+        if isinstance(value, str) and value in ALLOWED_STATUSES:
+            return value
+    elif key == TaskFilter.TAG.value:
+        if isinstance(value, str):
+            return value
+    elif isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"Invalid value for '{key}': {value!r}")
+
+
+# -------- Building ------------------------------------------------------------
+
+
+def _build(shape: tuple, slots):
+    """Turn shape into a clause; slots yields parameter numbers in the order compile_filter assigned them."""
+    key, arg = shape
+    if key in ALLOWED_COMBINATORS:
+        children = [_build(child, slots) for child in arg]
+        return and_(*children) if key == "and" else or_(*children)
+
+    if arg == "in":
+        param = bindparam(f"p{next(slots)}", expanding=True)
+        if key == TaskFilter.ASSIGNEE.value:
+            return exists(
+                select(TaskAssignment.task_id).where(
+                    TaskAssignment.task_id == Task.id, TaskAssignment.user_id.in_(param)
+                )
+            )
+        return _IN_FILTERS[key].in_(param)
+
+    col = _RANGE_FILTERS[key]
+    clauses = []
+    for side in arg:
+        param = bindparam(f"p{next(slots)}", type_=col.type)
+        clauses.append(col >= param if side == "lo" else col <= param)
+    return and_(*clauses)
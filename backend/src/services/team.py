@@ -1,8 +1,8 @@
-from typing import Optional, Any, Union
+from typing import Iterable, Optional, Any, Union
+from sqlalchemy import func, update
 from backend.src.database.db_setup import SessionLocal
-from backend.src.database.models.team import Team 
+from backend.src.database.models.team import Team, DEPARTMENT_PREFIX_LEN, TEAM_PREFIX_LEN
 from backend.src.database.models.team_assignment import TeamAssignment
-from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 
 
@@ -64,7 +64,7 @@ def get_teams_by_department(department_id: int) -> list[dict]:
     with SessionLocal() as session:
         teams = (
             session.query(Team)
-            .filter(func.substr(Team.team_number, 1, 2) == str(department_id).zfill(2))
+            .filter(Team.department_prefix == str(department_id).zfill(DEPARTMENT_PREFIX_LEN))
             .all()
         )
         result = []
@@ -80,11 +80,11 @@ def get_teams_by_department(department_id: int) -> list[dict]:
 
 def get_subteam_by_team_number(team_number: str) -> list[dict]:
     """Return all subteams under a given team number prefix."""
-    prefix = team_number[:4]
+    prefix = team_number[:TEAM_PREFIX_LEN]
     with SessionLocal() as session:
         subteams = (
             session.query(Team)
-            .filter(func.substr(Team.team_number, 1, 4) == prefix)
+            .filter(Team.team_prefix == prefix)
             .filter(Team.team_number != team_number)
             .all()
         )
@@ -123,6 +123,29 @@ def assign_to_team(team_id: int, assignee_id: int) -> dict:
             "user_id": assignment.user_id,
         }
 
+def get_teams_by_prefixes(prefixes: Iterable[str]) -> list[dict]:
+    """Return all teams under any of the 4-digit team prefixes, in one query (ordered by team_id)."""
+    prefixes = sorted(set(prefixes))
+    if not prefixes:
+        return []
+    with SessionLocal() as session:
+        teams = (
+            session.query(Team)
+            .filter(Team.team_prefix.in_(prefixes))
+            .order_by(Team.team_id)
+            .all()
+        )
+        return [
+            {
+                "team_id": t.team_id,
+                "team_name": t.team_name,
+                "manager_id": t.manager_id,
+                "department_id": t.department_id,
+                "team_number": t.team_number,
+            }
+            for t in teams
+        ]
+
 def get_users_in_team(team_id: int) -> list[dict]:
     """Return all users assigned to a given team."""
     with SessionLocal() as session:
@@ -135,6 +158,26 @@ def get_users_in_team(team_id: int) -> list[dict]:
             users.append({"user_id": uid})
         return users
     
+def get_teams_by_ids(team_ids: Iterable[int]) -> list[dict]:
+    """Return the teams with the given ids in one query (ordered by team_id); unknown ids are left out."""
+    ids = set(team_ids)
+    if not ids:
+        return []
+    with SessionLocal() as session:
+        teams = (
+            session.query(Team).filter(Team.team_id.in_(ids)).order_by(Team.team_id).all()
+        )
+        return [
+            {
+                "team_id": t.team_id,
+                "team_name": t.team_name,
+                "manager_id": t.manager_id,
+                "department_id": t.department_id,
+                "team_number": t.team_number,
+            }
+            for t in teams
+        ]
+
 def get_teams_of_user(user_id: int) -> list[dict]:
     """Return all teams a user is assigned to."""
     with SessionLocal() as session:
@@ -142,17 +185,7 @@ def get_teams_of_user(user_id: int) -> list[dict]:
             session.query(TeamAssignment).filter_by(user_id=user_id).all()
         )
         team_ids = [a.team_id for a in assignments]
-        teams = []
-        for tid in team_ids:
-            team = session.get(Team, tid)
-            teams.append({
-                "team_id": team.team_id,
-                "team_name": team.team_name,
-                "manager_id": team.manager_id,
-                "department_id": team.department_id,
-                "team_number": team.team_number,
-            })
-        return teams
+    return get_teams_by_ids(team_ids)
     
 def get_team_by_manager(manager_id: int) -> list[dict]:
     """Return all teams managed by a given user."""
@@ -169,4 +202,20 @@ def get_team_by_manager(manager_id: int) -> list[dict]:
                 "department_id": team.department_id,
                 "team_number": team.team_number,
             })
-        return result
\ No newline at end of file
+        return result
+
+def backfill_team_prefixes() -> int:
+    """
+    Recompute department_prefix / team_prefix from team_number for every team
+    (e.g. for databases created before the columns existed). Returns the rows updated.
+    """
+    with SessionLocal.begin() as session:
+        result = session.execute(
+            update(Team)
+            .values(
+                department_prefix=func.substr(Team.team_number, 1, DEPARTMENT_PREFIX_LEN),
+                team_prefix=func.substr(Team.team_number, 1, TEAM_PREFIX_LEN),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import re
-from typing import Optional, List
+from typing import Iterable, Optional, List
 
 from sqlalchemy import select
 from passlib.context import CryptContext
 
-from backend.src.database.db_setup import SessionLocal
+from backend.src.database.db_setup import SessionLocal, AsyncSessionLocal
 from backend.src.database.models.user import User
 from backend.src.database.models.department import Department
 from backend.src.enums.user_role import UserRole, ALLOWED_ROLES
@@ -76,6 +76,54 @@ def get_user(identifier: str | int) -> Optional[User]:
         return session.execute(stmt).scalar_one_or_none()
 
 
+def get_users_by_ids(user_ids: Iterable[int]) -> dict[int, User]:
+    """Fetch users by id in one query, as {user_id: user}; unknown ids are left out."""
+    ids = {int(uid) for uid in user_ids}
+    if not ids:
+        return {}
+    with SessionLocal() as session:
+        stmt = select(User).where(User.user_id.in_(ids))
+        return {u.user_id: u for u in session.execute(stmt).scalars()}
+
+
+def get_users_by_emails(emails: Iterable[str]) -> dict[str, User]:
+    """Fetch users by email in one query, as {email: user}; unknown emails are left out."""
+    wanted = {e for e in emails if e}
+    if not wanted:
+        return {}
+    with SessionLocal() as session:
+        stmt = select(User).where(User.email.in_(wanted))
+        return {u.email: u for u in session.execute(stmt).scalars()}
+
+
+def get_users_by_identifiers(identifiers: Iterable[str]) -> dict[str, User]:
+    """
+    Batch get_user for emails or names, in one query, as {identifier: user}. An email
+    match wins over a name match; unknown identifiers, and names shared by several
+    users, are left out.
+    """
+    wanted = {i for i in identifiers if i}
+    if not wanted:
+        return {}
+    with SessionLocal() as session:
+        stmt = select(User).where(User.email.in_(wanted) | User.name.in_(wanted))
+        users = session.execute(stmt).scalars().all()
+    by_email = {u.email: u for u in users if u.email in wanted}
+    by_name: dict[str, list[User]] = {}
+    for u in users:
+        if u.name in wanted:
+            by_name.setdefault(u.name, []).append(u)
+    found = {name: matches[0] for name, matches in by_name.items() if len(matches) == 1}
+    found.update(by_email)
+    return found
+
+
+async def get_user_async(user_id: int) -> Optional[User]:
+    """Fetch a user by id on the async engine."""
+    async with AsyncSessionLocal() as session:
+        return await session.get(User, user_id)
+
+
 def list_users() -> list[User]:
     """List all users ordered by user_id."""
     with SessionLocal() as session:
@@ -1,8 +1,20 @@
 """
 Email templates for different notification types
+
+The named templates (TEMPLATE_NAMES) are parsed and compiled once per process by a
+shared jinja2 Environment (get_environment) and rendered from the compiled objects;
+set EMAIL_TEMPLATE_CACHE_DIR to also keep their compiled bytecode on disk, so new
+worker processes skip the compile step.
 """
-from jinja2 import Template
-from typing import Dict, Any
+from functools import lru_cache
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template
+from typing import Dict, Any, Tuple
+
+# Templates compiled into the shared environment; other names render the fallback
+TEMPLATE_NAMES = ("task_updated", "upcoming_deadline", "overdue_deadline", "activity_digest")
+
+# Ad hoc template strings (render_template) kept compiled
+TEMPLATE_STRING_CACHE_SIZE = 32
 
 
 class EmailTemplates:
@@ -332,11 +344,92 @@ class EmailTemplates:
             "text": text_template
         }
     
+    @staticmethod
+    def get_activity_digest_template() -> Dict[str, str]:
+        """Get activity digest email template (several tasks' buffered notifications in one email)"""
+        html_template = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <title>{{ heading }}</title>
+            <style>
+                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+                .header { background-color: #007bff; color: white; padding: 20px; text-align: center; }
+                .content { padding: 20px; background-color: #f8f9fa; }
+                .task-info { background-color: white; padding: 15px; margin: 10px 0; border-radius: 5px; }
+                .footer { text-align: center; padding: 20px; font-size: 12px; color: #666; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>{{ app_name }}</h1>
+                    <h2>{{ heading }}</h2>
+                </div>
+
+                <div class="content">
+                    <p>{{ tasks|length }} task{{ 's' if tasks|length != 1 }} had activity{{ ' since your last digest' if digest }}:</p>
+                    {% for task in tasks %}
+                    <div class="task-info">
+                        <p><strong>{{ task.task_title|e }}</strong> (#{{ task.task_id }})</p>
+                        <p>{{ task.activity|e }} &mdash; <em>by {{ task.actors|join(', ')|e }}</em></p>
+                        {% if task.changes %}
+                        <ul>
+                            {% for change in task.changes %}
+                            <li><strong>{{ change.field }}</strong>: {{ change.before|e }} &rarr; {{ change.after|e }}</li>
+                            {% endfor %}
+                        </ul>
+                        {% endif %}
+                    </div>
+                    {% endfor %}
+
+                    <p>This is an automated notification from {{ app_name }}.</p>
+                </div>
+
+                <div class="footer">
+                    <p>&copy; {{ app_name }}. All rights reserved.</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+        text_template = """
+        {{ app_name }} - {{ heading }}
+
+        {{ tasks|length }} task{{ 's' if tasks|length != 1 }} had activity{{ ' since your last digest' if digest }}:
+        {% for task in tasks %}
+        {{ task.task_title }} (#{{ task.task_id }})
+        {{ task.activity }} - by {{ task.actors|join(', ') }}
+        {% for change in task.changes %}
+        - {{ change.field }}: {{ change.before }} -> {{ change.after }}
+        {% endfor %}
+        {% endfor %}
+
+        This is an automated notification from {{ app_name }}.
+        """
+
+        return {
+            "html": html_template,
+            "text": text_template
+        }
+
     @staticmethod
     def render_template(template_str: str, data: Dict[str, Any]) -> str:
         """Render a template with provided data"""
-        template = Template(template_str)
-        return template.render(**data)
+        return _compile_string(template_str).render(**data)
+
+    @staticmethod
+    def render_by_type(email_type: str, data: Dict[str, Any]) -> Tuple[str, str]:
+        """Render the (text, html) bodies of a named template from its compiled form"""
+        compiled = _compiled_templates().get(email_type)
+        if compiled is None:
+            fallback = EmailTemplates.get_template_by_type(email_type)
+            return (EmailTemplates.render_template(fallback["text"], data),
+                    EmailTemplates.render_template(fallback["html"], data))
+        return compiled["text"].render(**data), compiled["html"].render(**data)
     
     @staticmethod
     def get_template_by_type(email_type: str) -> Dict[str, str]:
@@ -345,9 +438,44 @@ class EmailTemplates:
             "task_updated": EmailTemplates.get_task_update_template(),
             "upcoming_deadline": EmailTemplates.get_upcoming_deadline_template(),
             "overdue_deadline": EmailTemplates.get_overdue_deadline_template(),
+            "activity_digest": EmailTemplates.get_activity_digest_template(),
         }
         
         return templates.get(email_type, {
             "html": "<p>{{ message }}</p>",
             "text": "{{ message }}"
-        })
\ No newline at end of file
+        })
+
+
+@lru_cache(maxsize=None)
+def get_environment() -> Environment:
+    """The process-wide environment holding the named templates as `<name>.txt` / `<name>.html`."""
+    from ..config.email_config import get_email_settings
+
+    sources = {}
+    for name in TEMPLATE_NAMES:
+        template = EmailTemplates.get_template_by_type(name)
+        sources[f"{name}.txt"] = template["text"]
+        sources[f"{name}.html"] = template["html"]
+    cache_dir = get_email_settings().email_template_cache_dir
+    # Same options as a bare jinja2.Template (no autoescape); sources never change, so no reload checks
+    return Environment(
+        loader=DictLoader(sources),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else None,
+    )
+
+
+@lru_cache(maxsize=None)
+def _compiled_templates() -> Dict[str, Dict[str, Template]]:
+    env = get_environment()
+    return {
+        name: {"text": env.get_template(f"{name}.txt"), "html": env.get_template(f"{name}.html")}
+        for name in TEMPLATE_NAMES
+    }
+
+
+@lru_cache(maxsize=TEMPLATE_STRING_CACHE_SIZE)
+def _compile_string(template_str: str) -> Template:
+    return get_environment().from_string(template_str)
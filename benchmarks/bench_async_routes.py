@@ -0,0 +1,177 @@
+"""
+Load test: async read routes vs the sync path they replaced.
+
+Seeds a fresh SQLite file, then drives the app in-process (httpx ASGITransport,
+no network) with N concurrent clients for a fixed time per mode:
+
+  async  GET /task/{id}, /task/, /task/user/{id}   (AsyncSessionLocal, event loop)
+  sync   the same handlers behind plain `def` routes (SessionLocal, AnyIO threadpool)
+
+and prints requests/s and latency for each. --threads caps the AnyIO threadpool
+(FastAPI's default is 40) to show where the sync path saturates.
+
+Usage:
+    python -m benchmarks.bench_async_routes
+    python -m benchmarks.bench_async_routes --clients 200 --threads 40 --seconds 10
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import anyio.to_thread
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.config.db_config import DatabaseSettings
+from backend.src.database.db_setup import Base, make_async_engine, make_engine
+from backend.src.database.models.task import Task
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.models.user import User
+from backend.src.main import app
+import backend.src.handlers.task_assignment_handler as assignment_handler
+import backend.src.handlers.task_handler as task_handler
+import backend.src.services.task as task_service
+import backend.src.services.task_assignment as assignment_service
+import backend.src.services.user as user_service
+
+USER_ID = 1
+
+
+def _sync_router() -> APIRouter:
+    """The three reads as sync routes, i.e. how they were served before going async."""
+    router = APIRouter(prefix="/sync/task")
+
+    @router.get("/")
+    def list_tasks():
+        return [t.id for t in task_handler.list_tasks(limit=50)]
+
+    @router.get("/user/{user_id}")
+    def list_tasks_by_user(user_id: int):
+        return [t.id for t in assignment_handler.list_user_tasks(user_id, limit=50)]
+
+    @router.get("/{task_id}")
+    def get_task(task_id: int):
+        return task_handler.get_task(task_id).id
+
+    return router
+
+
+def _async_router() -> APIRouter:
+    """Same payloads as _sync_router so only the execution path differs."""
+    router = APIRouter(prefix="/async/task")
+
+    @router.get("/")
+    async def list_tasks():
+        return [t.id for t in await task_handler.list_tasks_async(limit=50)]
+
+    @router.get("/user/{user_id}")
+    async def list_tasks_by_user(user_id: int):
+        return [t.id for t in await assignment_handler.list_user_tasks_async(user_id, limit=50)]
+
+    @router.get("/{task_id}")
+    async def get_task(task_id: int):
+        return (await task_handler.get_task_async(task_id)).id
+
+    return router
+
+
+def _setup(db_file: Path, n_tasks: int, pool_size: int) -> FastAPI:
+    settings = DatabaseSettings(pool_size=pool_size, max_overflow=0)
+    url = f"sqlite:///{db_file}"
+    engine = make_engine(url, settings)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User).values(user_id=USER_ID, name="Bench", email="bench@example.com",
+                                         role="staff", hashed_pw="x"))
+        conn.execute(insert(Task), [
+            {"title": f"Task {i}", "status": "To-do", "priority": random.randint(1, 10), "active": True}
+            for i in range(n_tasks)
+        ])
+        conn.execute(insert(TaskAssignment), [
+            {"task_id": i, "user_id": USER_ID} for i in range(1, n_tasks + 1, 3)
+        ])
+
+    session_local = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    async_session_local = async_sessionmaker(
+        bind=make_async_engine(url, settings), autoflush=False, expire_on_commit=False
+    )
+    for module in (task_service, assignment_service, user_service):
+        module.SessionLocal = session_local
+        module.AsyncSessionLocal = async_session_local
+
+    app.include_router(_sync_router())
+    app.include_router(_async_router())
+    return app
+
+
+async def _run_mode(mode: str, *, clients: int, seconds: float, n_tasks: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as ac:
+        paths = [f"/{mode}/task/", f"/{mode}/task/user/{USER_ID}"]
+
+        async def client():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                path = random.choice(paths + [f"/{mode}/task/{random.randint(1, n_tasks)}"])
+                start = time.perf_counter()
+                resp = await ac.get(path)
+                if resp.status_code == 200:
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(client() for _ in range(clients)))
+
+    latencies.sort()
+    latencies = latencies or [0.0]
+    return {
+        "mode": mode,
+        "rps": len(latencies) / seconds,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+        "errors": errors,
+    }
+
+
+async def _main(args) -> None:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+    print("=" * 62)
+    print(f"KIRA read routes: {args.clients} clients, {args.threads} threads, {args.seconds:g}s per mode")
+    print("=" * 62)
+    print(f"{'mode':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>10}")
+    for mode in ("sync", "async"):
+        r = await _run_mode(mode, clients=args.clients, seconds=args.seconds, n_tasks=args.tasks)
+        print(f"{r['mode']:<8}{r['rps']:>10.0f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['errors']:>10}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=100, help="concurrent clients")
+    parser.add_argument("--threads", type=int, default=40, help="AnyIO threadpool size for sync routes")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--tasks", type=int, default=2000, help="rows seeded before the run")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _setup(Path(tmp) / "bench.db", args.tasks, pool_size=max(args.clients, args.threads))
+        asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
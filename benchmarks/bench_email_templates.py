@@ -0,0 +1,94 @@
+"""
+Email template rendering: a new jinja2.Template per render vs. the compiled template cache.
+
+For each named template, renders the text + html bodies (one email) --renders times
+  - per call:  jinja2.Template(source).render(...) for both parts, as before the cache
+  - compiled:  EmailTemplates.render_by_type, from the shared environment
+and reports emails/second. Then times compiling all named templates in a fresh
+environment without and with a warm EMAIL_TEMPLATE_CACHE_DIR (what a new worker
+process pays on its first email).
+
+Usage:
+    python -m benchmarks.bench_email_templates
+    python -m benchmarks.bench_email_templates --renders 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from jinja2 import Template
+
+from backend.src.templates import email_templates
+from backend.src.templates.email_templates import EmailTemplates, TEMPLATE_NAMES
+
+DATA = {
+    "app_name": "KIRA", "app_url": "http://localhost:8000", "update_date": "2025-10-15 09:30:00",
+    "assignee_name": "John Doe", "task_title": "Complete Project Documentation", "task_id": 123,
+    "updated_by": "Jane Smith", "updated_fields": ["status", "deadline"],
+    "previous_values": {"status": "To Do", "deadline": "2025-10-20"},
+    "new_values": {"status": "In Progress", "deadline": "2025-10-31"},
+    "description": "Write the user guide", "priority": 3, "project_name": "Website Relaunch",
+    "deadline_date": "2025-10-31", "time_until_deadline": "2 days", "days_overdue": 2,
+    "task_url": "http://localhost:8000/tasks/123",
+}
+
+
+def _reset() -> None:
+    email_templates.get_environment.cache_clear()
+    email_templates._compiled_templates.cache_clear()
+    email_templates._compile_string.cache_clear()
+
+
+def _cold_compile_ms() -> float:
+    _reset()
+    start = time.perf_counter()
+    email_templates._compiled_templates()
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--renders", type=int, default=2000, help="emails rendered per template and mode")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print(f"KIRA email templates: {args.renders} emails per template (text + html)")
+    print("=" * 60)
+    print(f"{'template':>20}{'per call':>12}{'compiled':>12}{'speedup':>10}")
+    for name in TEMPLATE_NAMES:
+        sources = EmailTemplates.get_template_by_type(name)
+        start = time.perf_counter()
+        for _ in range(args.renders):
+            Template(sources["text"]).render(**DATA)
+            Template(sources["html"]).render(**DATA)
+        per_call = args.renders / (time.perf_counter() - start)
+
+        EmailTemplates.render_by_type(name, DATA)
+        start = time.perf_counter()
+        for _ in range(args.renders):
+            EmailTemplates.render_by_type(name, DATA)
+        compiled = args.renders / (time.perf_counter() - start)
+        print(f"{name:>20}{per_call:>8.0f} /s{compiled:>8.0f} /s{compiled / per_call:>9.1f}x")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ.pop("EMAIL_TEMPLATE_CACHE_DIR", None)
+        no_cache = _cold_compile_ms()
+        os.environ["EMAIL_TEMPLATE_CACHE_DIR"] = cache_dir
+        _cold_compile_ms()  # fills the bytecode cache
+        warm = _cold_compile_ms()
+        del os.environ["EMAIL_TEMPLATE_CACHE_DIR"]
+    _reset()
+    print(f"\ncompile all templates in a new process: {no_cache:.1f} ms, "
+          f"{warm:.1f} ms with a warm bytecode cache")
+
+
+if __name__ == "__main__":
+    main()
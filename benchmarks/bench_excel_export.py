@@ -0,0 +1,80 @@
+"""
+Excel schedule report: time and peak Python memory per project size.
+
+For each size in --tasks, generates that many in-memory tasks (spread over the
+four statuses, two assignees each) and runs report_service.generate_excel_report
+into a SpooledTemporaryFile, the way the export route does. Peak memory is
+measured with tracemalloc after the tasks exist, so it covers only the export.
+With the write-only sheet it should stay flat as the row count grows.
+
+Usage:
+    python -m benchmarks.bench_excel_export
+    python -m benchmarks.bench_excel_export --tasks 1000 10000 100000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.src.enums.task_status import TaskStatus
+from backend.src.handlers.report_handler import EXCEL_SPOOL_MAX_BYTES
+from backend.src.services import report as report_service
+
+STATUSES = [s.value for s in TaskStatus]
+
+
+def _tasks(n: int) -> tuple[list, dict]:
+    tasks = [
+        SimpleNamespace(
+            id=i, title=f"Task {i}", description="Lorem ipsum dolor sit amet " * 3,
+            status=STATUSES[i % len(STATUSES)], priority=i % 10 + 1,
+            start_date=date(2025, 1, 1), deadline=date(2025, 6, 30), tag="bench",
+        )
+        for i in range(1, n + 1)
+    ]
+    return tasks, {t.id: ["Alice Admin", "Bob Employee"] for t in tasks}
+
+
+def run(n: int, *, trace: bool) -> tuple[float, float, int]:
+    tasks, assignees = _tasks(n)
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_BYTES) as out:
+        report_service.generate_excel_report({"project_name": "Benchmark"}, tasks, assignees, out=out)
+        elapsed = time.perf_counter() - start
+        size = out.seek(0, 2)
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed * 1000, peak / 1e6, size
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 10000, 50000], help="project sizes")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("KIRA Excel export (write-only, spooled)")
+    print("=" * 60)
+    print(f"{'tasks':>8}{'ms':>12}{'peak MB':>12}{'file KB':>12}")
+    for n in args.tasks:
+        # timed without tracemalloc (it slows allocation-heavy code), then traced for the peak
+        ms, _, size = run(n, trace=False)
+        _, peak, _ = run(n, trace=True)
+        print(f"{n:>8}{ms:>12.0f}{peak:>12.1f}{size / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
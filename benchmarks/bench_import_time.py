@@ -0,0 +1,85 @@
+"""
+API startup import time, with a budget check.
+
+Runs `python -X importtime -c "import backend.src.main"` --runs times in fresh
+interpreters and reports the median cumulative import time of backend.src.main
+and the slowest modules under it, plus the interpreter's peak RSS after the import
+(where the resource module exists). Fails (exit status 1) when the median is over
+--budget-ms or when any of the renderer libraries, which must only load on first
+use, was imported at startup.
+
+Usage:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --runs 7 --budget-ms 1000 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+ENTRY_MODULE = "backend.src.main"
+# Report renderers / exporters: loaded on first use, never at startup
+LAZY_MODULES = ("reportlab", "openpyxl", "pypdf", "pyarrow", "aiosmtplib")
+# Printed by the child after the import: peak RSS in KB (Linux ru_maxrss unit)
+RSS_SNIPPET = (
+    "try:\n import resource; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+    "except ImportError:\n pass"
+)
+
+
+def import_times(module: str = ENTRY_MODULE) -> tuple:
+    """({module: cumulative import time in ms}, peak RSS in MB or None) for one fresh `import module`."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(project_root), os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {module}\n{RSS_SNIPPET}"],
+        capture_output=True, text=True, cwd=project_root, env=env, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1000
+    rss = proc.stdout.strip()
+    return times, float(rss) / 1024 if rss else None
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time")
+    parser.add_argument("--budget-ms", type=float, default=1500, help="fail above this median import time")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args(argv)
+
+    results = [import_times() for _ in range(args.runs)]
+    runs = [times for times, _ in results]
+    median = statistics.median(run[ENTRY_MODULE] for run in runs)
+    rss = results[-1][1]
+    print("=" * 60)
+    print(f"KIRA startup imports ({ENTRY_MODULE}, {args.runs} runs)")
+    print("=" * 60)
+    last = runs[-1]
+    for name, ms in sorted(last.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{ms:>10.0f} ms  {name}")
+
+    eager = sorted({name.split(".")[0] for run in runs for name in run} & set(LAZY_MODULES))
+    print(f"\n{'median':>10} {median:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    if rss is not None:
+        print(f"{'peak RSS':>10} {rss:.0f} MB")
+    print(f"{'eager':>10} {', '.join(eager) or 'none of ' + ', '.join(LAZY_MODULES)}")
+    if median > args.budget_ms or eager:
+        print("\n❌ Startup import budget exceeded")
+        sys.exit(1)
+    print("\n✅ Within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Manager / director task views on a generated organisation.
+
+For each org size in --users, builds a fresh SQLite file with one department whose
+staff are spread over teams of --team-size (half of them subteams) with
+--tasks-per-user tasks each, then times each view and counts its SQL statements, for:
+
+  per-member  the previous implementation: one list_tasks_for_user call per member
+              plus one subteam lookup per team (reproduced here for comparison)
+  set-based   task_assignment_handler.list_tasks_by_manager / _by_director
+
+The set-based statement count does not depend on the number of teams or members
+(SQLAlchemy's selectinload adds one subtask-loading round per 500 tasks listed).
+
+Usage:
+    python -m benchmarks.bench_org_views
+    python -m benchmarks.bench_org_views --users 100 1000 5000 --team-size 10
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.config.db_config import DatabaseSettings
+from backend.src.database.db_setup import Base, RequestScopedSessionmaker, make_engine
+from backend.src.database.query_stats import track_queries
+import backend.src.main  # noqa: F401  registers every model
+from backend.src.database.models.department import Department
+from backend.src.database.models.task import Task
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.models.team import Team
+from backend.src.database.models.team_assignment import TeamAssignment
+from backend.src.database.models.user import User
+import backend.src.handlers.task_assignment_handler as assignment_handler
+import backend.src.services.department as department_service
+import backend.src.services.task as task_service
+import backend.src.services.task_assignment as assignment_service
+import backend.src.services.team as team_service
+import backend.src.services.user as user_service
+
+MANAGER_ID = 1
+DIRECTOR_ID = 2
+
+
+def _seed(engine, *, users: int, teams: int, tasks_per_user: int) -> None:
+    team_numbers = [f"01{t:02d}{s:02d}" for t in range(1, teams + 1) for s in (0, 1)]
+    user_rows = [
+        {"user_id": MANAGER_ID, "name": "Manager", "email": "m@example.com", "role": "manager", "hashed_pw": "x"},
+        {"user_id": DIRECTOR_ID, "name": "Director", "email": "d@example.com", "role": "director", "hashed_pw": "x"},
+    ]
+    members, tasks, assignments = [], [], []
+    task_id = 1
+    for i in range(users):
+        user_id = 10 + i
+        user_rows.append({"user_id": user_id, "name": f"U{user_id}", "email": f"u{user_id}@example.com",
+                          "role": "staff", "hashed_pw": "x", "department_id": None})
+        members.append({"team_id": i % len(team_numbers) + 1, "user_id": user_id})
+        for _ in range(tasks_per_user):
+            tasks.append({"id": task_id, "title": f"T{task_id}", "status": "To-do",
+                          "priority": task_id % 10 + 1, "active": True})
+            assignments.append({"task_id": task_id, "user_id": user_id})
+            task_id += 1
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), user_rows)
+        conn.execute(insert(Department).values(department_id=1, department_name="Engineering", manager_id=DIRECTOR_ID))
+        conn.execute(update(User).where(User.user_id == DIRECTOR_ID).values(department_id=1))
+        conn.execute(insert(Team), [
+            {"team_id": n + 1, "team_name": f"Team {number}", "manager_id": MANAGER_ID,
+             "department_id": 1, "team_number": number}
+            for n, number in enumerate(team_numbers)
+        ])
+        conn.execute(insert(TeamAssignment), members)
+        conn.execute(insert(Task), tasks)
+        conn.execute(insert(TaskAssignment), assignments)
+
+
+def _per_member(teams: list[dict]) -> dict:
+    """The loop the handlers used before: subteams per team, tasks per member, list dedupe."""
+    all_tasks = {}
+    for team in teams:
+        for t in [team] + team_service.get_subteam_by_team_number(team["team_number"]):
+            key = f"{t['team_number']}-{t['team_name']}"
+            all_tasks[key] = []
+            for member in team_service.get_users_in_team(t["team_id"]):
+                for task in assignment_service.list_tasks_for_user(member["user_id"]):
+                    if task not in all_tasks[key]:
+                        all_tasks[key].append(task)
+    return all_tasks
+
+
+def _measure(fn) -> tuple[int, float, int]:
+    with track_queries() as stats:
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+    return stats.count, elapsed * 1000, sum(len(v) for v in result.values())
+
+
+def run(users: int, team_size: int, tasks_per_user: int) -> list[tuple[str, str, int, float, int]]:
+    teams = max(1, users // team_size // 2)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", DatabaseSettings())
+        Base.metadata.create_all(engine)
+        _seed(engine, users=users, teams=teams, tasks_per_user=tasks_per_user)
+        session_local = RequestScopedSessionmaker(sessionmaker(bind=engine, expire_on_commit=False))
+        for module in (task_service, assignment_service, team_service, user_service, department_service):
+            module.SessionLocal = session_local
+
+        manager_teams = team_service.get_team_by_manager(MANAGER_ID)
+        top_level = [t for t in manager_teams if t["team_number"].endswith("00")]
+        runs = [
+            ("manager", "per-member", lambda: _per_member(manager_teams)),
+            ("manager", "set-based", lambda: assignment_handler.list_tasks_by_manager(MANAGER_ID)),
+            ("director", "per-member", lambda: _per_member(top_level)),
+            ("director", "set-based", lambda: assignment_handler.list_tasks_by_director(DIRECTOR_ID)),
+        ]
+        results = [(view, label, *_measure(fn)) for view, label, fn in runs]
+        engine.dispose()
+    return results
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000], help="org sizes to generate")
+    parser.add_argument("--team-size", type=int, default=20)
+    parser.add_argument("--tasks-per-user", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print("=" * 72)
+    print(f"KIRA org views: teams of {args.team_size}, {args.tasks_per_user} tasks/user")
+    print("=" * 72)
+    print(f"{'users':>7}  {'view':<10}{'path':<12}{'queries':>10}{'ms':>12}{'tasks':>10}")
+    for users in args.users:
+        for view, label, queries, ms, n_tasks in run(users, args.team_size, args.tasks_per_user):
+            print(f"{users:>7}  {view:<10}{label:<12}{queries:>10}{ms:>12.1f}{n_tasks:>10}")
+
+
+if __name__ == "__main__":
+    main()
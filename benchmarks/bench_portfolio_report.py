@@ -0,0 +1,83 @@
+"""
+Portfolio PDF report: one project after another vs. sections rendered in the worker pool.
+
+Builds --projects in-memory projects of --tasks tasks each, then times
+  - sequential: report_service.generate_pdf_report per project in this process
+    (what exporting the projects one by one costs in render time)
+  - pooled:     report_jobs.render_pdf_sections over REPORT_WORKERS processes,
+    then report_service.merge_pdf_reports into one document
+The pool is started (and warmed up) before timing.
+
+Usage:
+    python -m benchmarks.bench_portfolio_report
+    REPORT_WORKERS=8 python -m benchmarks.bench_portfolio_report --projects 12 --tasks 500
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.src.config.report_config import get_report_settings
+from backend.src.enums.task_status import TaskStatus
+from backend.src.services import report as report_service
+from backend.src.services import report_jobs
+
+STATUSES = [s.value for s in TaskStatus]
+
+
+def _sections(projects: int, tasks: int) -> list:
+    sections = []
+    for p in range(1, projects + 1):
+        project_tasks = [
+            report_service.ReportTask(
+                id=p * 100000 + i, title=f"Task {i}", description="Lorem ipsum dolor sit amet",
+                status=STATUSES[i % len(STATUSES)], priority=i % 10 + 1,
+                start_date=date(2025, 1, 1), deadline=date(2025, 6, 30), tag="bench",
+            )
+            for i in range(tasks)
+        ]
+        assignees = {t.id: ["Alice Admin", "Bob Employee"] for t in project_tasks}
+        sections.append(({"project_id": p, "project_name": f"Project {p}"}, project_tasks, assignees))
+    return sections
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=12, help="projects in the portfolio")
+    parser.add_argument("--tasks", type=int, default=500, help="tasks per project")
+    args = parser.parse_args(argv)
+
+    sections = _sections(args.projects, args.tasks)
+    print("=" * 60)
+    print(f"KIRA portfolio PDF: {args.projects} projects x {args.tasks} tasks, "
+          f"{get_report_settings().workers} workers")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    for section in sections:
+        report_jobs.render_pdf_section(*section)
+    sequential = time.perf_counter() - start
+
+    # start every worker first: each spawn imports reportlab
+    report_jobs.render_pdf_sections(_sections(get_report_settings().workers * 2, 1))
+    start = time.perf_counter()
+    pdfs = report_jobs.render_pdf_sections(sections)
+    rendered = time.perf_counter() - start
+    merged = report_service.merge_pdf_reports(zip((s[0]["project_name"] for s in sections), pdfs))
+    pooled = time.perf_counter() - start
+    report_jobs.shutdown()
+
+    print(f"{'sequential':>12}{sequential * 1000:>10.0f} ms")
+    print(f"{'pooled':>12}{pooled * 1000:>10.0f} ms   (merge {(pooled - rendered) * 1000:.0f} ms, "
+          f"{len(merged.getvalue()) / 1024:.0f} KB)")
+    print(f"{'speedup':>12}{sequential / pooled:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Email batch throughput: blocking smtplib batch vs. the pooled aiosmtplib transport.
+
+Starts a local aiosmtpd server that requires AUTH and answers each message after
+--latency-ms (standing in for a remote provider's round trips), then sends
+--messages messages in batches of --batch-size with
+  - smtplib:  EmailService.send_batch, one connection + login per batch
+  - pool xN:  EMAIL_TRANSPORT=aiosmtplib with SMTP_POOL_SIZE=N, connections kept
+              alive between batches
+and reports messages/second for each.
+
+Usage:
+    python -m benchmarks.bench_smtp_pool
+    python -m benchmarks.bench_smtp_pool --messages 1000 --connections 1 4 8 16 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import socket
+import sys
+import time
+from email.mime.text import MIMEText
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from backend.src.config.email_config import EmailSettings
+from backend.src.enums.email import EmailTransport
+from backend.src.services.email import EmailService
+
+USERNAME, PASSWORD = "bench@test.com", "secret"
+
+
+class _SlowHandler:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.delivered = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(self.latency)
+        self.delivered += 1
+        return "250 Message accepted"
+
+
+def _authenticate(server, session, envelope, mechanism, auth_data):
+    return AuthResult(success=auth_data.login.decode() == USERNAME, handled=False)
+
+
+def _batches(messages: int, batch_size: int) -> list:
+    batches = []
+    for start in range(0, messages, batch_size):
+        batch = []
+        for i in range(start, min(start + batch_size, messages)):
+            msg = MIMEText(f"Notification {i}")
+            msg["Subject"], msg["To"], msg["Message-ID"] = f"Update {i}", f"user{i}@test.com", f"<bench-{i}@test.com>"
+            batch.append((msg, [f"user{i}@test.com"]))
+        batches.append(batch)
+    return batches
+
+
+def _run(settings: EmailSettings, batches: list) -> float:
+    with patch("backend.src.services.email.get_email_settings", return_value=settings):
+        service = EmailService()
+    start = time.perf_counter()
+    try:
+        for batch in batches:
+            results = service.send_batch(batch)
+            failed = [r for r in results if isinstance(r, Exception)]
+            if failed:
+                raise RuntimeError(f"{len(failed)} messages failed: {failed[0]!r}")
+    finally:
+        service.close()
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=400, help="messages to send")
+    parser.add_argument("--batch-size", type=int, default=50, help="messages per send_batch call (EMAIL_OUTBOX_BATCH_SIZE)")
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 4, 8], help="pool sizes to compare")
+    parser.add_argument("--latency-ms", type=float, default=20, help="server delay before accepting each message")
+    args = parser.parse_args(argv)
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    handler = _SlowHandler(args.latency_ms / 1000)
+    controller = Controller(
+        handler, hostname="127.0.0.1", port=port,
+        authenticator=_authenticate, auth_required=True, auth_require_tls=False,
+    )
+    controller.start()
+
+    base = dict(
+        fastmail_smtp_host="127.0.0.1", fastmail_smtp_port=port,
+        fastmail_username=USERNAME, fastmail_password=PASSWORD,
+        fastmail_from_email="noreply@test.com", use_tls=False, use_ssl=False, timeout=30,
+    )
+    batches = _batches(args.messages, args.batch_size)
+
+    print("=" * 60)
+    print(f"KIRA email throughput: {args.messages} messages in batches of {args.batch_size}, "
+          f"{args.latency_ms:.0f} ms server latency")
+    print("=" * 60)
+    try:
+        elapsed = _run(EmailSettings(**base, email_transport=EmailTransport.SMTPLIB), batches)
+        baseline = args.messages / elapsed
+        print(f"{'smtplib':>12}{baseline:>10.0f} msg/s")
+        for connections in args.connections:
+            settings = EmailSettings(**base, email_transport=EmailTransport.AIOSMTPLIB, smtp_pool_size=connections)
+            rate = args.messages / _run(settings, batches)
+            print(f"{f'pool x{connections}':>12}{rate:>10.0f} msg/s   ({rate / baseline:.1f}x)")
+    finally:
+        controller.stop()
+    print(f"\n{handler.delivered} messages delivered")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+SQLite concurrency benchmark: reader throughput while writers are active.
+
+Runs the same mixed workload against a fresh file database once per engine
+profile (see backend/src/config/db_config.py) and prints reads/s, writes/s,
+read latency and lock errors for each.
+
+Readers page through the default task listing (50 rows, priority_desc); writers
+update a random task's priority and insert a new task, one short transaction each.
+
+Usage:
+    python -m benchmarks.bench_sqlite_concurrency
+    python -m benchmarks.bench_sqlite_concurrency --readers 16 --writers 4 --seconds 10
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import insert, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.config.db_config import DatabaseSettings
+from backend.src.database.db_setup import Base, make_engine
+# Register every model so the Task mapper can configure its relationships
+from backend.src.database.models.task import Task
+from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task_closure import TaskClosure
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.models.team import Team
+from backend.src.database.models.team_assignment import TeamAssignment
+from backend.src.database.models.user import User
+from backend.src.database.models.department import Department
+from backend.src.database.models.project import Project, ProjectAssignment
+from backend.src.database.models.comment import Comment
+from backend.src.services import task_query
+from backend.src.services.task_paging import apply_page
+
+
+def _seed(engine, n_tasks: int) -> None:
+    rows = [
+        {"title": f"Task {i}", "status": "To-do", "priority": random.randint(1, 10), "active": True}
+        for i in range(n_tasks)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Task), rows)
+
+
+def run_profile(profile: str, *, readers: int, writers: int, seconds: float, n_tasks: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = DatabaseSettings(profile=profile, pool_size=readers + writers, max_overflow=0)
+        engine = make_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", settings)
+        Base.metadata.create_all(engine)
+        _seed(engine, n_tasks)
+        Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+        listing = apply_page(
+            task_query.listing_statement(None, active_only=True, sort_by="priority_desc", with_subtasks=False),
+            "priority_desc",
+            limit=50,
+        )
+        stop = threading.Event()
+        lock = threading.Lock()
+        stats = {"reads": 0, "writes": 0, "read_errors": 0, "write_errors": 0, "latencies": []}
+
+        def reader():
+            reads, errors, latencies = 0, 0, []
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    with Session() as session:
+                        session.execute(listing).scalars().all()
+                    reads += 1
+                    latencies.append(time.perf_counter() - start)
+                except OperationalError:
+                    errors += 1
+            with lock:
+                stats["reads"] += reads
+                stats["read_errors"] += errors
+                stats["latencies"].extend(latencies)
+
+        def writer():
+            writes, errors = 0, 0
+            while not stop.is_set():
+                try:
+                    with Session.begin() as session:
+                        session.execute(
+                            update(Task)
+                            .where(Task.id == random.randint(1, n_tasks))
+                            .values(priority=random.randint(1, 10))
+                        )
+                        session.execute(insert(Task).values(title="Write", status="To-do", priority=5, active=True))
+                    writes += 1
+                except OperationalError:
+                    errors += 1
+            with lock:
+                stats["writes"] += writes
+                stats["write_errors"] += errors
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer) for _ in range(writers)]
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        engine.dispose()
+
+    latencies = sorted(stats["latencies"]) or [0.0]
+    return {
+        "profile": profile,
+        "reads_per_s": stats["reads"] / seconds,
+        "writes_per_s": stats["writes"] / seconds,
+        "read_p50_ms": statistics.median(latencies) * 1000,
+        "read_p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+        "read_errors": stats["read_errors"],
+        "write_errors": stats["write_errors"],
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--tasks", type=int, default=5000, help="rows seeded before the run")
+    parser.add_argument("--profiles", nargs="+", default=["baseline", "tuned"])
+    args = parser.parse_args(argv)
+
+    print("=" * 78)
+    print(f"KIRA SQLite concurrency: {args.readers} readers, {args.writers} writers, {args.seconds:g}s")
+    print("=" * 78)
+    print(f"{'profile':<10}{'reads/s':>10}{'writes/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'read err':>10}{'write err':>11}")
+    for profile in args.profiles:
+        r = run_profile(profile, readers=args.readers, writers=args.writers, seconds=args.seconds, n_tasks=args.tasks)
+        print(
+            f"{r['profile']:<10}{r['reads_per_s']:>10.0f}{r['writes_per_s']:>10.0f}"
+            f"{r['read_p50_ms']:>9.2f}{r['read_p95_ms']:>9.2f}{r['read_errors']:>10}{r['write_errors']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
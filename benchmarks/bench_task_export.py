@@ -0,0 +1,92 @@
+"""
+Task data exports (CSV, Parquet, Arrow IPC) vs. the Excel report: serialization time and size.
+
+For each size in --tasks, generates that many in-memory export rows (two assignees
+each) in batches of EXPORT_BATCH_SIZE, as iter_task_batches yields them, and times
+each serializer on them. The Excel row renders the same tasks with
+report_service.generate_excel_report for comparison. Database reads are not timed.
+
+Usage:
+    python -m benchmarks.bench_task_export
+    python -m benchmarks.bench_task_export --tasks 1000 10000 100000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path so we can import backend modules
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.src.enums.task_status import TaskStatus
+from backend.src.services import report as report_service
+from backend.src.services import report_export as report_export_service
+
+STATUSES = [s.value for s in TaskStatus]
+
+
+def _batches(n: int) -> list:
+    rows = [
+        {
+            "task_id": i, "project_id": 1, "title": f"Task {i}", "description": "Lorem ipsum dolor sit amet " * 3,
+            "status": STATUSES[i % len(STATUSES)], "priority": i % 10 + 1,
+            "start_date": date(2025, 1, 1), "deadline": date(2025, 6, 30), "tag": "bench",
+            "active": True, "updated_at": datetime(2025, 1, 1, 12), "assignees": ["Alice Admin", "Bob Employee"],
+        }
+        for i in range(1, n + 1)
+    ]
+    size = report_export_service.EXPORT_BATCH_SIZE
+    return [rows[i:i + size] for i in range(0, n, size)]
+
+
+def _excel(batches) -> int:
+    rows = [row for batch in batches for row in batch]
+    tasks = [SimpleNamespace(id=row["task_id"], **{k: row[k] for k in (
+        "title", "description", "status", "priority", "start_date", "deadline", "tag")}) for row in rows]
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as out:
+        report_service.generate_excel_report(
+            {"project_name": "Benchmark"}, tasks, {row["task_id"]: row["assignees"] for row in rows}, out=out
+        )
+        return out.seek(0, 2)
+
+
+def _parquet(batches) -> int:
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as out:
+        report_export_service.write_parquet(batches, out)
+        return out.seek(0, 2)
+
+
+SERIALIZERS = {
+    "csv": lambda batches: sum(map(len, report_export_service.csv_chunks(batches))),
+    "arrow": lambda batches: sum(map(len, report_export_service.arrow_ipc_chunks(batches))),
+    "parquet": _parquet,
+    "excel": _excel,
+}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 10000, 50000], help="project sizes")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("KIRA task data export formats")
+    print("=" * 60)
+    print(f"{'tasks':>8}{'format':>10}{'ms':>12}{'file KB':>12}")
+    report_export_service.arrow_schema()  # import pyarrow before timing
+    for n in args.tasks:
+        batches = _batches(n)
+        for name, serialize in SERIALIZERS.items():
+            start = time.perf_counter()
+            size = serialize(batches)
+            ms = (time.perf_counter() - start) * 1000
+            print(f"{n:>8}{name:>10}{ms:>12.0f}{size / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
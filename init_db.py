@@ -15,6 +15,8 @@ from pathlib import Path
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+from sqlalchemy import text
+
 from backend.src.database.db_setup_tables import engine, Base
 from backend.src.init_scripts import seed_data
 from backend.src.init_scripts import seed_demo_data
@@ -31,7 +33,15 @@ def main():
     try:
         # Step 0: Drop all tables (for clean reset)
         print("\n🗑️  Step 0: Dropping all existing tables...")
-        Base.metadata.drop_all(engine)
+        sqlite = engine.dialect.name == "sqlite"
+        with engine.connect() as conn:
+            # SQLite enforces foreign keys and department <-> user reference each other, so drop with them off
+            if sqlite:
+                conn.execute(text("PRAGMA foreign_keys=OFF"))
+            Base.metadata.drop_all(bind=conn)
+            if sqlite:
+                conn.execute(text("PRAGMA foreign_keys=ON"))
+            conn.commit()
         print("✅ All tables dropped successfully!")
         
         # Step 1: Create tables
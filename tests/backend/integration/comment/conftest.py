@@ -3,10 +3,11 @@ from __future__ import annotations
 import os
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event, delete, text
+from sqlalchemy import delete
 from sqlalchemy.orm import sessionmaker
 
-from backend.src.database.db_setup import Base
+from tests.db_backend import make_test_engine, drop_schema
+from backend.src.database.db_setup import Base, RequestScopedSessionmaker
 from backend.src.database.models.comment import Comment
 from backend.src.database.models.task import Task
 from backend.src.database.models.user import User
@@ -17,28 +18,12 @@ from backend.src.database.models.project import Project
 @pytest.fixture(scope="session")
 def test_engine(tmp_path_factory):
     db_file = tmp_path_factory.mktemp("kira_integration_comment") / "comment_itest.db"
-    engine = create_engine(
-        f"sqlite:///{db_file}",
-        connect_args={"check_same_thread": False},
-        future=True,
-    )
-
-    @event.listens_for(engine, "connect")
-    def _fk_on(dbapi_connection, connection_record):  # pragma: no cover
-        cur = dbapi_connection.cursor()
-        cur.execute("PRAGMA foreign_keys=ON")
-        cur.close()
-
-    Base.metadata.create_all(bind=engine)
+    engine = make_test_engine(db_file)
     try:
         yield engine
     finally:
-        # Teardown: disable FK checks before dropping tables to avoid circular dependency issues
         try:
-            with engine.connect() as conn:
-                conn.execute(text("PRAGMA foreign_keys=OFF"))
-                Base.metadata.drop_all(bind=conn)
-                conn.execute(text("PRAGMA foreign_keys=ON"))
+            drop_schema(engine)
         finally:
             engine.dispose()
             if os.path.exists(db_file):
@@ -50,13 +35,13 @@ def test_engine(tmp_path_factory):
 
 @pytest.fixture(scope="session")
 def client(test_engine):
-    TestingSessionLocal = sessionmaker(
+    TestingSessionLocal = RequestScopedSessionmaker(sessionmaker(
         bind=test_engine,
         autoflush=False,
         autocommit=False,
         expire_on_commit=False,
         future=True,
-    )
+    ))
     # Point the comment service to the test DB
     import backend.src.services.comment as comment_service
     comment_service.SessionLocal = TestingSessionLocal
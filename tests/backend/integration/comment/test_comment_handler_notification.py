@@ -7,6 +7,7 @@ from backend.src.database.models.project import Project
 
 from backend.src.enums.notification import NotificationType
 import backend.src.handlers.comment_handler as comment_handler
+from backend.src.services import notification_dispatch
 
 from tests.mock_data.comment.integration_data import (
     VALID_USER,
@@ -79,6 +80,8 @@ def test_add_comment_triggers_notification_with_recipients_and_assignees(
             COMMENT_CREATE_NONEXISTENT_RECIPIENTS_PAYLOAD["recipient_emails"][0],
         ],
     )
+    # The notification runs on the worker pool: wait for it
+    notification_dispatch.shutdown()
 
     assert result["task_id"] == VALID_TASK["id"]
     assert mock_notif.last_kwargs is not None
@@ -110,6 +113,8 @@ def test_add_comment_notification_no_payload_and_no_assignees(
         user_id=VALID_USER["user_id"],
         comment_text="hi",
     )
+    # The notification runs on the worker pool: wait for it
+    notification_dispatch.shutdown()
 
     assert result["task_id"] == VALID_TASK["id"]
     call = mock_notif.last_kwargs
@@ -135,6 +140,8 @@ def test_add_comment_ignores_assignee_without_email(
         comment_text="hi",
         recipient_emails=[VALID_USER["email"]],
     )
+    # The notification runs on the worker pool: wait for it
+    notification_dispatch.shutdown()
 
     assert result["task_id"] == VALID_TASK["id"]
     call = mock_notif.last_kwargs
@@ -160,6 +167,8 @@ def test_add_comment_two_valid_payload_no_assignees(
         comment_text="hi",
         recipient_emails=[VALID_USER["email"], ANOTHER_USER["email"], VALID_USER["email"]],
     )
+    # The notification runs on the worker pool: wait for it
+    notification_dispatch.shutdown()
 
     assert result["task_id"] == VALID_TASK["id"]
     call = mock_notif.last_kwargs
@@ -267,4 +276,28 @@ def test_notify_comment_mentions_deduplicates_recipients(seed_task_and_users, mo
     assert getattr(resp, "success", False) is True
     call = mock_notif.last_kwargs
     assert call["type_of_alert"] == NotificationType.COMMENT_MENTION.value
-    assert sorted(call.get("to_recipients") or []) == [VALID_USER["email"]]
\ No newline at end of file
+    assert sorted(call.get("to_recipients") or []) == [VALID_USER["email"]]
+
+# INT-034/012
+def test_comment_recipients_resolve_by_display_name(seed_task_and_users, monkeypatch):
+    mock_notif = _MockNotifSvc()
+    monkeypatch.setattr(comment_handler.comment_service, "get_notification_service", lambda: mock_notif)
+    monkeypatch.setattr(comment_handler, "get_notification_service", lambda: mock_notif)
+    monkeypatch.setattr(comment_handler.assignment_service, "list_assignees", lambda task_id: [])
+
+    comment_handler.add_comment(
+        task_id=VALID_TASK["id"],
+        user_id=VALID_USER["user_id"],
+        comment_text="hi",
+        recipient_emails=[ANOTHER_USER["name"], "Nobody"],
+    )
+    # The notification runs on the worker pool: wait for it
+    notification_dispatch.shutdown()
+    assert mock_notif.last_kwargs["to_recipients"] == [ANOTHER_USER["email"]]
+
+    comment_handler.notify_comment_mentions(
+        task_id=VALID_TASK["id"],
+        user_id=VALID_USER["user_id"],
+        recipient_emails=[VALID_USER["name"], ANOTHER_USER["email"]],
+    )
+    assert sorted(mock_notif.last_kwargs["to_recipients"]) == sorted([VALID_USER["email"], ANOTHER_USER["email"]])
@@ -0,0 +1,136 @@
+# tests/backend/integration/database/test_db_setup.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from backend.src.config.db_config import DatabaseSettings
+from backend.src.database.db_setup import make_async_engine, make_engine, to_async_url
+
+
+def _pragma(engine, name: str):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'profile.db'}"
+
+
+# INT-146/001
+def test_tuned_profile_applies_pragmas(db_url):
+    engine = make_engine(db_url, DatabaseSettings(profile="tuned"))
+    try:
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1  # NORMAL
+        assert _pragma(engine, "foreign_keys") == 1
+        assert _pragma(engine, "busy_timeout") == 5000
+        assert _pragma(engine, "cache_size") == -64000
+        assert _pragma(engine, "mmap_size") == 256 * 1024 * 1024
+    finally:
+        engine.dispose()
+
+
+# INT-146/002
+def test_tuned_profile_uses_sized_queue_pool(db_url):
+    engine = make_engine(db_url, DatabaseSettings(pool_size=3, max_overflow=2, pool_timeout=1))
+    try:
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == 3
+        assert engine.pool._max_overflow == 2
+    finally:
+        engine.dispose()
+
+
+# INT-146/003
+def test_settings_read_from_env(db_url, monkeypatch):
+    monkeypatch.setenv("DB_BUSY_TIMEOUT", "1234")
+    monkeypatch.setenv("DB_SYNCHRONOUS", "FULL")
+    engine = make_engine(db_url)
+    try:
+        assert _pragma(engine, "busy_timeout") == 1234
+        assert _pragma(engine, "synchronous") == 2  # FULL
+    finally:
+        engine.dispose()
+
+
+# INT-146/004
+def test_baseline_profile_keeps_sqlite_defaults(db_url):
+    engine = make_engine(db_url, DatabaseSettings(profile="baseline"))
+    try:
+        assert _pragma(engine, "journal_mode") == "delete"
+        assert _pragma(engine, "foreign_keys") == 0
+    finally:
+        engine.dispose()
+
+
+# INT-146/005
+def test_unknown_profile_rejected(db_url):
+    with pytest.raises(ValueError, match="Unknown DB profile"):
+        make_engine(db_url, DatabaseSettings(profile="turbo"))
+
+
+# INT-146/006
+def test_wal_reader_not_blocked_by_open_write(db_url):
+    """With WAL a reader sees the last committed state while a write transaction is still open."""
+    engine = make_engine(db_url, DatabaseSettings(busy_timeout=100))
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE t (v INTEGER)"))
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+
+        writer_has_lock = threading.Event()
+        release_writer = threading.Event()
+
+        def _writer():
+            with engine.begin() as conn:
+                conn.execute(text("INSERT INTO t VALUES (2)"))
+                writer_has_lock.set()
+                release_writer.wait(5)
+
+        thread = threading.Thread(target=_writer)
+        thread.start()
+        try:
+            assert writer_has_lock.wait(5)
+            with engine.connect() as conn:
+                assert conn.execute(text("SELECT COUNT(*) FROM t")).scalar() == 1
+        finally:
+            release_writer.set()
+            thread.join()
+
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM t")).scalar() == 2
+    finally:
+        engine.dispose()
+
+
+# INT-148/005
+@pytest.mark.parametrize("url, expected", [
+    ("sqlite:///kira.db", "sqlite+aiosqlite:///kira.db"),
+    ("sqlite+aiosqlite:///kira.db", "sqlite+aiosqlite:///kira.db"),
+    ("postgresql://kira:pw@db/kira", "postgresql+psycopg://kira:pw@db/kira"),
+    ("postgresql+psycopg2://kira:pw@db/kira", "postgresql+psycopg://kira:pw@db/kira"),
+    ("postgresql+asyncpg://kira:pw@db/kira", "postgresql+asyncpg://kira:pw@db/kira"),
+])
+def test_to_async_url(url, expected):
+    assert to_async_url(url) == expected
+
+
+# INT-148/006
+def test_async_engine_applies_tuned_profile(db_url):
+    async def run():
+        engine = make_async_engine(db_url, DatabaseSettings(pool_size=4, busy_timeout=1234))
+        try:
+            async with engine.connect() as conn:
+                journal = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+                busy = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+                fks = (await conn.execute(text("PRAGMA foreign_keys"))).scalar()
+            return journal, busy, fks, engine.pool.size()
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run()) == ("wal", 1234, 1, 4)
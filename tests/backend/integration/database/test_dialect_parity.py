@@ -0,0 +1,126 @@
+# tests/backend/integration/database/test_dialect_parity.py
+"""
+Statements the app relies on must compile for PostgreSQL as well as SQLite.
+These run without a server; scripts/test_postgres.sh runs the suites against a live one.
+"""
+from __future__ import annotations
+
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import psycopg
+from sqlalchemy.schema import CreateTable, CreateIndex
+
+import backend.src.main  # noqa: F401  registers every model
+from backend.src.database.db_setup import Base, make_engine
+from backend.src.config.db_config import DatabaseSettings
+from backend.src.services import task as task_service
+from backend.src.services import team as team_service
+from backend.src.services import task_query
+from backend.src.services.task_paging import SORT_KEYS, apply_page, encode_cursor
+
+DIALECTS = [postgresql.dialect(), sqlite.dialect()]
+
+
+def _sql(stmt, dialect) -> str:
+    return str(stmt.compile(dialect=dialect))
+
+
+# INT-147/001
+@pytest.mark.parametrize("dialect", DIALECTS, ids=lambda d: d.name)
+def test_schema_ddl_compiles(dialect):
+    for table in Base.metadata.sorted_tables:
+        assert "CREATE TABLE" in str(CreateTable(table).compile(dialect=dialect))
+        for index in table.indexes:
+            assert "INDEX" in str(CreateIndex(index).compile(dialect=dialect))
+
+
+# INT-147/002
+def test_department_user_cycle_is_breakable_with_alter():
+    """PostgreSQL adds/drops the department -> user FK via ALTER, so create_all/drop_all can order the cycle."""
+    fk = next(iter(Base.metadata.tables["department"].c.manager_id.foreign_keys))
+    assert fk.use_alter and fk.constraint.name
+
+
+# INT-147/003
+@pytest.mark.parametrize("dialect", DIALECTS, ids=lambda d: d.name)
+@pytest.mark.parametrize("sort_by", list(SORT_KEYS))
+def test_filtered_paged_listing_compiles(dialect, sort_by):
+    shape, _ = task_query.compile_filter({
+        "or": [{"status": ["To-do"], "assignee_id": 1}, {"priority_range": [8, None], "tag": "urgent"}],
+        "deadline_range": ["2025-01-01", "2025-12-31"],
+    })
+    last = MagicMock(id=3, priority=5, status="To-do", start_date=None, deadline=None)
+    stmt = task_query.listing_statement(shape, active_only=True, sort_by=sort_by, with_subtasks=True)
+    sql = _sql(apply_page(stmt, sort_by, limit=10, after=encode_cursor(last, sort_by)), dialect)
+    assert "ORDER BY" in sql and "LIMIT" in sql
+
+
+# INT-147/004
+@pytest.mark.parametrize("dialect", DIALECTS, ids=lambda d: d.name)
+def test_hierarchy_statements_compile(dialect):
+    """Closure maintenance (INSERT ... SELECT) and the recursive subtree CTE."""
+    session = MagicMock()
+    task_service._closure_link(session, 1, [2, 3])
+    task_service._closure_unlink(session, 2)
+    for call in session.execute.call_args_list:
+        assert _sql(call.args[0], dialect)
+
+    with patch.object(task_service, "SessionLocal") as session_local:
+        tree_session = session_local.return_value.__enter__.return_value
+        tree_session.execute.return_value.all.return_value = []
+        assert task_service.get_task_tree(1, max_depth=3) is None
+        sql = _sql(tree_session.execute.call_args.args[0], dialect)
+    assert "WITH RECURSIVE" in sql.upper()
+    # PostgreSQL types a recursive CTE's columns from its anchor: NULL / a bare
+    # parameter there would not match the integers of the recursive member
+    assert "CAST(NULL AS INTEGER) AS parent_id" in sql
+
+
+# INT-147/008
+def test_recursive_cte_anchor_binds_are_typed_for_psycopg():
+    """psycopg (the DATABASE_URL driver) sends casts for typed binds; the anchor depth must get one."""
+    with patch.object(task_service, "SessionLocal") as session_local:
+        tree_session = session_local.return_value.__enter__.return_value
+        tree_session.execute.return_value.all.return_value = []
+        task_service.get_task_tree(1)
+        sql = _sql(tree_session.execute.call_args.args[0], psycopg.dialect())
+    anchor = sql.split("UNION ALL")[0]
+    assert "CAST(NULL AS INTEGER) AS parent_id" in anchor
+    assert "::INTEGER AS depth" in anchor
+
+
+# INT-147/005
+@pytest.mark.parametrize("dialect", DIALECTS, ids=lambda d: d.name)
+def test_team_prefix_queries_are_portable(dialect):
+    """Team hierarchy lookups compare the stored prefix columns rather than substr() or LIKE."""
+    with patch.object(team_service, "SessionLocal") as session_local:
+        session = session_local.return_value.__enter__.return_value
+        session.query.return_value.filter.return_value.all.return_value = []
+        session.query.return_value.filter.return_value.filter.return_value.all.return_value = []
+        team_service.get_teams_by_department(1)
+        team_service.get_subteam_by_team_number("010200")
+        criteria = [c.args[0] for c in session.query.return_value.filter.call_args_list]
+
+    for criterion in criteria:
+        sql = _sql(criterion, dialect).lower()
+        assert "_prefix =" in sql and "like" not in sql and "substr" not in sql
+
+
+# INT-147/006
+def test_non_sqlite_url_gets_plain_pooled_engine():
+    with patch("backend.src.database.db_setup.create_engine") as create_engine, \
+         patch("backend.src.database.db_setup.apply_sqlite_pragmas") as pragmas:
+        make_engine("postgresql+psycopg://kira:kira@db:5432/kira", DatabaseSettings(pool_size=7))
+    kwargs = create_engine.call_args.kwargs
+    assert kwargs["pool_size"] == 7 and kwargs["pool_pre_ping"] is True
+    assert "connect_args" not in kwargs
+    pragmas.assert_not_called()
+
+
+# INT-147/007
+def test_database_url_env_selects_backend(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql+psycopg://kira:kira@db:5432/kira")
+    with patch("backend.src.database.db_setup.create_engine") as create_engine:
+        make_engine()
+    assert create_engine.call_args.args[0] == "postgresql+psycopg://kira:kira@db:5432/kira"
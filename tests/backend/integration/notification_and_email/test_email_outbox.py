@@ -0,0 +1,238 @@
+"""
+Integration tests for the email outbox and its batched dispatcher: rows written in
+the caller's transaction, one SMTP connection per batch, per-row retry with backoff,
+and leases.
+"""
+from __future__ import annotations
+
+import os
+import smtplib
+import tempfile
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.config.email_config import EmailSettings, OutboxSettings
+from backend.src.database.db_setup import Base, RequestScopedSessionmaker, request_scope
+from backend.src.database.models.email_outbox import EmailOutbox
+from backend.src.database.models.task import utcnow
+from backend.src.enums.email import OutboxStatus
+from backend.src.schemas.email import EmailContent, EmailMessage, EmailRecipient
+from backend.src.services import email_dispatcher, email_outbox, notification_buffer
+from backend.src.services.email import EmailService
+from backend.src.services.notification import NotificationService
+from tests.mock_data.integration_data import EMAIL_SETTINGS_TLS
+
+
+@pytest.fixture
+def outbox_db(monkeypatch):
+    """email_outbox on a temporary database, behind the request-scoped sessionmaker."""
+    db_fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(db_fd)
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    monkeypatch.setattr(email_outbox, "SessionLocal", RequestScopedSessionmaker(Session))
+    monkeypatch.setattr(notification_buffer, "SessionLocal", RequestScopedSessionmaker(Session))
+    try:
+        yield Session
+    finally:
+        engine.dispose()
+        os.remove(db_path)
+
+
+@pytest.fixture
+def email_service(monkeypatch):
+    """An EmailService with complete SMTP settings, used by the dispatcher."""
+    settings = EmailSettings(**EMAIL_SETTINGS_TLS, test_recipient_email="member@test.com")
+    with patch("backend.src.services.email.get_email_settings", return_value=settings):
+        service = EmailService()
+    monkeypatch.setattr(email_dispatcher, "get_email_service", lambda: service)
+    return service
+
+
+@pytest.fixture
+def smtp():
+    with patch("backend.src.services.email.smtplib.SMTP") as smtp_class:
+        yield smtp_class
+
+
+def _settings(**overrides) -> OutboxSettings:
+    values = dict(autostart=False, batch_size=50, lease_seconds=300, backoff_base_seconds=30,
+                  backoff_max_seconds=3600, max_attempts=3)
+    values.update(overrides)
+    return OutboxSettings(**values)
+
+
+def _message(n: int) -> EmailMessage:
+    return EmailMessage(
+        recipients=[EmailRecipient(email=f"user{n}@test.com")],
+        content=EmailContent(subject=f"Update {n}", text_body=f"Body {n}"),
+    )
+
+
+def _rows(Session):
+    with Session() as session:
+        return session.query(EmailOutbox).order_by(EmailOutbox.id).all()
+
+
+class TestEmailOutbox:
+    """Queueing into the outbox."""
+
+    #INT-161/001
+    def test_queued_email_follows_the_request_transaction(self, outbox_db, email_service, smtp):
+        with pytest.raises(RuntimeError):
+            with request_scope():
+                email_service.queue_email(_message(1))
+                raise RuntimeError("request failed")
+        assert _rows(outbox_db) == []
+
+        with request_scope():
+            response = email_service.queue_email(_message(2))
+
+        rows = _rows(outbox_db)
+        assert response.success and response.message == "Email queued"
+        assert [row.id for row in rows] == [int(response.email_id)]
+        assert rows[0].status == OutboxStatus.PENDING.value
+        assert rows[0].to_addrs == ["user2@test.com"]
+        assert rows[0].text_body == "Body 2"
+        smtp.assert_not_called()
+
+    #INT-161/002
+    def test_notify_activity_queues_without_smtp(self, outbox_db, email_service, smtp):
+        service = NotificationService()
+        service.email_service = email_service
+
+        response = service.notify_activity(
+            user_email="manager@test.com", task_id=7, task_title="Write report",
+            type_of_alert="task_update", updated_fields=["title"],
+            old_values={"title": "Draft"}, new_values={"title": "Write report"},
+        )
+
+        rows = _rows(outbox_db)
+        assert response.success
+        assert len(rows) == 1 and rows[0].to_addrs == ["member@test.com"]
+        assert "Write report" in rows[0].subject
+        smtp.assert_not_called()
+
+    #INT-161/003
+    def test_claimed_rows_are_leased(self, outbox_db, email_service):
+        for n in range(3):
+            email_service.queue_email(_message(n))
+        settings = _settings(lease_seconds=60)
+        now = utcnow()
+
+        first = email_outbox.claim_batch(2, settings=settings, now=now)
+        second = email_outbox.claim_batch(10, settings=settings, now=now)
+        after_lease = email_outbox.claim_batch(10, settings=settings, now=now + timedelta(seconds=61))
+
+        assert [row.attempts for row in first] == [1, 1]
+        assert [row.id for row in second] == [3]
+        assert [row.id for row in after_lease] == [1, 2, 3]
+        assert [row.attempts for row in after_lease] == [2, 2, 2]
+
+
+class TestEmailDispatcher:
+    """Sending the outbox in batches."""
+
+    #INT-161/004
+    def test_batch_is_sent_over_one_connection(self, outbox_db, email_service, smtp):
+        for n in range(5):
+            email_service.queue_email(_message(n))
+
+        result = email_dispatcher.dispatch_once(_settings())
+
+        server = smtp.return_value
+        assert (result.claimed, result.sent, result.failed) == (5, 5, 0)
+        smtp.assert_called_once()
+        server.starttls.assert_called_once()
+        server.login.assert_called_once_with("ci@test.com", "secret")
+        server.quit.assert_called_once()
+        assert server.send_message.call_count == 5
+        rows = _rows(outbox_db)
+        assert {row.status for row in rows} == {OutboxStatus.SENT.value}
+        assert [row.message_id for row in rows] == [f"<kira-outbox-{row.id}@test.com>" for row in rows]
+        assert email_dispatcher.dispatch_once(_settings()).claimed == 0
+        assert email_outbox.status_counts() == {"pending": 0, "sent": 5, "failed": 0}
+
+    #INT-161/005
+    def test_refused_message_is_retried_alone(self, outbox_db, email_service, smtp):
+        for n in range(3):
+            email_service.queue_email(_message(n))
+        smtp.return_value.send_message.side_effect = [
+            {}, smtplib.SMTPRecipientsRefused({"user1@test.com": (550, b"No such user")}), {},
+        ]
+        before = utcnow()
+
+        result = email_dispatcher.dispatch_once(_settings())
+
+        assert (result.sent, result.failed) == (2, 1)
+        sent, refused, sent_too = _rows(outbox_db)
+        assert sent.status == sent_too.status == OutboxStatus.SENT.value
+        assert refused.status == OutboxStatus.PENDING.value
+        assert refused.attempts == 1
+        assert "SMTPRecipientsRefused" in refused.last_error
+        assert refused.next_attempt_at >= before + timedelta(seconds=30)
+
+    #INT-161/006
+    def test_lost_connection_fails_the_rest_of_the_batch(self, outbox_db, email_service, smtp):
+        for n in range(4):
+            email_service.queue_email(_message(n))
+        smtp.return_value.send_message.side_effect = [{}, smtplib.SMTPServerDisconnected("gone")]
+
+        result = email_dispatcher.dispatch_once(_settings())
+
+        assert (result.sent, result.failed) == (1, 3)
+        assert smtp.return_value.send_message.call_count == 2
+        assert [row.status for row in _rows(outbox_db)] == ["sent", "pending", "pending", "pending"]
+
+    #INT-161/007
+    def test_connect_failure_backs_off_then_gives_up(self, outbox_db, email_service, smtp):
+        email_service.queue_email(_message(1))
+        smtp.side_effect = OSError("connection refused")
+        settings = _settings(backoff_base_seconds=0, max_attempts=3)
+
+        for attempt in (1, 2):
+            assert email_dispatcher.dispatch_once(settings).failed == 1
+            row = _rows(outbox_db)[0]
+            assert (row.status, row.attempts) == (OutboxStatus.PENDING.value, attempt)
+        assert email_dispatcher.dispatch_once(settings).failed == 1
+
+        row = _rows(outbox_db)[0]
+        assert (row.status, row.attempts) == (OutboxStatus.FAILED.value, 3)
+        assert "connection refused" in row.last_error
+        assert email_dispatcher.dispatch_once(settings).claimed == 0
+        assert email_outbox.backoff_seconds(1, _settings()) == 30
+        assert email_outbox.backoff_seconds(4, _settings()) == 240
+        assert email_outbox.backoff_seconds(20, _settings()) == 3600
+
+    #INT-161/008
+    def test_dispatch_skipped_without_smtp_settings(self, outbox_db, email_service, smtp):
+        email_service.queue_email(_message(1))
+        email_service.settings.fastmail_password = ""
+
+        assert email_dispatcher.dispatch_once(_settings()).claimed == 0
+        assert _rows(outbox_db)[0].attempts == 0
+        smtp.assert_not_called()
+
+    #INT-161/009
+    def test_background_dispatcher_sends_and_stops(self, outbox_db, email_service, smtp, monkeypatch):
+        monkeypatch.setattr(email_dispatcher, "get_outbox_settings", lambda: _settings(autostart=True, poll_interval=0.05))
+        email_service.queue_email(_message(1))
+
+        assert email_dispatcher.start() is True
+        try:
+            deadline = time.monotonic() + 5
+            while _rows(outbox_db)[0].status != OutboxStatus.SENT.value and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            email_dispatcher.stop()
+
+        assert _rows(outbox_db)[0].status == OutboxStatus.SENT.value
+        assert email_dispatcher._thread is None
+        monkeypatch.setattr(email_dispatcher, "get_outbox_settings", lambda: _settings(autostart=False))
+        assert email_dispatcher.start() is False
@@ -0,0 +1,228 @@
+"""
+Integration tests for notification coalescing: events buffered per (recipient, task),
+merged field diffs, one email per recipient and window, and daily digests.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.config.email_config import EmailSettings
+from backend.src.config.notification_config import NotificationSettings
+from backend.src.database.db_setup import Base, RequestScopedSessionmaker, request_scope
+from backend.src.database.models.email_outbox import EmailOutbox
+from backend.src.database.models.task import utcnow
+from backend.src.enums.notification import NotificationType
+from backend.src.services import email_outbox, notification_buffer
+from backend.src.services.email import EmailService
+from backend.src.services.notification import NotificationService
+from tests.mock_data.integration_data import EMAIL_SETTINGS_TLS
+
+ALICE, BOB = "alice@test.com", "bob@test.com"
+
+
+@pytest.fixture
+def buffer_db(monkeypatch):
+    """notification_buffer and email_outbox on a temporary database."""
+    db_fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(db_fd)
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    monkeypatch.setattr(email_outbox, "SessionLocal", RequestScopedSessionmaker(Session))
+    monkeypatch.setattr(notification_buffer, "SessionLocal", RequestScopedSessionmaker(Session))
+    try:
+        yield Session
+    finally:
+        engine.dispose()
+        os.remove(db_path)
+
+
+def _service(monkeypatch, **notification_settings) -> NotificationService:
+    settings = NotificationSettings(**notification_settings)
+    monkeypatch.setattr("backend.src.services.notification.get_notification_settings", lambda: settings)
+    monkeypatch.setattr(notification_buffer, "get_notification_settings", lambda: settings)
+    email_settings = EmailSettings(**EMAIL_SETTINGS_TLS, test_recipient_email="member@test.com")
+    with patch("backend.src.services.email.get_email_settings", return_value=email_settings):
+        service = NotificationService()
+        service.email_service = EmailService()
+    return service
+
+
+def _update(service, task_id, old, new, *, to=(ALICE,), by="manager@test.com", title=None):
+    return service.notify_activity(
+        user_email=by, task_id=task_id, task_title=title or f"Task {task_id}",
+        type_of_alert=NotificationType.TASK_UPDATE.value, updated_fields=list(new),
+        old_values=old, new_values=new, to_recipients=list(to),
+    )
+
+
+def _outbox(Session):
+    with Session() as session:
+        return session.query(EmailOutbox).order_by(EmailOutbox.id).all()
+
+
+class TestNotificationCoalescing:
+
+    #INT-164/001
+    def test_updates_in_window_become_one_email_with_merged_diff(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch, coalesce_window_seconds=60)
+
+        first = _update(service, 1, {"priority": 3}, {"priority": 5})
+        _update(service, 1, {"priority": 5, "title": "Task 1"}, {"priority": 8, "title": "Renamed"}, title="Renamed")
+        _update(service, 1, {"deadline": "2025-10-01"}, {"deadline": "2025-10-15"}, by="lead@test.com", title="Renamed")
+
+        assert first.success and first.message == "Notification buffered"
+        assert _outbox(buffer_db) == []
+        assert notification_buffer.pending_count() == 1
+        assert service.flush_buffered() == 0
+
+        assert service.flush_buffered(now=utcnow() + timedelta(seconds=61)) == 1
+
+        (email,) = _outbox(buffer_db)
+        assert email.to_addrs == [ALICE]
+        assert email.subject == "[Kira Task Management] Updated — Renamed (#1)"
+        assert "- priority: 3 -> 8" in email.text_body
+        assert "- title: Task 1 -> Renamed" in email.text_body
+        assert "- deadline: 2025-10-01 -> 2025-10-15" in email.text_body
+        assert "manager@test.com, lead@test.com" in email.text_body
+        assert notification_buffer.pending_count() == 0
+
+    #INT-164/002
+    def test_changes_reverted_in_window_send_nothing(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch, coalesce_window_seconds=60)
+
+        _update(service, 1, {"priority": 3}, {"priority": 5})
+        _update(service, 1, {"priority": 5}, {"priority": 3})
+
+        assert service.flush_buffered(now=utcnow() + timedelta(seconds=61)) == 0
+        assert _outbox(buffer_db) == []
+        assert notification_buffer.pending_count() == 0
+
+    #INT-164/003
+    def test_bulk_edit_sends_one_email_per_recipient(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch, coalesce_window_seconds=60)
+
+        for task_id in range(1, 51):
+            _update(service, task_id, {"status": "To Do"}, {"status": "Done"}, to=(ALICE, BOB))
+
+        assert notification_buffer.pending_count() == 100
+        assert service.flush_buffered(now=utcnow() + timedelta(seconds=61)) == 2
+
+        emails = _outbox(buffer_db)
+        assert sorted(e.to_addrs[0] for e in emails) == [ALICE, BOB]
+        for email in emails:
+            assert email.subject == "[Kira Task Management] Task activity — 50 tasks"
+            assert email.text_body.count("- status: To Do -> Done") == 50
+            assert "Task 50 (#50)" in email.text_body
+            assert "<strong>Task 7</strong> (#7)" in email.html_body
+
+    #INT-164/004
+    def test_mixed_activity_on_one_task_is_summarised(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch, coalesce_window_seconds=60)
+
+        service.notify_activity(
+            user_email="manager@test.com", task_id=4, task_title="Task 4",
+            type_of_alert=NotificationType.TASK_ASSIGN.value, to_recipients=[ALICE],
+        )
+        service.notify_activity(
+            user_email="manager@test.com", task_id=4, task_title="Task 4",
+            type_of_alert=NotificationType.COMMENT_CREATE.value, comment_user="Bob <b>", to_recipients=[ALICE],
+        )
+        service.flush_buffered(now=utcnow() + timedelta(seconds=61))
+
+        (email,) = _outbox(buffer_db)
+        assert email.subject == "[Kira Task Management] Task activity — 1 task"
+        assert "Assigned, commented - by manager@test.com, Bob <b>" in email.text_body
+        assert "by manager@test.com, Bob &lt;b&gt;" in email.html_body
+
+    #INT-164/005
+    def test_later_tasks_join_the_recipients_open_window(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch, coalesce_window_seconds=60)
+        now = utcnow()
+
+        notification_buffer.add([ALICE], task_id=1, task_title="Task 1", type_of_alert="task_update",
+                                actor="a", updated_fields=["tag"], old_values={"tag": "x"}, new_values={"tag": "y"}, now=now)
+        notification_buffer.add([ALICE], task_id=2, task_title="Task 2", type_of_alert="task_update",
+                                actor="a", updated_fields=["tag"], old_values={"tag": "x"}, new_values={"tag": "y"},
+                                now=now + timedelta(seconds=50))
+
+        assert service.flush_buffered(now=now + timedelta(seconds=60)) == 1
+        assert "2 tasks" in _outbox(buffer_db)[0].subject
+
+    #INT-164/006
+    def test_digest_recipients_get_one_daily_email(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch, digest_recipients=[BOB], digest_hour_utc=8)
+
+        response = _update(service, 1, {"priority": 3}, {"priority": 5}, to=(ALICE, BOB))
+        _update(service, 2, {"priority": 1}, {"priority": 2}, to=(BOB,))
+
+        # Alice is not a digest recipient and there is no window: she is emailed at once
+        assert response.recipients_count == 1 and response.message == "Email queued"
+        assert [e.to_addrs for e in _outbox(buffer_db)] == [[ALICE]]
+        due = notification_buffer.next_digest_at(utcnow(), 8)
+        assert service.flush_buffered(now=due - timedelta(seconds=1)) == 0
+        assert service.flush_buffered(now=due) == 1
+
+        digest = _outbox(buffer_db)[-1]
+        assert digest.to_addrs == [BOB]
+        assert digest.subject == "[Kira Task Management] Daily digest — 2 tasks"
+        assert "since your last digest" in digest.text_body
+
+    #INT-164/007
+    def test_no_window_sends_immediately(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch)
+
+        response = _update(service, 1, {"priority": 3}, {"priority": 5})
+
+        assert response.message == "Email queued"
+        assert len(_outbox(buffer_db)) == 1
+        assert notification_buffer.pending_count() == 0
+
+    #INT-164/008
+    def test_buffered_event_follows_the_request_transaction(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch, coalesce_window_seconds=60)
+
+        with pytest.raises(RuntimeError):
+            with request_scope():
+                _update(service, 1, {"priority": 3}, {"priority": 5})
+                raise RuntimeError("request failed")
+
+        assert notification_buffer.pending_count() == 0
+
+    #INT-164/009
+    def test_failed_flush_keeps_the_buffer(self, buffer_db, monkeypatch):
+        service = _service(monkeypatch, coalesce_window_seconds=60)
+        _update(service, 1, {"priority": 3}, {"priority": 5})
+        monkeypatch.setattr(email_outbox, "enqueue", lambda **kwargs: (_ for _ in ()).throw(RuntimeError("db down")))
+
+        with pytest.raises(RuntimeError):
+            service.flush_buffered(now=utcnow() + timedelta(seconds=61))
+
+        assert notification_buffer.pending_count() == 1
+
+
+class TestNotificationBufferHelpers:
+
+    #INT-164/010
+    def test_merge_changes_keeps_first_old_and_last_new(self):
+        fields, old, new = notification_buffer.merge_changes(
+            ["priority"], {"priority": 3}, {"priority": 5},
+            ["priority", "start_date"], {"priority": 5, "start_date": None},
+            {"priority": 7, "start_date": datetime(2025, 1, 2).date()},
+        )
+
+        assert fields == ["priority", "start_date"]
+        assert old == {"priority": 3, "start_date": None}
+        assert new == {"priority": 7, "start_date": "2025-01-02"}
+
+    #INT-164/011
+    def test_next_digest_at(self):
+        assert notification_buffer.next_digest_at(datetime(2025, 3, 1, 7, 59), 8) == datetime(2025, 3, 1, 8)
+        assert notification_buffer.next_digest_at(datetime(2025, 3, 1, 8, 0), 8) == datetime(2025, 3, 2, 8)
@@ -0,0 +1,213 @@
+"""
+Integration tests for the bounded notification worker pool: backpressure under a
+flood of jobs, counters, draining on shutdown and the comment handler using it.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.config.notification_config import NotificationSettings
+from backend.src.database.db_setup import Base, RequestScopedSessionmaker, request_scope
+from backend.src.database.models.email_outbox import EmailOutbox
+from backend.src.handlers import comment_handler
+from backend.src.services import email_outbox, notification_dispatch
+from backend.src.services.notification_dispatch import NotificationDispatcher
+
+
+@pytest.fixture
+def dispatcher():
+    pool = NotificationDispatcher(workers=2, queue_size=3)
+    yield pool
+    pool.shutdown(timeout=5)
+
+
+@pytest.fixture
+def shared_pool(monkeypatch):
+    """The module-level pool, built from test settings and shut down afterwards."""
+    settings = NotificationSettings(workers=2, queue_size=4, drain_timeout_seconds=5)
+    monkeypatch.setattr(notification_dispatch, "get_notification_settings", lambda: settings)
+    notification_dispatch.shutdown()
+    yield
+    notification_dispatch.shutdown()
+
+
+def _notify_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("notify")]
+
+
+class TestNotificationDispatcher:
+
+    #INT-165/001
+    def test_flood_is_bounded_and_runs_overflow_in_the_caller(self, dispatcher):
+        gate = threading.Event()
+        ran = []
+        lock = threading.Lock()
+
+        def job(i):
+            if threading.current_thread().name.startswith("notify"):
+                gate.wait(5)
+            with lock:
+                ran.append(i)
+
+        accepted = [dispatcher.submit(job, i) for i in range(50)]
+
+        stats = dispatcher.stats()
+        # 2 running + 3 queued; the other 45 ran in this thread straight away
+        assert accepted.count(True) == 5
+        assert stats.queue_depth + stats.in_flight == 5
+        assert stats.ran_inline == 45
+        assert len(_notify_threads()) <= 2
+
+        gate.set()
+        assert dispatcher.shutdown(timeout=5) == 0
+        stats = dispatcher.stats()
+        assert sorted(ran) == list(range(50))
+        assert (stats.submitted, stats.completed, stats.failed, stats.dropped) == (50, 50, 0, 0)
+        assert stats.queue_depth == stats.in_flight == 0
+
+    #INT-165/002
+    def test_failing_job_is_counted_not_raised(self, dispatcher, caplog):
+        def boom():
+            raise RuntimeError("smtp down")
+
+        assert dispatcher.submit(boom) is True
+        dispatcher.shutdown(timeout=5)
+
+        assert dispatcher.stats().failed == 1
+        assert "Notification job" in caplog.text
+
+        # Inline runs swallow failures too
+        assert dispatcher.submit(boom) is False
+        assert dispatcher.stats().failed == 2
+
+    #INT-165/003
+    def test_shutdown_drains_queued_jobs(self, dispatcher):
+        done = []
+
+        def slow(i):
+            time.sleep(0.05)
+            done.append(i)
+
+        for i in range(5):
+            assert dispatcher.submit(slow, i) is True
+
+        assert dispatcher.shutdown(timeout=5) == 0
+        assert sorted(done) == list(range(5))
+        assert dispatcher.stats().completed == 5
+
+    #INT-165/004
+    def test_shutdown_timeout_drops_queued_jobs(self, dispatcher):
+        gate = threading.Event()
+        done = []
+
+        def blocked(i):
+            gate.wait(5)
+            done.append(i)
+
+        for i in range(5):
+            dispatcher.submit(blocked, i)
+
+        dropped = dispatcher.shutdown(timeout=0.1)
+        gate.set()
+
+        stats = dispatcher.stats()
+        assert dropped == 3
+        assert stats.dropped == 3
+        assert stats.queue_depth == 0
+
+    #INT-165/005
+    def test_submit_after_shutdown_runs_in_the_caller(self, dispatcher):
+        dispatcher.shutdown(timeout=1)
+        caller = []
+
+        assert dispatcher.submit(lambda: caller.append(threading.current_thread())) is False
+        assert caller == [threading.current_thread()]
+        assert dispatcher.stats().ran_inline == 1
+
+    #INT-165/006
+    def test_rejects_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            NotificationDispatcher(workers=0, queue_size=1)
+        with pytest.raises(ValueError):
+            NotificationDispatcher(workers=1, queue_size=-1)
+
+
+    #INT-165/009
+    def test_job_run_by_a_saturated_caller_does_not_join_its_unit_of_work(self, monkeypatch):
+        db_fd, db_path = tempfile.mkstemp(suffix=".db")
+        os.close(db_fd)
+        engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+        monkeypatch.setattr(email_outbox, "SessionLocal", RequestScopedSessionmaker(Session))
+        pool = NotificationDispatcher(workers=1, queue_size=0)
+        gate = threading.Event()
+        try:
+            pool.submit(gate.wait, 5)
+            with pytest.raises(RuntimeError):
+                with request_scope():
+                    ran_inline = not pool.submit(
+                        email_outbox.enqueue, subject="Comment", to_addrs=["a@test.com"], text_body="hi"
+                    )
+                    raise RuntimeError("request failed")
+
+            # The request rolled back; the notification it ran committed on its own
+            assert ran_inline
+            with Session() as session:
+                assert [row.subject for row in session.query(EmailOutbox)] == ["Comment"]
+        finally:
+            gate.set()
+            pool.shutdown(timeout=5)
+            engine.dispose()
+            os.remove(db_path)
+
+
+class TestSharedNotificationPool:
+
+    #INT-165/007
+    def test_comment_notifications_go_through_the_pool(self, shared_pool, monkeypatch):
+        sent = threading.Event()
+        calls = []
+
+        def send_notify(**kwargs):
+            calls.append((threading.current_thread().name, kwargs))
+            sent.set()
+
+        monkeypatch.setattr(comment_handler.task_service, "get_task_with_subtasks", lambda task_id: type("T", (), {"title": "Task"})())
+        monkeypatch.setattr(comment_handler.user_service, "get_user", lambda user_id: type("U", (), {"email": "a@test.com", "name": "A"})())
+        monkeypatch.setattr(comment_handler.user_service, "get_users_by_identifiers", lambda identifiers: {})
+        monkeypatch.setattr(comment_handler.comment_service, "add_comment", lambda *args: {"task_id": 1})
+        monkeypatch.setattr(comment_handler.comment_service, "_send_notify", send_notify)
+        monkeypatch.setattr(comment_handler.assignment_service, "list_assignees", lambda task_id: [])
+
+        comment_handler.add_comment(task_id=1, user_id=1, comment_text="hi")
+
+        assert sent.wait(5)
+        (thread_name, kwargs), = calls
+        assert thread_name.startswith("notify")
+        assert kwargs == {
+            "task_id": 1, "task_title": "Task", "commenter_email": "a@test.com",
+            "commenter_name": "A", "recipients": None,
+        }
+        assert notification_dispatch.stats().submitted == 1
+
+    #INT-165/008
+    def test_shutdown_resets_the_pool_and_health_reports_it(self, shared_pool):
+        first = notification_dispatch.get_notification_dispatcher()
+        notification_dispatch.submit(lambda: None)
+        notification_dispatch.shutdown()
+
+        assert notification_dispatch.get_notification_dispatcher() is not first
+
+        from backend.src.main import app
+        body = TestClient(app).get("/health/notifications").json()
+        assert body["workers"] == 2 and body["queue_size"] == 4
+        assert body["submitted"] == 0 and body["dropped"] == 0
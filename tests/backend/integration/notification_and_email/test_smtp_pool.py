@@ -0,0 +1,209 @@
+"""
+Integration tests for the pooled aiosmtplib transport against a local aiosmtpd server.
+"""
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from email.mime.text import MIMEText
+from unittest.mock import patch
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from backend.src.config.email_config import EmailSettings
+from backend.src.enums.email import EmailTransport
+from backend.src.services.email import EmailService
+from backend.src.services.smtp_pool import AsyncSMTPTransport, SMTPConnectionPool
+
+USERNAME, PASSWORD = "ci@test.com", "secret"
+
+
+class _Handler:
+    def __init__(self):
+        self.delivered = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("refused"):
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.delivered.append((envelope.mail_from, list(envelope.rcpt_tos)))
+        return "250 Message accepted"
+
+
+class _Authenticator:
+    def __init__(self):
+        self.logins = 0
+
+    def __call__(self, server, session, envelope, mechanism, auth_data):
+        ok = auth_data.login.decode() == USERNAME and auth_data.password.decode() == PASSWORD
+        self.logins += ok
+        return AuthResult(success=ok, handled=False)
+
+
+def _start_server(**server_options):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    handler, authenticator = _Handler(), _Authenticator()
+    controller = Controller(
+        handler, hostname="127.0.0.1", port=port,
+        authenticator=authenticator, auth_required=True, auth_require_tls=False, **server_options,
+    )
+    controller.start()
+    return controller, port, handler, authenticator
+
+
+@pytest.fixture
+def smtp_server():
+    """A local SMTP server requiring AUTH (without TLS); yields (port, handler, authenticator)."""
+    controller, *server = _start_server()
+    try:
+        yield server
+    finally:
+        controller.stop()
+
+
+def _settings(port: int, **overrides) -> EmailSettings:
+    values = dict(
+        fastmail_smtp_host="127.0.0.1", fastmail_smtp_port=port,
+        fastmail_username=USERNAME, fastmail_password=PASSWORD,
+        fastmail_from_email="noreply@test.com", use_tls=False, use_ssl=False, timeout=5,
+        email_transport=EmailTransport.AIOSMTPLIB, smtp_pool_size=3,
+    )
+    values.update(overrides)
+    return EmailSettings(**values)
+
+
+def _batch(n: int, *, refused=()):
+    messages = []
+    for i in range(n):
+        to = "refused@test.com" if i in refused else f"user{i}@test.com"
+        msg = MIMEText(f"Body {i}")
+        msg["Subject"], msg["To"], msg["Message-ID"] = f"Update {i}", to, f"<msg-{i}@test.com>"
+        messages.append((msg, [to]))
+    return messages
+
+
+class TestSMTPConnectionPool:
+
+    #INT-162/001
+    def test_batch_is_spread_over_pooled_connections(self, smtp_server):
+        port, handler, authenticator = smtp_server
+        pool = SMTPConnectionPool(_settings(port))
+
+        async def run():
+            try:
+                return await pool.send_many(_batch(20))
+            finally:
+                await pool.close()
+
+        results = asyncio.run(run())
+
+        assert results == [f"<msg-{i}@test.com>" for i in range(20)]
+        assert len(handler.delivered) == 20
+        assert handler.delivered[0][0] == "noreply@test.com"
+        assert pool.opened == authenticator.logins == 3
+
+    #INT-162/002
+    def test_connection_replaced_after_message_cap(self, smtp_server):
+        port, handler, authenticator = smtp_server
+        pool = SMTPConnectionPool(_settings(port), size=1, max_messages_per_connection=4)
+
+        async def run():
+            try:
+                return await pool.send_many(_batch(10))
+            finally:
+                await pool.close()
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, str) for r in results)
+        assert len(handler.delivered) == 10
+        assert pool.opened == authenticator.logins == 3
+
+    #INT-162/003
+    def test_refused_recipient_fails_only_its_message(self, smtp_server):
+        port, handler, _ = smtp_server
+        pool = SMTPConnectionPool(_settings(port), size=1)
+
+        async def run():
+            try:
+                return await pool.send_many(_batch(5, refused={2}))
+            finally:
+                await pool.close()
+
+        results = asyncio.run(run())
+
+        assert isinstance(results[2], aiosmtplib.SMTPRecipientsRefused)
+        assert [r for i, r in enumerate(results) if i != 2] == [f"<msg-{i}@test.com>" for i in (0, 1, 3, 4)]
+        assert len(handler.delivered) == 4
+        assert pool.opened == 1
+
+    #INT-162/004
+    def test_login_failure_fails_every_message(self, smtp_server):
+        port, handler, _ = smtp_server
+        pool = SMTPConnectionPool(_settings(port, fastmail_password="wrong"), size=2)
+
+        results = asyncio.run(pool.send_many(_batch(3)))
+
+        assert all(isinstance(r, aiosmtplib.SMTPAuthenticationError) for r in results)
+        assert handler.delivered == []
+
+
+class TestAsyncSMTPTransport:
+
+    #INT-162/005
+    def test_email_service_batches_reuse_kept_alive_connections(self, smtp_server):
+        port, handler, authenticator = smtp_server
+        with patch("backend.src.services.email.get_email_settings", return_value=_settings(port)):
+            service = EmailService()
+        try:
+            first = service.send_batch(_batch(6))
+            second = service.send_batch(_batch(6))
+            transport = service._pool_transport
+        finally:
+            service.close()
+
+        assert isinstance(transport, AsyncSMTPTransport)
+        assert first == second == [f"<msg-{i}@test.com>" for i in range(6)]
+        assert len(handler.delivered) == 12
+        assert transport.pool.opened == authenticator.logins == 3
+        assert service._pool_transport is None
+
+    #INT-162/006
+    def test_idle_connections_are_reopened(self, smtp_server):
+        port, handler, authenticator = smtp_server
+        transport = AsyncSMTPTransport(_settings(port), size=1, idle_timeout=0.2)
+        try:
+            transport.send_batch(_batch(2))
+            time.sleep(0.3)
+            transport.send_batch(_batch(2))
+        finally:
+            transport.close()
+            transport.close()
+
+        assert len(handler.delivered) == 4
+        assert transport.pool.opened == authenticator.logins == 2
+
+    #INT-162/007
+    def test_connection_closed_by_server_is_replaced(self):
+        controller, port, handler, authenticator = _start_server(timeout=0.2)
+        transport = AsyncSMTPTransport(_settings(port), size=1, idle_timeout=60)
+        try:
+            transport.send_batch(_batch(2))
+            time.sleep(0.5)  # the server drops the idle session
+            results = transport.send_batch(_batch(2))
+        finally:
+            transport.close()
+            controller.stop()
+
+        assert results == ["<msg-0@test.com>", "<msg-1@test.com>"]
+        assert len(handler.delivered) == 4
+        assert transport.pool.opened == authenticator.logins == 2
@@ -0,0 +1,125 @@
+"""
+Shared fixtures for report integration tests: a temporary database with one project
+whose tasks cover every status.
+"""
+from __future__ import annotations
+
+import pytest
+
+from backend.src.database.models.task import Task
+from backend.src.database.models.project import Project
+from backend.src.database.models.user import User
+from backend.src.database.models.task_assignment import TaskAssignment
+from tests.mock_data.report_data import (
+    MOCK_USER_MANAGER,
+    MOCK_USER_TEAM_MEMBER_1,
+    MOCK_USER_TEAM_MEMBER_2,
+    MOCK_PROJECT,
+    MOCK_PROJECT_ID,
+    MOCK_TASKS_FOR_INTEGRATION,
+    MOCK_TASK_IDS_FOR_INTEGRATION,
+    MOCK_TASK_ASSIGNEES,
+    MOCK_USER_IDS_BY_NAME,
+)
+
+
+@pytest.fixture(autouse=True)
+def report_cache_dir(tmp_path, monkeypatch):
+    """Rendered reports go to a per-test cache directory."""
+    cache_dir = tmp_path / "report-cache"
+    monkeypatch.setenv("REPORT_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(scope="function")
+def test_engine():
+    """Create a temporary database for testing."""
+    import tempfile
+    import os
+    from sqlalchemy import create_engine
+    from backend.src.database.db_setup import Base
+    
+    db_fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(db_fd)
+    
+    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    Base.metadata.create_all(bind=engine)
+    
+    yield engine
+    
+    engine.dispose()
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+
+@pytest.fixture(scope="function")
+def isolated_test_db(test_engine):
+    """Patch services to use the test database for each test."""
+    from sqlalchemy.orm import sessionmaker
+    from unittest.mock import patch
+    
+    TestingSessionLocal = sessionmaker(
+        bind=test_engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        future=True,
+    )
+    
+    from backend.src.services import task as task_service
+    from backend.src.services import project as project_service
+    from backend.src.services import task_assignment as assignment_service
+    
+    with patch("backend.src.services.task.SessionLocal", TestingSessionLocal), \
+         patch("backend.src.services.project.SessionLocal", TestingSessionLocal), \
+         patch("backend.src.services.task_assignment.SessionLocal", TestingSessionLocal), \
+         patch("backend.src.services.report_export.SessionLocal", TestingSessionLocal):
+        yield test_engine
+
+
+@pytest.fixture
+def setup_project_with_tasks(isolated_test_db):
+    """Create a project with multiple tasks in different statuses."""
+    from sqlalchemy.orm import sessionmaker
+    
+    Session = sessionmaker(bind=isolated_test_db, future=True)
+    session = Session()
+    
+    try:
+        user1 = User(user_id=1, **MOCK_USER_MANAGER)
+        user2 = User(user_id=2, **MOCK_USER_TEAM_MEMBER_1)
+        user3 = User(user_id=3, **MOCK_USER_TEAM_MEMBER_2)
+        
+        session.add_all([user1, user2, user3])
+        session.flush()
+        
+        project = Project(**MOCK_PROJECT)
+        session.add(project)
+        session.flush()
+        
+        tasks = []
+        for task_data in MOCK_TASKS_FOR_INTEGRATION:
+            task_dict = {k: v for k, v in task_data.items() if k != "id"}
+            task = Task(**task_dict)
+            session.add(task)
+            session.flush()
+            tasks.append(task)
+    
+        assignments = []
+        
+        for task_idx, mock_task_id in enumerate(MOCK_TASK_IDS_FOR_INTEGRATION):
+            if mock_task_id in MOCK_TASK_ASSIGNEES:
+                for assignee_name in MOCK_TASK_ASSIGNEES[mock_task_id]:
+                    if assignee_name in MOCK_USER_IDS_BY_NAME:
+                        assignments.append(TaskAssignment(
+                            task_id=tasks[task_idx].id,
+                            user_id=MOCK_USER_IDS_BY_NAME[assignee_name]
+                        ))
+        
+        session.add_all(assignments)
+        session.commit()
+        
+        yield {"project_id": MOCK_PROJECT_ID, "project": project, "tasks": tasks, "users": [user1, user2, user3]}
+        
+    finally:
+        session.close()
@@ -0,0 +1,66 @@
+"""
+Integration tests for the project-wide assignee map the report handlers load in one query.
+"""
+from __future__ import annotations
+
+from sqlalchemy import insert
+
+from backend.src.database.models.project import Project
+from backend.src.database.models.task import Task
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.query_stats import track_queries
+from backend.src.handlers import report_handler
+from backend.src.services import task_assignment as assignment_service
+from tests.mock_data.report_data import MOCK_PROJECT_ID, MOCK_USER_IDS_BY_NAME
+
+OTHER_PROJECT_ID = 2
+
+
+def _add_tasks(engine, count: int, *, project_id: int = MOCK_PROJECT_ID, active: bool = True) -> list[int]:
+    with engine.begin() as conn:
+        task_ids = conn.execute(
+            insert(Task).returning(Task.id),
+            [{"title": f"Extra {i}", "status": "To-do", "priority": 5, "project_id": project_id, "active": active}
+             for i in range(count)],
+        ).scalars().all()
+        conn.execute(insert(TaskAssignment), [
+            {"task_id": task_id, "user_id": user_id} for task_id in task_ids for user_id in MOCK_USER_IDS_BY_NAME.values()
+        ])
+    return list(task_ids)
+
+
+# INT-157/001
+def test_map_matches_per_task_assignee_lists(setup_project_with_tasks):
+    names = assignment_service.assignee_names_by_task(MOCK_PROJECT_ID)
+
+    for task in setup_project_with_tasks["tasks"]:
+        expected = [user.name for user in assignment_service.list_assignees(task.id)]
+        assert names.get(task.id, []) == expected
+
+
+# INT-157/002
+def test_report_data_loads_in_a_fixed_number_of_queries(setup_project_with_tasks, isolated_test_db):
+    with track_queries() as small:
+        _, tasks, _ = report_handler._load_report_data(MOCK_PROJECT_ID)
+        list(tasks)
+    extra = _add_tasks(isolated_test_db, 50)
+    with track_queries() as large:
+        _, tasks, task_assignees = report_handler._load_report_data(MOCK_PROJECT_ID)
+        tasks = list(tasks)
+
+    assert large.count == small.count
+    assert set(extra) <= set(task_assignees)
+    assert set(extra) <= {task.id for task in tasks}
+
+
+# INT-157/003
+def test_map_skips_other_projects_and_inactive_tasks(setup_project_with_tasks, isolated_test_db):
+    with isolated_test_db.begin() as conn:
+        conn.execute(insert(Project).values(project_id=OTHER_PROJECT_ID, project_name="Other", project_manager=1, active=True))
+    other = _add_tasks(isolated_test_db, 2, project_id=OTHER_PROJECT_ID)
+    inactive = _add_tasks(isolated_test_db, 2, active=False)
+
+    names = assignment_service.assignee_names_by_task(MOCK_PROJECT_ID)
+    assert not set(names) & set(other + inactive)
+    assert set(assignment_service.assignee_names_by_task(MOCK_PROJECT_ID, active_only=False)) >= set(inactive)
+    assert assignment_service.assignee_names_by_task(999) == {}
@@ -6,12 +6,9 @@ from __future__ import annotations
 
 import pytest
 from datetime import date, datetime
+import tempfile
 from io import BytesIO
 
-from backend.src.database.models.task import Task
-from backend.src.database.models.project import Project
-from backend.src.database.models.user import User
-from backend.src.database.models.task_assignment import TaskAssignment
 from backend.src.enums.task_status import TaskStatus
 from backend.src.enums.user_role import UserRole
 from backend.src.handlers.report_handler import generate_pdf_report, generate_excel_report
@@ -36,99 +33,6 @@ from tests.mock_data.report_data import (
 )
 
 
-@pytest.fixture(scope="function")
-def test_engine():
-    """Create a temporary database for testing."""
-    import tempfile
-    import os
-    from sqlalchemy import create_engine
-    from backend.src.database.db_setup import Base
-    
-    db_fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(db_fd)
-    
-    engine = create_engine(f"sqlite:///{db_path}", echo=False)
-    Base.metadata.create_all(bind=engine)
-    
-    yield engine
-    
-    engine.dispose()
-    if os.path.exists(db_path):
-        os.remove(db_path)
-
-
-@pytest.fixture(scope="function")
-def isolated_test_db(test_engine):
-    """Patch services to use the test database for each test."""
-    from sqlalchemy.orm import sessionmaker
-    from unittest.mock import patch
-    
-    TestingSessionLocal = sessionmaker(
-        bind=test_engine,
-        autoflush=False,
-        autocommit=False,
-        expire_on_commit=False,
-        future=True,
-    )
-    
-    from backend.src.services import task as task_service
-    from backend.src.services import project as project_service
-    from backend.src.services import task_assignment as assignment_service
-    
-    with patch("backend.src.services.task.SessionLocal", TestingSessionLocal), \
-         patch("backend.src.services.project.SessionLocal", TestingSessionLocal), \
-         patch("backend.src.services.task_assignment.SessionLocal", TestingSessionLocal):
-        yield test_engine
-
-
-@pytest.fixture
-def setup_project_with_tasks(isolated_test_db):
-    """Create a project with multiple tasks in different statuses."""
-    from sqlalchemy.orm import sessionmaker
-    
-    Session = sessionmaker(bind=isolated_test_db, future=True)
-    session = Session()
-    
-    try:
-        user1 = User(user_id=1, **MOCK_USER_MANAGER)
-        user2 = User(user_id=2, **MOCK_USER_TEAM_MEMBER_1)
-        user3 = User(user_id=3, **MOCK_USER_TEAM_MEMBER_2)
-        
-        session.add_all([user1, user2, user3])
-        session.flush()
-        
-        project = Project(**MOCK_PROJECT)
-        session.add(project)
-        session.flush()
-        
-        tasks = []
-        for task_data in MOCK_TASKS_FOR_INTEGRATION:
-            task_dict = {k: v for k, v in task_data.items() if k != "id"}
-            task = Task(**task_dict)
-            session.add(task)
-            session.flush()
-            tasks.append(task)
-    
-        assignments = []
-        
-        for task_idx, mock_task_id in enumerate(MOCK_TASK_IDS_FOR_INTEGRATION):
-            if mock_task_id in MOCK_TASK_ASSIGNEES:
-                for assignee_name in MOCK_TASK_ASSIGNEES[mock_task_id]:
-                    if assignee_name in MOCK_USER_IDS_BY_NAME:
-                        assignments.append(TaskAssignment(
-                            task_id=tasks[task_idx].id,
-                            user_id=MOCK_USER_IDS_BY_NAME[assignee_name]
-                        ))
-        
-        session.add_all(assignments)
-        session.commit()
-        
-        yield {"project_id": MOCK_PROJECT_ID, "project": project, "tasks": tasks, "users": [user1, user2, user3]}
-        
-    finally:
-        session.close()
-
-
 class TestReportExport:
     """Test report export functionality."""
     #INT-123/001
@@ -154,7 +58,7 @@ class TestReportExport:
         excel_buffer = generate_excel_report(project_id)
         
         assert excel_buffer is not None
-        assert isinstance(excel_buffer, BytesIO)
+        assert isinstance(excel_buffer, tempfile.SpooledTemporaryFile)
         
         excel_buffer.seek(0)
         content = excel_buffer.read()
@@ -232,7 +136,7 @@ class TestReportExport:
         """Test Excel generation when report service raises a non-ValueError exception."""
         project_id = setup_project_with_tasks["project_id"]
         
-        def mock_generate_excel(project, tasks, task_assignees):
+        def mock_generate_excel(project, tasks, task_assignees, out=None):
             raise RuntimeError("Excel generation failed")
         
         from backend.src.services import report as report_service
@@ -411,3 +315,31 @@ class TestReportAPI:
         assert len(response.content) > 0
         assert response.content.startswith(b'PK')
 
+
+    #INT-123/015
+    def test_generate_excel_report_streams_plain_rows(self, setup_project_with_tasks, monkeypatch):
+        """The Excel report reads its tasks as plain rows, a batch at a time, never as Task objects."""
+        from openpyxl import load_workbook
+        from sqlalchemy import event
+        from backend.src.database.models.task import Task
+        from backend.src.services import task as task_service
+
+        stream = task_service.iter_task_rows_by_project
+        monkeypatch.setattr(
+            task_service, "iter_task_rows_by_project", lambda *args, **kwargs: stream(*args, **kwargs, batch_size=2)
+        )
+        loaded = []
+
+        def on_load(target, context):
+            loaded.append(target)
+
+        event.listen(Task, "load", on_load)
+        try:
+            excel_buffer = generate_excel_report(setup_project_with_tasks["project_id"])
+        finally:
+            event.remove(Task, "load", on_load)
+
+        assert loaded == []
+        ws = load_workbook(excel_buffer)[EXPECTED_REPORT_SHEET_NAME]
+        assert ws["A6"].value == EXPECTED_REPORT_METRIC_TOTAL_TASKS
+        assert ws["B6"].value == len(setup_project_with_tasks["tasks"])
@@ -0,0 +1,164 @@
+"""
+Integration tests for background report jobs: submit, poll, download, result cache.
+"""
+from __future__ import annotations
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.src.database.models.project import new_report_version
+from backend.src.handlers import report_handler
+from backend.src.main import app
+from backend.src.services import report_jobs
+from backend.src.services import task as task_service
+from tests.mock_data.report_data import EXPECTED_ERROR_PROJECT_NOT_FOUND, MOCK_PROJECT_ID, NOT_FOUND_PROJECT_ID
+
+JOB_TIMEOUT = 60
+
+
+@pytest.fixture
+def client(setup_project_with_tasks, monkeypatch):
+    monkeypatch.setenv("REPORT_WORKERS", "1")
+    # the TestClient context runs the app's shutdown hook, which stops the worker pool
+    with TestClient(app) as c:
+        yield c
+
+
+def _submit(client, report_format: str, project_id: int = MOCK_PROJECT_ID):
+    return client.post(app.url_path_for("create_report_job"), json={"project_id": project_id, "format": report_format})
+
+
+def _submit_and_wait(client, report_format: str) -> dict:
+    resp = _submit(client, report_format)
+    assert resp.status_code == 202, resp.text
+    report_jobs.wait(resp.json()["job_id"], timeout=JOB_TIMEOUT)
+    return client.get(app.url_path_for("get_report_job", job_id=resp.json()["job_id"])).json()
+
+
+# INT-155/001
+@pytest.mark.parametrize("report_format, magic, extension", [("pdf", b"%PDF", "pdf"), ("excel", b"PK", "xlsx")])
+def test_job_renders_in_background_and_downloads(client, report_format, magic, extension):
+    job = _submit_and_wait(client, report_format)
+    assert job["status"] == "done", job
+    assert job["cached"] is False and job["finished_at"] is not None
+
+    resp = client.get(app.url_path_for("download_report_job", job_id=job["job_id"]))
+    assert resp.status_code == 200
+    assert resp.content.startswith(magic)
+    assert f"project_{MOCK_PROJECT_ID}_schedule_report.{extension}" in resp.headers["content-disposition"]
+
+
+# INT-155/002
+def test_repeat_request_is_served_from_cache(client):
+    first = _submit_and_wait(client, "pdf")
+    repeat = _submit(client, "pdf").json()
+
+    assert repeat["status"] == "done" and repeat["cached"] is True
+    assert repeat["data_version"] == first["data_version"]
+    assert repeat["job_id"] != first["job_id"]
+    download = client.get(app.url_path_for("download_report_job", job_id=repeat["job_id"]))
+    assert download.content.startswith(b"%PDF")
+
+
+# INT-155/003
+def test_changed_data_renders_a_new_version(client, setup_project_with_tasks):
+    first = _submit_and_wait(client, "excel")
+    task_service.update_task(setup_project_with_tasks["tasks"][0].id, title="Renamed for the report")
+
+    second = _submit_and_wait(client, "excel")
+    assert second["status"] == "done" and second["cached"] is False
+    assert second["data_version"] != first["data_version"]
+
+
+# INT-155/004
+def test_unknown_project_job_and_format(client):
+    resp = _submit(client, "pdf", project_id=NOT_FOUND_PROJECT_ID)
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == EXPECTED_ERROR_PROJECT_NOT_FOUND.format(project_id=NOT_FOUND_PROJECT_ID)
+
+    assert _submit(client, "docx").status_code == 422
+    assert client.get(app.url_path_for("get_report_job", job_id="nope")).status_code == 404
+    assert client.get(app.url_path_for("download_report_job", job_id="nope")).status_code == 404
+
+
+# INT-155/005
+def test_download_before_done_is_a_conflict(client, tmp_path):
+    job = report_jobs.ReportJob("pending-job", MOCK_PROJECT_ID, report_jobs.ReportFormat.PDF, "v", tmp_path / "x.pdf")
+    with report_jobs._lock:
+        report_jobs._jobs[job.job_id] = job
+    try:
+        resp = client.get(app.url_path_for("download_report_job", job_id=job.job_id))
+        assert resp.status_code == 409
+        assert client.get(app.url_path_for("get_report_job", job_id=job.job_id)).json()["status"] == "pending"
+    finally:
+        with report_jobs._lock:
+            report_jobs._jobs.pop(job.job_id, None)
+
+
+# INT-155/006
+def test_new_version_replaces_the_projects_older_files(client, setup_project_with_tasks, report_cache_dir):
+    pdf = _submit_and_wait(client, "pdf")
+    first = _submit_and_wait(client, "excel")
+    task_service.update_task(setup_project_with_tasks["tasks"][0].id, title="Renamed for the report")
+    second = _submit_and_wait(client, "excel")
+
+    project_dir = report_cache_dir / f"project_{MOCK_PROJECT_ID}"
+    assert [p.name for p in project_dir.glob("*.xlsx")] == [f"{second['data_version']}.xlsx"]
+    # other formats are pruned only when they are rendered again
+    assert [p.name for p in project_dir.glob("*.pdf")] == [f"{pdf['data_version']}.pdf"]
+    assert client.get(app.url_path_for("download_report_job", job_id=first["job_id"])).status_code == 410
+    assert client.get(app.url_path_for("download_report_job", job_id=second["job_id"])).status_code == 200
+
+
+# INT-155/007
+def test_portfolio_cache_keeps_the_newest_files(report_cache_dir, monkeypatch):
+    monkeypatch.setenv("REPORT_PORTFOLIO_CACHE_FILES", "2")
+    pdf, xlsx = report_jobs.ReportFormat.PDF, report_jobs.ReportFormat.EXCEL
+    report_jobs.write_cache_file(report_jobs.portfolio_cache_path(xlsx, "x"), lambda out: out.write(b"PK"))
+    for i, version in enumerate(["a", "b", "c"]):
+        path = report_jobs.write_cache_file(report_jobs.portfolio_cache_path(pdf, version), lambda out: out.write(b"%PDF"))
+        os.utime(path, (1000 + i, 1000 + i))
+
+    portfolio_dir = report_cache_dir / "portfolio"
+    assert sorted(p.name for p in portfolio_dir.glob("*.pdf")) == ["b.pdf", "c.pdf"]
+    assert [p.name for p in portfolio_dir.glob("*.xlsx")] == ["x.xlsx"]
+
+
+# INT-155/008
+def test_older_version_written_last_keeps_the_newer_file(setup_project_with_tasks, report_cache_dir):
+    """A slow render of an older version must not prune the newer version's file."""
+    older, newer = sorted(new_report_version() for _ in range(2))
+    pdf = report_jobs.ReportFormat.PDF
+    report_jobs.write_cache_file(report_jobs.cache_path(MOCK_PROJECT_ID, pdf, newer), lambda out: out.write(b"%PDF new"))
+    report_jobs.write_cache_file(report_jobs.cache_path(MOCK_PROJECT_ID, pdf, older), lambda out: out.write(b"%PDF old"))
+
+    project_dir = report_cache_dir / f"project_{MOCK_PROJECT_ID}"
+    assert sorted(p.stem for p in project_dir.glob("*.pdf")) == [older, newer]
+
+    report_jobs.write_cache_file(report_jobs.cache_path(MOCK_PROJECT_ID, pdf, new_report_version()), lambda out: out.write(b"%PDF"))
+    assert len(list(project_dir.glob("*.pdf"))) == 1
+
+
+# INT-155/009
+def test_report_pruned_before_it_is_opened_is_rendered_again(client, monkeypatch):
+    """If a newer render prunes the returned file before the response opens it, the version is rendered again."""
+    export = report_handler.export_report
+    calls = []
+
+    def export_then_prune(*args):
+        path = export(*args)
+        calls.append(path)
+        if len(calls) == 1:
+            path.unlink()
+        return path
+
+    monkeypatch.setattr(report_handler, "export_report", export_then_prune)
+    resp = client.get(f"/kira/app/api/v1/report/project/{MOCK_PROJECT_ID}/pdf")
+
+    assert resp.status_code == 200
+    assert resp.content.startswith(b"%PDF")
+    assert int(resp.headers["content-length"]) == len(resp.content)
+    assert len(calls) == 2
+
@@ -0,0 +1,139 @@
+"""
+Integration tests for portfolio (multi-project) report export.
+"""
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from fastapi.testclient import TestClient
+from openpyxl import load_workbook
+from pypdf import PdfReader
+from sqlalchemy import insert, update
+
+from backend.src.database.models.department import Department
+from backend.src.database.models.project import Project
+from backend.src.database.models.task import Task
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.models.user import User
+from backend.src.database.query_stats import track_queries
+from backend.src.handlers import report_handler
+from backend.src.main import app
+from backend.src.services import task as task_service
+from tests.mock_data.report_data import MOCK_PROJECT, MOCK_PROJECT_ID, MOCK_USER_IDS_BY_NAME
+
+PORTFOLIO_PATH = "/kira/app/api/v1/report/portfolio"
+MANAGER_ID = MOCK_USER_IDS_BY_NAME["Project Manager"]
+OTHER_MANAGER_ID = MOCK_USER_IDS_BY_NAME["Team Member 1"]
+DEPARTMENT_ID = 1
+
+
+def _add_project(engine, project_id: int, manager_id: int, task_count: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(insert(Project).values(
+            project_id=project_id, project_name=f"Portfolio {project_id}", project_manager=manager_id, active=True
+        ))
+        task_ids = conn.execute(insert(Task).returning(Task.id), [
+            {"title": f"P{project_id} task {i}", "status": "In-progress", "priority": 5,
+             "project_id": project_id, "active": True}
+            for i in range(task_count)
+        ]).scalars().all()
+        conn.execute(insert(TaskAssignment), [{"task_id": task_id, "user_id": manager_id} for task_id in task_ids])
+
+
+@pytest.fixture
+def portfolio(setup_project_with_tasks, isolated_test_db):
+    """Project 1 (mock data) and 2 managed by the manager, project 3 by someone else; the manager is in department 1."""
+    _add_project(isolated_test_db, 2, MANAGER_ID, 3)
+    _add_project(isolated_test_db, 3, OTHER_MANAGER_ID, 2)
+    with isolated_test_db.begin() as conn:
+        conn.execute(insert(Department).values(department_id=DEPARTMENT_ID, department_name="Ops", manager_id=MANAGER_ID))
+        conn.execute(update(User).where(User.user_id == MANAGER_ID).values(department_id=DEPARTMENT_ID))
+    return isolated_test_db
+
+
+@pytest.fixture
+def client(portfolio, monkeypatch):
+    monkeypatch.setenv("REPORT_WORKERS", "2")
+    with TestClient(app) as c:
+        yield c
+
+
+def _get(client, report_format: str, headers=None, **params):
+    return client.get(f"{PORTFOLIO_PATH}/{report_format}", params=params, headers=headers or {})
+
+
+# INT-158/001
+def test_pdf_portfolio_merges_one_section_per_project(client):
+    resp = _get(client, "pdf", project_ids=[3, MOCK_PROJECT_ID, 2])
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"] == "application/pdf"
+    assert "portfolio_schedule_report.pdf" in resp.headers["content-disposition"]
+
+    reader = PdfReader(BytesIO(resp.content))
+    assert [item.title for item in reader.outline] == [MOCK_PROJECT["project_name"], "Portfolio 2", "Portfolio 3"]
+    assert len(reader.pages) >= 3
+
+
+# INT-158/002
+def test_excel_portfolio_has_overview_and_a_sheet_per_project(client):
+    resp = _get(client, "excel", project_ids=[MOCK_PROJECT_ID, 2, 3])
+    assert resp.status_code == 200, resp.text
+
+    wb = load_workbook(BytesIO(resp.content))
+    assert wb.sheetnames == ["Portfolio", MOCK_PROJECT["project_name"], "Portfolio 2", "Portfolio 3"]
+    overview = [[c.value for c in row][:3] for row in wb["Portfolio"].iter_rows(min_row=4)]
+    single = task_service.list_tasks_by_project(MOCK_PROJECT_ID)
+    assert overview == [[MOCK_PROJECT_ID, MOCK_PROJECT["project_name"], len(single)], [2, "Portfolio 2", 3], [3, "Portfolio 3", 2]]
+
+
+# INT-158/003
+@pytest.mark.parametrize("params, expected", [
+    ({"manager_id": MANAGER_ID}, [MOCK_PROJECT_ID, 2]),
+    ({"department_id": DEPARTMENT_ID}, [MOCK_PROJECT_ID, 2]),
+    ({"project_ids": [2, 2, 3]}, [2, 3]),
+])
+def test_portfolio_selectors(portfolio, params, expected):
+    assert report_handler.resolve_portfolio(**params) == expected
+
+
+# INT-158/004
+@pytest.mark.parametrize("params, status", [
+    ({}, 400),
+    ({"project_ids": [MOCK_PROJECT_ID], "manager_id": MANAGER_ID}, 400),
+    ({"project_ids": [MOCK_PROJECT_ID, 999]}, 404),
+    ({"manager_id": 999}, 404),
+    ({"department_id": 999}, 404),
+    ({"project_ids": list(range(1, report_handler.PORTFOLIO_MAX_PROJECTS + 2))}, 400),
+])
+def test_portfolio_rejects_bad_selections(client, params, status):
+    assert _get(client, "excel", **params).status_code == status
+
+
+# INT-158/005
+def test_portfolio_data_loads_in_a_fixed_number_of_queries(portfolio):
+    with track_queries() as one:
+        report_handler._load_portfolio_data([MOCK_PROJECT_ID])
+    with track_queries() as three:
+        projects, tasks_by_project, task_assignees = report_handler._load_portfolio_data([MOCK_PROJECT_ID, 2, 3])
+
+    assert three.count == one.count == 3
+    assert [p["project_id"] for p in projects] == [MOCK_PROJECT_ID, 2, 3]
+    assert all(task.project_id == pid for pid, tasks in tasks_by_project.items() for task in tasks)
+    assert all(task_assignees[task.id] == ["Project Manager"] for task in tasks_by_project[2])
+
+
+# INT-158/006
+def test_portfolio_etag_and_cache(client, portfolio, report_cache_dir, monkeypatch):
+    first = _get(client, "pdf", project_ids=[MOCK_PROJECT_ID, 2])
+    etag = first.headers["etag"]
+    assert _get(client, "pdf", headers={"If-None-Match": etag}, project_ids=[2, MOCK_PROJECT_ID]).status_code == 304
+
+    with monkeypatch.context() as m:
+        m.setattr(report_handler, "_load_portfolio_data", lambda ids: pytest.fail("re-rendered"))
+        assert _get(client, "pdf", project_ids=[MOCK_PROJECT_ID, 2]).content == first.content
+
+    task_service.update_task(task_service.list_tasks_by_project(2)[0].id, title="Changed")
+    changed = _get(client, "pdf", headers={"If-None-Match": etag}, project_ids=[MOCK_PROJECT_ID, 2])
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert len(list(report_cache_dir.glob("portfolio/*.pdf"))) == 2
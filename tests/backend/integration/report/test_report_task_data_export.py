@@ -0,0 +1,203 @@
+"""
+Integration tests for the raw task data exports (CSV, Parquet, Arrow IPC).
+"""
+from __future__ import annotations
+
+import csv
+import io
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.database.models.task import Task
+from backend.src.database.query_stats import track_queries
+from backend.src.enums.report import ExportFormat
+from backend.src.handlers import report_handler
+from backend.src.main import app
+from backend.src.services import report_export as report_export_service
+from backend.src.services import task as task_service
+from backend.src.services import task_assignment as assignment_service
+from backend.src.services import user as user_service
+from tests.mock_data.report_data import MOCK_PROJECT_ID, MOCK_USER_IDS_BY_NAME
+
+EXPORT_PATH = f"/kira/app/api/v1/report/project/{MOCK_PROJECT_ID}"
+
+
+@pytest.fixture(autouse=True)
+def no_watermark_lag(monkeypatch):
+    """Exact incremental results: no overlap between consecutive exports unless a test asks for it."""
+    monkeypatch.setenv("REPORT_EXPORT_WATERMARK_LAG_SECONDS", "0")
+
+
+@pytest.fixture
+def client(setup_project_with_tasks):
+    with TestClient(app) as c:
+        yield c
+
+
+def _csv_rows(resp) -> list[dict]:
+    return list(csv.DictReader(io.StringIO(resp.content.decode("utf-8"))))
+
+
+# INT-159/001
+def test_csv_export_matches_report_dataset(client):
+    resp = client.get(f"{EXPORT_PATH}/csv")
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert f"project_{MOCK_PROJECT_ID}_tasks.csv" in resp.headers["content-disposition"]
+    datetime.fromisoformat(resp.headers["x-export-watermark"])
+
+    _, tasks, task_assignees = report_handler._load_report_data(MOCK_PROJECT_ID)
+    tasks = list(tasks)
+    rows = _csv_rows(resp)
+    assert list(rows[0]) == report_export_service.EXPORT_COLUMNS
+    assert [int(row["task_id"]) for row in rows] == sorted(task.id for task in tasks)
+    by_id = {task.id: task for task in tasks}
+    for row in rows:
+        task = by_id[int(row["task_id"])]
+        assert (row["title"], row["status"], row["active"]) == (task.title, task.status, "True")
+        assert row["assignees"] == "; ".join(task_assignees.get(task.id, []))
+
+
+# INT-159/002
+@pytest.mark.parametrize("export_format", ["parquet", "arrow"])
+def test_columnar_exports_carry_the_csv_rows(client, export_format):
+    csv_rows = _csv_rows(client.get(f"{EXPORT_PATH}/csv"))
+    resp = client.get(f"{EXPORT_PATH}/{export_format}")
+    assert resp.status_code == 200, resp.text
+
+    if export_format == "parquet":
+        table = pq.read_table(io.BytesIO(resp.content))
+    else:
+        table = pa.ipc.open_stream(resp.content).read_all()
+    assert table.schema.equals(report_export_service.arrow_schema())
+    assert table.column("task_id").to_pylist() == [int(row["task_id"]) for row in csv_rows]
+    assert ["; ".join(names) for names in table.column("assignees").to_pylist()] == [row["assignees"] for row in csv_rows]
+
+
+# INT-159/003
+def test_changed_since_returns_only_changed_tasks(client):
+    first = client.get(f"{EXPORT_PATH}/csv")
+    watermark = first.headers["x-export-watermark"]
+    edited, reassigned, deleted = [int(row["task_id"]) for row in _csv_rows(first)[:3]]
+
+    unchanged = client.get(f"{EXPORT_PATH}/csv", params={"changed_since": watermark})
+    assert _csv_rows(unchanged) == []
+
+    task_service.update_task(edited, title="Edited")
+    assignment_service.clear_task_assignees(reassigned)
+    task_service.delete_task(deleted)
+
+    rows = {int(row["task_id"]): row for row in _csv_rows(
+        client.get(f"{EXPORT_PATH}/csv", params={"changed_since": watermark})
+    )}
+    assert set(rows) == {edited, reassigned, deleted}
+    assert rows[edited]["title"] == "Edited"
+    assert rows[reassigned]["assignees"] == ""
+    assert rows[deleted]["active"] == "False"
+
+
+# INT-159/004
+def test_renaming_an_assignee_marks_their_tasks_changed(setup_project_with_tasks, monkeypatch):
+    watermark, _ = report_handler.export_tasks(MOCK_PROJECT_ID, ExportFormat.CSV)
+    user_id = MOCK_USER_IDS_BY_NAME["Team Member 2"]
+    expected = {
+        task_id for task_id, names in assignment_service.assignee_names_by_task(MOCK_PROJECT_ID).items()
+        if "Team Member 2" in names
+    }
+    assert expected
+    monkeypatch.setattr(user_service, "SessionLocal", task_service.SessionLocal)
+    user_service.update_user(user_id, name="Renamed Member")
+
+    changed = [
+        row for batch in report_export_service.iter_task_batches(MOCK_PROJECT_ID, changed_since=watermark.replace(tzinfo=None))
+        for row in batch
+    ]
+    assert {row["task_id"] for row in changed} == expected
+    assert all("Renamed Member" in row["assignees"] for row in changed)
+
+
+# INT-159/005
+@pytest.mark.parametrize("export_format", ["csv", "parquet", "arrow"])
+def test_unknown_project_is_404(client, export_format):
+    assert client.get(f"/kira/app/api/v1/report/project/999/{export_format}").status_code == 404
+
+
+# INT-159/006
+def test_batches_cost_two_queries_each(setup_project_with_tasks, isolated_test_db):
+    with isolated_test_db.begin() as conn:
+        conn.execute(insert(Task), [
+            {"title": f"Bulk {i}", "status": "To-do", "priority": 5, "project_id": MOCK_PROJECT_ID, "active": True}
+            for i in range(45)
+        ])
+
+    with track_queries() as stats:
+        batches = list(report_export_service.iter_task_batches(MOCK_PROJECT_ID, batch_size=10))
+    total = sum(len(batch) for batch in batches)
+    assert total == len(task_service.list_tasks_by_project(MOCK_PROJECT_ID))
+    assert all(len(batch) == 10 for batch in batches[:-1])
+    # A short last batch ends the export without another query
+    assert stats.count == 2 * len(batches) + (total % 10 == 0)
+
+
+# INT-159/007
+def test_tasks_from_before_the_column_get_stamped(isolated_test_db):
+    from backend.src.init_scripts.add_task_updated_at import add_updated_at_column, backfill_updated_at
+
+    with isolated_test_db.begin() as conn:
+        conn.execute(text("DROP INDEX ix_task_project_updated_at"))
+        conn.execute(text("ALTER TABLE task DROP COLUMN updated_at"))
+        conn.execute(text("INSERT INTO task (title, status, priority, active, recurring) VALUES ('Legacy', 'To-do', 5, 1, 0)"))
+
+    assert add_updated_at_column(isolated_test_db) is True
+    assert add_updated_at_column(isolated_test_db) is False
+    assert backfill_updated_at(isolated_test_db) == 1
+    assert backfill_updated_at(isolated_test_db) == 0
+
+
+# INT-159/008
+def test_attaching_and_detaching_subtasks_shows_in_incremental_exports(client):
+    first = client.get(f"{EXPORT_PATH}/csv")
+    parent, child = [int(row["task_id"]) for row in _csv_rows(first)[:2]]
+
+    task_service.attach_subtasks(parent, [child])
+    attached = client.get(f"{EXPORT_PATH}/csv", params={"changed_since": first.headers["x-export-watermark"]})
+    rows = {int(row["task_id"]): row for row in _csv_rows(attached)}
+    # the new subtask leaves the top level: it comes through as removed
+    assert set(rows) == {parent, child}
+    assert (rows[parent]["active"], rows[child]["active"]) == ("True", "False")
+    assert child not in {int(row["task_id"]) for row in _csv_rows(client.get(f"{EXPORT_PATH}/csv"))}
+
+    task_service.detach_subtask(parent, child)
+    detached = client.get(f"{EXPORT_PATH}/csv", params={"changed_since": attached.headers["x-export-watermark"]})
+    rows = {int(row["task_id"]): row for row in _csv_rows(detached)}
+    assert set(rows) == {parent, child}
+    assert rows[child]["active"] == "True"
+
+
+# INT-159/009
+def test_change_committed_after_an_export_started_is_not_missed(setup_project_with_tasks, isolated_test_db, monkeypatch):
+    """updated_at is stamped at flush; a write that commits after the export read its rows shows up next time."""
+    monkeypatch.setenv("REPORT_EXPORT_WATERMARK_LAG_SECONDS", "5")
+    task_id = setup_project_with_tasks["tasks"][0].id
+    Session = sessionmaker(bind=isolated_test_db, future=True)
+
+    with Session() as slow_writer:
+        slow_writer.get(Task, task_id).title = "Committed late"
+        slow_writer.flush()
+        watermark, chunks = report_handler.export_tasks(MOCK_PROJECT_ID, ExportFormat.CSV)
+        first = list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+        slow_writer.commit()
+
+    assert "Committed late" not in {row["title"] for row in first}
+    changed = {
+        row["task_id"]: row for batch in report_export_service.iter_task_batches(
+            MOCK_PROJECT_ID, changed_since=watermark.replace(tzinfo=None)
+        ) for row in batch
+    }
+    assert changed[task_id]["title"] == "Committed late"
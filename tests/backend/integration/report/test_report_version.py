@@ -0,0 +1,190 @@
+"""
+Integration tests for the project report version: ETag / 304 on the report routes,
+reuse of rendered files, and which writes give a project a new version.
+"""
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect, text, update
+from sqlalchemy.orm import sessionmaker
+from unittest.mock import patch
+
+from backend.src.database.models.project import Project
+from backend.src.database.models.task import Task
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.models.user import User
+from backend.src.handlers import report_handler
+from backend.src.main import app
+from backend.src.services import project as project_service
+from backend.src.services import report_jobs
+from backend.src.services import task_assignment as assignment_service
+from tests.query_budget import db_queries
+from tests.mock_data.report_data import MOCK_PROJECT_ID, MOCK_USER_IDS_BY_NAME
+
+OTHER_PROJECT_ID = 2
+
+
+@pytest.fixture
+def client(setup_project_with_tasks):
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def orm_session(isolated_test_db):
+    Session = sessionmaker(bind=isolated_test_db, future=True)
+    with Session() as session:
+        session.add(Project(project_id=OTHER_PROJECT_ID, project_name="Other", project_manager=1, active=True))
+        session.commit()
+        yield session
+
+
+def _version(project_id: int = MOCK_PROJECT_ID) -> str:
+    return project_service.get_report_version(project_id)
+
+
+def _export(client, report_format: str, etag: str | None = None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(f"/kira/app/api/v1/report/project/{MOCK_PROJECT_ID}/{report_format}", headers=headers)
+
+
+# INT-156/001
+@pytest.mark.parametrize("report_format", ["pdf", "excel"])
+def test_matching_etag_gets_304_from_one_lookup(client, report_format):
+    first = _export(client, report_format)
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and _version() in etag
+
+    with patch.object(report_handler, "export_report") as export:
+        resp = _export(client, report_format, f'"stale", W/{etag}')
+
+    assert resp.status_code == 304
+    assert resp.content == b"" and resp.headers["etag"] == etag
+    assert db_queries(resp) == 1
+    export.assert_not_called()
+    assert _export(client, report_format, '"stale"').status_code == 200
+
+
+# INT-156/002
+def test_unchanged_project_reuses_the_rendered_file(client, report_cache_dir, monkeypatch):
+    first = _export(client, "pdf")
+    monkeypatch.setattr(report_handler, "generate_pdf_report", lambda project_id: pytest.fail("re-rendered"))
+
+    again = _export(client, "pdf")
+    assert again.status_code == 200
+    assert again.content == first.content and again.headers["etag"] == first.headers["etag"]
+    assert len(list(report_cache_dir.glob("project_1/*.pdf"))) == 1
+
+
+# INT-156/003
+def test_report_relevant_writes_give_a_new_version(client, orm_session, setup_project_with_tasks):
+    task_id = setup_project_with_tasks["tasks"][0].id
+    member_id = MOCK_USER_IDS_BY_NAME["Team Member 1"]
+    writes = [
+        lambda s: setattr(s.get(Task, task_id), "title", "Retitled"),
+        lambda s: setattr(s.get(Project, MOCK_PROJECT_ID), "project_name", "Renamed"),
+        lambda s: s.add(TaskAssignment(task_id=task_id, user_id=MOCK_USER_IDS_BY_NAME["Project Manager"])),
+        lambda s: setattr(s.get(User, member_id), "name", "Member Renamed"),
+        lambda s: setattr(s.get(Task, task_id), "project_id", OTHER_PROJECT_ID),
+        lambda s: s.delete(s.get(User, member_id)),
+    ]
+    for write in writes:
+        before, other_before = _version(), _version(OTHER_PROJECT_ID)
+        write(orm_session)
+        orm_session.commit()
+        assert _version() != before
+
+    # moving a task out changes both projects' reports
+    assert _version(OTHER_PROJECT_ID) != other_before
+
+
+# INT-156/004
+def test_unrelated_writes_and_reads_keep_the_version(client, orm_session, setup_project_with_tasks):
+    before = _version()
+    orm_session.get(Project, OTHER_PROJECT_ID).project_name = "Other renamed"
+    orm_session.get(User, MOCK_USER_IDS_BY_NAME["Team Member 1"]).hashed_pw = "rotated"
+    orm_session.commit()
+    _export(client, "excel")
+
+    assert _version() == before
+
+
+# INT-156/005
+def test_bulk_assignee_clear_gives_a_new_version(client, setup_project_with_tasks):
+    task = next(t for t in setup_project_with_tasks["tasks"] if assignment_service.list_assignees(t.id))
+    before = _version()
+
+    assert assignment_service.clear_task_assignees(task.id) > 0
+    assert _version() != before
+
+
+# INT-156/006
+def test_download_of_a_job_honours_if_none_match(client, monkeypatch):
+    monkeypatch.setenv("REPORT_WORKERS", "1")
+    job = client.post("/kira/app/api/v1/report/jobs", json={"project_id": MOCK_PROJECT_ID, "format": "pdf"}).json()
+    report_jobs.wait(job["job_id"], timeout=60)
+
+    url = f"/kira/app/api/v1/report/jobs/{job['job_id']}/download"
+    etag = client.get(url).headers["etag"]
+    assert etag == _export(client, "pdf").headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+
+# INT-156/007
+def test_projects_from_before_the_column_get_a_version(isolated_test_db):
+    from backend.src.init_scripts.add_report_version import add_report_version_column, backfill_report_versions
+
+    with isolated_test_db.begin() as conn:
+        conn.execute(text("ALTER TABLE project DROP COLUMN report_version"))
+        conn.execute(text("INSERT INTO project (project_id, project_name, active) VALUES (7, 'Legacy', 1), (8, 'Old', 1)"))
+
+    assert add_report_version_column(isolated_test_db) is True
+    assert add_report_version_column(isolated_test_db) is False
+    assert "report_version" in {c["name"] for c in inspect(isolated_test_db).get_columns("project")}
+    assert backfill_report_versions(isolated_test_db) == 2
+
+    with isolated_test_db.begin() as conn:
+        conn.execute(update(Project.__table__).values(report_version=None))
+    version = _version(7)
+    assert version and _version(7) == version
+    assert project_service.get_report_version(999) is None
+
+
+# INT-156/008
+def test_linking_and_unlinking_subtasks_gives_a_new_etag(client, setup_project_with_tasks):
+    from backend.src.services import task as task_service
+
+    parent, child, other = (t.id for t in setup_project_with_tasks["tasks"][:3])
+
+    def etag():
+        return _export(client, "excel").headers["etag"]
+
+    changes = [
+        lambda: task_service.attach_subtasks(parent, [child]),
+        lambda: task_service.detach_subtask(parent, child),
+        lambda: task_service.link_subtask(parent, other),
+        # the soft delete removes its links with bulk deletes, past the flush hooks
+        lambda: task_service.delete_task(other),
+    ]
+    for change in changes:
+        before = etag()
+        change()
+        assert etag() != before
+
+
+# INT-156/009
+def test_deleting_a_parent_in_another_project_touches_its_subtasks_project(
+    client, orm_session, setup_project_with_tasks
+):
+    from backend.src.services import task as task_service
+
+    parent, child = (t.id for t in setup_project_with_tasks["tasks"][:2])
+    orm_session.get(Task, parent).project_id = OTHER_PROJECT_ID
+    orm_session.commit()
+    task_service.link_subtask(parent, child)
+    before = _version()
+
+    # child is back at the top level of this project's report
+    task_service.delete_task(parent)
+    assert _version() != before
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event, delete, text
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
 from backend.src.main import app
-from backend.src.database.db_setup import Base
+from tests.db_backend import make_test_engine, make_test_async_engine, drop_schema
+from backend.src.database.db_setup import Base, RequestScopedSessionmaker
 
 import backend.src.services.task as svc
 import backend.src.services.task_assignment as task_assignment_svc
@@ -17,6 +20,7 @@ import backend.src.services.team as team_svc
 
 from backend.src.database.models.task import Task
 from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task_closure import TaskClosure
 from backend.src.database.models.project import Project
 from backend.src.database.models.task_assignment import TaskAssignment
 from backend.src.database.models.user import User
@@ -28,49 +32,41 @@ from backend.src.database.models.team_assignment import TeamAssignment as TeamAs
 @pytest.fixture(scope="session")
 def test_engine(tmp_path_factory):
     """
-    Session-scoped file-backed SQLite engine with FK support.
+    Session-scoped engine (SQLite file with FK support, or TEST_DATABASE_URL).
     Creates schema once, drops at the end.
     """
     db_file = tmp_path_factory.mktemp("kira_integration") / "itest.db"
-    engine = create_engine(
-        f"sqlite:///{db_file}",
-        connect_args={"check_same_thread": False},
-        future=True,
-    )
-
-    @event.listens_for(engine, "connect")
-    def _fk_on(dbapi_connection, connection_record):  # pragma: no cover
-        cur = dbapi_connection.cursor()
-        cur.execute("PRAGMA foreign_keys=ON")
-        cur.close()
-
-    Base.metadata.create_all(bind=engine)
+    engine = make_test_engine(db_file)
     try:
         yield engine
     finally:
-        # Teardown: disable FK checks before dropping tables to avoid circular dependency issues
         try:
-            with engine.connect() as conn:
-                conn.execute(text("PRAGMA foreign_keys=OFF"))
-                Base.metadata.drop_all(bind=conn)
-                conn.execute(text("PRAGMA foreign_keys=ON"))
+            drop_schema(engine)
         finally:
             engine.dispose()
 
 
 @pytest.fixture(scope="session")
-def client(test_engine):
+def test_async_engine(test_engine):
+    """Async engine on the same test database, for the async read routes."""
+    engine = make_test_async_engine(test_engine)
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(scope="session")
+def client(test_engine, test_async_engine):
     """
-    FastAPI TestClient wired to the test DB via SessionLocal override.
+    FastAPI TestClient wired to the test DB via SessionLocal / AsyncSessionLocal override.
     expire_on_commit=False to avoid DetachedInstanceError across requests.
     """
-    TestingSessionLocal = sessionmaker(
+    TestingSessionLocal = RequestScopedSessionmaker(sessionmaker(
         bind=test_engine,
         autoflush=False,
         autocommit=False,
         expire_on_commit=False,
         future=True,
-    )
+    ))
     # Point the service layer to the test DB
     svc.SessionLocal = TestingSessionLocal
     project_svc.SessionLocal = TestingSessionLocal
@@ -79,6 +75,11 @@ def client(test_engine):
     department_svc.SessionLocal = TestingSessionLocal
     team_svc.SessionLocal = TestingSessionLocal
 
+    TestingAsyncSessionLocal = async_sessionmaker(bind=test_async_engine, autoflush=False, expire_on_commit=False)
+    svc.AsyncSessionLocal = TestingAsyncSessionLocal
+    task_assignment_svc.AsyncSessionLocal = TestingAsyncSessionLocal
+    user_svc.AsyncSessionLocal = TestingAsyncSessionLocal
+
     with TestClient(app) as c:
         yield c
 
@@ -105,6 +106,7 @@ def clean_db(test_engine):
     with TestingSession.begin() as s:
         s.execute(delete(TeamAssignmentModel))
         s.execute(delete(TaskAssignment))
+        s.execute(delete(TaskClosure))
         s.execute(delete(ParentAssignment))
         s.execute(delete(Task))
         s.execute(delete(Team))
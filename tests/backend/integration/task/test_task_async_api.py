@@ -0,0 +1,117 @@
+# tests/backend/integration/task/test_task_async_api.py
+from __future__ import annotations
+
+import asyncio
+import inspect
+import pytest
+from datetime import date, datetime
+from httpx import ASGITransport, AsyncClient
+
+from backend.src.main import app
+from backend.src.database.models.project import Project
+from backend.src.database.models.user import User
+from backend.src.services import task as task_service
+from backend.src.services import task_assignment as assignment_service
+from tests.mock_data.task.integration_data import (
+    TASK_CREATE_PAYLOAD,
+    VALID_PROJECT,
+    VALID_USER_ADMIN,
+)
+
+ASYNC_ROUTES = ["get_task", "list_tasks", "list_tasks_by_user"]
+
+
+def serialize_payload(payload: dict) -> dict:
+    def convert(v):
+        if isinstance(v, (date, datetime)):
+            return v.isoformat()
+        return v
+    return {k: convert(v) for k, v in payload.items()}
+
+
+@pytest.fixture(scope="function")
+def test_db_session(test_engine):
+    from sqlalchemy.orm import sessionmaker
+    TestingSessionLocal = sessionmaker(bind=test_engine, expire_on_commit=False, future=True)
+    with TestingSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def create_test_project(test_db_session, clean_db):
+    test_db_session.add(User(**VALID_USER_ADMIN))
+    test_db_session.commit()
+    test_db_session.add(Project(**VALID_PROJECT))
+    test_db_session.commit()
+
+
+@pytest.fixture
+def tasks(client, task_base_path):
+    """Eight assigned top-level tasks; the first one gets the next two as subtasks."""
+    ids = []
+    for i in range(8):
+        payload = dict(TASK_CREATE_PAYLOAD, title=f"Async Task {i}", priority=(i % 3) + 1)
+        resp = client.post(f"{task_base_path}/", json=serialize_payload(payload))
+        assert resp.status_code == 201, resp.text
+        ids.append(resp.json()["id"])
+    for task_id in ids:
+        client.post(f"{task_base_path}/{task_id}/assignees", json={"user_ids": [VALID_USER_ADMIN["user_id"]]})
+    resp = client.post(f"{task_base_path}/{ids[0]}/subtasks", json={"subtask_ids": ids[1:3]})
+    assert resp.status_code == 200, resp.text
+    return ids
+
+
+# INT-148/001
+@pytest.mark.parametrize("name", ASYNC_ROUTES)
+def test_hot_read_routes_are_async(name):
+    route = next(r for r in app.routes if getattr(r, "name", None) == name)
+    assert inspect.iscoroutinefunction(route.endpoint)
+
+
+# INT-148/002
+def test_async_services_match_sync(client, tasks):
+    """The async services return the same rows, in the same order, as the sync ones."""
+    filters = {"priority_range": [2, None]}
+
+    async def run():
+        return (
+            await task_service.list_tasks_async(filter_by=filters, sort_by="priority_asc", limit=3),
+            await assignment_service.list_tasks_for_user_async(VALID_USER_ADMIN["user_id"]),
+            await task_service.get_task_with_subtasks_async(tasks[0]),
+        )
+
+    listed, for_user, parent = asyncio.run(run())
+
+    assert [t.id for t in listed] == [
+        t.id for t in task_service.list_tasks(filter_by=filters, sort_by="priority_asc", limit=3)
+    ]
+    assert [t.id for t in for_user] == [
+        t.id for t in assignment_service.list_tasks_for_user(VALID_USER_ADMIN["user_id"])
+    ]
+    # subtasks are eagerly loaded, so they are readable after the async session closed
+    assert sorted(link.subtask.id for link in parent.subtask_links) == tasks[1:3]
+
+
+# INT-148/003
+def test_concurrent_async_reads(client, task_base_path, tasks):
+    """Many overlapping requests on one event loop all succeed."""
+    user_id = VALID_USER_ADMIN["user_id"]
+
+    async def run():
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            urls = [f"{task_base_path}/{tid}" for tid in tasks]
+            urls += [f"{task_base_path}/", f"{task_base_path}/user/{user_id}"] * 8
+            return await asyncio.gather(*(ac.get(url) for url in urls))
+
+    responses = asyncio.run(run())
+
+    assert all(r.status_code == 200 for r in responses), [r.text for r in responses if r.status_code != 200]
+    assert responses[0].json()["id"] == tasks[0]
+    assert len(responses[0].json()["subTasks"]) == 2
+
+
+# INT-148/004
+def test_async_routes_keep_error_mapping(client, task_base_path, tasks):
+    assert client.get(f"{task_base_path}/999999").status_code == 404
+    assert client.get(f"{task_base_path}/user/999999").status_code == 404
+    assert client.get(f"{task_base_path}/", params={"sort_by": "bogus"}).status_code == 400
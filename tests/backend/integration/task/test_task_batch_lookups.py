@@ -0,0 +1,129 @@
+# tests/backend/integration/task/test_task_batch_lookups.py
+from __future__ import annotations
+
+import pytest
+from datetime import date, datetime
+from unittest.mock import patch
+from sqlalchemy import insert, update
+
+from backend.src.database.models.department import Department
+from backend.src.database.models.project import Project
+from backend.src.database.models.team import Team
+from backend.src.database.models.team_assignment import TeamAssignment
+from backend.src.database.models.user import User
+from backend.src.database.query_stats import track_queries
+from backend.src.handlers import comment_handler
+from backend.src.services import team as team_service
+from backend.src.services import user as user_service
+from tests.query_budget import db_queries
+from tests.mock_data.task.integration_data import TASK_CREATE_PAYLOAD, VALID_PROJECT, VALID_USER_ADMIN
+
+STAFF_IDS = list(range(10, 16))
+
+
+def serialize_payload(payload: dict) -> dict:
+    def convert(v):
+        if isinstance(v, (date, datetime)):
+            return v.isoformat()
+        return v
+    return {k: convert(v) for k, v in payload.items()}
+
+
+@pytest.fixture(autouse=True)
+def seed(test_engine, clean_db):
+    with test_engine.begin() as conn:
+        conn.execute(insert(User), [VALID_USER_ADMIN] + [
+            {"user_id": uid, "name": f"Staff {uid}", "email": f"staff{uid}@example.com",
+             "role": "staff", "admin": False, "hashed_pw": "x", "department_id": None}
+            for uid in STAFF_IDS
+        ])
+        conn.execute(insert(Project), [VALID_PROJECT])
+
+
+def _new_task(client, task_base_path) -> int:
+    return client.post(f"{task_base_path}/", json=serialize_payload(TASK_CREATE_PAYLOAD)).json()["id"]
+
+
+def _email(uid: int) -> str:
+    return f"staff{uid}@example.com"
+
+
+# INT-153/001
+@pytest.mark.parametrize("method", ["post", "delete"])
+def test_assignment_fan_out_query_count_is_constant(client, task_base_path, method):
+    one, many = _new_task(client, task_base_path), _new_task(client, task_base_path)
+    if method == "delete":
+        client.post(f"{task_base_path}/{one}/assignees", json={"user_ids": STAFF_IDS[:1]})
+        client.post(f"{task_base_path}/{many}/assignees", json={"user_ids": STAFF_IDS})
+
+    call = lambda task_id, ids: client.request(method.upper(), f"{task_base_path}/{task_id}/assignees",
+                                               json={"user_ids": ids})
+    small, large = call(one, STAFF_IDS[:1]), call(many, STAFF_IDS)
+
+    assert small.status_code == large.status_code == 200, large.text
+    assert db_queries(large) == db_queries(small)
+
+
+# INT-153/002
+def test_unknown_assignee_is_rejected_before_any_write(client, task_base_path):
+    task_id = _new_task(client, task_base_path)
+    before = client.get(f"{task_base_path}/{task_id}/assignees").json()
+    resp = client.post(f"{task_base_path}/{task_id}/assignees", json={"user_ids": [STAFF_IDS[0], 999999]})
+
+    assert resp.status_code == 404
+    assert client.get(f"{task_base_path}/{task_id}/assignees").json() == before
+
+
+# INT-153/003
+def test_mention_fan_out_query_count_is_constant(client, task_base_path):
+    task_id = _new_task(client, task_base_path)
+    counts = []
+    with patch("backend.src.handlers.comment_handler.get_notification_service") as get_svc:
+        for recipients in ([_email(STAFF_IDS[0])], [_email(uid) for uid in STAFF_IDS] + ["nobody@example.com"]):
+            with track_queries() as stats:
+                comment_handler.notify_comment_mentions(task_id, VALID_USER_ADMIN["user_id"], recipients)
+            counts.append(stats.count)
+
+    assert counts[0] == counts[1]
+    assert get_svc.return_value.notify_activity.call_args.kwargs["to_recipients"] == sorted(
+        _email(uid) for uid in STAFF_IDS
+    )
+
+
+# INT-153/004
+def test_batch_lookups_skip_unknown_keys(client, test_engine):
+    with test_engine.begin() as conn:
+        conn.execute(insert(Department).values(department_id=1, department_name="Ops", manager_id=1))
+        conn.execute(insert(Team), [
+            {"team_id": tid, "team_name": f"T{tid}", "manager_id": 1, "department_id": 1, "team_number": f"0101{tid:02d}"}
+            for tid in (3, 1, 2)
+        ])
+        conn.execute(insert(TeamAssignment), [{"team_id": 3, "user_id": 10}, {"team_id": 1, "user_id": 10}])
+
+    with track_queries() as stats:
+        users = user_service.get_users_by_ids([10, 11, 999999])
+        by_email = user_service.get_users_by_emails([_email(12), "nobody@example.com", None])
+        teams = team_service.get_teams_by_ids([3, 1, 99])
+
+    assert sorted(users) == [10, 11]
+    assert list(by_email) == [_email(12)] and by_email[_email(12)].user_id == 12
+    assert [t["team_id"] for t in teams] == [1, 3]
+    assert stats.count == 3
+    assert [t["team_id"] for t in team_service.get_teams_of_user(10)] == [1, 3]
+    assert user_service.get_users_by_ids([]) == {} and team_service.get_teams_by_ids([]) == []
+
+
+# INT-153/005
+def test_identifier_lookup_matches_emails_and_unique_names(client, test_engine):
+    with test_engine.begin() as conn:
+        # user 11 shares user 12's name; user 10 is named after user 12's email
+        conn.execute(update(User).where(User.user_id.in_([11, 12])).values(name="Shared Name"))
+        conn.execute(update(User).where(User.user_id == 10).values(name=_email(12)))
+        conn.execute(update(User).where(User.user_id == 13).values(name="Unique Name"))
+
+    with track_queries() as stats:
+        found = user_service.get_users_by_identifiers([_email(12), "Unique Name", "Shared Name", "Nobody", None])
+
+    assert stats.count == 1
+    assert {key: u.user_id for key, u in found.items()} == {_email(12): 12, "Unique Name": 13}
+    assert user_service.get_users_by_identifiers([]) == {}
@@ -0,0 +1,157 @@
+# tests/backend/integration/task/test_task_filter_api.py
+from __future__ import annotations
+
+import json
+import pytest
+from datetime import date, datetime, timedelta
+from sqlalchemy import event
+
+from backend.src.database.models.project import Project
+from backend.src.database.models.user import User
+from backend.src.enums.task_status import TaskStatus
+from backend.src.services import task as task_service
+from backend.src.services import task_query
+from tests.mock_data.task.integration_data import (
+    TASK_CREATE_PAYLOAD,
+    VALID_PROJECT,
+    VALID_PROJECT_2,
+    VALID_USER_ADMIN,
+    VALID_USER_MANAGER,
+    COMBINED_DATA_FILTERS,
+)
+
+TODAY = date.today()
+
+
+def serialize_payload(payload: dict) -> dict:
+    def convert(v):
+        if isinstance(v, (date, datetime)):
+            return v.isoformat()
+        return v
+    return {k: convert(v) for k, v in payload.items()}
+
+
+@pytest.fixture(scope="function")
+def test_db_session(test_engine):
+    from sqlalchemy.orm import sessionmaker
+    TestingSessionLocal = sessionmaker(
+        bind=test_engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        future=True,
+    )
+    with TestingSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def create_test_project(test_db_session, clean_db):
+    test_db_session.add(User(**VALID_USER_ADMIN))
+    test_db_session.add(User(**VALID_USER_MANAGER))
+    test_db_session.commit()
+    test_db_session.add(Project(**VALID_PROJECT))
+    test_db_session.add(Project(**VALID_PROJECT_2))
+    test_db_session.commit()
+
+
+@pytest.fixture
+def dashboard_tasks(client, task_base_path):
+    """Tasks spread over status, priority, tag, project and assignee; returns {title: id}."""
+    specs = [
+        ("a", TaskStatus.TO_DO.value, 9, "urgent", 1, 1, TODAY),
+        ("b", TaskStatus.TO_DO.value, 4, None, 1, 3, TODAY + timedelta(days=5)),
+        ("c", TaskStatus.IN_PROGRESS.value, 8, "urgent", 2, 3, TODAY - timedelta(days=3)),
+        ("d", TaskStatus.BLOCKED.value, 2, "backlog", 2, 1, None),
+        ("e", TaskStatus.COMPLETED.value, 6, "urgent", 1, 3, TODAY + timedelta(days=1)),
+    ]
+    ids = {}
+    for title, status, priority, tag, project_id, assignee, deadline in specs:
+        payload = dict(TASK_CREATE_PAYLOAD, title=title, status=status, priority=priority,
+                       tag=tag, project_id=project_id, deadline=deadline, start_date=None)
+        resp = client.post(f"{task_base_path}/", json=serialize_payload(payload))
+        assert resp.status_code == 201, resp.text
+        ids[title] = resp.json()["id"]
+        resp = client.post(f"{task_base_path}/{ids[title]}/assignees", json={"user_ids": [assignee]})
+        assert resp.status_code == 200, resp.text
+    return ids
+
+
+def _titles(client, task_base_path, expr, path="/") -> set[str]:
+    resp = client.get(f"{task_base_path}{path}", params={"filters": json.dumps(expr)})
+    assert resp.status_code == 200, resp.text
+    return {t["title"] for t in resp.json()}
+
+
+# INT-144/001
+@pytest.mark.parametrize("path", ["/", "/parents"])
+@pytest.mark.parametrize("expr, expected", [
+    ({"status": TaskStatus.TO_DO.value, "priority_range": [5, 10]}, {"a"}),
+    ({"status": [TaskStatus.TO_DO.value, TaskStatus.BLOCKED.value]}, {"a", "b", "d"}),
+    ({"tag": "urgent", "project_id": 1}, {"a", "e"}),
+    ({"assignee_id": 3, "priority_range": [None, 6]}, {"b", "e"}),
+    ({"or": [{"status": TaskStatus.BLOCKED.value}, {"priority_range": [9, None]}]}, {"a", "d"}),
+    ({"or": [{"and": [{"tag": "urgent"}, {"assignee_id": 3}]}, {"project_id": 2, "tag": "backlog"}]}, {"c", "e", "d"}),
+    ({"deadline_range": [TODAY.isoformat(), None], "or": [{"tag": "urgent"}, {"priority_range": [1, 4]}]}, {"a", "b", "e"}),
+])
+def test_composed_filters(client, task_base_path, dashboard_tasks, path, expr, expected):
+    """AND/OR combinations over every predicate return exactly the matching tasks."""
+    assert _titles(client, task_base_path, expr, path) == expected
+
+
+# INT-144/002
+@pytest.mark.parametrize("combined", COMBINED_DATA_FILTERS)
+def test_previously_exclusive_filters_combine(client, task_base_path, dashboard_tasks, combined):
+    """Filters that used to be rejected together are now ANDed."""
+    resp = client.get(f"{task_base_path}/", params={"filters": combined})
+    assert resp.status_code == 200
+    for item in resp.json():
+        assert item["status"] == TaskStatus.TO_DO.value
+
+
+# INT-144/003
+def test_filter_compiles_to_single_statement(test_engine, dashboard_tasks):
+    """An assignee + OR filter runs as one SELECT (plus the subtask eager load), not a per-row check."""
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    expr = {"assignee_id": [1, 3], "or": [{"tag": "urgent"}, {"status": TaskStatus.BLOCKED.value}]}
+    event.listen(test_engine, "before_cursor_execute", _capture)
+    try:
+        tasks = task_service.list_parent_tasks(filter_by=expr)
+    finally:
+        event.remove(test_engine, "before_cursor_execute", _capture)
+
+    assert {t.title for t in tasks} == {"a", "c", "d", "e"}
+    assert len(statements) == 1
+
+
+# INT-144/004
+def test_same_shape_reuses_cached_statement(dashboard_tasks):
+    """Different values with the same filter shape hit the statement cache."""
+    task_query.listing_statement.cache_clear()
+    first = task_service.list_parent_tasks(filter_by={"status": TaskStatus.TO_DO.value, "priority_range": [1, 5]})
+    second = task_service.list_parent_tasks(filter_by={"status": TaskStatus.IN_PROGRESS.value, "priority_range": [5, 10]})
+    third = task_service.list_parent_tasks(filter_by={"status": [TaskStatus.BLOCKED.value, TaskStatus.TO_DO.value], "priority_range": [1, 2]})
+
+    assert [t.title for t in first] == ["b"]
+    assert [t.title for t in second] == ["c"]
+    assert [t.title for t in third] == ["d"]
+    info = task_query.listing_statement.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+# INT-144/005
+def test_project_scope_is_combined_with_filter(dashboard_tasks):
+    tasks = task_service.list_tasks(project_id=2, filter_by={"tag": "urgent"})
+    assert [t.title for t in tasks] == ["c"]
+
+
+# INT-144/006
+@pytest.mark.parametrize("path", ["/", "/parents"])
+@pytest.mark.parametrize("expr", [{"status": [["To-do"]]}, {"status": {"a": 1}}])
+def test_malformed_filter_value_is_a_bad_request(client, task_base_path, dashboard_tasks, path, expr):
+    resp = client.get(f"{task_base_path}{path}", params={"filters": json.dumps(expr)})
+    assert resp.status_code == 400
@@ -273,7 +273,7 @@ def test_list_task_invalid_filter(client, task_base_path):
 # INT-002/007
 @pytest.mark.parametrize("invalid_combi", INVALID_DATA_FILTER_COMBI)
 def test_list_task_invalid_filter_combi(client, task_base_path, invalid_combi):
-    """Test invalid filter combinations return 400 Bad Request."""
+    """Test malformed filter expressions return 400 Bad Request."""
     for payload in (
         TASK_CREATE_PAYLOAD,
         TASK_2_PAYLOAD,     
@@ -0,0 +1,159 @@
+# tests/backend/integration/task/test_task_hierarchy_index.py
+from __future__ import annotations
+import pytest
+from sqlalchemy import text
+
+import backend.src.database.db_setup as db_setup
+from backend.src.database.models.project import Project
+from backend.src.database.models.user import User
+from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.services import task as task_service
+from tests.mock_data.task.integration_data import (
+    TASK_CREATE_PAYLOAD_SERVICE,
+    TASK_CREATE_CHILD_SERVICE,
+    VALID_PROJECT,
+    VALID_PROJECT_2,
+    VALID_USER_ADMIN,
+    VALID_USER_MANAGER,
+)
+
+
+@pytest.fixture(autouse=True)
+def test_db_session(test_engine):
+    from sqlalchemy.orm import sessionmaker
+    TestingSessionLocal = sessionmaker(
+        bind=test_engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        future=True,
+    )
+
+    with TestingSessionLocal() as session:
+        db_setup.SessionLocal.configure(bind=session.get_bind())
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def seed_project_and_user(test_db_session, clean_db):
+    manager = User(**VALID_USER_ADMIN)
+    manager2 = User(**VALID_USER_MANAGER)
+    test_db_session.add_all([manager, manager2])
+    test_db_session.flush()
+    project = Project(**VALID_PROJECT)
+    project2 = Project(**VALID_PROJECT_2)
+    test_db_session.add_all([project, project2])
+    test_db_session.commit()
+
+
+def _closure_rows(session) -> set[tuple[int, int, int]]:
+    rows = session.execute(
+        text("SELECT ancestor_id, descendant_id, depth FROM task_closure")
+    ).all()
+    return {tuple(r) for r in rows}
+
+
+def _chain(n: int) -> list:
+    """Create n tasks linked as a single chain t0 -> t1 -> ... -> t(n-1)."""
+    tasks = [task_service.add_task(**TASK_CREATE_PAYLOAD_SERVICE)]
+    for _ in range(n - 1):
+        child = task_service.add_task(**TASK_CREATE_CHILD_SERVICE)
+        task_service.link_subtask(tasks[-1].id, child.id)
+        tasks.append(child)
+    return tasks
+
+# ---------------------------------------------------------------------------
+
+# INT-141/001
+def test_link_subtask_maintains_all_depths(test_db_session):
+    """Linking a chain writes one row per ancestor/descendant pair."""
+    a, b, c = _chain(3)
+    assert _closure_rows(test_db_session) == {
+        (a.id, b.id, 1),
+        (b.id, c.id, 1),
+        (a.id, c.id, 2),
+    }
+
+
+# INT-141/002
+def test_attach_subtree_propagates_to_new_ancestors(test_db_session):
+    """Attaching an existing subtree links every node in it to the new parent's ancestors."""
+    root = task_service.add_task(**TASK_CREATE_PAYLOAD_SERVICE)
+    mid = task_service.add_task(**TASK_CREATE_CHILD_SERVICE)
+    sub, leaf = _chain(2)
+    task_service.link_subtask(root.id, mid.id)
+
+    task_service.attach_subtasks(mid.id, [sub.id])
+
+    rows = _closure_rows(test_db_session)
+    assert (root.id, leaf.id, 3) in rows
+    assert (mid.id, leaf.id, 2) in rows
+    assert (root.id, sub.id, 2) in rows
+    assert len(rows) == 6
+
+
+# INT-141/003
+def test_detach_subtask_keeps_inner_subtree(test_db_session):
+    """Detaching removes links to former ancestors only."""
+    a, b, c, d = _chain(4)
+    task_service.detach_subtask(a.id, b.id)
+    assert _closure_rows(test_db_session) == {
+        (b.id, c.id, 1),
+        (c.id, d.id, 1),
+        (b.id, d.id, 2),
+    }
+
+
+# INT-141/004
+def test_delete_task_removes_node_from_index(test_db_session):
+    """Soft delete cuts the task out of the hierarchy; its children keep their subtrees."""
+    a, b, c, d = _chain(4)
+    task_service.delete_task(b.id)
+    assert _closure_rows(test_db_session) == {(c.id, d.id, 1)}
+
+
+# INT-141/005
+def test_attach_subtasks_bulk_cycle_guard(test_db_session):
+    """Any ancestor of the parent among the subtask ids is rejected."""
+    a, b, c = _chain(3)
+    loose = task_service.add_task(**TASK_CREATE_CHILD_SERVICE)
+    with pytest.raises(ValueError, match="Cycle detected"):
+        task_service.attach_subtasks(c.id, [loose.id, a.id])
+    # all-or-nothing: nothing attached to c
+    assert task_service.list_descendant_ids(c.id) == []
+
+
+# INT-141/006
+def test_list_descendant_ids_with_depth_limit(test_db_session):
+    """Descendants come back nearest-first and honour max_depth."""
+    a, b, c, d = _chain(4)
+    assert task_service.list_descendant_ids(a.id) == [b.id, c.id, d.id]
+    assert task_service.list_descendant_ids(a.id, max_depth=2) == [b.id, c.id]
+    assert task_service.list_descendant_ids(d.id) == []
+
+
+# INT-141/007
+def test_rebuild_task_closure_matches_maintained_index(test_db_session):
+    """Rebuilding from parent_assignment reproduces the incrementally maintained rows."""
+    _chain(4)
+    maintained = _closure_rows(test_db_session)
+
+    test_db_session.execute(text("DELETE FROM task_closure"))
+    test_db_session.commit()
+    written = task_service.rebuild_task_closure()
+
+    assert written == len(maintained) == 6
+    assert _closure_rows(test_db_session) == maintained
+
+
+# INT-141/008
+def test_rebuild_task_closure_rejects_cycles(test_db_session):
+    """Legacy data containing a cycle cannot be indexed."""
+    a = task_service.add_task(**TASK_CREATE_PAYLOAD_SERVICE)
+    b = task_service.add_task(**TASK_CREATE_CHILD_SERVICE)
+    test_db_session.add(ParentAssignment(parent_id=a.id, subtask_id=b.id))
+    test_db_session.add(ParentAssignment(parent_id=b.id, subtask_id=a.id))
+    test_db_session.commit()
+
+    with pytest.raises(ValueError, match="Cycle detected"):
+        task_service.rebuild_task_closure()
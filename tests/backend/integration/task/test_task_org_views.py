@@ -0,0 +1,121 @@
+# tests/backend/integration/task/test_task_org_views.py
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import insert, update
+
+from backend.src.database.models.department import Department
+from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task import Task
+from backend.src.database.models.task_assignment import TaskAssignment
+from backend.src.database.models.team import Team
+from backend.src.database.models.team_assignment import TeamAssignment
+from backend.src.database.models.user import User
+from tests.query_budget import db_queries
+
+DEPARTMENT_ID = 1
+DEPARTMENT_NAME = "Engineering"
+MANAGER_ID = 1
+DIRECTOR_ID = 2
+
+
+def build_org(engine, *, teams: int, members: int, tasks_per_member: int) -> dict:
+    """
+    One department (director 2) with `teams` top-level teams managed by user 1, each with
+    one subteam; every team has `members` staff with `tasks_per_member` tasks each.
+    Returns {team_number: [task ids of its members]}.
+    """
+    users = [
+        {"user_id": MANAGER_ID, "name": "Manager", "email": "m@example.com", "role": "manager", "hashed_pw": "x"},
+        {"user_id": DIRECTOR_ID, "name": "Director", "email": "d@example.com", "role": "director", "hashed_pw": "x"},
+    ]
+    team_rows, team_members, task_rows, assignments = [], [], [], []
+    expected: dict[str, list[int]] = {}
+    next_user, next_task, next_team = 10, 1, 1
+    for t in range(1, teams + 1):
+        for number in (f"01{t:02d}00", f"01{t:02d}01"):
+            team_rows.append({"team_id": next_team, "team_name": f"Team {number}", "manager_id": MANAGER_ID,
+                              "department_id": DEPARTMENT_ID, "team_number": number})
+            expected[number] = []
+            for _ in range(members):
+                users.append({"user_id": next_user, "name": f"U{next_user}", "email": f"u{next_user}@example.com",
+                              "role": "staff", "hashed_pw": "x"})
+                team_members.append({"team_id": next_team, "user_id": next_user})
+                for _ in range(tasks_per_member):
+                    task_rows.append({"id": next_task, "title": f"T{next_task}", "status": "To-do",
+                                      "priority": 5, "active": True})
+                    assignments.append({"task_id": next_task, "user_id": next_user})
+                    expected[number].append(next_task)
+                    next_task += 1
+                next_user += 1
+            next_team += 1
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), users)
+        conn.execute(insert(Department).values(
+            department_id=DEPARTMENT_ID, department_name=DEPARTMENT_NAME, manager_id=DIRECTOR_ID))
+        conn.execute(update(User).where(User.user_id == DIRECTOR_ID).values(department_id=DEPARTMENT_ID))
+        conn.execute(insert(Team), team_rows)
+        conn.execute(insert(TeamAssignment), team_members)
+        conn.execute(insert(Task), task_rows)
+        conn.execute(insert(TaskAssignment), assignments)
+    return expected
+
+
+def _reset_org(engine):
+    with engine.begin() as conn:
+        for model in (TaskAssignment, ParentAssignment, Task, TeamAssignment, Team):
+            conn.execute(model.__table__.delete())
+        conn.execute(update(User).values(department_id=None))
+        conn.execute(Department.__table__.delete())
+        conn.execute(User.__table__.delete())
+
+
+def _ids(data: dict) -> dict:
+    return {key.split("-")[0]: sorted(t["id"] for t in tasks) for key, tasks in data.items()}
+
+
+# INT-151/001
+@pytest.mark.parametrize("path", [f"/manager/{MANAGER_ID}", f"/director/{DIRECTOR_ID}"])
+def test_views_group_tasks_by_team_and_subteam(client, task_base_path, test_engine, path):
+    expected = build_org(test_engine, teams=2, members=2, tasks_per_member=2)
+    resp = client.get(task_base_path + path)
+
+    assert resp.status_code == 200, resp.text
+    assert _ids(resp.json()) == {number: sorted(ids) for number, ids in expected.items()}
+
+
+# INT-151/002
+@pytest.mark.parametrize("path", [f"/manager/{MANAGER_ID}", f"/director/{DIRECTOR_ID}"])
+def test_views_query_count_is_constant(client, task_base_path, test_engine, path):
+    build_org(test_engine, teams=1, members=1, tasks_per_member=1)
+    small = db_queries(client.get(task_base_path + path))
+
+    # same views over an org 5 teams x 8 members x 3 tasks the size
+    _reset_org(test_engine)
+    build_org(test_engine, teams=5, members=8, tasks_per_member=3)
+    large = client.get(task_base_path + path)
+
+    assert large.status_code == 200
+    assert sum(len(v) for v in large.json().values()) == 5 * 2 * 8 * 3
+    assert db_queries(large) == small
+
+
+# INT-151/003
+def test_shared_subtask_and_inactive_tasks(client, task_base_path, test_engine):
+    """A task assigned to two members is listed once; subtasks and inactive tasks only via their parent / not at all."""
+    expected = build_org(test_engine, teams=1, members=2, tasks_per_member=2)
+    team_tasks = expected["010100"]
+    with test_engine.begin() as conn:
+        conn.execute(insert(TaskAssignment).values(task_id=team_tasks[0], user_id=11))
+        conn.execute(insert(ParentAssignment).values(parent_id=team_tasks[0], subtask_id=team_tasks[1]))
+        conn.execute(update(Task).where(Task.id == team_tasks[2]).values(active=False))
+
+    data = client.get(f"{task_base_path}/manager/{MANAGER_ID}").json()
+    listed = data["010100-Team 010100"]
+
+    assert [t["id"] for t in listed].count(team_tasks[0]) == 1
+    assert sorted(t["id"] for t in listed) == [team_tasks[0], team_tasks[3]]
+    parent = next(t for t in listed if t["id"] == team_tasks[0])
+    assert [st["id"] for st in parent["subTasks"]] == [team_tasks[1]]
+
@@ -0,0 +1,183 @@
+# tests/backend/integration/task/test_task_pagination_api.py
+from __future__ import annotations
+
+import pytest
+from datetime import date, datetime, timedelta
+from sqlalchemy import event
+
+from backend.src.database.models.project import Project
+from backend.src.database.models.user import User
+from backend.src.enums.task_sort import TaskSort
+from backend.src.enums.task_status import TaskStatus
+from backend.src.services import task as task_service
+from backend.src.services.task_paging import encode_cursor
+from tests.db_backend import TEST_DATABASE_URL
+from tests.mock_data.task.integration_data import (
+    TASK_CREATE_PAYLOAD,
+    VALID_PROJECT,
+    VALID_USER_ADMIN,
+)
+
+ALL_SORTS = [s.value for s in TaskSort]
+STATUSES = [s.value for s in TaskStatus]
+NEXT_CURSOR = "X-Next-Cursor"
+
+
+def serialize_payload(payload: dict) -> dict:
+    def convert(v):
+        if isinstance(v, (date, datetime)):
+            return v.isoformat()
+        return v
+    return {k: convert(v) for k, v in payload.items()}
+
+
+@pytest.fixture(scope="function")
+def test_db_session(test_engine):
+    from sqlalchemy.orm import sessionmaker
+    TestingSessionLocal = sessionmaker(
+        bind=test_engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        future=True,
+    )
+    with TestingSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def create_test_project(test_db_session, clean_db):
+    test_db_session.add(User(**VALID_USER_ADMIN))
+    test_db_session.commit()
+    test_db_session.add(Project(**VALID_PROJECT))
+    test_db_session.commit()
+
+
+@pytest.fixture
+def many_tasks(client, task_base_path):
+    """
+    23 top-level tasks assigned to the admin, with repeated priorities, repeated
+    and missing dates and mixed statuses so every sort has ties and NULLs to page over.
+    """
+    today = date.today()
+    ids = []
+    for i in range(23):
+        payload = dict(TASK_CREATE_PAYLOAD)
+        payload["title"] = f"Paged Task {i}"
+        payload["priority"] = (i % 4) + 1
+        payload["status"] = STATUSES[i % len(STATUSES)]
+        payload["start_date"] = None if i % 5 == 0 else today + timedelta(days=i % 3)
+        payload["deadline"] = None if i % 6 == 0 else today + timedelta(days=10 + i % 4)
+        resp = client.post(f"{task_base_path}/", json=serialize_payload(payload))
+        assert resp.status_code == 201, resp.text
+        task_id = resp.json()["id"]
+        resp = client.post(f"{task_base_path}/{task_id}/assignees", json={"user_ids": [VALID_USER_ADMIN["user_id"]]})
+        assert resp.status_code == 200, resp.text
+        ids.append(task_id)
+    return ids
+
+
+def _walk(client, url: str, params: dict, limit: int) -> list[list[int]]:
+    """Follow X-Next-Cursor until exhausted; return the ids of each page."""
+    pages = []
+    after = None
+    while True:
+        query = dict(params, limit=limit)
+        if after:
+            query["after"] = after
+        resp = client.get(url, params=query)
+        assert resp.status_code == 200, resp.text
+        pages.append([t["id"] for t in resp.json()])
+        after = resp.headers.get(NEXT_CURSOR)
+        if not after:
+            return pages
+        assert len(pages) < 100, "pagination did not terminate"
+
+
+# INT-143/001
+@pytest.mark.parametrize("sort_by", ALL_SORTS)
+@pytest.mark.parametrize("path", ["/", "/parents", "/project/1", "/user/1"])
+def test_pages_concatenate_to_full_listing(client, task_base_path, many_tasks, sort_by, path):
+    """Walking every page returns exactly the unpaginated listing, in order."""
+    url = f"{task_base_path}{path}"
+    full = client.get(url, params={"sort_by": sort_by})
+    assert full.status_code == 200
+    assert NEXT_CURSOR not in full.headers
+    expected = [t["id"] for t in full.json()]
+    assert sorted(expected) == sorted(many_tasks)
+
+    pages = _walk(client, url, {"sort_by": sort_by}, limit=5)
+    assert [len(p) for p in pages[:-1]] == [5] * (len(pages) - 1)
+    assert [tid for page in pages for tid in page] == expected
+
+
+# INT-143/002
+def test_last_full_page_is_followed_by_empty_page(client, task_base_path, many_tasks):
+    """When the total is a multiple of limit, the final cursor yields an empty page."""
+    pages = _walk(client, f"{task_base_path}/", {}, limit=23)
+    assert [len(p) for p in pages] == [23, 0]
+
+
+# INT-143/003
+def test_pagination_combines_with_filters(client, task_base_path, many_tasks):
+    filters = '{"priority_range": [3, 4]}'
+    full = client.get(f"{task_base_path}/", params={"filters": filters})
+    expected = [t["id"] for t in full.json()]
+    assert 0 < len(expected) < len(many_tasks)
+
+    pages = _walk(client, f"{task_base_path}/", {"filters": filters}, limit=4)
+    assert [tid for page in pages for tid in page] == expected
+
+
+# INT-143/004
+@pytest.mark.parametrize("after", [
+    "not-a-cursor", "e30", "eyJzIjoicHJpb3JpdHlfZGVzYyIsImsiOlsxXX0",
+    "eyJzIjoicHJpb3JpdHlfZGVzYyIsImsiOlsiOSIsbnVsbCwxXX0",  # priority as a string
+])
+@pytest.mark.parametrize("path", ["/", "/parents", "/project/1", "/user/1"])
+def test_invalid_cursor_rejected(client, task_base_path, many_tasks, path, after):
+    resp = client.get(f"{task_base_path}{path}", params={"limit": 5, "after": after})
+    assert resp.status_code == 400
+    assert "Invalid cursor" in resp.json()["detail"]
+
+
+# INT-143/005
+def test_cursor_from_other_sort_rejected(client, task_base_path, many_tasks):
+    resp = client.get(f"{task_base_path}/", params={"limit": 5, "sort_by": "deadline_asc"})
+    cursor = resp.headers[NEXT_CURSOR]
+    resp = client.get(f"{task_base_path}/", params={"limit": 5, "sort_by": "priority_desc", "after": cursor})
+    assert resp.status_code == 400
+
+
+# INT-143/006
+@pytest.mark.parametrize("limit", [0, -1, 501])
+def test_limit_out_of_range(client, task_base_path, limit):
+    resp = client.get(f"{task_base_path}/", params={"limit": limit})
+    assert resp.status_code == 422
+
+
+# INT-143/007
+@pytest.mark.skipif(bool(TEST_DATABASE_URL), reason="checks SQLite's positional LIMIT/OFFSET parameters")
+def test_deep_page_is_a_bounded_keyset_query(test_engine, many_tasks):
+    """A page deep into the listing is one LIMIT query with a keyset predicate and a zero offset."""
+    page = task_service.list_parent_tasks(sort_by="priority_desc", limit=5)
+    for _ in range(3):
+        cursor = encode_cursor(page[-1], "priority_desc")
+        statements: list[tuple] = []
+
+        def _capture(conn, cursor_, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(test_engine, "before_cursor_execute", _capture)
+        try:
+            page = task_service.list_parent_tasks(sort_by="priority_desc", limit=5, after=cursor)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _capture)
+
+        assert len(statements) == 1
+        sql, params = statements[0]
+        assert "TASK.ID >" in sql.upper()
+        # SQLite renders "LIMIT ? OFFSET ?"; the offset must stay 0 however deep we page
+        assert tuple(params[-2:]) == (5, 0)
+    assert len(page) == 5
+
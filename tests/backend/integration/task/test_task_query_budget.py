@@ -0,0 +1,95 @@
+# tests/backend/integration/task/test_task_query_budget.py
+from __future__ import annotations
+
+import pytest
+from datetime import date, datetime
+
+from backend.src.database.models.project import Project
+from backend.src.database.models.user import User
+from tests.query_budget import assert_query_budget, db_queries
+from tests.mock_data.task.integration_data import (
+    TASK_CREATE_PAYLOAD,
+    VALID_PROJECT,
+    VALID_USER_ADMIN,
+)
+
+USER_ID = VALID_USER_ADMIN["user_id"]
+
+# Statements allowed per request; listings must not grow with the number of rows
+BUDGETS = {
+    "/{id}": 3,
+    "/": 3,
+    "/parents": 1,
+    "/project/1": 4,
+    f"/user/{USER_ID}": 4,
+    "/{id}/tree": 1,
+}
+
+
+def serialize_payload(payload: dict) -> dict:
+    def convert(v):
+        if isinstance(v, (date, datetime)):
+            return v.isoformat()
+        return v
+    return {k: convert(v) for k, v in payload.items()}
+
+
+@pytest.fixture(scope="function")
+def test_db_session(test_engine):
+    from sqlalchemy.orm import sessionmaker
+    TestingSessionLocal = sessionmaker(bind=test_engine, expire_on_commit=False, future=True)
+    with TestingSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def create_test_project(test_db_session, clean_db):
+    test_db_session.add(User(**VALID_USER_ADMIN))
+    test_db_session.commit()
+    test_db_session.add(Project(**VALID_PROJECT))
+    test_db_session.commit()
+
+
+def _create_tasks(client, task_base_path, n: int) -> list[int]:
+    """n assigned tasks; every third one gets the next task as a subtask."""
+    ids = []
+    for i in range(n):
+        payload = dict(TASK_CREATE_PAYLOAD, title=f"Budget Task {i}")
+        ids.append(client.post(f"{task_base_path}/", json=serialize_payload(payload)).json()["id"])
+    for task_id in ids:
+        client.post(f"{task_base_path}/{task_id}/assignees", json={"user_ids": [USER_ID]})
+    for parent, child in zip(ids[::3], ids[1::3]):
+        client.post(f"{task_base_path}/{parent}/subtasks", json={"subtask_ids": [child]})
+    return ids
+
+
+# INT-150/001
+def test_responses_report_query_stats(client, task_base_path):
+    task_id = _create_tasks(client, task_base_path, 1)[0]
+    resp = client.get(f"{task_base_path}/{task_id}")
+
+    assert resp.status_code == 200
+    assert db_queries(resp) >= 1
+    assert resp.headers["Server-Timing"].startswith("db;dur=")
+    assert f'desc="{db_queries(resp)} queries"' in resp.headers["Server-Timing"]
+
+
+# INT-150/002
+@pytest.mark.parametrize("path, budget", BUDGETS.items())
+def test_read_endpoint_query_budgets(client, task_base_path, path, budget):
+    ids = _create_tasks(client, task_base_path, 6)
+    resp = client.get(task_base_path + path.format(id=ids[0]))
+
+    assert resp.status_code == 200, resp.text
+    assert_query_budget(resp, budget)
+
+
+# INT-150/003
+@pytest.mark.parametrize("path", ["/", "/parents", "/project/1", f"/user/{USER_ID}"])
+def test_listing_query_count_does_not_grow_with_rows(client, task_base_path, path):
+    _create_tasks(client, task_base_path, 3)
+    few = db_queries(client.get(task_base_path + path))
+    _create_tasks(client, task_base_path, 15)
+    many = db_queries(client.get(task_base_path + path))
+
+    assert many == few
@@ -245,7 +245,7 @@ def test_delete_nonexistent_task_raises(test_db_session):
 
 # INT-131/017
 def test_assert_no_cycle_detects_multi_level_cycle(test_db_session):
-    """Directly test _assert_no_cycle BFS traversal."""
+    """Directly test _assert_no_cycle lookup against the rebuilt hierarchy index."""
     t1 = task_service.add_task(**TASK_CREATE_PAYLOAD_SERVICE)
     t2 = task_service.add_task(**TASK_CREATE_CHILD_SERVICE)
     t3 = task_service.add_task(**TASK_CREATE_CHILD_SERVICE)
@@ -253,6 +253,7 @@ def test_assert_no_cycle_detects_multi_level_cycle(test_db_session):
     test_db_session.add(ParentAssignment(parent_id=t1.id, subtask_id=t2.id))
     test_db_session.add(ParentAssignment(parent_id=t2.id, subtask_id=t3.id))
     test_db_session.commit()
+    task_service.rebuild_task_closure()
 
     with pytest.raises(ValueError, match="Cycle detected"):
         task_service._assert_no_cycle(
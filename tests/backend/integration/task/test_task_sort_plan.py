@@ -0,0 +1,54 @@
+# tests/backend/integration/task/test_task_sort_plan.py
+from __future__ import annotations
+
+import pytest
+from types import SimpleNamespace
+from datetime import date
+from sqlalchemy import text
+from sqlalchemy.dialects import sqlite
+
+from backend.src.database.models.task import Task
+from backend.src.services import task_query
+from backend.src.services.task_paging import SORT_KEYS, apply_page, encode_cursor
+from tests.db_backend import TEST_DATABASE_URL
+
+# EXPLAIN QUERY PLAN output is SQLite's; other backends plan these differently
+pytestmark = pytest.mark.skipif(bool(TEST_DATABASE_URL), reason="SQLite query plans")
+
+
+def _plan(test_engine, stmt) -> list[str]:
+    sql = str(stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+    with test_engine.connect() as conn:
+        return [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+# INT-145/001
+def test_every_sort_has_an_index():
+    index_names = {ix.name for ix in Task.__table__.indexes}
+    for sort_by in SORT_KEYS:
+        assert f"ix_task_sort_{sort_by}" in index_names
+
+
+# INT-145/002
+@pytest.mark.parametrize("active_only", [True, False])
+@pytest.mark.parametrize("sort_by", list(SORT_KEYS))
+def test_listing_sort_is_read_from_index(test_engine, sort_by, active_only):
+    """SQLite walks the sort's index instead of building a temp B-tree for ORDER BY."""
+    stmt = task_query.listing_statement(None, active_only=active_only, sort_by=sort_by, with_subtasks=False)
+    plan = _plan(test_engine, stmt)
+
+    assert any(f"USING INDEX ix_task_sort_{sort_by}" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+# INT-145/003
+@pytest.mark.parametrize("sort_by", list(SORT_KEYS))
+def test_keyset_page_is_read_from_index(test_engine, sort_by):
+    """A cursor page keeps the index order, so only `limit` rows are visited past the cursor."""
+    last = SimpleNamespace(id=10, priority=5, status="To-do", start_date=date(2025, 1, 1), deadline=date(2025, 2, 1))
+    stmt = task_query.listing_statement(None, active_only=True, sort_by=sort_by, with_subtasks=False)
+    stmt = apply_page(stmt, sort_by, limit=20, after=encode_cursor(last, sort_by))
+    plan = _plan(test_engine, stmt)
+
+    assert any(f"ix_task_sort_{sort_by}" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
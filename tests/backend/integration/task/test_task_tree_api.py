@@ -0,0 +1,151 @@
+# tests/backend/integration/task/test_task_tree_api.py
+from __future__ import annotations
+
+import pytest
+from datetime import date, datetime
+from sqlalchemy import event
+
+from backend.src.database.models.project import Project
+from backend.src.database.models.user import User
+from backend.src.services import task as task_service
+from tests.mock_data.task.integration_data import (
+    TASK_CREATE_PAYLOAD,
+    TASK_CREATE_CHILD,
+    VALID_PROJECT,
+    VALID_USER_ADMIN,
+    INVALID_TASK_ID_NONEXISTENT,
+)
+
+
+def serialize_payload(payload: dict) -> dict:
+    def convert(v):
+        if isinstance(v, (date, datetime)):
+            return v.isoformat()
+        return v
+    return {k: convert(v) for k, v in payload.items()}
+
+
+@pytest.fixture(scope="function")
+def test_db_session(test_engine):
+    from sqlalchemy.orm import sessionmaker
+    TestingSessionLocal = sessionmaker(
+        bind=test_engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        future=True,
+    )
+    with TestingSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def create_test_project(test_db_session, clean_db):
+    test_db_session.add(User(**VALID_USER_ADMIN))
+    test_db_session.commit()
+    test_db_session.add(Project(**VALID_PROJECT))
+    test_db_session.commit()
+
+
+def _create(client, task_base_path, payload: dict, parent_id: int | None = None) -> int:
+    body = serialize_payload(payload)
+    if parent_id is not None:
+        body["parent_id"] = parent_id
+    resp = client.post(f"{task_base_path}/", json=body)
+    assert resp.status_code == 201, resp.text
+    return resp.json()["id"]
+
+
+@pytest.fixture
+def five_level_plan(client, task_base_path):
+    """root -> a -> b -> c -> d, plus a second child of root."""
+    root = _create(client, task_base_path, TASK_CREATE_PAYLOAD)
+    chain = [root]
+    for _ in range(4):
+        chain.append(_create(client, task_base_path, TASK_CREATE_CHILD, parent_id=chain[-1]))
+    sibling = _create(client, task_base_path, TASK_CREATE_CHILD, parent_id=root)
+    return chain, sibling
+
+
+def _depth(node: dict) -> int:
+    return 1 + max((_depth(c) for c in node["subTasks"]), default=0)
+
+# ---------------------------------------------------------------------------
+
+# INT-142/001
+def test_get_task_tree_returns_all_levels(client, task_base_path, five_level_plan):
+    """The whole subtree comes back nested, however deep."""
+    chain, sibling = five_level_plan
+    resp = client.get(f"{task_base_path}/{chain[0]}/tree")
+    assert resp.status_code == 200
+    tree = resp.json()
+
+    assert tree["id"] == chain[0]
+    assert [c["id"] for c in tree["subTasks"]] == sorted([chain[1], sibling])
+    assert _depth(tree) == 5
+
+    node = tree
+    for expected_id in chain[1:]:
+        node = next(c for c in node["subTasks"] if c["id"] == expected_id)
+    assert node["subTasks"] == []
+
+
+# INT-142/002
+@pytest.mark.parametrize("max_depth, expected_levels", [(0, 1), (1, 2), (3, 4), (10, 5)])
+def test_get_task_tree_depth_limit(client, task_base_path, five_level_plan, max_depth, expected_levels):
+    """max_depth caps the number of levels below the requested task."""
+    chain, _ = five_level_plan
+    resp = client.get(f"{task_base_path}/{chain[0]}/tree", params={"max_depth": max_depth})
+    assert resp.status_code == 200
+    assert _depth(resp.json()) == expected_levels
+
+
+# INT-142/003
+def test_get_task_tree_of_inner_node(client, task_base_path, five_level_plan):
+    """Requesting a subtask returns only the subtree beneath it."""
+    chain, _ = five_level_plan
+    resp = client.get(f"{task_base_path}/{chain[2]}/tree")
+    assert resp.status_code == 200
+    assert resp.json()["id"] == chain[2]
+    assert _depth(resp.json()) == 3
+
+
+# INT-142/004
+def test_get_task_tree_not_found(client, task_base_path):
+    resp = client.get(f"{task_base_path}/{INVALID_TASK_ID_NONEXISTENT}/tree")
+    assert resp.status_code == 404
+
+
+# INT-142/005
+def test_get_task_tree_inactive_root_not_found(client, task_base_path):
+    task_id = _create(client, task_base_path, TASK_CREATE_PAYLOAD)
+    assert client.post(f"{task_base_path}/{task_id}/delete").status_code == 200
+    resp = client.get(f"{task_base_path}/{task_id}/tree")
+    assert resp.status_code == 404
+
+
+# INT-142/006
+def test_get_task_tree_negative_depth_rejected(client, task_base_path, five_level_plan):
+    chain, _ = five_level_plan
+    resp = client.get(f"{task_base_path}/{chain[0]}/tree", params={"max_depth": -1})
+    assert resp.status_code == 422
+
+
+# INT-142/007
+def test_get_task_tree_single_query(client, test_engine, five_level_plan):
+    """A five-level plan is fetched with one SQL statement."""
+    chain, _ = five_level_plan
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", _count)
+    try:
+        tree = task_service.get_task_tree(chain[0])
+    finally:
+        event.remove(test_engine, "before_cursor_execute", _count)
+
+    assert tree is not None
+    assert len(statements) == 1
+    assert "WITH RECURSIVE" in statements[0].upper()
@@ -0,0 +1,152 @@
+# tests/backend/integration/task/test_task_unit_of_work.py
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from datetime import date, datetime
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from backend.src.database.db_setup import request_scope
+from backend.src.database.models.project import Project
+from backend.src.database.models.task import Task
+from backend.src.database.models.user import User
+from backend.src.services import task as task_service
+from backend.src.services import task_assignment as assignment_service
+from backend.src.services import user as user_service
+from tests.mock_data.task.integration_data import (
+    TASK_CREATE_PAYLOAD,
+    TASK_CREATE_PAYLOAD_SERVICE,
+    VALID_PROJECT,
+    VALID_USER_ADMIN,
+)
+
+
+def serialize_payload(payload: dict) -> dict:
+    def convert(v):
+        if isinstance(v, (date, datetime)):
+            return v.isoformat()
+        return v
+    return {k: convert(v) for k, v in payload.items()}
+
+
+@pytest.fixture(scope="function")
+def test_db_session(test_engine):
+    from sqlalchemy.orm import sessionmaker
+    TestingSessionLocal = sessionmaker(bind=test_engine, expire_on_commit=False, future=True)
+    with TestingSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def create_test_project(test_db_session, clean_db):
+    test_db_session.add(User(**VALID_USER_ADMIN))
+    test_db_session.commit()
+    test_db_session.add(Project(**VALID_PROJECT))
+    test_db_session.commit()
+
+
+@pytest.fixture
+def count_events(test_engine):
+    """count_events(name) -> list that grows by one per engine/pool event while the test runs."""
+    registered = []
+
+    def _count(name):
+        seen = []
+        target = test_engine.pool if name == "checkout" else test_engine
+
+        def _listener(*args, **kwargs):
+            seen.append(1)
+
+        event.listen(target, name, _listener)
+        registered.append((target, name, _listener))
+        return seen
+
+    yield _count
+    for target, name, listener in registered:
+        event.remove(target, name, listener)
+
+
+def _task_count(test_db_session) -> int:
+    return test_db_session.execute(select(func.count(Task.id))).scalar()
+
+
+# INT-149/001
+def test_update_request_checks_out_one_connection(client, task_base_path, count_events):
+    """get_task_with_subtasks, update_task and list_assignees share the request's session."""
+    task_id = client.post(f"{task_base_path}/", json=serialize_payload(TASK_CREATE_PAYLOAD)).json()["id"]
+    client.post(f"{task_base_path}/{task_id}/assignees", json={"user_ids": [VALID_USER_ADMIN["user_id"]]})
+
+    checkouts = count_events("checkout")
+    resp = client.patch(f"{task_base_path}/{task_id}", json={"title": "Renamed", "priority": 9})
+
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["title"] == "Renamed"
+    assert len(checkouts) == 1
+
+
+# INT-149/002
+def test_repeated_lookups_hit_identity_map(client, count_events):
+    statements = count_events("before_cursor_execute")
+    with request_scope():
+        first = user_service.get_user(VALID_USER_ADMIN["user_id"])
+        issued = len(statements)
+        second = user_service.get_user(VALID_USER_ADMIN["user_id"])
+
+    assert first is second
+    assert issued == 1 and len(statements) == 1
+
+
+# INT-149/003
+def test_scope_rolls_back_everything_when_request_fails(client, test_db_session):
+    before = _task_count(test_db_session)
+    with pytest.raises(RuntimeError):
+        with request_scope():
+            task_service.add_task(**TASK_CREATE_PAYLOAD_SERVICE)
+            task_service.add_task(**TASK_CREATE_PAYLOAD_SERVICE)
+            raise RuntimeError("route failed")
+
+    assert _task_count(test_db_session) == before
+
+
+# INT-149/004
+def test_failed_service_call_only_undoes_its_own_writes(client, test_db_session):
+    """Each SessionLocal.begin() block is a SAVEPOINT inside the request transaction."""
+    before = _task_count(test_db_session)
+    with request_scope():
+        task = task_service.add_task(**TASK_CREATE_PAYLOAD_SERVICE)
+        with pytest.raises(ValueError, match="not found"):
+            assignment_service.assign_users(task.id, [VALID_USER_ADMIN["user_id"], 999999])
+        assert assignment_service.list_assignees(task.id) == []
+
+    assert _task_count(test_db_session) == before + 1
+
+
+# INT-149/005
+def test_outside_a_request_each_call_gets_its_own_session(client):
+    with task_service.SessionLocal() as first, task_service.SessionLocal() as second:
+        assert first is not second
+
+
+# INT-149/006
+def test_request_commits_on_the_threadpool_before_responding(client, task_base_path, test_db_session):
+    """The unit of work's commit is not run on the event loop, and it is done when the response arrives."""
+    commits = []
+
+    def _after_commit(session):
+        try:
+            asyncio.get_running_loop()
+            commits.append("event loop")
+        except RuntimeError:
+            commits.append("threadpool")
+
+    event.listen(Session, "after_commit", _after_commit)
+    try:
+        resp = client.post(f"{task_base_path}/", json=serialize_payload(TASK_CREATE_PAYLOAD))
+    finally:
+        event.remove(Session, "after_commit", _after_commit)
+
+    assert resp.status_code == 201, resp.text
+    assert "threadpool" in commits and "event loop" not in commits
+    assert test_db_session.get(Task, resp.json()["id"]) is not None
@@ -180,7 +180,7 @@ def test_unassign_users_logger_info_failure_raises(isolated_test_db, seed_users_
 def test_assign_users_no_emails_no_notify_integration(isolated_test_db, seed_users_and_task):
     _, handler, m_notif = isolated_test_db
     m_notif.notify_activity.reset_mock()
-    with patch("backend.src.handlers.task_assignment_handler.user_service.get_user", side_effect=lambda uid: MagicMock(email=None)):
+    with patch("backend.src.handlers.task_assignment_handler.user_service.get_users_by_ids", side_effect=lambda ids: {uid: MagicMock(email=None) for uid in ids}):
         created = handler.assign_users(seed_users_and_task["task_id"], seed_users_and_task["user_ids"]) 
         assert created == 2
         m_notif.notify_activity.assert_not_called()
@@ -207,13 +207,12 @@ def test_assign_users_get_user_missing_email_skips_but_still_notifies_if_any(iso
     m_notif.notify_activity.reset_mock()
     with patch("backend.src.handlers.task_assignment_handler.assignment_service.list_assignees") as m_list, \
          patch("backend.src.handlers.task_assignment_handler.assignment_service.assign_users", return_value=2), \
-         patch("backend.src.handlers.task_assignment_handler.user_service.get_user") as m_get_user:
+         patch("backend.src.handlers.task_assignment_handler.user_service.get_users_by_ids") as m_get_users:
         m_list.side_effect = [[], [MagicMock(user_id=USER_ADMIN_ID), MagicMock(user_id=USER_EMPLOYEE_ID)]]
-        def _fake_get(uid):
-            if uid == USER_ADMIN_ID:
-                return MagicMock(email=None)
-            return MagicMock(email=USER_EMPLOYEE["email"]) 
-        m_get_user.side_effect = _fake_get
+        m_get_users.return_value = {
+            USER_ADMIN_ID: MagicMock(email=None),
+            USER_EMPLOYEE_ID: MagicMock(email=USER_EMPLOYEE["email"]),
+        }
         created = handler.assign_users(task_id=TASK_FOR_ASSIGN_ID, user_ids=USER_IDS_FOR_ASSIGN)
         assert created == 2
     m_notif.notify_activity.assert_called_once()
@@ -226,7 +225,7 @@ def test_unassign_users_after_list_fails_raises(isolated_test_db, seed_users_and
     m_notif.notify_activity.reset_mock()
     with patch("backend.src.handlers.task_assignment_handler.assignment_service.list_assignees") as m_list, \
          patch("backend.src.handlers.task_assignment_handler.assignment_service.unassign_users", return_value=2), \
-         patch("backend.src.handlers.task_assignment_handler.user_service.get_user", return_value=MagicMock(email=USER_EMPLOYEE["email"])):
+         patch("backend.src.handlers.task_assignment_handler.user_service.get_users_by_ids", side_effect=lambda ids: {uid: MagicMock(email=USER_EMPLOYEE["email"]) for uid in ids}):
         m_list.side_effect = [[MagicMock(user_id=USER_ADMIN_ID), MagicMock(user_id=USER_EMPLOYEE_ID)], Exception("after fail")]
         with pytest.raises(Exception):
             handler.unassign_users(task_id=TASK_FOR_ASSIGN_ID, user_ids=USER_IDS_FOR_ASSIGN)
@@ -236,7 +235,7 @@ def test_unassign_users_no_emails_no_notify_integration(isolated_test_db, seed_u
     _, handler, m_notif = isolated_test_db
     handler.assign_users(seed_users_and_task["task_id"], seed_users_and_task["user_ids"]) 
     m_notif.notify_activity.reset_mock()
-    with patch("backend.src.handlers.task_assignment_handler.user_service.get_user", side_effect=lambda uid: MagicMock(email=None)):
+    with patch("backend.src.handlers.task_assignment_handler.user_service.get_users_by_ids", side_effect=lambda ids: {uid: MagicMock(email=None) for uid in ids}):
         deleted = handler.unassign_users(seed_users_and_task["task_id"], seed_users_and_task["user_ids"]) 
         assert deleted == 2
         m_notif.notify_activity.assert_not_called()
@@ -250,7 +249,7 @@ def test_unassign_users_no_diff_fallback_to_ids(isolated_test_db, seed_users_and
     after_list = [MagicMock(user_id=USER_ADMIN_ID), MagicMock(user_id=USER_EMPLOYEE_ID)]
     with patch("backend.src.handlers.task_assignment_handler.assignment_service.list_assignees") as m_list, \
          patch("backend.src.handlers.task_assignment_handler.assignment_service.unassign_users", return_value=2), \
-         patch("backend.src.handlers.task_assignment_handler.user_service.get_user", return_value=MagicMock(email="x@example.com")):
+         patch("backend.src.handlers.task_assignment_handler.user_service.get_users_by_ids", side_effect=lambda ids: {uid: MagicMock(email="x@example.com") for uid in ids}):
         m_list.side_effect = [before_list, after_list]
         deleted = handler.unassign_users(task_id=TASK_FOR_ASSIGN_ID, user_ids=ids)
         assert deleted == 2
@@ -264,7 +263,7 @@ def test_unassign_users_before_list_fails_uses_ids_fallback(isolated_test_db, se
     m_notif.notify_activity.reset_mock()
     with patch("backend.src.handlers.task_assignment_handler.assignment_service.list_assignees") as m_list, \
          patch("backend.src.handlers.task_assignment_handler.assignment_service.unassign_users", return_value=2), \
-         patch("backend.src.handlers.task_assignment_handler.user_service.get_user", return_value=MagicMock(email="y@example.com")):
+         patch("backend.src.handlers.task_assignment_handler.user_service.get_users_by_ids", side_effect=lambda ids: {uid: MagicMock(email="y@example.com") for uid in ids}):
         m_list.side_effect = [Exception("before fail"), []]
         deleted = handler.unassign_users(task_id=TASK_FOR_ASSIGN_ID, user_ids=USER_IDS_FOR_ASSIGN)
         assert deleted == 2
@@ -278,7 +277,7 @@ def test_unassign_users_removed_ids_empty_then_fallback_to_ids(isolated_test_db,
     m_notif.notify_activity.reset_mock()
     with patch("backend.src.handlers.task_assignment_handler.assignment_service.list_assignees") as m_list, \
          patch("backend.src.handlers.task_assignment_handler.assignment_service.unassign_users", return_value=1), \
-         patch("backend.src.handlers.task_assignment_handler.user_service.get_user", return_value=MagicMock(email="z@example.com")):
+         patch("backend.src.handlers.task_assignment_handler.user_service.get_users_by_ids", side_effect=lambda ids: {uid: MagicMock(email="z@example.com") for uid in ids}):
         m_list.side_effect = [[MagicMock(user_id=USER_ADMIN_ID)], [MagicMock(user_id=USER_ADMIN_ID)]]
         deleted = handler.unassign_users(task_id=TASK_FOR_ASSIGN_ID, user_ids=[USER_ADMIN_ID])
         assert deleted == 1
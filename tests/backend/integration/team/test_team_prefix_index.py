@@ -0,0 +1,119 @@
+# tests/backend/integration/team/test_team_prefix_index.py
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, event, insert, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.src.database.db_setup import Base
+from backend.src.database.models.department import Department
+from backend.src.database.models.team import Team
+from backend.src.database.models.user import User
+from backend.src.handlers import department_handler as handler
+from backend.src.services import team as team_service
+from tests.mock_data.team_data import DIRECTOR_USER, MANAGER_USER, STAFF_USER, VALID_DEPARTMENT
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'teams.db'}", echo=False)
+    Base.metadata.create_all(bind=engine)
+    TestSessionLocal = sessionmaker(bind=engine)
+    with TestSessionLocal.begin() as db:
+        db.add_all([User(**STAFF_USER), User(**MANAGER_USER), User(**DIRECTOR_USER)])
+        db.flush()
+        db.add(Department(**{**VALID_DEPARTMENT, "manager_id": MANAGER_USER["user_id"]}))
+
+    with patch('backend.src.services.team.SessionLocal', TestSessionLocal), \
+         patch('backend.src.services.department.SessionLocal', TestSessionLocal), \
+         patch('backend.src.services.user.SessionLocal', TestSessionLocal):
+        yield engine
+    engine.dispose()
+
+
+def _prefixes(engine) -> dict:
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT team_number, department_prefix, team_prefix FROM team"))
+        return {number: (dept, team) for number, dept, team in rows}
+
+
+def _query_plans(engine, fn) -> list[str]:
+    """Run fn and return SQLite's plan for every SELECT on team it issued."""
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM team" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    with engine.connect() as conn:
+        return [
+            " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params))
+            for sql, params in captured
+        ]
+
+
+# INT-152/001
+def test_create_team_maintains_prefixes(engine):
+    team = handler.create_team_under_department(VALID_DEPARTMENT["department_id"], "Team", MANAGER_USER["user_id"])
+    sub = handler.create_team_under_team(team["team_id"], "Sub", MANAGER_USER["user_id"])
+
+    assert _prefixes(engine) == {
+        team["team_number"]: ("01", team["team_number"][:4]),
+        sub["team_number"]: ("01", team["team_number"][:4]),
+    }
+
+
+# INT-152/002
+def test_core_inserts_fill_prefixes_from_team_number(engine):
+    with engine.begin() as conn:
+        conn.execute(insert(Team), [
+            {"team_name": "A", "manager_id": 2, "department_id": 1, "team_number": "010300"},
+            {"team_name": "B", "manager_id": 2, "department_id": 1, "team_number": "010301"},
+        ])
+
+    assert _prefixes(engine) == {"010300": ("01", "0103"), "010301": ("01", "0103")}
+    assert [t["team_number"] for t in team_service.get_subteam_by_team_number("010300")] == ["010301"]
+
+
+# INT-152/003
+def test_hierarchy_lookups_use_prefix_indexes(engine):
+    team = handler.create_team_under_department(VALID_DEPARTMENT["department_id"], "Team", MANAGER_USER["user_id"])
+    handler.create_team_under_team(team["team_id"], "Sub", MANAGER_USER["user_id"])
+
+    plans = _query_plans(engine, lambda: (
+        team_service.get_teams_by_department(VALID_DEPARTMENT["department_id"]),
+        team_service.get_subteam_by_team_number(team["team_number"]),
+        team_service.get_teams_by_prefixes([team["team_number"][:4]]),
+    ))
+
+    assert len(plans) == 3
+    assert "ix_team_department_prefix" in plans[0]
+    assert all("ix_team_team_prefix" in plan for plan in plans[1:])
+    assert not any("SCAN team" in plan for plan in plans)
+
+
+# INT-152/004
+def test_backfill_adds_and_fills_prefix_columns(engine):
+    """A team table from before the prefix columns gets them added, filled and indexed."""
+    from backend.src.init_scripts.backfill_team_prefixes import add_missing_prefix_columns
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_team_department_prefix"))
+        conn.execute(text("DROP INDEX ix_team_team_prefix"))
+        conn.execute(text("ALTER TABLE team DROP COLUMN department_prefix"))
+        conn.execute(text("ALTER TABLE team DROP COLUMN team_prefix"))
+        conn.execute(text(
+            "INSERT INTO team (team_name, manager_id, department_id, team_number) "
+            "VALUES ('Legacy', 2, 1, '020500'), ('Legacy sub', 2, 1, '020501')"
+        ))
+
+    assert add_missing_prefix_columns(engine) == ["department_prefix", "team_prefix"]
+    assert add_missing_prefix_columns(engine) == []
+    assert team_service.backfill_team_prefixes() == 2
+    assert _prefixes(engine) == {"020500": ("02", "0205"), "020501": ("02", "0205")}
+    assert {c["name"] for c in inspect(engine).get_columns("team")} >= {"department_prefix", "team_prefix"}
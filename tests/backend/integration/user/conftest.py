@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event, delete, text
+from sqlalchemy import delete
 from sqlalchemy.orm import sessionmaker
 
 import backend.src.services.user as svc
-from backend.src.database.db_setup import Base
+from tests.db_backend import make_test_engine, drop_schema
+from backend.src.database.db_setup import Base, RequestScopedSessionmaker
 from backend.src.database.models.user import User
 # from backend.src.database.models.team import Team  # when needed for FK
 from backend.src.main import app
@@ -16,32 +17,16 @@ from backend.src.main import app
 @pytest.fixture(scope="session")
 def test_engine(tmp_path_factory):
     """
-    Session-scoped file-backed SQLite engine with FK support.
+    Session-scoped engine (SQLite file with FK support, or TEST_DATABASE_URL).
     Creates schema once, drops at the end.
     """
     db_file = tmp_path_factory.mktemp("kira_integration") / "itest.db"
-    engine = create_engine(
-        f"sqlite:///{db_file}",
-        connect_args={"check_same_thread": False},
-        future=True,
-    )
-
-    @event.listens_for(engine, "connect")
-    def _fk_on(dbapi_connection, connection_record):  # pragma: no cover
-        cur = dbapi_connection.cursor()
-        cur.execute("PRAGMA foreign_keys=ON")
-        cur.close()
-
-    Base.metadata.create_all(bind=engine)
+    engine = make_test_engine(db_file)
     try:
         yield engine
     finally:
-        # Teardown: disable FK checks before dropping tables to avoid circular dependency issues
         try:
-            with engine.connect() as conn:
-                conn.execute(text("PRAGMA foreign_keys=OFF"))
-                Base.metadata.drop_all(bind=conn)
-                conn.execute(text("PRAGMA foreign_keys=ON"))
+            drop_schema(engine)
         finally:
             engine.dispose()
 
@@ -52,13 +37,13 @@ def client(test_engine):
     FastAPI TestClient wired to the test DB via SessionLocal override.
     expire_on_commit=False to avoid DetachedInstanceError across requests.
     """
-    TestingSessionLocal = sessionmaker(
+    TestingSessionLocal = RequestScopedSessionmaker(sessionmaker(
         bind=test_engine,
         autoflush=False,
         autocommit=False,
         expire_on_commit=False,
         future=True,
-    )
+    ))
     # Point the service layer to the test DB
     svc.SessionLocal = TestingSessionLocal
 
@@ -12,6 +12,7 @@ import backend.src.services.task as svc
 from backend.src.database.db_setup import Base
 from backend.src.database.models.task import Task
 from backend.src.database.models.parent_assignment import ParentAssignment
+from backend.src.database.models.task_closure import TaskClosure
 
 
 @pytest.fixture(scope="session")
@@ -74,6 +75,7 @@ def clean_db(test_engine):
     """
     TestingSession = sessionmaker(bind=test_engine, future=True)
     with TestingSession.begin() as s:
+        s.execute(delete(TaskClosure))
         s.execute(delete(ParentAssignment))
         s.execute(delete(Task))
     yield
@@ -0,0 +1,86 @@
+# tests/backend/unit/database/test_query_stats.py
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from backend.src.api.middleware import QueryStatsMiddleware
+from backend.src.database.query_stats import statement_shape, track_queries
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def _app(engine, threshold: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, n_plus_one_threshold=threshold)
+
+    @app.get("/loop/{n}")
+    def loop(n: int):
+        with engine.connect() as conn:
+            for i in range(n):
+                conn.execute(text("SELECT :i"), {"i": i})
+        return {"ok": True}
+
+    return app
+
+
+# UNI-150/001
+@pytest.mark.parametrize("sql, shape", [
+    ("SELECT *\n  FROM task\n WHERE id = ?", "SELECT * FROM task WHERE id = ?"),
+    ("SELECT * FROM task WHERE id IN (?, ?, ?)", "SELECT * FROM task WHERE id IN (?)"),
+    ("SELECT * FROM task WHERE id IN (%(id_1_1)s, %(id_1_2)s)", "SELECT * FROM task WHERE id IN (?)"),
+    ("SELECT * FROM task WHERE id IN (?)", "SELECT * FROM task WHERE id IN (?)"),
+])
+def test_statement_shape(sql, shape):
+    assert statement_shape(sql) == shape
+
+
+# UNI-150/002
+def test_track_queries_counts_statements_and_shapes(engine):
+    with track_queries() as stats:
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT :i"), {"i": i})
+            conn.execute(text("SELECT 1 + 1"))
+
+    assert stats.count == 4
+    assert stats.total_seconds > 0
+    assert stats.repeated(2) == [("SELECT ?", 3)]
+
+
+# UNI-150/003
+def test_nothing_counted_outside_track_queries(engine):
+    with track_queries() as stats:
+        pass
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert stats.count == 0
+
+
+# UNI-150/004
+def test_middleware_sets_headers(engine):
+    resp = TestClient(_app(engine, threshold=10)).get("/loop/4")
+
+    assert resp.headers["X-DB-Queries"] == "4"
+    assert resp.headers["Server-Timing"].startswith("db;dur=")
+    assert resp.headers["Server-Timing"].endswith('desc="4 queries"')
+
+
+# UNI-150/005
+@pytest.mark.parametrize("n, warned", [(3, False), (4, True)])
+def test_middleware_warns_on_repeated_statement(engine, caplog, n, warned):
+    with caplog.at_level(logging.WARNING, logger="backend.src.api.middleware"):
+        TestClient(_app(engine, threshold=3)).get(f"/loop/{n}")
+
+    messages = [r.getMessage() for r in caplog.records if "Possible N+1" in r.getMessage()]
+    assert bool(messages) is warned
+    if warned:
+        assert f"ran {n} times in GET /loop/{n}: SELECT ?" in messages[0]
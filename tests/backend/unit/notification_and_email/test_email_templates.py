@@ -1,7 +1,9 @@
 import pytest
-from jinja2 import Template
+from unittest.mock import patch
+from jinja2 import Environment, Template
 
-from backend.src.templates.email_templates import EmailTemplates
+from backend.src.templates import email_templates
+from backend.src.templates.email_templates import EmailTemplates, TEMPLATE_NAMES
 
 
 class TestEmailTemplates:
@@ -154,4 +156,63 @@ class TestEmailTemplatesEdgeCases:
         
         rendered_html = html_template.render(**render_data_performance)
         assert 'Performance Test Task' in rendered_html
-        assert len(rendered_html) > 1000
\ No newline at end of file
+        assert len(rendered_html) > 1000
+
+class TestCompiledEmailTemplates:
+
+    @pytest.fixture(autouse=True)
+    def fresh_template_cache(self, monkeypatch):
+        def reset():
+            email_templates.get_environment.cache_clear()
+            email_templates._compiled_templates.cache_clear()
+            email_templates._compile_string.cache_clear()
+
+        monkeypatch.delenv("EMAIL_TEMPLATE_CACHE_DIR", raising=False)
+        reset()
+        yield reset
+        reset()
+
+    # UNI-163/001
+    @pytest.mark.parametrize("name", TEMPLATE_NAMES)
+    def test_render_by_type_matches_per_call_template(self, name, render_data_basic):
+        sources = EmailTemplates.get_template_by_type(name)
+
+        text, html = EmailTemplates.render_by_type(name, render_data_basic)
+
+        assert text == Template(sources["text"]).render(**render_data_basic)
+        assert html == Template(sources["html"]).render(**render_data_basic)
+
+    # UNI-163/002
+    def test_named_templates_compiled_once_per_process(self, render_data_basic):
+        EmailTemplates.render_by_type("task_updated", render_data_basic)
+        compiled = email_templates._compiled_templates()
+
+        with patch.object(Environment, "compile", side_effect=AssertionError("recompiled")):
+            for name in TEMPLATE_NAMES * 3:
+                EmailTemplates.render_by_type(name, render_data_basic)
+
+        assert email_templates._compiled_templates() is compiled
+        assert set(compiled) == set(TEMPLATE_NAMES)
+
+    # UNI-163/003
+    def test_unknown_type_renders_fallback(self):
+        text, html = EmailTemplates.render_by_type("no_such_template", {"message": "Hello"})
+
+        assert (text, html) == ("Hello", "<p>Hello</p>")
+
+    # UNI-163/004
+    def test_render_template_reuses_compiled_string(self):
+        assert EmailTemplates.render_template("Hi {{ name }}", {"name": "Ann"}) == "Hi Ann"
+        assert EmailTemplates.render_template("Hi {{ name }}", {"name": "Bob"}) == "Hi Bob"
+
+        assert email_templates._compile_string.cache_info().hits == 1
+
+    # UNI-163/005
+    def test_bytecode_cache_dir_skips_compile_in_new_environment(self, fresh_template_cache, monkeypatch, tmp_path, render_data_basic):
+        monkeypatch.setenv("EMAIL_TEMPLATE_CACHE_DIR", str(tmp_path))
+        expected = EmailTemplates.render_by_type("task_updated", render_data_basic)
+        assert len(list(tmp_path.iterdir())) == 2 * len(TEMPLATE_NAMES)
+
+        fresh_template_cache()
+        with patch.object(Environment, "compile", side_effect=AssertionError("recompiled")):
+            assert EmailTemplates.render_by_type("task_updated", render_data_basic) == expected
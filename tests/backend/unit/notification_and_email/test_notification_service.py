@@ -28,7 +28,7 @@ class TestNotificationService:
     # UNI-124/045
     def test_notify_task_updated_success(self, notification_service, mock_email_service, notification_valid_update):
         expected_response = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
-        mock_email_service.send_email.return_value = expected_response
+        mock_email_service.queue_email.return_value = expected_response
 
         result = notification_service.notify_task_updated(
             task_id=notification_valid_update["task_id"],
@@ -38,7 +38,7 @@ class TestNotificationService:
             new_values=notification_valid_update.get("new_values"),
         )
 
-        assert mock_email_service.send_email.call_count == 1
+        assert mock_email_service.queue_email.call_count == 1
         assert result.success is True
         assert result.message == "Email sent successfully"
         assert result.recipients_count == 1
@@ -46,7 +46,7 @@ class TestNotificationService:
     # UNI-124/046
     def test_notify_task_updated_email_failure(self, notification_service, mock_email_service, notification_minimal_update):
         expected_response = EmailResponse(success=False, message="SMTP connection failed", recipients_count=0)
-        mock_email_service.send_email.return_value = expected_response
+        mock_email_service.queue_email.return_value = expected_response
 
         result = notification_service.notify_task_updated(
             task_id=notification_minimal_update["task_id"],
@@ -61,7 +61,7 @@ class TestNotificationService:
     # UNI-124/047
     def test_notify_task_updated_with_minimal_data(self, notification_service, mock_email_service, notification_minimal_update):
         expected_response = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
-        mock_email_service.send_email.return_value = expected_response
+        mock_email_service.queue_email.return_value = expected_response
 
         result = notification_service.notify_task_updated(
             task_id=notification_minimal_update["task_id"],
@@ -69,12 +69,12 @@ class TestNotificationService:
             updated_fields=notification_minimal_update["updated_fields"],
         )
 
-        assert mock_email_service.send_email.call_count == 1
+        assert mock_email_service.queue_email.call_count == 1
         assert result.success is True
 
     # UNI-124/048
     def test_notify_task_updated_exception_handling(self, notification_service, mock_email_service, notification_single_field_update):
-        mock_email_service.send_email.side_effect = Exception("Unexpected error")
+        mock_email_service.queue_email.side_effect = Exception("Unexpected error")
 
         result = notification_service.notify_task_updated(
             task_id=notification_single_field_update["task_id"],
@@ -89,7 +89,7 @@ class TestNotificationService:
     # UNI-124/049
     def test_notify_task_updated_with_all_parameters(self, notification_service, mock_email_service, notification_multiple_fields_update):
         expected_response = EmailResponse(success=True, message="Email sent successfully", recipients_count=2)
-        mock_email_service.send_email.return_value = expected_response
+        mock_email_service.queue_email.return_value = expected_response
 
         result = notification_service.notify_task_updated(
             task_id=notification_multiple_fields_update["task_id"],
@@ -99,7 +99,7 @@ class TestNotificationService:
             new_values=notification_multiple_fields_update["new_values"],
         )
 
-        assert mock_email_service.send_email.call_count == 1
+        assert mock_email_service.queue_email.call_count == 1
         assert result.success is True
         assert result.recipients_count == 2
 
@@ -113,7 +113,7 @@ class TestNotificationService:
     @patch('backend.src.services.notification.logger')
     # UNI-124/051
     def test_logging_on_success(self, mock_logger, notification_service, mock_email_service, notification_minimal_update):
-        mock_email_service.send_email.return_value = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
+        mock_email_service.queue_email.return_value = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
 
         notification_service.notify_task_updated(
             task_id=notification_minimal_update["task_id"],
@@ -128,7 +128,7 @@ class TestNotificationService:
     @patch('backend.src.services.notification.logger')
     # UNI-124/052
     def test_logging_on_email_failure(self, mock_logger, notification_service, mock_email_service, notification_minimal_update):
-        mock_email_service.send_email.return_value = EmailResponse(success=False, message="SMTP error", recipients_count=0)
+        mock_email_service.queue_email.return_value = EmailResponse(success=False, message="SMTP error", recipients_count=0)
 
         notification_service.notify_task_updated(
             task_id=notification_minimal_update["task_id"],
@@ -142,7 +142,7 @@ class TestNotificationService:
     @patch('backend.src.services.notification.logger')
     # UNI-124/053
     def test_logging_on_exception(self, mock_logger, notification_service, mock_email_service, notification_minimal_update):
-        mock_email_service.send_email.side_effect = Exception("Test exception")
+        mock_email_service.queue_email.side_effect = Exception("Test exception")
 
         notification_service.notify_task_updated(
             task_id=notification_minimal_update["task_id"],
@@ -155,7 +155,7 @@ class TestNotificationService:
     @patch('backend.src.services.notification.logger')
     # UNI-124/054
     def test_notify_activity_success_logs(self, mock_logger, mock_email_service, notify_activity_success_params):
-        mock_email_service.send_email.return_value = EmailResponse(success=True, message="ok", recipients_count=1)
+        mock_email_service.queue_email.return_value = EmailResponse(success=True, message="ok", recipients_count=1)
         with patch('backend.src.services.notification.get_email_service', return_value=mock_email_service):
             svc = NotificationService()
             resp = svc.notify_activity(**notify_activity_success_params)
@@ -171,7 +171,7 @@ class TestNotificationService:
     @patch('backend.src.services.notification.logger')
     # UNI-124/055
     def test_notify_activity_failure_logs(self, mock_logger, mock_email_service, notify_activity_failure_params):
-        mock_email_service.send_email.return_value = EmailResponse(success=False, message="Boom", recipients_count=1)
+        mock_email_service.queue_email.return_value = EmailResponse(success=False, message="Boom", recipients_count=1)
         with patch('backend.src.services.notification.get_email_service', return_value=mock_email_service):
             svc = NotificationService()
             resp = svc.notify_activity(**notify_activity_failure_params)
@@ -189,7 +189,7 @@ class TestNotificationService:
             resp = svc.notify_activity(**notify_activity_no_recipients_params)
             assert resp.success is True
             assert resp.message == "No recipients configured for notifications"
-            mock_email_service.send_email.assert_not_called()
+            mock_email_service.queue_email.assert_not_called()
 
     # UNI-124/057
     def test_notify_activity_invalid_type_returns_failure(self, mock_email_service, notify_activity_invalid_type_params):
@@ -210,7 +210,7 @@ class TestNotificationService:
     # UNI-124/059
     def test_notify_activity_comment_with_user_success(self, mock_email_service, notify_activity_comment_with_user_params):
         """Covers comment_ path with provided comment_user to avoid validation error."""
-        mock_email_service.send_email.return_value = EmailResponse(success=True, message="ok", recipients_count=1)
+        mock_email_service.queue_email.return_value = EmailResponse(success=True, message="ok", recipients_count=1)
         mock_email_service._get_task_notification_recipients.return_value = [EmailRecipient(email="r@example.com")]
         with patch('backend.src.services.notification.get_email_service', return_value=mock_email_service):
             svc = NotificationService()
@@ -238,7 +238,7 @@ class TestNotificationServiceEdgeCases:
     # UNI-124/061
     def test_notify_task_updated_empty_updated_fields(self, notification_empty_updated_fields):
         mock_email_service = Mock()
-        mock_email_service.send_email.return_value = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
+        mock_email_service.queue_email.return_value = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
         mock_email_service._get_task_notification_recipients.return_value = [
             EmailRecipient(email="unit+test@example.com", name="Unit Test")
         ]
@@ -250,13 +250,13 @@ class TestNotificationServiceEdgeCases:
                 task_title=notification_empty_updated_fields["task_title"],
                 updated_fields=notification_empty_updated_fields["updated_fields"],
             )
-            mock_email_service.send_email.assert_called_once()
+            mock_email_service.queue_email.assert_called_once()
             assert result.success is True
 
     # UNI-124/062
     def test_notify_task_updated_with_none_values(self, notification_null_values):
         mock_email_service = Mock()
-        mock_email_service.send_email.return_value = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
+        mock_email_service.queue_email.return_value = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
         mock_email_service._get_task_notification_recipients.return_value = [
             EmailRecipient(email="unit+test@example.com", name="Unit Test")
         ]
@@ -270,7 +270,7 @@ class TestNotificationServiceEdgeCases:
                 previous_values=notification_null_values.get("previous_values"),
                 new_values=notification_null_values.get("new_values"),
             )
-            assert mock_email_service.send_email.call_count == 1
+            assert mock_email_service.queue_email.call_count == 1
             assert result.success is True
 
     # UNI-124/063
@@ -282,7 +282,7 @@ class TestNotificationServiceEdgeCases:
     # UNI-124/064
     def test_notify_task_updated_large_data(self, notification_large_update):
         mock_email_service = Mock()
-        mock_email_service.send_email.return_value = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
+        mock_email_service.queue_email.return_value = EmailResponse(success=True, message="Email sent successfully", recipients_count=1)
         mock_email_service._get_task_notification_recipients.return_value = [
             EmailRecipient(email="unit+test@example.com", name="Unit Test")
         ]
@@ -296,7 +296,7 @@ class TestNotificationServiceEdgeCases:
                 previous_values=notification_large_update["previous_values"],
                 new_values=notification_large_update["new_values"],
             )
-            mock_email_service.send_email.assert_called_once()
+            mock_email_service.queue_email.assert_called_once()
             assert result.success is True
 
     # UNI-124/065
@@ -0,0 +1,39 @@
+"""
+Unit tests for lazy loading of the report renderers.
+Each check runs in a fresh interpreter, since this one has them loaded already.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks.bench_import_time import ENTRY_MODULE, LAZY_MODULES
+
+pytestmark = pytest.mark.unit
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+
+def _loaded_after(code: str) -> set:
+    """Top-level LAZY_MODULES packages in sys.modules after running `code` in a fresh interpreter."""
+    probe = f"{code}\nimport sys\nprint(' '.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", probe],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, check=True,
+    )
+    return set(proc.stdout.split()) & set(LAZY_MODULES)
+
+
+#UNI-160/001
+def test_api_startup_does_not_import_renderers():
+    assert _loaded_after(f"import {ENTRY_MODULE}") == set()
+
+
+#UNI-160/002
+def test_renderer_loads_on_first_use_only():
+    code = (
+        "from backend.src.services import report as report_service\n"
+        "report_service.generate_excel_report({'project_name': 'Lazy'}, [], {})"
+    )
+    assert _loaded_after(code) == {"openpyxl"}
@@ -243,3 +243,104 @@ class TestGenerateExcelReport:
             assert col_width >= 10, f"Column {col_letter} should have minimum width"
             assert col_width <= 50, f"Column {col_letter} should have maximum width"
 
+
+
+class TestStreamingExcelReport:
+    #UNI-154/001
+    def test_generate_excel_report_writes_into_given_file(self):
+        import tempfile
+        from openpyxl import load_workbook
+
+        tasks = dicts_to_objects(MOCK_TASKS_ALL_STATUSES)
+        with tempfile.SpooledTemporaryFile(max_size=1024) as out:
+            returned = report_service.generate_excel_report(MOCK_PROJECT, iter(tasks), MOCK_TASK_ASSIGNEES, out=out)
+
+            assert returned is out
+            assert out.tell() == 0
+            ws = load_workbook(out)[EXPECTED_REPORT_SHEET_NAME]
+
+        assert ws["A12"].value == "PROJECTED TASKS"
+        assert [c.value for c in ws[13]] == report_service.EXCEL_HEADERS
+        assert ws["A14"].value == MOCK_TASKS_ALL_STATUSES[0]["id"]
+        assert ws["A14"].fill.fgColor.rgb.endswith("F5F5F5")
+        assert ws["A14"].border.left.style == "thin"
+        assert {str(r) for r in ws.merged_cells.ranges} >= {"A1:H1", "B2:H2", "A4:H4", "A12:H12", "A16:H16"}
+
+    #UNI-154/002
+    def test_generate_excel_report_column_widths_fit_content(self):
+        from openpyxl import load_workbook
+
+        tasks = dicts_to_objects(MOCK_TASKS_ALL_STATUSES + [MOCK_TASK_LONG_TITLE])
+        ws = load_workbook(report_service.generate_excel_report(MOCK_PROJECT, tasks, MOCK_TASK_ASSIGNEES))[EXPECTED_REPORT_SHEET_NAME]
+
+        assert ws.column_dimensions["A"].width == len("Project Schedule Report") + 2
+        assert ws.column_dimensions["B"].width == report_service.EXCEL_MAX_WIDTH
+        assert ws.column_dimensions["D"].width == report_service.EXCEL_MIN_WIDTH
+
+    #UNI-154/003
+    def test_generate_excel_report_memory_does_not_grow_with_rows(self):
+        import tempfile
+        import tracemalloc
+
+        def peak_bytes(n: int) -> int:
+            tasks = [
+                SimpleNamespace(**{**MOCK_TASKS_ALL_STATUSES[i % 4], "id": i}) for i in range(n)
+            ]
+            tracemalloc.start()
+            with tempfile.SpooledTemporaryFile(max_size=64 * 1024) as out:
+                report_service.generate_excel_report(MOCK_PROJECT, tasks, {}, out=out)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        small, large = peak_bytes(200), peak_bytes(2000)
+        assert large < small * 2
+
+
+class TestPortfolioReport:
+    PROJECTS = [
+        {"project_id": 1, "project_name": "Alpha"},
+        {"project_id": 2, "project_name": "Q3: launch/ops [EU]"},
+        {"project_id": 3, "project_name": "Alpha"},
+    ]
+
+    #UNI-158/001
+    def test_portfolio_workbook_has_overview_and_one_sheet_per_project(self):
+        from openpyxl import load_workbook
+
+        tasks = dicts_to_objects(MOCK_TASKS_ALL_STATUSES)
+        tasks_by_project = {1: tasks, 2: tasks[:1], 3: []}
+        wb = load_workbook(report_service.generate_portfolio_excel_report(self.PROJECTS, tasks_by_project, MOCK_TASK_ASSIGNEES))
+
+        assert wb.sheetnames == ["Portfolio", "Alpha", "Q3 launch ops EU", "Alpha (3)"]
+        overview = wb["Portfolio"]
+        assert [c.value for c in overview[3]] == report_service.PORTFOLIO_HEADERS
+        assert [c.value for c in overview[4]][:3] == [1, "Alpha", len(tasks)]
+        assert [c.value for c in overview[6]][:3] == [3, "Alpha", 0]
+        assert wb["Alpha"]["B2"].value == "Alpha"
+        assert wb["Alpha"]["A14"].value == MOCK_TASKS_ALL_STATUSES[0]["id"]
+
+    #UNI-158/002
+    def test_sheet_titles_are_valid_and_unique(self):
+        used = set()
+        long_name = {"project_id": 12, "project_name": "x" * 40}
+        titles = [report_service._sheet_title(p, used) for p in [long_name, long_name, {"project_id": 5, "project_name": "///"}]]
+
+        assert titles == ["x" * 31, "x" * 26 + " (12)", "Project"]
+        assert all(len(t) <= 31 for t in titles)
+        with pytest.raises(ValueError, match="At least one project"):
+            report_service.generate_portfolio_excel_report([], {}, {})
+
+    #UNI-158/003
+    def test_merge_pdf_reports_concatenates_sections_with_bookmarks(self):
+        from pypdf import PdfReader
+
+        tasks = dicts_to_objects(MOCK_TASKS_ALL_STATUSES)
+        parts = [
+            report_service.generate_pdf_report({"project_name": name}, tasks, MOCK_TASK_ASSIGNEES).getvalue()
+            for name in ("Alpha", "Beta")
+        ]
+        merged = PdfReader(report_service.merge_pdf_reports(zip(["Alpha", "Beta"], parts)))
+
+        assert len(merged.pages) == sum(len(PdfReader(BytesIO(p)).pages) for p in parts)
+        assert [item.title for item in merged.outline] == ["Alpha", "Beta"]
@@ -62,33 +62,30 @@ def test_no_teams_returns_empty(mock_user_service, mock_team_service):
 @patch("backend.src.handlers.task_assignment_handler.assignment_service")
 @patch("backend.src.handlers.task_assignment_handler.team_service")
 @patch("backend.src.handlers.task_assignment_handler.user_service")
-def test_aggregates_tasks_by_team_and_subteam(mock_user_service, mock_team_service, mock_assignment_service):
+def test_manager_aggregates_tasks_by_team_and_subteam(mock_user_service, mock_team_service, mock_assignment_service):
     mock_user = MagicMock()
     mock_user.role = VALID_USER_ADMIN["role"]
     mock_user_service.get_user.return_value = mock_user
 
-    teams = [VALID_TEAM]
-    subteams = [VALID_SUBTEAM]
-    mock_team_service.get_team_by_manager.return_value = teams
-
-    mock_team_service.get_users_in_team.side_effect = (
-        lambda tid: [{"user_id": VALID_USER_ADMIN["user_id"]}] if tid == VALID_TEAM["team_id"] else [{"user_id": VALID_USER["user_id"]}]
-    )
-    mock_team_service.get_subteam_by_team_number.side_effect = (
-        lambda num: subteams if num == VALID_TEAM[f"{VALID_TEAM['team_number']}-{VALID_TEAM['team_name']}"] else []
-    )
-
-    user_tasks = {
-        VALID_USER_ADMIN["user_id"]: [VALID_DEFAULT_TASK, VALID_TASK_EXPLICIT_PRIORITY],
-        VALID_USER["user_id"]: [VALID_TASK_FULL, VALID_TASK_EXPLICIT_PRIORITY],
+    mock_team_service.get_team_by_manager.return_value = [VALID_TEAM]
+    mock_team_service.get_teams_by_prefixes.return_value = [VALID_TEAM, VALID_SUBTEAM]
+    mock_assignment_service.list_tasks_for_teams.return_value = {
+        VALID_TEAM["team_id"]: [VALID_DEFAULT_TASK, VALID_TASK_EXPLICIT_PRIORITY],
+        VALID_SUBTEAM["team_id"]: [VALID_TASK_FULL, VALID_TASK_EXPLICIT_PRIORITY],
     }
-    mock_assignment_service.list_tasks_for_user.side_effect = (
-        lambda uid: user_tasks.get(uid, [])
-    )
 
     result = handler.list_tasks_by_manager(VALID_USER_ADMIN["user_id"])
-    assert set(result.keys()) == {f"{VALID_TEAM['team_number']}-{VALID_SUBTEAM['team_number']}"}
-    assert result[f"{VALID_TEAM['team_number']}-{VALID_SUBTEAM['team_number']}"] == [VALID_DEFAULT_TASK, VALID_TASK_EXPLICIT_PRIORITY]
+
+    # One lookup for all teams and one for all their tasks, not one per team / member
+    mock_team_service.get_teams_by_prefixes.assert_called_once()
+    assert list(mock_team_service.get_teams_by_prefixes.call_args.args[0]) == [VALID_TEAM["team_number"][:4]]
+    mock_assignment_service.list_tasks_for_teams.assert_called_once()
+    assert list(mock_assignment_service.list_tasks_for_teams.call_args.args[0]) == [VALID_TEAM["team_id"], VALID_SUBTEAM["team_id"]]
+    assert list(result.keys()) == [
+        f"{VALID_TEAM['team_number']}-{VALID_TEAM['team_name']}",
+        f"{VALID_SUBTEAM['team_number']}-{VALID_SUBTEAM['team_name']}",
+    ]
+    assert result[f"{VALID_TEAM['team_number']}-{VALID_TEAM['team_name']}"] == [VALID_DEFAULT_TASK, VALID_TASK_EXPLICIT_PRIORITY]
     assert result[f"{VALID_SUBTEAM['team_number']}-{VALID_SUBTEAM['team_name']}"] == [VALID_TASK_FULL, VALID_TASK_EXPLICIT_PRIORITY]
 
 
@@ -148,39 +145,26 @@ def test_no_teams_returns_empty(mock_user_service, mock_department_service, mock
 @patch("backend.src.handlers.task_assignment_handler.team_service")
 @patch("backend.src.handlers.task_assignment_handler.department_service")
 @patch("backend.src.handlers.task_assignment_handler.user_service")
-def test_aggregates_tasks_by_team_and_subteam(mock_user_service, mock_department_service, mock_team_service, mock_assignment_service):
+def test_director_aggregates_tasks_by_team_and_subteam(mock_user_service, mock_department_service, mock_team_service, mock_assignment_service):
     mock_user = MagicMock()
     mock_user.role = VALID_USER_DIRECTOR["role"]
     mock_user_service.get_user.return_value = mock_user
-    mock_department_service.get_department_by_director.return_value = {
-        "department_id": VALID_USER_DIRECTOR["department_id"]
-    }
-
-    teams = [VALID_TEAM]
-    subteams = [VALID_SUBTEAM]
-    mock_team_service.get_teams_by_department.return_value = teams
-
-    mock_team_service.get_users_in_team.side_effect = (
-        lambda tid: [{"user_id": VALID_USER_ADMIN["user_id"]}] if tid == VALID_TEAM["team_id"] else [{"user_id": VALID_USER["user_id"]}]
-    )
-    mock_team_service.get_subteam_by_team_number.side_effect = (
-        lambda num: subteams if num == VALID_TEAM["team_number"] else []
-    )
     mock_department_service.get_department_by_director.return_value = {
         "department_name": VALID_DEPARTMENT["department_name"],
         "department_id": VALID_DEPARTMENT["department_id"],
         "manager_id": VALID_DEPARTMENT["manager_id"],
     }
-
-    user_tasks = {
-        VALID_USER_ADMIN["user_id"]: [VALID_DEFAULT_TASK, VALID_TASK_EXPLICIT_PRIORITY],
-        VALID_USER["user_id"]: [VALID_TASK_FULL, VALID_TASK_EXPLICIT_PRIORITY],
+    mock_team_service.get_teams_by_department.return_value = [VALID_TEAM, VALID_SUBTEAM]
+    mock_assignment_service.list_tasks_for_teams.return_value = {
+        VALID_TEAM["team_id"]: [VALID_DEFAULT_TASK, VALID_TASK_EXPLICIT_PRIORITY],
     }
-    mock_assignment_service.list_tasks_for_user.side_effect = (
-        lambda uid: user_tasks.get(uid, [])
-    )
 
     result = handler.list_tasks_by_director(VALID_USER_DIRECTOR["user_id"])
-    assert set(result.keys()) == {f"{VALID_TEAM['team_number']}-{VALID_TEAM['team_name']}-{VALID_DEPARTMENT['department_name']}", f"{VALID_SUBTEAM['team_number']}-{VALID_SUBTEAM['team_name']}-{VALID_DEPARTMENT['department_name']}"}
-    assert result[f"{VALID_TEAM['team_number']}-{VALID_TEAM['team_name']}-{VALID_DEPARTMENT['department_name']}"] == [VALID_DEFAULT_TASK, VALID_TASK_EXPLICIT_PRIORITY]
-    assert result[f"{VALID_SUBTEAM['team_number']}-{VALID_SUBTEAM['team_name']}-{VALID_DEPARTMENT['department_name']}"] == [VALID_TASK_FULL, VALID_TASK_EXPLICIT_PRIORITY]
\ No newline at end of file
+
+    team_key = f"{VALID_TEAM['team_number']}-{VALID_TEAM['team_name']}-{VALID_DEPARTMENT['department_name']}"
+    subteam_key = f"{VALID_SUBTEAM['team_number']}-{VALID_SUBTEAM['team_name']}-{VALID_DEPARTMENT['department_name']}"
+    mock_assignment_service.list_tasks_for_teams.assert_called_once()
+    mock_team_service.get_subteam_by_team_number.assert_not_called()
+    assert list(result.keys()) == [team_key, subteam_key]
+    assert result[team_key] == [VALID_DEFAULT_TASK, VALID_TASK_EXPLICIT_PRIORITY]
+    assert result[subteam_key] == []
@@ -205,7 +205,8 @@ def test_list_tasks_with_priority_filter(mock_session_local):
     result = task_service.list_parent_tasks(filter_by={"priority_range": [5, 8]})
 
     mock_session.execute.assert_called_once()
-    executed_stmt = mock_session.execute.call_args[0][0]
+    # filter values are bound at execute time against the cached statement
+    executed_stmt = mock_session.execute.call_args[0][0].params(mock_session.execute.call_args[0][1])
     compiled = executed_stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
     sql_text = str(compiled).lower()
 
@@ -260,7 +261,8 @@ def test_list_tasks_with_combined_date_filters(mock_session_local):
     })
     
     mock_session.execute.assert_called_once()
-    executed_stmt = mock_session.execute.call_args[0][0]
+    # filter values are bound at execute time against the cached statement
+    executed_stmt = mock_session.execute.call_args[0][0].params(mock_session.execute.call_args[0][1])
     compiled = executed_stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
     sql_text = str(compiled).lower()
     
@@ -310,7 +312,8 @@ def test_list_tasks_with_status_filter(mock_session_local):
     result = task_service.list_parent_tasks(filter_by={"status": VALID_TASK_BLOCKED["status"]})
     
     mock_session.execute.assert_called_once()
-    executed_stmt = mock_session.execute.call_args[0][0]
+    # filter values are bound at execute time against the cached statement
+    executed_stmt = mock_session.execute.call_args[0][0].params(mock_session.execute.call_args[0][1])
     compiled = executed_stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
     sql_text = str(compiled).lower()
     expected_status = VALID_TASK_BLOCKED["status"].lower()
@@ -583,7 +586,8 @@ def test_list_tasks_with_deadline_filter_and_status_sort(mock_session_local):
     )
 
     mock_session.execute.assert_called_once()
-    executed_stmt = mock_session.execute.call_args[0][0]
+    # filter values are bound at execute time against the cached statement
+    executed_stmt = mock_session.execute.call_args[0][0].params(mock_session.execute.call_args[0][1])
     compiled = executed_stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
     sql_text = str(compiled).lower()
     
@@ -860,4 +864,54 @@ def test_get_task_by_invalid_id(mock_session_local):
     invalid_id_str = str(INVALID_TASK_ID_NONEXISTENT)
     assert "id" in sql_text and invalid_id_str in sql_text, f"Task ID filter not found in SQL: {sql_text}"
     
-    assert result is None
\ No newline at end of file
+    assert result is None
+# UNI-142/001
+@patch("backend.src.services.task.SessionLocal")
+def test_get_task_tree_uses_recursive_cte(mock_session_local):
+    """Subtree fetch is a single WITH RECURSIVE statement honouring max_depth"""
+    from backend.src.services import task as task_service
+    
+    mock_session = MagicMock()
+    mock_session_local.return_value.__enter__.return_value = mock_session
+    mock_session.execute.return_value.all.return_value = []
+    
+    result = task_service.get_task_tree(VALID_DEFAULT_TASK["id"], max_depth=2)
+    
+    mock_session.execute.assert_called_once()
+    executed_stmt = mock_session.execute.call_args[0][0]
+    compiled = executed_stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
+    sql_text = str(compiled).lower()
+    
+    assert sql_text.startswith("with recursive subtree")
+    assert "parent_assignment" in sql_text
+    assert "subtree.depth < 2" in sql_text
+    assert result is None
+
+# UNI-142/002
+@patch("backend.src.handlers.task_handler.task_service")
+def test_get_task_tree_handler_rejects_negative_depth(mock_task_service):
+    """Negative max_depth is rejected before querying"""
+    from backend.src.handlers import task_handler
+    
+    with pytest.raises(ValueError, match="max_depth"):
+        task_handler.get_task_tree(VALID_DEFAULT_TASK["id"], max_depth=-1)
+    mock_task_service.get_task_tree.assert_not_called()
+
+# UNI-142/003
+@patch("backend.src.handlers.task_handler.task_service")
+def test_get_task_tree_handler_returns_nested_task_with_subtasks(mock_task_service):
+    """Every level of the tree is a TaskWithSubTasks whose subTasks nest further"""
+    from backend.src.handlers import task_handler
+    from backend.src.schemas.task import TaskTree, TaskWithSubTasks
+
+    def node(task_id, *children):
+        return {**VALID_DEFAULT_TASK, "id": task_id, "active": True, "subtasks": list(children)}
+
+    mock_task_service.get_task_tree.return_value = node(1, node(2, node(3)))
+
+    tree = task_handler.get_task_tree(1)
+
+    assert isinstance(tree, TaskTree) and isinstance(tree, TaskWithSubTasks)
+    grandchild = tree.subTasks[0].subTasks[0]
+    assert isinstance(grandchild, TaskWithSubTasks) and grandchild.id == 3
+    assert tree.model_dump(by_alias=True)["subTasks"][0]["subTasks"][0]["subTasks"] == []
@@ -0,0 +1,95 @@
+# tests/backend/unit/task/test_task_paging.py
+import pytest
+import base64
+import json
+from types import SimpleNamespace
+from datetime import date
+from sqlalchemy import select
+from sqlalchemy.dialects import sqlite
+
+from backend.src.database.models.task import Task
+from backend.src.enums.task_sort import TaskSort
+from backend.src.services import task_paging
+from backend.src.handlers import task_handler
+
+pytestmark = pytest.mark.unit
+
+
+def _task(**overrides):
+    fields = dict(id=7, priority=5, status="To-do", start_date=date(2025, 1, 2), deadline=None)
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+# UNI-143/001
+@pytest.mark.parametrize("sort_by", [s.value for s in TaskSort])
+def test_cursor_round_trip(sort_by):
+    """Every sort's key tuple survives encode/decode, including dates and NULLs."""
+    task = _task()
+    cursor = task_paging.encode_cursor(task, sort_by)
+    assert "=" not in cursor
+    expected = [getattr(task, k.column.key) for k in task_paging.SORT_KEYS[sort_by]]
+    assert task_paging.decode_cursor(cursor, sort_by) == expected
+
+
+# UNI-143/002
+def test_every_sort_ends_with_task_id():
+    assert set(task_paging.SORT_KEYS) == {s.value for s in TaskSort}
+    for keys in task_paging.SORT_KEYS.values():
+        assert keys[-1].column is Task.id
+
+
+# UNI-143/003
+def test_apply_sort_unknown_raises():
+    with pytest.raises(ValueError, match="Invalid sort_by"):
+        task_paging.apply_sort(select(Task), "bad_key")
+
+
+# UNI-143/004
+def test_after_clause_null_deadline_skips_deadline_branch():
+    """After a NULL-deadline row only same-priority NULL-deadline rows with a larger id, or lower priorities, follow."""
+    cursor = task_paging.encode_cursor(_task(deadline=None), "priority_desc")
+    sql = _sql(task_paging.apply_page(select(Task.id), "priority_desc", after=cursor))
+    assert "task.priority < 5" in sql
+    assert "task.deadline IS NULL AND task.id > 7" in sql
+    assert "task.deadline >" not in sql
+
+
+# UNI-143/005
+def test_after_clause_dated_row_includes_null_tail():
+    cursor = task_paging.encode_cursor(_task(deadline=date(2025, 3, 1)), "deadline_asc")
+    sql = _sql(task_paging.apply_page(select(Task.id), "deadline_asc", limit=10, after=cursor))
+    assert "task.deadline IS NULL" in sql
+    assert "task.deadline > '2025-03-01'" in sql
+    assert "LIMIT 10" in sql
+
+
+# UNI-143/006
+def test_next_page_cursor_only_for_full_pages():
+    page = [_task(id=1), _task(id=2)]
+    assert task_handler.next_page_cursor(page, "priority_desc", None) is None
+    assert task_handler.next_page_cursor(page, "priority_desc", 3) is None
+    cursor = task_handler.next_page_cursor(page, "priority_desc", 2)
+    assert task_paging.decode_cursor(cursor, "priority_desc")[-1] == 2
+
+
+# UNI-143/007
+@pytest.mark.parametrize("sort_by, values", [
+    ("priority_desc", ["9", None, 1]),
+    ("priority_desc", [True, None, 1]),
+    ("priority_desc", [5, 20250101, 1]),
+    ("priority_desc", [5, None, None]),
+    ("deadline_asc", ["2025-01-01", 5, "1"]),
+    ("status", [3, 5, 1]),
+    ("start_date_asc", ["not-a-date", 5, 1]),
+])
+def test_forged_cursor_values_rejected(sort_by, values):
+    """Every key value must match its column's type; otherwise the comparison would give wrong pages."""
+    raw = json.dumps({"s": sort_by, "k": values}).encode()
+    cursor = base64.urlsafe_b64encode(raw).decode().rstrip("=")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        task_paging.decode_cursor(cursor, sort_by)
@@ -19,7 +19,7 @@ pytestmark = pytest.mark.unit
 
 # UNI-013/001
 @patch("backend.src.services.task.SessionLocal")
-@patch("backend.src.services.task._assert_no_cycle")
+@patch("backend.src.services.task._assert_no_cycles")
 def test_attach_subtasks_single_child_success(mock_assert_no_cycle, mock_session_local):
     """Attach single child to parent successfully"""
     from backend.src.services import task as task_service
@@ -57,7 +57,7 @@ def test_attach_subtasks_single_child_success(mock_assert_no_cycle, mock_session
 
 # UNI-013/002
 @patch("backend.src.services.task.SessionLocal")
-@patch("backend.src.services.task._assert_no_cycle")
+@patch("backend.src.services.task._assert_no_cycles")
 def test_attach_subtasks_multiple_children_success(mock_assert_no_cycle, mock_session_local):
     """Attach multiple children to parent successfully"""
     from backend.src.services import task as task_service
@@ -102,7 +102,7 @@ def test_attach_subtasks_multiple_children_success(mock_assert_no_cycle, mock_se
 
 # UNI-013/003
 @patch("backend.src.services.task.SessionLocal")
-@patch("backend.src.services.task._assert_no_cycle")
+@patch("backend.src.services.task._assert_no_cycles")
 def test_attach_subtasks_idempotent_behavior(mock_assert_no_cycle, mock_session_local):
     """Re-attaching same child is idempotent (no duplicates created)"""
     from backend.src.services import task as task_service
@@ -175,7 +175,7 @@ def test_attach_subtasks_existing_parent_conflict_raises_error(mock_session_loca
 
 # UNI-013/005
 @patch("backend.src.services.task.SessionLocal")
-@patch("backend.src.services.task._assert_no_cycle")
+@patch("backend.src.services.task._assert_no_cycles")
 def test_attach_subtasks_cycle_detection_raises_error(mock_assert_no_cycle, mock_session_local):
     """Attach subtasks that would create cycle raises ValueError"""
     from backend.src.services import task as task_service
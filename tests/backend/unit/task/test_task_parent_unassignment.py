@@ -115,11 +115,16 @@ def test_detach_subtask_sql_query_validation(mock_session_local):
     
     result = task_service.detach_subtask(VALID_PARENT_TASK["id"], VALID_DEFAULT_TASK["id"])
     
-    mock_session.execute.assert_called_once()
-    executed_stmt = mock_session.execute.call_args[0][0]
+    # First statement looks up the link; second trims the hierarchy index
+    assert mock_session.execute.call_count == 2
+    executed_stmt = mock_session.execute.call_args_list[0][0][0]
     compiled = executed_stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
     sql_text = str(compiled).lower()
     
+    closure_stmt = mock_session.execute.call_args_list[1][0][0]
+    closure_sql = str(closure_stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})).lower()
+    assert closure_sql.startswith("delete from task_closure")
+    
     assert "parent_assignment" in sql_text
     assert "parent_id" in sql_text
     assert "subtask_id" in sql_text
@@ -0,0 +1,70 @@
+# tests/backend/unit/task/test_task_query.py
+import pytest
+from datetime import date
+from sqlalchemy.dialects import sqlite
+
+from backend.src.services import task_query
+
+pytestmark = pytest.mark.unit
+
+
+def _sql(shape, params) -> str:
+    stmt = task_query.listing_statement(shape, active_only=True, sort_by="priority_desc", with_subtasks=False)
+    return str(stmt.params(params).compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+# UNI-144/001
+def test_shape_ignores_values_and_list_lengths():
+    shape_a, params_a = task_query.compile_filter({"status": "To-do", "priority_range": [1, 5]})
+    shape_b, params_b = task_query.compile_filter({"status": ["Blocked", "Completed"], "priority_range": [7, 9]})
+    assert shape_a == shape_b
+    assert params_a == {"p0": ["To-do"], "p1": 1, "p2": 5}
+    assert params_b == {"p0": ["Blocked", "Completed"], "p1": 7, "p2": 9}
+
+
+# UNI-144/002
+def test_open_bounds_change_shape():
+    closed, _ = task_query.compile_filter({"priority_range": [1, 5]})
+    open_hi, params = task_query.compile_filter({"priority_range": [1, None]})
+    assert closed != open_hi
+    assert params == {"p0": 1}
+
+
+# UNI-144/003
+def test_no_filter_has_no_shape():
+    assert task_query.compile_filter(None) == (None, {})
+    assert task_query.compile_filter({}) == (None, {})
+
+
+# UNI-144/004
+def test_nested_expression_renders_and_or():
+    shape, params = task_query.compile_filter({
+        "deadline_range": ["2025-01-01", "2025-01-31"],
+        "or": [{"tag": "urgent"}, {"and": [{"assignee_id": 4}, {"project_id": [1, 2]}]}],
+    })
+    assert params["p0"] == date(2025, 1, 1)
+    sql = _sql(shape, params)
+    assert "task.deadline >= '2025-01-01' AND task.deadline <= '2025-01-31'" in sql
+    assert "task.tag IN ('urgent') OR (EXISTS" in sql
+    assert "task_assignment.user_id IN (4)" in sql
+    assert "task.project_id IN (1, 2)" in sql
+
+
+# UNI-144/005
+@pytest.mark.parametrize("expr, message", [
+    ({"unknown": 1, "status": "To-do"}, "Invalid filter keys: \\['unknown'\\]"),
+    ({"or": {"status": "To-do"}}, "'or' expects a non-empty list"),
+    ({"and": [{}]}, "non-empty object"),
+    ({"status": []}, "at least one value"),
+    ({"status": "Done"}, "Invalid value for 'status'"),
+    ({"status": [["To-do"]]}, "Invalid value for 'status'"),
+    ({"status": {"a": 1}}, "Invalid value for 'status'"),
+    ({"priority_range": [None, None]}, "at least one bound"),
+    ({"priority_range": ["1", 5]}, "Invalid value for 'priority_range'"),
+    ({"assignee_id": True}, "Invalid value for 'assignee_id'"),
+    ({"tag": 3}, "Invalid value for 'tag'"),
+    ({"start_date_range": [20250101, None]}, "Invalid value for 'start_date_range'"),
+])
+def test_invalid_expressions_raise(expr, message):
+    with pytest.raises(ValueError, match=message):
+        task_query.compile_filter(expr)
@@ -8,6 +8,9 @@ import time
 import multiprocessing
 import requests
 
+# No background email sending in tests (the repo .env has live SMTP settings); tests call dispatch_once
+os.environ.setdefault("EMAIL_OUTBOX_AUTOSTART", "false")
+
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
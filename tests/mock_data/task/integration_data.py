@@ -230,7 +230,8 @@ MULTI_DATA_FILTER = json.dumps({
 
 INVALID_DATA_FILTER = json.dumps({"invalid_filter": TaskStatus.TO_DO.value})
 
-INVALID_DATA_FILTER_COMBI = [
+# Predicates that used to be mutually exclusive; the filter engine ANDs them
+COMBINED_DATA_FILTERS = [
     json.dumps({
         "start_date_range": [
             (date.today() - timedelta(days=10)).isoformat(),
@@ -244,6 +245,15 @@ INVALID_DATA_FILTER_COMBI = [
     }),
 ]
 
+INVALID_DATA_FILTER_COMBI = [
+    json.dumps({"or": []}),
+    json.dumps({"and": [{"status": TaskStatus.TO_DO.value}, {"invalid_filter": 1}]}),
+    json.dumps({"priority_range": [3]}),
+    json.dumps({"status": "Done"}),
+    json.dumps({"deadline_range": ["not-a-date", None]}),
+    json.dumps(["status", TaskStatus.TO_DO.value]),
+]
+
 FILTER_AND_SORT_QUERY =  "sort_by=status&filters=" + json.dumps({"priority_range": [3, 7]})
 
 TASK_UPDATE_PAYLOAD = {
@@ -0,0 +1,24 @@
+"""
+Query budgets for API tests, read from the X-DB-Queries header that
+QueryStatsMiddleware sets on every response.
+
+    resp = client.get(f"{task_base_path}/{task_id}")
+    assert_query_budget(resp, 3)
+
+For code called directly (no request), use backend.src.database.query_stats.track_queries.
+"""
+from __future__ import annotations
+
+from backend.src.api.middleware import QUERY_COUNT_HEADER
+
+
+def db_queries(response) -> int:
+    """Number of SQL statements the request ran."""
+    return int(response.headers[QUERY_COUNT_HEADER])
+
+
+def assert_query_budget(response, budget: int) -> None:
+    used = db_queries(response)
+    assert used <= budget, (
+        f"{response.request.method} {response.request.url.path} ran {used} queries (budget {budget})"
+    )